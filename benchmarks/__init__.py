@@ -0,0 +1,13 @@
+'''
+Benchmarks for the schema, flowgraph and scheduler hot paths.
+
+The benchmarks only use builtin tasks, so no EDA tools are needed. Each
+module follows the airspeed velocity (asv) conventions: ``time_*`` methods
+of a class are timed after calling its ``setup`` method, and are repeated
+for every combination of the values in ``params``. The value returned by
+``track_*`` methods, such as the memory used, is recorded instead of their
+time, in the ``unit`` of the method.
+
+Run them with ``scripts/benchmark.py``, which stores the results as JSON so
+runs on different commits can be compared.
+'''
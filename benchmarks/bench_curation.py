@@ -0,0 +1,50 @@
+'''
+Benchmarks for collecting the files of a project.
+'''
+
+import os
+import shutil
+import tempfile
+
+from siliconcompiler import Design, Project
+from siliconcompiler.utils.curation import collect
+
+
+class Collect:
+    '''
+    Collects the files of a design, and a directory of files.
+    '''
+    params = [100, 1000]
+    param_names = ["files"]
+
+    def setup(self, files):
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+
+        srcdir = os.path.join(self.tmpdir, "src")
+        incdir = os.path.join(self.tmpdir, "include")
+        os.makedirs(srcdir)
+        os.makedirs(incdir)
+
+        design = Design("bench")
+        with design.active_fileset("rtl"):
+            design.set_topmodule("bench")
+            with design._active(copy=True):
+                design.add_idir(incdir)
+                for n in range(files):
+                    path = os.path.join(srcdir, f"module{n}.v")
+                    with open(path, "w") as f:
+                        f.write(f"module module{n}();\nendmodule\n")
+                    design.add_file(path)
+
+                    with open(os.path.join(incdir, f"header{n}.vh"), "w") as f:
+                        f.write(f"`define HEADER{n}\n")
+
+        self.project = Project(design)
+        self.project.add_fileset("rtl")
+        self.project.option.set_builddir(os.path.join(self.tmpdir, "build"))
+
+    def teardown(self, files):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_collect(self, files):
+        collect(self.project, verbose=False)
@@ -0,0 +1,51 @@
+'''
+Benchmarks for resolving the filesets of a design and its dependencies.
+'''
+
+import functools
+import os
+import shutil
+import tempfile
+
+from benchmarks.common import build_design_forest
+
+
+@functools.lru_cache(maxsize=None)
+def get_forest(designs):
+    return build_design_forest(designs)
+
+
+class Filesets:
+    '''
+    Resolves and writes the rtl fileset of a forest of designs, as tools do
+    when they are set up for each node.
+    '''
+    params = [500, 5000]
+    param_names = ["designs"]
+
+    def setup(self, designs):
+        self.top = get_forest(designs)
+        # A change, so the filesets are resolved again
+        self.top.set("fileset", "rtl", "topmodule", "top")
+
+        # The files of the designs are found relative to the current directory
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+        for n in range(designs):
+            open(f"ip{n}.v", "w").close()
+        open("top.v", "w").close()
+
+    def teardown(self, designs):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_get_fileset(self, designs):
+        self.top.get_fileset("rtl")
+
+    def time_get_fileset_cached(self, designs):
+        self.top.get_fileset("rtl")
+        self.top.get_fileset("rtl")
+
+    def time_write_fileset(self, designs):
+        self.top.write_fileset("top.f", "rtl")
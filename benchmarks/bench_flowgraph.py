@@ -0,0 +1,90 @@
+'''
+Benchmarks for flowgraph traversal.
+
+The flows are built from stages of parallel seeds, see
+:func:`benchmarks.common.build_sweep_flow`, so the number of paths grows
+exponentially with the number of stages while the number of nodes grows
+linearly. The time of each operation shows whether it enumerates paths.
+'''
+
+import functools
+
+from siliconcompiler.flowgraph import RuntimeFlowgraph
+
+from benchmarks.common import build_sweep_flow
+
+
+# Number of stages and seeds of each flow shape
+SHAPES = {
+    "wide": (2, 1000),
+    "deep": (500, 2),
+    "sweep": (50, 50),
+    "sweep10k": (100, 100),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_flow(shape):
+    return build_sweep_flow(*SHAPES[shape])
+
+
+class Build:
+    '''
+    Adds the nodes and edges of a flowgraph.
+    '''
+    params = list(SHAPES)
+    param_names = ["shape"]
+
+    def time_build(self, shape):
+        build_sweep_flow(*SHAPES[shape])
+
+
+class Traversal:
+    '''
+    Checks and orders a flowgraph.
+    '''
+    params = list(SHAPES)
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        # A new flow, since the flow keeps the results of its traversals
+        self.flow = build_sweep_flow(*SHAPES[shape])
+
+    def time_validate(self, shape):
+        self.flow.validate()
+
+    def time_execution_order(self, shape):
+        self.flow.get_execution_order()
+
+    def time_exit_nodes(self, shape):
+        self.flow.get_exit_nodes()
+
+
+class Runtime:
+    '''
+    Builds the runtime flowgraph of a run, with and without a range of
+    steps to run.
+    '''
+    params = list(SHAPES)
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.flow = get_flow(shape)
+        stages, _ = SHAPES[shape]
+        self.from_steps = ["stage1"]
+        self.to_steps = [f"select{stages - 1}"]
+        self.runtime = RuntimeFlowgraph(self.flow)
+
+    def time_runtime(self, shape):
+        RuntimeFlowgraph(self.flow)
+
+    def time_runtime_from_to(self, shape):
+        RuntimeFlowgraph(self.flow, from_steps=self.from_steps, to_steps=self.to_steps,
+                         prune_nodes=[("stage0", "0")])
+
+    def time_nodes_starting_at(self, shape):
+        self.runtime.get_nodes_starting_at("import", "0")
+
+    def time_runtime_validate(self, shape):
+        RuntimeFlowgraph.validate(self.flow, from_steps=self.from_steps, to_steps=self.to_steps,
+                                  prune_nodes=[("stage0", "0")])
@@ -0,0 +1,39 @@
+'''
+Benchmarks for scanning tool logs with the task regex patterns.
+'''
+
+import logging
+import os
+import shutil
+import tempfile
+
+from siliconcompiler import sc_open
+from siliconcompiler.utils.logscan import LogScanner
+
+from benchmarks.common import LOG_CHECKS, generate_log, skip_unless_large
+
+
+class Scan:
+    '''
+    Scans a synthetic tool log for errors, warnings and a metric in a single
+    pass, without the node around it.
+
+    The 1 GB log is only scanned when SC_BENCHMARK_LARGE is set.
+    '''
+    params = [16, 256, 1024]
+    param_names = ["size_mb"]
+
+    def setup(self, size_mb):
+        if size_mb > 256:
+            skip_unless_large()
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+        self.log = os.path.join(self.tmpdir, "synthetic.log")
+        generate_log(self.log, size_mb * 1024 * 1024)
+        self.scanner = LogScanner(LOG_CHECKS, logger=logging.getLogger())
+
+    def teardown(self, size_mb):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_scan(self, size_mb):
+        with sc_open(self.log) as f:
+            self.scanner.scan(f, lambda suffix, num, string: None)
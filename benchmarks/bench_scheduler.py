@@ -0,0 +1,75 @@
+'''
+Benchmarks for running nodes.
+'''
+
+import logging
+import os
+import shutil
+import tempfile
+
+from siliconcompiler.scheduler import SchedulerNode, TaskScheduler
+from siliconcompiler.tools.builtin.nop import NOPTask
+from siliconcompiler import Flowgraph
+
+from benchmarks.common import LOG_CHECKS, build_fanout_flow, build_project, generate_log, \
+    prepare_nodes, skip_unless_large
+
+
+class Throughput:
+    '''
+    Runs a flow of trivial nodes, which measures the time the scheduler and
+    each node spend around the tasks.
+    '''
+    params = [10, 100, 1000]
+    param_names = ["nodes"]
+    repeat = 1
+    timeout = 1800
+
+    def setup(self, nodes):
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+        self.project = build_project(build_fanout_flow(nodes), self.tmpdir)
+        self.tasks = prepare_nodes(self.project)
+
+    def teardown(self, nodes):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_run(self, nodes):
+        TaskScheduler(self.project, self.tasks).run(logging.NullHandler())
+
+
+class CheckLogfile:
+    '''
+    Scans a tool log for errors, warnings and a metric.
+
+    The 1 GB log is only scanned when SC_BENCHMARK_LARGE is set.
+    '''
+    params = [16, 256, 1024]
+    param_names = ["size_mb"]
+
+    def setup(self, size_mb):
+        if size_mb > 256:
+            skip_unless_large()
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+
+        flow = Flowgraph("scan")
+        flow.node("scan", NOPTask())
+        self.project = build_project(flow, self.tmpdir)
+        for suffix, regexes in LOG_CHECKS.items():
+            self.project.set("tool", "builtin", "task", "nop", "regex", suffix, regexes,
+                             step="scan", index="0")
+
+        self.node = SchedulerNode(self.project, "scan", "0")
+        os.makedirs(self.node.workdir)
+        generate_log(self.node.get_log(), size_mb * 1024 * 1024)
+
+        # Reports of the matches are written to the current directory
+        self.cwd = os.getcwd()
+        os.chdir(self.node.workdir)
+
+    def teardown(self, size_mb):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_check_logfile(self, size_mb):
+        with self.node.runtime():
+            self.node.check_logfile()
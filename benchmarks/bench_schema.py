@@ -0,0 +1,144 @@
+'''
+Benchmarks for reading, writing and journaling manifests, and for the
+memory used by loaded projects.
+'''
+
+import gc
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+import psutil
+
+from siliconcompiler import ASIC
+from siliconcompiler.schema import Journal
+
+from benchmarks.common import get_demo_manifest
+
+
+class ReadManifest:
+    '''
+    Loads the manifest of the ASIC demo.
+    '''
+    params = [True, False]
+    param_names = ["lazyload"]
+
+    def setup(self, lazyload):
+        self.manifest = get_demo_manifest()
+
+    def time_from_manifest(self, lazyload):
+        ASIC.from_manifest(filepath=self.manifest, lazyload=lazyload)
+
+
+def _loaded_rss(manifest: str, copies: int) -> float:
+    '''
+    Returns the increase in resident set size, in MB, from loading copies of
+    a manifest without lazy loading.
+    '''
+    gc.collect()
+    process = psutil.Process()
+    rss = process.memory_info().rss
+    projects = [ASIC.from_manifest(filepath=manifest, lazyload=False)
+                for _ in range(copies)]
+    gc.collect()
+    return (process.memory_info().rss - rss) / 2**20 / len(projects)
+
+
+class LoadedMemory:
+    '''
+    Memory used by projects loaded without lazy loading, as happens for the
+    libraries of a design and in every node process.
+
+    The resident set size is measured in a fresh process, since in this one
+    it also depends on the benchmarks run before. The memory allocated while
+    loading is traced as well, which is steadier but misses the memory held
+    outside of Python objects.
+    '''
+    params = [20]
+    param_names = ["copies"]
+    repeat = 1
+
+    def setup(self, copies):
+        self.manifest = get_demo_manifest()
+        gc.collect()
+
+    def track_allocated_per_project(self, copies):
+        tracemalloc.start()
+        try:
+            projects = [ASIC.from_manifest(filepath=self.manifest, lazyload=False)
+                        for _ in range(copies)]
+            gc.collect()
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return allocated / 2**20 / len(projects)
+
+    track_allocated_per_project.unit = "MB"
+
+    def track_rss_per_project(self, copies):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from benchmarks.bench_schema import _loaded_rss; "
+             "print(_loaded_rss(sys.argv[1], int(sys.argv[2])))",
+             self.manifest, str(copies)],
+            cwd=root, stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        return float(proc.stdout.strip().splitlines()[-1])
+
+    track_rss_per_project.unit = "MB"
+
+
+class WriteManifest:
+    '''
+    Writes the manifest of the ASIC demo.
+    '''
+    params = [".pkg.json", ".pkg.json.gz"]
+    param_names = ["suffix"]
+
+    def setup(self, suffix):
+        self.project = ASIC.from_manifest(filepath=get_demo_manifest(), lazyload=False)
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+        self.manifest = os.path.join(self.tmpdir, f"asic_demo{suffix}")
+
+    def teardown(self, suffix):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_write_manifest(self, suffix):
+        self.project.write_manifest(self.manifest)
+
+
+class JournalReplay:
+    '''
+    Replays a journal of metrics and records, as is done in the parent for
+    every node which finishes.
+    '''
+    params = [100, 1000]
+    param_names = ["nodes"]
+
+    def setup(self, nodes):
+        self.tmpdir = tempfile.mkdtemp(prefix="sc_bench_")
+        self.journal = os.path.join(self.tmpdir, f"asic_demo{Journal.FILE_EXTENSION}")
+
+        project = ASIC.from_manifest(filepath=get_demo_manifest(), lazyload=False)
+        journal = Journal.access(project)
+        journal.start()
+        for n in range(nodes):
+            step, index = "place", str(n)
+            project.set("record", "status", "success", step=step, index=index)
+            project.set("metric", "errors", 0, step=step, index=index)
+            project.set("metric", "warnings", n, step=step, index=index)
+            project.set("metric", "tasktime", 1.0, step=step, index=index)
+            project.set("metric", "cellarea", 10.0 * n, step=step, index=index)
+        journal.write_file(self.journal)
+        journal.stop()
+
+        self.project = ASIC.from_manifest(filepath=get_demo_manifest(), lazyload=False)
+
+    def teardown(self, nodes):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_replay_file(self, nodes):
+        Journal.replay_file(self.project, self.journal)
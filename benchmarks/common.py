@@ -0,0 +1,179 @@
+'''
+Builders shared by the benchmarks.
+'''
+
+import functools
+import logging
+import os
+import random
+import tempfile
+
+from siliconcompiler import Design, Flowgraph, NodeStatus, Project
+from siliconcompiler.demos import asic_demo
+from siliconcompiler.scheduler import SchedulerNode
+from siliconcompiler.tools.builtin.minimum import MinimumTask
+from siliconcompiler.tools.builtin.nop import NOPTask
+
+
+# Environment variable which enables the benchmarks of the largest inputs
+LARGE_ENV = "SC_BENCHMARK_LARGE"
+
+# Lines of a synthetic tool log, with how often each appears
+LOG_LINES = [
+    ("[INFO GRT-0101] Running extra iterations to remove overflow.\n", 40),
+    ("[INFO DRT-0195] Start 1st optimization iteration.\n", 40),
+    ("    Completing 10% with 1234 violations.\n", 10),
+    ("    elapsed time = 00:00:01, memory = 1234.56 (MB).\n", 10),
+    ("Number of DRVs: 12\n", 1),
+    ("[WARNING STA-1212] clock clk not found.\n", 1),
+    ("[WARNING GRT-0043] No OR_DEFAULT vias defined.\n", 1),
+    ("[ERROR GRT-0116] Global routing finished with congestion.\n", 0.01),
+]
+
+# Patterns to scan the synthetic log for
+LOG_CHECKS = {
+    "errors": ["^\\[ERROR", "-v ERROR GRT-0000"],
+    "warnings": ["^\\[WARNING", "-v WARNING (STA|ODB)-"],
+    "drvs": ["-i drv", "-o [0-9]+"],
+}
+
+
+def skip_unless_large() -> None:
+    '''
+    Skips a benchmark of a large input, which takes minutes and gigabytes of
+    disk, unless the SC_BENCHMARK_LARGE environment variable is set.
+    '''
+    if not os.environ.get(LARGE_ENV):
+        raise NotImplementedError(f"set {LARGE_ENV}=1 to run")
+
+
+def build_sweep_flow(stages: int, seeds: int) -> Flowgraph:
+    '''
+    Builds a flow where every stage runs one node per seed, each taking its
+    input from the minimum of the previous stage.
+
+    The number of paths through this flow grows exponentially with the
+    number of stages, while the number of nodes grows linearly.
+    '''
+    flow = Flowgraph("sweep")
+
+    flow.node("import", NOPTask())
+    prev = "import"
+    for stage in range(stages):
+        step = f"stage{stage}"
+        select = f"select{stage}"
+        flow.node(select, MinimumTask())
+        for seed in range(seeds):
+            flow.node(step, NOPTask(), index=seed)
+            flow.edge(prev, step, head_index=seed)
+            flow.edge(step, select, tail_index=seed)
+        prev = select
+
+    return flow
+
+
+def build_fanout_flow(nodes: int) -> Flowgraph:
+    '''
+    Builds a flow where an import node feeds a number of parallel nodes,
+    which are all joined by a single minimum node.
+    '''
+    flow = Flowgraph("fanout")
+
+    flow.node("import", NOPTask())
+    flow.node("select", MinimumTask())
+    for index in range(nodes):
+        flow.node("run", NOPTask(), index=index)
+        flow.edge("import", "run", head_index=index)
+        flow.edge("run", "select", tail_index=index)
+
+    return flow
+
+
+def build_design_forest(designs: int, deps: int = 3, seed: int = 0) -> Design:
+    '''
+    Builds a forest of designs where each design depends on the rtl fileset
+    of up to deps designs created before it, and returns a top design which
+    depends on every design nothing else depends on.
+
+    Dependencies are shared between designs, as IP blocks are in an SoC, so
+    the number of paths through the forest grows much faster than the number
+    of designs.
+    '''
+    rng = random.Random(seed)
+
+    forest = []
+    roots = set()
+    for n in range(designs):
+        design = Design(f"ip{n}")
+        with design.active_fileset("rtl"):
+            design.set_topmodule(f"ip{n}")
+            design.add_file(f"ip{n}.v")
+            for dep in set(rng.sample(range(n), min(n, deps))):
+                design.add_depfileset(forest[dep], "rtl")
+                roots.discard(dep)
+        forest.append(design)
+        roots.add(n)
+
+    top = Design("top")
+    with top.active_fileset("rtl"):
+        top.set_topmodule("top")
+        top.add_file("top.v")
+        for n in sorted(roots):
+            top.add_depfileset(forest[n], "rtl")
+    return top
+
+
+def build_project(flow: Flowgraph, builddir: str) -> Project:
+    '''
+    Builds a project running a flow of builtin tasks in a build directory.
+    '''
+    design = Design("bench")
+    with design.active_fileset("rtl"):
+        design.set_topmodule("bench")
+
+    project = Project(design)
+    project.add_fileset("rtl")
+    project.set_flow(flow)
+    project.option.set_builddir(builddir)
+    project.option.set_nodashboard(True)
+    project.option.set_quiet(True)
+    project.logger.setLevel(logging.WARNING)
+    return project
+
+
+def prepare_nodes(project: Project) -> dict:
+    '''
+    Sets up the nodes of the project flow for a TaskScheduler, as the
+    Scheduler does before running them.
+    '''
+    tasks = {}
+    for step, index in project.get_flow().get_nodes():
+        tasks[(step, index)] = SchedulerNode(project, step, index)
+        tasks[(step, index)].setup()
+        project.set("record", "status", NodeStatus.PENDING, step=step, index=index)
+    return tasks
+
+
+@functools.lru_cache(maxsize=None)
+def get_demo_manifest() -> str:
+    '''
+    Returns the path to the manifest of the ASIC demo, which is only
+    written once per process.
+    '''
+    path = os.path.join(tempfile.mkdtemp(prefix="sc_bench_"), "asic_demo.pkg.json")
+    asic_demo.ASICDemo().write_manifest(path)
+    return path
+
+
+def generate_log(path: str, size: int) -> None:
+    '''
+    Writes a synthetic tool log of about size bytes.
+    '''
+    random.seed(0)
+    lines, weights = zip(*LOG_LINES)
+    block = "".join(random.choices(lines, weights=weights, k=10000))
+    written = 0
+    with open(path, "w") as f:
+        while written < size:
+            f.write(block)
+            written += len(block)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+'''
+Runs the benchmarks in benchmarks/ and stores the results as JSON.
+
+Each benchmark is set up and timed repeat times, and the fastest, median
+and mean times are stored with the commit and machine they were run on.
+Benchmarks which track a value, such as the memory used, store that value
+instead of the time.
+With --compare, the results are compared against a previous results file,
+and the script fails if a benchmark became slower than the threshold.
+
+The benchmarks follow the airspeed velocity (asv) conventions, so they can
+also be run with asv.
+'''
+
+import argparse
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_params(obj):
+    params = getattr(obj, "params", [])
+    if params and not isinstance(params[0], (list, tuple)):
+        # A single parameter
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def discover(pattern):
+    '''
+    Returns the name, class and method of every benchmark whose name
+    matches the pattern.
+    '''
+    sys.path.insert(0, ROOT)
+    import benchmarks
+
+    found = []
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method in sorted(dir(cls)):
+                if not method.startswith(("time_", "track_")):
+                    continue
+                name = f"{module_info.name}.{cls_name}.{method}"
+                if re.search(pattern, name):
+                    found.append((name, cls, method))
+    return found
+
+
+def run_benchmark(cls, method, params, repeat):
+    '''
+    Returns the time of each run of a benchmark, or the value returned by
+    each run of a track_ benchmark, or None if it does not apply to these
+    parameters.
+    '''
+    samples = []
+    for _ in range(repeat):
+        bench = cls()
+        try:
+            if hasattr(bench, "setup"):
+                bench.setup(*params)
+        except NotImplementedError:
+            return None
+
+        try:
+            start = time.perf_counter()
+            value = getattr(bench, method)(*params)
+            if method.startswith("track_"):
+                samples.append(value)
+            else:
+                samples.append(time.perf_counter() - start)
+        finally:
+            if hasattr(bench, "teardown"):
+                bench.teardown(*params)
+    return samples
+
+
+def run(pattern, repeat):
+    results = {}
+    for name, cls, method in discover(pattern):
+        bench_repeat = repeat or getattr(cls, "repeat", 3)
+        unit = getattr(getattr(cls, method), "unit", "s")
+        for params in get_params(cls):
+            full_name = name
+            if params:
+                full_name = f"{name}({', '.join(repr(param) for param in params)})"
+
+            samples = run_benchmark(cls, method, params, bench_repeat)
+            if samples is None:
+                continue
+
+            results[full_name] = {
+                "min": min(samples),
+                "median": statistics.median(samples),
+                "mean": statistics.mean(samples),
+                "samples": samples,
+                "unit": unit
+            }
+            print(f"{full_name}: {results[full_name]['min']:.4f} {unit}", flush=True)
+    return results
+
+
+def compare(results, base, threshold):
+    '''
+    Prints the change of each benchmark against a previous run and returns
+    the names of the benchmarks which became slower, or whose tracked value
+    became larger, than the threshold.
+    '''
+    slower = []
+    print()
+    print(f"{'benchmark':<70} {'base':>10} {'new':>10} {'ratio':>7}")
+    for name in sorted(set(results) & set(base)):
+        base_time = base[name]["min"]
+        new_time = results[name]["min"]
+        ratio = new_time / base_time if base_time else float("inf")
+
+        worse, better = " slower", " faster"
+        if results[name].get("unit", "s") != "s":
+            worse, better = " larger", " smaller"
+
+        flag = ""
+        if ratio > threshold:
+            flag = worse
+            slower.append(name)
+        elif ratio < 1 / threshold:
+            flag = better
+        print(f"{name:<70} {base_time:>10.4f} {new_time:>10.4f} {ratio:>7.2f}{flag}")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bench', default='',
+                        help='only run the benchmarks whose name matches this regular expression')
+    parser.add_argument('--repeat', type=int,
+                        help='number of times to run each benchmark, '
+                             'defaults to the repeat of the benchmark or 3')
+    parser.add_argument('--output', default='benchmarks.json',
+                        help='file to store the results in')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='results of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which a benchmark is reported as slower')
+    args = parser.parse_args()
+
+    results = run(args.bench, args.repeat)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "commit": get_commit(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "cpus": os.cpu_count(),
+            "benchmarks": results
+        }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)["benchmarks"]
+        if compare(results, base, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
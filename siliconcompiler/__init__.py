@@ -1,26 +1,41 @@
-# General utilities
-from siliconcompiler._common import NodeStatus
-from siliconcompiler.utils import sc_open
+from siliconcompiler._lazy import lazy_attributes
+
 from siliconcompiler._metadata import version as __version__
 
-# User classes
-from siliconcompiler.design import Design
-from siliconcompiler.pdk import PDK
-from siliconcompiler.flowgraph import Flowgraph
-from siliconcompiler.checklist import Checklist
-from siliconcompiler.library import StdCellLibrary
+# Public classes are imported on first access (PEP 562), so importing the
+# package does not load the scheduler, dashboards and tool support until a
+# program uses them.
+_LAZY_ATTRIBUTES = {
+    # General utilities
+    "NodeStatus": "siliconcompiler._common",
+    "sc_open": "siliconcompiler.utils",
+
+    # User classes
+    "Design": "siliconcompiler.design",
+    "PDK": "siliconcompiler.pdk",
+    "Flowgraph": "siliconcompiler.flowgraph",
+    "Checklist": "siliconcompiler.checklist",
+    "StdCellLibrary": "siliconcompiler.library",
+
+    # Tasks
+    "Task": "siliconcompiler.tool",
+    "OpenTask": "siliconcompiler.tool",
+    "ShowTask": "siliconcompiler.tool",
+    "ScreenshotTask": "siliconcompiler.tool",
+    "TaskSkip": "siliconcompiler.tool",
+
+    # Projects
+    "Project": "siliconcompiler.project",
+    "ASIC": "siliconcompiler.asic",
+    "FPGA": "siliconcompiler.fpga",
+    "Lint": "siliconcompiler.project",
+    "Sim": "siliconcompiler.project",
 
-# Tasks
-from siliconcompiler.tool import Task, OpenTask, ShowTask, ScreenshotTask, TaskSkip
+    "FPGADevice": "siliconcompiler.fpga",
+}
 
-# Projects
-from siliconcompiler.project import Project
-from siliconcompiler.asic import ASIC
-from siliconcompiler.fpga import FPGA
-from siliconcompiler.project import Lint
-from siliconcompiler.project import Sim
 
-from siliconcompiler.fpga import FPGADevice
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
 
 
 __all__ = [
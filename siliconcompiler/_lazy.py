@@ -0,0 +1,30 @@
+import importlib
+
+
+def lazy_attributes(namespace, attributes):
+    """
+    Creates the module ``__getattr__`` and ``__dir__`` (PEP 562) which import
+    the attributes of a package on first access.
+
+    Args:
+        namespace (dict): globals of the package, where imported attributes
+            are cached so later lookups do not come back here.
+        attributes (dict): maps each attribute to the module it is imported
+            from.
+
+    Returns:
+        tuple: the ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    def __getattr__(name):
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted([*namespace.keys(), *attributes.keys()])
+
+    return __getattr__, __dir__
@@ -345,6 +345,7 @@ class Checklist(NamedSchema):
             'tasktime',
             'totaltime',
             'exetime',
+            'overhead',
             'memory')
 
         for item in items:
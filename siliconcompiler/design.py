@@ -1,9 +1,10 @@
 import contextlib
 import io
 import os.path
+import weakref
 from pathlib import Path
 
-from typing import Dict, List, Set, Union, Tuple, Optional, Iterable
+from typing import Dict, List, Set, Union, Tuple, Optional, Iterable, Iterator
 
 from siliconcompiler import utils
 
@@ -12,13 +13,17 @@ from siliconcompiler.schema_support.packageschema import PackageSchema
 from siliconcompiler.schema_support.pathschema import PathSchema
 from siliconcompiler.schema_support.dependencyschema import DependencySchema
 from siliconcompiler.schema import NamedSchema
-from siliconcompiler.schema import EditableSchema
+from siliconcompiler.schema import EditableSchema, Journal
 
 Alias = dict[
     Tuple[str, str],
     Tuple[Union[NamedSchema, str, None], Union[str, Tuple[str, ...], None]]
 ]
 
+# Resolved filesets of each design, see Design.get_fileset
+_FILESET_MEMO: "weakref.WeakKeyDictionary[Design, Tuple[int, Dict]]" = \
+    weakref.WeakKeyDictionary()
+
 
 ###########################################################################
 class Design(DependencySchema, PathSchema, NamedSchema):
@@ -833,31 +838,32 @@ class Design(DependencySchema, PathSchema, NamedSchema):
 
         return Design.__name__
 
-    def __get_fileset(self,
-                      filesets: Union[Iterable[str], str],
-                      alias: Alias,
-                      filelist: List[Tuple[str, str]],
-                      visited: Set[Tuple[str, Union[Tuple[str, ...], str]]],
-                      mapping: Dict[str, "Design"]) -> \
-            List[Tuple["Design", str]]:
+    def __walk_fileset(self,
+                       filesets: Union[Iterable[str], str],
+                       alias: Alias,
+                       filelist: List[Tuple[str, str]],
+                       visited: Set[Tuple[str, Union[Tuple[str, ...], str]]],
+                       mapping: Dict[str, "Design"]) -> \
+            Iterator[Tuple["Design", Union[Tuple[str, ...], str]]]:
         """
-        Private recursive method to compute the full list of (design, fileset)
-        tuples required for a given set of top-level filesets.
+        Private generator which visits a set of filesets of this design.
 
-        This method traverses the design's dependency graph.
+        Each dependency which has not been visited yet is yielded as a
+        (design, filesets) tuple and must be walked before this generator is
+        resumed, so a fileset is appended to ``filelist`` after all of its
+        dependencies. :meth:`__resolve_filesets` drives the walk with an
+        explicit stack, so the depth of the dependency tree is not bound by
+        the recursion limit.
 
         Args:
-            filesets (Union[Iterable[str], str]): List of top-level filesets to evaluate.
+            filesets (Union[Iterable[str], str]): List of filesets to visit.
             alias (Dict[Tuple[str, str], Tuple[Design, str]]): Map of aliased
                 (design, fileset) tuples to substitute during traversal.
-            visited (Set[Tuple[str, str]]): Internal list used to track
-                visited (design name, fileset) nodes during recursion.
-            mapping (Dict[str, Design]): Internal dictionary mapping design names to
-                design objects, used to resolve dependencies during recursion.
-
-        Returns:
-            List[Tuple[Design, str]]: A flattened, unique list of
-            (Design, fileset) tuples.
+            filelist (List[Tuple[str, str]]): Visited (design name, fileset)
+                tuples, in dependency order.
+            visited (Set[Tuple[str, str]]): Visited (design name, fileset) tuples.
+            mapping (Dict[str, Design]): Dictionary mapping design names to
+                design objects.
         """
         if self.name is None:
             raise ValueError("Design name must be set before resolving filesets.")
@@ -900,20 +906,48 @@ class Design(DependencySchema, PathSchema, NamedSchema):
 
                 dep_key = (dep_obj.name, depfileset)
                 if dep_key not in visited:
-                    dep_obj.__get_fileset(depfileset, alias, filelist, visited, mapping)
+                    yield dep_obj, depfileset
 
             filelist.append(key)
 
-        # Cleanup
-        final_map = []
+    def __resolve_filesets(self,
+                           filesets: Union[Iterable[str], str],
+                           alias: Alias) -> List[Tuple["Design", str]]:
+        """
+        Private method to compute the full list of (design, fileset)
+        tuples required for a given set of top-level filesets.
+
+        The dependency graph is walked depth first, see :meth:`__walk_fileset`,
+        so each fileset follows the filesets it depends on.
+
+        Args:
+            filesets (Union[Iterable[str], str]): List of top-level filesets to evaluate.
+            alias (Dict[Tuple[str, str], Tuple[Design, str]]): Map of aliased
+                (design, fileset) tuples to substitute during traversal.
+
+        Returns:
+            List[Tuple[Design, str]]: A flattened, unique list of
+            (Design, fileset) tuples.
+        """
+        filelist: List[Tuple[str, str]] = []
+        visited: Set[Tuple[str, Union[Tuple[str, ...], str]]] = set()
+        mapping: Dict[str, "Design"] = {}
+
+        stack = [self.__walk_fileset(filesets, alias, filelist, visited, mapping)]
+        while stack:
+            try:
+                dep_obj, depfileset = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            stack.append(dep_obj.__walk_fileset(depfileset, alias, filelist, visited, mapping))
+
+        final_map: Dict[Tuple[str, str], Tuple["Design", str]] = {}
         for libname, fileset in filelist:
             if libname not in mapping:
                 raise LookupError(f"{libname} not found in mapping")
-            lib = mapping[libname]
-            cmap = (lib, fileset)
-            if cmap not in final_map:
-                final_map.append(cmap)
-        return final_map
+            final_map.setdefault((libname, fileset), (mapping[libname], fileset))
+        return list(final_map.values())
 
     def get_fileset(self,
                     filesets: Union[List[str], str],
@@ -927,6 +961,9 @@ class Design(DependencySchema, PathSchema, NamedSchema):
         `depfileset` entries, returning a flattened and unique list of all
         required sources.
 
+        The result is cached until any schema changes, see
+        :meth:`Journal.revision() <siliconcompiler.schema.Journal.revision>`.
+
         Args:
             filesets (Union[List[str], str]): A single fileset name or a list of
                 fileset names to evaluate.
@@ -943,7 +980,32 @@ class Design(DependencySchema, PathSchema, NamedSchema):
         if alias is None:
             alias = {}
 
-        return self.__get_fileset(filesets, alias, [], set(), {})
+        revision = Journal.revision()
+        try:
+            memo_key = (
+                filesets if isinstance(filesets, str) else tuple(filesets),
+                frozenset((key, id(dep_obj), depfileset)
+                          for key, (dep_obj, depfileset) in alias.items()))
+            hash(memo_key)
+            filesets = memo_key[0]
+        except (TypeError, ValueError):
+            # Not hashable, so resolve without the cache
+            return self.__resolve_filesets(filesets, alias)
+
+        memo = _FILESET_MEMO.get(self)
+        if memo is not None and memo[0] == revision and memo_key in memo[1]:
+            resolved = [(design(), fileset) for design, fileset in memo[1][memo_key]]
+            if all(design is not None for design, _ in resolved):
+                return resolved
+
+        resolved = self.__resolve_filesets(filesets, alias)
+
+        if memo is None or memo[0] != revision:
+            memo = (revision, {})
+            _FILESET_MEMO[self] = memo
+        # Weak references, so the cache does not keep designs alive
+        memo[1][memo_key] = tuple((weakref.ref(design), fileset) for design, fileset in resolved)
+        return resolved
 
     def _generate_doc(self, doc,
                       ref_root: str = "",
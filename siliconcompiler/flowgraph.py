@@ -1,17 +1,17 @@
-import graphviz
 import importlib
 import inspect
 import logging
 
 import os.path
 
-from typing import Callable, Tuple, Union, Optional, List, Type, Set, Dict, TYPE_CHECKING
+from typing import Callable, Iterable, Tuple, Union, Optional, List, Type, Set, Dict, TYPE_CHECKING
 
 from siliconcompiler.schema import BaseSchema, NamedSchema, DocsSchema, LazyLoad
 from siliconcompiler.schema import EditableSchema, Parameter, Scope
 from siliconcompiler.schema.utils import trim
 
 from siliconcompiler import NodeStatus
+from siliconcompiler.utils.graph import DirectedGraph
 
 if TYPE_CHECKING:
     from siliconcompiler import Task
@@ -55,14 +55,25 @@ class Flowgraph(NamedSchema, DocsSchema):
         '''
 
         self.__cache_nodes = None
+        self.__cache_nodes_set = None
+        self.__clear_edge_cache()
+
+        self.__cache_tasks = None
+
+    def __clear_edge_cache(self) -> None:
+        '''
+        Clears the internal cache for memoized properties of the edges.
+
+        This should be called when only the edges of the graph are modified,
+        so the nodes do not need to be recomputed.
+        '''
+
         self.__cache_nodes_entry = None
         self.__cache_nodes_exit = None
         self.__cache_execution_order_forward = None
         self.__cache_execution_order_reverse = None
 
-        self.__cache_node_outputs = None
-
-        self.__cache_tasks = None
+        self.__cache_graph = None
 
     def _set_callback(self, callback: Optional[Callable[["Flowgraph", "Task"], None]]) -> None:
         """Registers a callback function to be executed when a node is added."""
@@ -172,7 +183,13 @@ class Flowgraph(NamedSchema, DocsSchema):
         graph_node.set('task', task.task())
         graph_node.set('taskmodule', task_module)
 
+        # Keep the set of nodes, so adding edges while the flow is built does
+        # not collect the nodes again after every new node
+        nodes_set = self.__cache_nodes_set
         self.__clear_cache()
+        if nodes_set is not None:
+            nodes_set.add((step, index))
+            self.__cache_nodes_set = nodes_set
         if self.__callback:
             self.__callback(self, task)
 
@@ -226,7 +243,7 @@ class Flowgraph(NamedSchema, DocsSchema):
 
         head_node.add('input', tail_node)
 
-        self.__clear_cache()
+        self.__clear_edge_cache()
 
     def _rewire_inputs(self, transform) -> None:
         '''
@@ -492,9 +509,18 @@ class Flowgraph(NamedSchema, DocsSchema):
                 nodes.append((step, index))
 
         self.__cache_nodes = tuple(sorted(set(nodes)))
+        self.__cache_nodes_set = set(self.__cache_nodes)
 
         return self.__cache_nodes
 
+    def __is_node(self, step: str, index: str) -> bool:
+        '''
+        Returns true if the (step, index) is a node in this flowgraph.
+        '''
+        if self.__cache_nodes_set is None:
+            self.get_nodes()
+        return (step, index) in self.__cache_nodes_set
+
     def get_entry_nodes(self) -> Tuple[Tuple[str, str], ...]:
         '''
         Collects all nodes that are entry points to the flowgraph.
@@ -534,12 +560,10 @@ class Flowgraph(NamedSchema, DocsSchema):
         if self.__cache_nodes_exit is not None:
             return self.__cache_nodes_exit
 
-        inputnodes = []
-        for step, index in self.get_nodes():
-            inputnodes.extend(self.get_graph_node(step, index).get_input())
+        graph = self._get_graph()
         nodes = []
         for step, index in self.get_nodes():
-            if (step, index) not in inputnodes:
+            if not graph.get_outputs((step, index)):
                 nodes.append((step, index))
 
         self.__cache_nodes_exit = tuple(sorted(set(nodes)))
@@ -575,62 +599,7 @@ class Flowgraph(NamedSchema, DocsSchema):
             if self.__cache_execution_order_forward is not None:
                 return self.__cache_execution_order_forward
 
-        # Generate execution edges lookup map
-        ex_map = {}
-        for step, index in self.get_nodes():
-            for istep, iindex in self.get_graph_node(step, index).get_input():
-                if reverse:
-                    ex_map.setdefault((step, index), set()).add((istep, iindex))
-                else:
-                    ex_map.setdefault((istep, iindex), set()).add((step, index))
-
-        rev_ex_map = {}
-        for node, edges in ex_map.items():
-            for step, index in edges:
-                rev_ex_map.setdefault((step, index), set()).add(node)
-
-        # Collect execution order of nodes
-        if reverse:
-            order = [set(self.get_exit_nodes())]
-        else:
-            order = [set(self.get_entry_nodes())]
-
-        visited = set()
-        while True:
-            next_level = set()
-            next_visited = set()
-            for step, index in sorted(order[-1]):
-                if (step, index) not in rev_ex_map:
-                    # No edges so assume inputs are okay
-                    inputs_valid = True
-                else:
-                    inputs_valid = all([node in visited for node in rev_ex_map[(step, index)]])
-
-                if inputs_valid:
-                    next_visited.add((step, index))
-                    if (step, index) in ex_map:
-                        next_level.update(ex_map.pop((step, index)))
-                else:
-                    next_level.add((step, index))
-
-            visited.update(next_visited)
-
-            if not next_level:
-                break
-
-            order.append(next_level)
-
-        # Filter duplicates from flow
-        used_nodes = set()
-        exec_order = []
-        order.reverse()
-        for n, level_nodes in enumerate(order):
-            exec_order.append(list(level_nodes.difference(used_nodes)))
-            used_nodes.update(level_nodes)
-
-        exec_order.reverse()
-
-        ordering = tuple([tuple(sorted(level)) for level in exec_order])
+        ordering = tuple(self._get_graph().get_levels(reverse=reverse))
 
         if reverse:
             self.__cache_execution_order_reverse = ordering
@@ -660,66 +629,31 @@ class Flowgraph(NamedSchema, DocsSchema):
 
         index = str(index)
 
-        if (step, index) not in self.get_nodes():
+        if not self.__is_node(step, index):
             raise ValueError(f"{step}/{index} is not a valid node")
 
-        if self.__cache_node_outputs is not None:
-            return self.__cache_node_outputs[(step, index)]
+        return self._get_graph().get_outputs((step, index))
 
-        self.__cache_node_outputs = {}
-
-        input_map = {}
-        for istep, iindex in self.get_nodes():
-            input_map[(istep, iindex)] = self.get_graph_node(istep, iindex).get_input()
-            self.__cache_node_outputs[(istep, iindex)] = set()
-
-        for src_node, dst_nodes in input_map.items():
-            for dst_node in dst_nodes:
-                if dst_node not in self.__cache_node_outputs:
-                    self.__cache_node_outputs[dst_node] = set()
-                self.__cache_node_outputs[dst_node].add(src_node)
-
-        # Convert sets to sorted tuples for consistent output
-        self.__cache_node_outputs = {
-            node: tuple(sorted(outputs)) for node, outputs in self.__cache_node_outputs.items()
-        }
-
-        return self.__cache_node_outputs[(step, index)]
-
-    def __find_loops(self, step: str, index: str, path: Optional[List[Tuple[str, str]]] = None) \
-            -> Union[List[Tuple[str, str]], None]:
+    def _get_graph(self) -> DirectedGraph:
         '''
-        Internal helper to search for loops in the graph via depth-first search.
+        Returns the graph of the nodes and edges of this flowgraph.
 
-        This method is used by `validate()`.
-
-        Args:
-            step (str): Step name to start/continue from.
-            index (str): Index name to start/continue from.
-            path (list, optional): The current path (nodes in recursion stack).
-                Defaults to None.
-            visited (set, optional): All nodes visited so far (to avoid
-                re-checking branches). Defaults to None.
+        The result is memoized.
 
         Returns:
-            list[tuple(str,str)]: A list of nodes forming a loop, or
-            None if no loop is found from this path.
+            :class:`DirectedGraph`: graph of the (step, index) nodes.
         '''
-        if path is None:
-            path = []
-
-        if (step, index) in path:
-            path.append((step, index))
-            return path
+        if self.__cache_graph is not None:
+            return self.__cache_graph
 
-        path.append((step, index))
+        # Edges from undefined nodes are reported by validate
+        self.__cache_graph = DirectedGraph({
+            (step, index): [node for node in self.get_graph_node(step, index).get_input()
+                            if self.__is_node(*node)]
+            for step, index in self.get_nodes()
+        })
 
-        for ostep, oindex in self.get_node_outputs(step, index):
-            loop_path = self.__find_loops(ostep, oindex, path=path.copy())
-            if loop_path:
-                return loop_path
-
-        return None
+        return self.__cache_graph
 
     def validate(self, logger: Optional[logging.Logger] = None) -> bool:
         '''
@@ -772,11 +706,24 @@ class Flowgraph(NamedSchema, DocsSchema):
                     error = True
 
         # Detect loops
-        for start_step, start_index in self.get_entry_nodes():
-            loop_path = self.__find_loops(start_step, start_index)
-            if loop_path:
-                error = True
-                if logger:
+        graph = self._get_graph()
+        loops = graph.get_loops()
+        if loops:
+            error = True
+
+            loop_paths = []
+            acyclic = set()
+            for node in self.get_entry_nodes():
+                loop_path = graph.find_loop(node, acyclic)
+                if loop_path:
+                    loop_paths.append(loop_path)
+            # Loops which cannot be reached from an entry node
+            for loop in loops:
+                if not any(node in loop_path for loop_path in loop_paths for node in loop):
+                    loop_paths.append(graph.find_loop(loop[0]))
+
+            if logger:
+                for loop_path in loop_paths:
                     loop_path_str = [f"{step}/{index}" for step, index in loop_path]
                     logger.error(f"Loop detected in {self.name}: {' -> '.join(loop_path_str)}")
 
@@ -831,7 +778,7 @@ class Flowgraph(NamedSchema, DocsSchema):
             ValueError: If the node is not valid.
         """
         index = str(index)
-        if (step, index) not in self.get_nodes():
+        if not self.__is_node(step, index):
             raise ValueError(f"{step}/{index} is not a valid node in {self.name}.")
         return self.__get_task_module(self.get_graph_node(step, index).get_taskmodule())
 
@@ -1026,6 +973,8 @@ class Flowgraph(NamedSchema, DocsSchema):
         elif not has_io:
             show_io = False
 
+        import graphviz
+
         dot = graphviz.Digraph(format=fileformat)
         dot.graph_attr['rankdir'] = rankdir
         dot.attr(bgcolor=background)
@@ -1153,7 +1102,7 @@ class Flowgraph(NamedSchema, DocsSchema):
             index = "0"
         index = str(index)
 
-        if (step, index) not in self.get_nodes():
+        if not self.__is_node(step, index):
             raise ValueError(f"{step}/{index} is not a valid node in {self.name}.")
 
         return self.get(step, index, field="schema")
@@ -1311,50 +1260,32 @@ class RuntimeFlowgraph:
 
         self.__compute_graph()
 
-    def __walk_graph(self, node: Tuple[str, str],
-                     path: Optional[List[Tuple[str, str]]] = None,
-                     reverse: Optional[bool] = True) -> Set[Tuple[Tuple[str, str], ...]]:
+    def __walk_graph(self, nodes: Iterable[Tuple[str, str]],
+                     reverse: Optional[bool] = True) -> Set[Tuple[str, str]]:
         '''
-        Internal helper to recursively walk the graph to find all connected nodes.
+        Internal helper to find all nodes on a path between the runtime
+        boundaries and the given nodes.
 
         This walk respects the runtime boundaries (`-from`, `-to`, `-prune`).
+        Each set of reachable nodes is computed once, so the walk is linear in
+        the size of the graph instead of in the number of paths.
 
         Args:
-            node (tuple(str,str)): The node to start the walk from.
-            path (list, optional): The path taken so far, used for cycle
-                detection. Defaults to None.
-            reverse (bool, optional): If True, walks backwards along inputs.
-                If False, walks forwards along outputs. Defaults to True.
+            nodes (list[tuple(str,str)]): The nodes to start the walk from.
+            reverse (bool, optional): If True, walks backwards along inputs
+                to the `-from` nodes. If False, walks forwards along outputs
+                to the `-to` nodes. Defaults to True.
 
         Returns:
-            set[tuple(str,str)]: The set of nodes visited during the walk.
+            set[tuple(str,str)]: The set of nodes on a path between the
+            given nodes and the boundary.
         '''
-        if node in self.__prune:
-            return set()
-
-        if path is None:
-            path = []
-
-        if node in path:
-            return set(path)
+        graph = self.__base._get_graph()
 
-        # Build a fresh path for each branch so siblings don't pollute each other.
-        path = [*path, node]
-        if reverse:
-            if node in self.__from:
-                return set(path)
-        else:
-            if node in self.__to:
-                return set(path)
-
-        nodes = set()
-        if reverse:
-            for input_node in self.__base.get(*node, "input"):
-                nodes.update(self.__walk_graph(input_node, path=path, reverse=reverse))
-        else:
-            for output_node in self.__base.get_node_outputs(*node):
-                nodes.update(self.__walk_graph(output_node, path=path, reverse=reverse))
-        return nodes
+        boundary = self.__from if reverse else self.__to
+        walked = graph.reachable(nodes, reverse=reverse, stop=boundary, exclude=self.__prune)
+        connected = graph.reachable(boundary, reverse=not reverse, exclude=self.__prune)
+        return walked.intersection(connected)
 
     def __compute_graph(self) -> None:
         '''
@@ -1363,33 +1294,28 @@ class RuntimeFlowgraph:
         This method determines the final set of nodes, entry/exit points, and
         the execution order based on the runtime constraints.
         '''
-        self.__nodes = set()
-        for exitnode in self.__to:
-            path = self.__walk_graph(exitnode)
-            if any(node in self.__from for node in path):
-                # Reject paths that dont connect to any from nodes
-                self.__nodes.update(path)
-        self.__nodes = tuple(sorted(self.__nodes))
+        graph = self.__base._get_graph()
+
+        self.__nodes = tuple(sorted(self.__walk_graph(self.__to)))
+        nodes = set(self.__nodes)
 
         # Update to and from to only include nodes that in the final graph
-        self.__from = tuple([node for node in self.__from if node in self.__nodes])
-        self.__to = tuple([node for node in self.__to if node in self.__nodes])
+        self.__from = tuple([node for node in self.__from if node in nodes])
+        self.__to = tuple([node for node in self.__to if node in nodes])
 
         # Update to and from to those at the start or end
         self.__from = tuple([
             node for node in self.__from
-            if not self.__base.get(*node, "input") or
-            all([in_node not in self.__nodes for in_node in self.__base.get(*node, "input")])
+            if all([in_node not in nodes for in_node in graph.get_inputs(node)])
         ])
         self.__to = tuple([
             node for node in self.__to
-            if not self.__base.get_node_outputs(*node) or
-            all([out_node not in self.__nodes for out_node in self.__base.get_node_outputs(*node)])
+            if all([out_node not in nodes for out_node in graph.get_outputs(node)])
         ])
 
         ordering = []
         for level_nodes in self.__base.get_execution_order():
-            level_exec = [node for node in level_nodes if node in self.__nodes]
+            level_exec = [node for node in level_nodes if node in nodes]
             if level_exec:
                 ordering.append(tuple(level_exec))
         self.__execution_order = tuple(ordering)
@@ -1452,7 +1378,7 @@ class RuntimeFlowgraph:
         if (step, index) not in self.get_nodes():
             raise ValueError(f"{step}/{index} is not a valid node")
 
-        return tuple(sorted(self.__walk_graph((step, str(index)), reverse=False)))
+        return tuple(sorted(self.__walk_graph([(step, index)], reverse=False)))
 
     def get_node_inputs(self, step: str, index: str, record: Optional["RecordSchema"] = None) \
             -> List[Tuple[str, str]]:
@@ -1626,11 +1552,9 @@ class RuntimeFlowgraph:
                 found_any = False
                 from_nodes = set([node for node in flow.get_nodes() if node[0] in from_steps])
                 to_nodes = set([node for node in flow.get_nodes() if node[0] in to_steps])
+                connected = runtime.__walk_graph(to_nodes)
                 for entrynode in from_nodes:
-                    found = False
-                    for exitnode in to_nodes:
-                        if entrynode in runtime.__walk_graph(exitnode):
-                            found = True
+                    found = entrynode in connected
                     if not found:
                         exits = ",".join([f"{step}/{index}" for step, index in to_nodes])
                         missing.append(f'no path from {entrynode[0]}/{entrynode[1]} to {exits} '
@@ -4,6 +4,8 @@ This module provides a generic HTTP/HTTPS resolver for SiliconCompiler packages.
 It defines the `HTTPResolver` class, which is responsible for downloading
 and unpacking archives (TAR or ZIP) from a given URL.
 """
+import hashlib
+import json
 import requests
 import shutil
 import tarfile
@@ -11,10 +13,10 @@ import zipfile
 
 import os.path
 
-from typing import Callable, Dict, IO, List, Tuple, Type
+from typing import Callable, Dict, IO, List, Optional, Tuple, Type
 
-from io import BytesIO
-from urllib.parse import urlparse
+from pathlib import Path
+from urllib.parse import urldefrag, urlparse
 
 from siliconcompiler.package import RemoteResolver
 from siliconcompiler.package.cache import DataSourceUnavailableError, PermanentResolutionError
@@ -48,6 +50,11 @@ _TERMINAL_STATUSES = (400, 404, 405, 410, 414, 451)
 _ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tar.zst",
                      ".tgz", ".tbz2", ".txz", ".tzst", ".zip")
 
+#: Size of the pieces a download is written to disk in. Large enough that the
+#: per-chunk overhead vanishes, small enough that memory use stays flat however
+#: large the archive is.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _extract_tar(fileobj: IO[bytes], path: str, mode: str) -> None:
     """Extracts a tar archive, applying the PEP 706 extraction filter."""
@@ -73,6 +80,31 @@ def _extract_zip(fileobj: IO[bytes], path: str) -> None:
         zip_ref.extractall(path=path)
 
 
+def _detect_format(header: bytes) -> Optional[str]:
+    """Names the archive format a download's first bytes announce.
+
+    Args:
+        header (bytes): The start of the download; eight bytes cover every magic
+            number checked here.
+
+    Returns:
+        str: The name used by :func:`_archive_formats`, or None if no magic number
+            matches. A zip may legally carry a prefix ahead of its first entry, so
+            None rules nothing out.
+    """
+    if header.startswith(b"\x1f\x8b"):
+        return "gzip tar"
+    if header.startswith(b"BZh"):
+        return "bzip2 tar"
+    if header.startswith(b"\xfd7zXZ\x00"):
+        return "xz tar"
+    if is_zstd(header):
+        return "zstd tar"
+    if header.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+        return "zip"
+    return None
+
+
 def _archive_formats() -> List[Tuple[str, Callable[[IO[bytes], str], None]]]:
     """The archive formats an HTTP download may arrive in, in the order tried.
 
@@ -104,6 +136,10 @@ def _archive_formats() -> List[Tuple[str, Callable[[IO[bytes], str], None]]]:
 def _extract_archive(fileobj: IO[bytes], path: str, data_url: str) -> str:
     """Unpacks a downloaded archive, identifying its format by trial.
 
+    The format its magic number announces (see :func:`_detect_format`) is tried
+    first, so a well-formed archive is read once; the others follow in case the
+    header was misleading.
+
     Args:
         fileobj (IO[bytes]): The downloaded archive, open and seekable.
         path (str): The directory to extract into.
@@ -121,7 +157,11 @@ def _extract_archive(fileobj: IO[bytes], path: str, data_url: str) -> str:
         TypeError: If the archive is in no format known here.
         tarfile.FilterError: If the extraction filter refuses a member.
     """
-    for name, extract in _archive_formats():
+    fileobj.seek(0)
+    detected = _detect_format(fileobj.read(8))
+    formats = sorted(_archive_formats(), key=lambda fmt: fmt[0] != detected)
+
+    for name, extract in formats:
         fileobj.seek(0)
         try:
             extract(fileobj, path)
@@ -140,6 +180,30 @@ def _extract_archive(fileobj: IO[bytes], path: str, data_url: str) -> str:
                     "tar (gzip, bzip2, xz or zstd) or zip archive.")
 
 
+def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Reads the first byte and total length from a ``Content-Range`` header.
+
+    Args:
+        value (str): The header, such as ``bytes 100-199/200``.
+
+    Returns:
+        tuple: The first byte and the total length, each None where the header is
+            missing, malformed or, for the length, given as ``*``.
+    """
+    if not value or not value.startswith("bytes "):
+        return None, None
+
+    byte_range, _, total = value[6:].partition("/")
+    try:
+        start = int(byte_range.split("-")[0])
+    except ValueError:
+        return None, None
+    try:
+        return start, int(total)
+    except ValueError:
+        return start, None
+
+
 def get_resolver() -> Dict[str, Type["HTTPResolver"]]:
     """
     Returns a dictionary mapping HTTP schemes to the HTTPResolver class.
@@ -164,6 +228,11 @@ class HTTPResolver(RemoteResolver):
     it is a tarball (gzip, bzip2, xz or Zstandard compressed) or a zip file, and
     extracts it into the local cache. It also includes special handling to flatten
     the directory structure of archives downloaded from GitHub.
+
+    The archive is streamed to a file next to the cache rather than held in
+    memory, and an attempt that is cut off is resumed by the next one. A source
+    can pin the archive's contents with a ``#<algorithm>=<digest>`` fragment,
+    such as ``https://example.com/pdk.tar.gz#sha256=...``.
     """
 
     def check_cache(self) -> bool:
@@ -189,11 +258,192 @@ class HTTPResolver(RemoteResolver):
         Returns:
             str: The fully-formed URL to download from.
         """
-        data_url = self.source
+        data_url = urldefrag(self.source).url
         if data_url.endswith('/'):
             data_url = f"{data_url}{self.reference}.tar.gz"
         return data_url
 
+    @property
+    def checksum(self) -> Optional[Tuple[str, str]]:
+        """
+        The digest the downloaded archive must have, if the source names one.
+
+        The digest is given as a URL fragment, ``#<algorithm>=<hex digest>``,
+        which is never sent to the server. Any algorithm :mod:`hashlib`
+        guarantees is accepted.
+
+        Returns:
+            tuple: The algorithm and the lowercase hex digest, or None if the
+                source does not name one.
+
+        Raises:
+            PermanentResolutionError: If the fragment names an unknown algorithm,
+                which no retry can change.
+        """
+        fragment = urlparse(self.source).fragment
+        if "=" not in fragment:
+            return None
+
+        algorithm, digest = fragment.split("=", 1)
+        algorithm = algorithm.lower()
+        if algorithm not in hashlib.algorithms_guaranteed:
+            raise PermanentResolutionError(
+                f"Unsupported checksum algorithm for {self.display_name}: {algorithm}")
+        return algorithm, digest.lower()
+
+    @property
+    def download_file(self) -> Path:
+        """
+        The file the archive is downloaded into before it is unpacked.
+
+        It sits in the cache directory but outside :attr:`cache_path`, so what an
+        interrupted attempt fetched survives the cleanup after that attempt and
+        the next attempt resumes from there.
+        """
+        return self.cache_dir / f"{self.cache_name}.download"
+
+    @property
+    def __download_state_file(self) -> Path:
+        """The record of where :attr:`download_file` came from."""
+        return self.cache_dir / f"{self.cache_name}.download.json"
+
+    def __remove_download(self) -> None:
+        """Removes a download and its record."""
+        for path in (self.download_file, self.__download_state_file):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _download(self, data_url: str, headers: Dict[str, str]) -> None:
+        """
+        Streams the archive into :attr:`download_file`.
+
+        A partial download left by an earlier attempt is resumed with an HTTP
+        ``Range`` request. The ``ETag`` or ``Last-Modified`` value the server
+        first answered with is sent along as ``If-Range``, so a server whose
+        archive has changed since sends all of it again, and so does a server
+        that does not support ranges. Ranges count bytes of the body as sent, so
+        the archive is requested without a ``Content-Encoding`` and a download
+        that arrives encoded anyway is never resumed.
+
+        Args:
+            data_url (str): The URL to download from.
+            headers (dict): The headers to send with the request.
+
+        Raises:
+            FileNotFoundError: If the server refuses the download, see
+                :meth:`resolve_remote`.
+            IOError: If the transfer ends before the whole archive arrived. What
+                did arrive is kept for the next attempt.
+        """
+        state = {}
+        try:
+            with open(self.__download_state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        offset = 0
+        request_headers = dict(headers)
+        request_headers["Accept-Encoding"] = "identity"
+        if state.get("url") == data_url and state.get("validator") and \
+                os.path.exists(self.download_file):
+            offset = os.path.getsize(self.download_file)
+            if offset:
+                request_headers["Range"] = f"bytes={offset}-"
+                request_headers["If-Range"] = state["validator"]
+
+        response = requests.get(data_url, stream=True, headers=request_headers)
+        try:
+            encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+            start, total = None, None
+            if response.status_code == 206:
+                start, total = _parse_content_range(response.headers.get("Content-Range"))
+
+            if offset and (response.status_code == 416 or
+                           (response.status_code == 206 and (start != offset or encoded))):
+                # The partial download does not line up with the archive on the
+                # server, so start over without it.
+                response.close()
+                self.__remove_download()
+                return self._download(data_url, headers)
+
+            if not response.ok:
+                status = response.status_code
+                error = DataSourceUnavailableError if status in _TERMINAL_STATUSES \
+                    else FileNotFoundError
+                raise error(f'Failed to download {self.display_name} data source from '
+                            f'{data_url}. Status code: {status}')
+
+            if response.status_code == 206:
+                mode = "ab"
+                self.logger.info(f'Resuming download of {self.display_name} data at '
+                                 f'{offset} bytes')
+            else:
+                mode = "wb"
+                if encoded:
+                    # The body is decoded as it is read, so its length is not the
+                    # one the server announced.
+                    total = None
+                else:
+                    try:
+                        total = int(response.headers.get("Content-Length"))
+                    except (TypeError, ValueError):
+                        total = None
+
+            if encoded:
+                # The body is decoded as it is read, so the bytes on disk cannot
+                # be lined up with a range of the body on the server.
+                try:
+                    os.remove(self.__download_state_file)
+                except FileNotFoundError:
+                    pass
+            else:
+                with open(self.__download_state_file, "w", encoding="utf-8") as f:
+                    json.dump({
+                        "url": data_url,
+                        "validator": response.headers.get("ETag") or
+                        response.headers.get("Last-Modified")
+                    }, f)
+
+            with open(self.download_file, mode) as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        finally:
+            response.close()
+
+        size = os.path.getsize(self.download_file)
+        if total is not None and size != total:
+            raise IOError(f'Download of {self.display_name} data from {data_url} ended '
+                          f'after {size} of {total} bytes')
+
+    def __verify_checksum(self, data_url: str, checksum: Optional[Tuple[str, str]]) -> None:
+        """
+        Checks the download against the digest the source names, if any.
+
+        Args:
+            data_url (str): The URL the archive was downloaded from.
+            checksum (tuple): The algorithm and digest, see :attr:`checksum`.
+
+        Raises:
+            ValueError: If the digest does not match. The download is discarded,
+                so the next attempt fetches a fresh copy.
+        """
+        if not checksum:
+            return
+
+        algorithm, expected = checksum
+        digest = hashlib.new(algorithm)
+        with open(self.download_file, "rb") as f:
+            for chunk in iter(lambda: f.read(_DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        if digest.hexdigest() != expected:
+            raise ValueError(f'Checksum mismatch for {self.display_name} data from '
+                             f'{data_url}: expected {algorithm} {expected}, '
+                             f'got {digest.hexdigest()}')
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Constructs the HTTP headers for the download request.
@@ -227,9 +477,12 @@ class HTTPResolver(RemoteResolver):
                 :class:`~siliconcompiler.package.cache.DataSourceUnavailableError`
                 subclass, so the source is abandoned rather than re-requested;
                 every other status, including 401 and 403, stays retryable.
+            IOError: If the transfer ends early. The next attempt resumes it.
+            ValueError: If the archive does not match the :attr:`checksum`.
             TypeError: If what arrives is in no archive format known here.
             PermanentResolutionError: If it arrives in one this environment lacks
-                the bindings to unpack, which no retry can change.
+                the bindings to unpack, or the checksum names an unknown
+                algorithm, neither of which a retry can change.
         """
         data_url = self.download_url
 
@@ -252,20 +505,20 @@ class HTTPResolver(RemoteResolver):
 
         self.logger.info(f'Downloading {self.display_name} data from {data_url}')
 
-        response = requests.get(data_url, stream=True, headers=headers)
-        if not response.ok:
-            status = response.status_code
-            error = DataSourceUnavailableError if status in _TERMINAL_STATUSES \
-                else FileNotFoundError
-            raise error(f'Failed to download {self.display_name} data source from '
-                        f'{data_url}. Status code: {status}')
+        # Read first, since an unusable checksum makes the download pointless
+        checksum = self.checksum
 
-        os.makedirs(self.cache_path, exist_ok=True)
+        self._download(data_url, headers)
 
-        # Download content into an in-memory buffer
-        fileobj = BytesIO(response.content)
+        # The download is complete from here on, so it is not kept for a retry
+        try:
+            self.__verify_checksum(data_url, checksum)
 
-        archive_format = _extract_archive(fileobj, self.cache_path, data_url)
+            os.makedirs(self.cache_path, exist_ok=True)
+            with open(self.download_file, "rb") as fileobj:
+                archive_format = _extract_archive(fileobj, self.cache_path, data_url)
+        finally:
+            self.__remove_download()
         self.logger.debug(f'Unpacked {self.display_name} data as a {archive_format} archive')
 
         # --- GitHub-specific directory flattening ---
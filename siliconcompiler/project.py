@@ -24,8 +24,7 @@ from siliconcompiler.schema_support.cmdlineschema import CommandLineSchema
 from siliconcompiler.schema_support.dependencyschema import DependencySchema
 from siliconcompiler.schema_support.pathschema import PathSchemaBase
 
-from siliconcompiler.report.dashboard.cli import CliDashboard
-from siliconcompiler.scheduler import Scheduler, SCRuntimeError
+from siliconcompiler.scheduler import SCRuntimeError
 from siliconcompiler.utils.logging import get_stream_handler, SCHistoryLogHandler
 from siliconcompiler.utils import get_file_ext
 from siliconcompiler.utils.multiprocessing import MPManager
@@ -172,6 +171,7 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 pass
             self.__dashboard = None
         else:
+            from siliconcompiler.report.dashboard.cli import CliDashboard
             self.__dashboard = CliDashboard(self)
 
     def __init_option_callbacks(self):
@@ -598,6 +598,7 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 self.option.add_fileset(fileset, clobber=True)
 
         # Disable dashboard if breakpoints are set
+        from siliconcompiler.report.dashboard.cli import CliDashboard
         if self.__dashboard and self.__dashboard.is_running() and \
                 CliDashboard.should_disable(self):
             self.__dashboard.stop()
@@ -625,6 +626,7 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
             # Executes the flow, and returns a project object for the completed job.
         '''
         from siliconcompiler.remote import ClientScheduler
+        from siliconcompiler.scheduler import Scheduler
 
         # Start dashboard
         if self.__dashboard:
@@ -688,10 +690,9 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         if getattr(self, "_Project__skipreset", False):
             return
 
-        for key in self.allkeys():
+        for key, param in self.iter_params():
             if key[0] == "history":
                 continue
-            param = self.get(*key, field=None)
             if param.get(field="scope") != Scope.GLOBAL:
                 param.reset()
 
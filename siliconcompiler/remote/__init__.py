@@ -25,6 +25,7 @@ class JobStatus():
     Enum class to help ensure consistent status messages
     '''
 
+    QUEUED = "queued"
     RUNNING = "running"
 
     COMPLETED = "completed"
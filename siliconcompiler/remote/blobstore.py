@@ -0,0 +1,326 @@
+"""
+Content-addressed store of the files uploaded for remote runs.
+
+A client submitting a job describes the files of its job directory with a
+manifest, which maps the relative path of each file to its SHA-256 digest,
+see :func:`build_manifest`. The server answers with the digests missing from
+its store, the client uploads only those files, in chunks, and the server
+creates the job directory from the store, see :meth:`BlobStore.materialize`.
+Resubmitting a job after a small change only uploads the files which changed.
+
+The chunks of a file are written into a partial file in the staging
+directory, which :meth:`BlobStore.commit` checks against the digest before
+moving it into the store.
+
+Files are shared with the job directories through hardlinks, so a file in
+the store which has no other link is not used by any job.
+:meth:`BlobStore.collect` removes these, and abandoned uploads, once they
+have not been used for :data:`GRACE_PERIOD`.
+"""
+import collections
+import contextlib
+import hashlib
+import os
+import pathlib
+import re
+import stat
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Counter, Dict, Iterable, Iterator, List
+
+from siliconcompiler.schema.filehash import FileHashCache, digest_file
+from siliconcompiler.utils.transfer import COPY_STRATEGIES, LINK_STRATEGIES, transfer_file
+
+#: Name of the hashing algorithm of the digests
+ALGORITHM = "sha256"
+
+#: Largest chunk a file is uploaded in
+CHUNK_SIZE = 8 * 1024 * 1024
+
+#: Largest file which can be uploaded
+MAX_BLOB_SIZE = 1024 ** 4
+
+#: Seconds an unused file or an abandoned upload is kept for
+GRACE_PERIOD = 24 * 60 * 60
+
+# Number of threads used to hash the files of a manifest
+_MAX_WORKERS = 8
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_digest(digest: str) -> bool:
+    """
+    Checks if a string is a digest of the store.
+
+    Args:
+        digest (str): string to check.
+    """
+    return isinstance(digest, str) and _DIGEST_RE.match(digest) is not None
+
+
+def is_safe_path(relpath: str) -> bool:
+    """
+    Checks if a manifest path stays within the directory it is created in.
+
+    Args:
+        relpath (str): relative path, with ``/`` as the separator.
+    """
+    if not relpath or "\\" in relpath or os.path.isabs(relpath) or \
+            pathlib.PureWindowsPath(relpath).drive:
+        return False
+    return all(part not in ("", ".", "..") for part in relpath.split("/"))
+
+
+def build_manifest(directory: str) -> Dict[str, Dict]:
+    """
+    Describes the files in a directory.
+
+    Symbolic links to files are described as the files they point to, and
+    links to directories are not followed.
+
+    Args:
+        directory (path): directory to describe.
+
+    Returns:
+        dict: maps the path of each file, relative to the directory and with
+        ``/`` as the separator, to its ``digest``, ``size`` and permission
+        ``mode``.
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.isfile(path):
+                paths.append(path)
+    paths.sort()
+
+    cache = FileHashCache.default()
+
+    def describe(path: str) -> Dict:
+        info = os.stat(path)
+        return {
+            "digest": cache.hash_file(path, ALGORITHM, hashlib.sha256),
+            "size": info.st_size,
+            "mode": stat.S_IMODE(info.st_mode)
+        }
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        descriptions = executor.map(describe, paths)
+        return {pathlib.Path(os.path.relpath(path, directory)).as_posix(): description
+                for path, description in zip(paths, descriptions)}
+
+
+class BlobStore:
+    """
+    Store of files keyed by their digest.
+
+    Args:
+        root (path): directory holding the files of the store.
+        staging (path): directory holding the files being uploaded, which must
+            be on the same filesystem as the store.
+    """
+
+    def __init__(self, root: str, staging: str):
+        self.__root = root
+        self.__staging = staging
+
+    def path(self, digest: str) -> str:
+        """
+        Returns the path of a file in the store.
+
+        Args:
+            digest (str): digest of the file.
+        """
+        if not is_digest(digest):
+            raise ValueError(f"{digest} is not a valid digest")
+        return os.path.join(self.__root, digest[:2], digest)
+
+    def __partial(self, digest: str) -> str:
+        if not is_digest(digest):
+            raise ValueError(f"{digest} is not a valid digest")
+        return os.path.join(self.__staging, f"{digest}.part")
+
+    def has(self, digest: str) -> bool:
+        """
+        Checks if a file is in the store.
+
+        Args:
+            digest (str): digest of the file.
+        """
+        return os.path.isfile(self.path(digest))
+
+    def __refresh(self, digest: str) -> None:
+        # Restarts the grace period of a file no job uses, so it is not
+        # collected before the job it was checked for is created. Files which
+        # are linked are in use, and touching them would change the files of
+        # the jobs too.
+        path = self.path(digest)
+        with contextlib.suppress(FileNotFoundError):
+            if os.stat(path).st_nlink == 1:
+                os.utime(path)
+
+    def missing(self, digests: Iterable[str]) -> List[str]:
+        """
+        Returns the digests of the files which are not in the store.
+
+        The files which are in the store are kept for another grace period.
+
+        Args:
+            digests (list of str): digests of the files.
+        """
+        missing = []
+        for digest in set(digests):
+            if self.has(digest):
+                self.__refresh(digest)
+            else:
+                missing.append(digest)
+        return sorted(missing)
+
+    @contextlib.contextmanager
+    def write(self, digest: str, offset: int) -> Iterator[BinaryIO]:
+        """
+        Opens the partial file of an upload to write a chunk of it.
+
+        Chunks can be written in any order and concurrently, each with its own
+        call.
+
+        Args:
+            digest (str): digest of the file being uploaded.
+            offset (int): position of the chunk in the file.
+        """
+        partial = self.__partial(digest)
+        os.makedirs(self.__staging, exist_ok=True)
+        fd = os.open(partial, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        with os.fdopen(fd, "r+b") as f:
+            f.seek(offset)
+            yield f
+
+    def commit(self, digest: str) -> bool:
+        """
+        Moves an uploaded file into the store, if it matches its digest.
+
+        An upload which does not match, because it is incomplete or corrupted,
+        is removed so it can be sent again.
+
+        Args:
+            digest (str): digest of the file.
+
+        Returns:
+            bool: True if the file is in the store.
+        """
+        partial = self.__partial(digest)
+        if self.has(digest):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial)
+            self.__refresh(digest)
+            return True
+
+        try:
+            matches = digest_file(partial, hashlib.sha256) == digest
+        except FileNotFoundError:
+            # Not uploaded, or committed by a concurrent request
+            return self.has(digest)
+
+        if not matches:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial)
+            return False
+
+        os.makedirs(os.path.dirname(self.path(digest)), exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            os.replace(partial, self.path(digest))
+        self.__refresh(digest)
+        return self.has(digest)
+
+    def collect(self, grace: float = GRACE_PERIOD) -> int:
+        """
+        Removes the files which no job uses and the abandoned uploads.
+
+        A file is used while a job directory links to it. Files and uploads
+        are kept for a grace period after they were last written or checked
+        for, so the job they were uploaded for can still be created.
+
+        Args:
+            grace (float): seconds to keep files and uploads for.
+
+        Returns:
+            int: the number of bytes freed.
+        """
+        expired = time.time() - grace
+
+        candidates = []
+        with contextlib.suppress(FileNotFoundError):
+            for prefix in os.scandir(self.__root):
+                if not prefix.is_dir(follow_symlinks=False):
+                    continue
+                candidates.extend((entry.path, True) for entry in os.scandir(prefix.path)
+                                  if is_digest(entry.name))
+        with contextlib.suppress(FileNotFoundError):
+            candidates.extend((entry.path, False) for entry in os.scandir(self.__staging)
+                              if entry.name.endswith(".part") and is_digest(entry.name[:-5]))
+
+        freed = 0
+        for path, stored in candidates:
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if (stored and info.st_nlink > 1) or info.st_mtime >= expired:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                freed += info.st_size
+        return freed
+
+    def materialize(self, files: Dict[str, Dict], directory: str,
+                    shared: Iterable[str] = ()) -> Counter[str]:
+        """
+        Creates the files of a manifest from the store.
+
+        The files under the shared directories are hardlinked to the store,
+        unless they differ from it in being executable. These must only ever
+        be read, since writing to a hardlink changes the file in the store.
+        The other files, such as manifests which a job rewrites in place, are
+        copied.
+
+        Args:
+            files (dict): manifest of the files, see :func:`build_manifest`.
+            directory (path): directory to create the files in.
+            shared (list of str): relative paths of the shared directories.
+
+        Returns:
+            Counter: the number of files created with each transfer strategy.
+
+        Raises:
+            ValueError: if a path of the manifest is not within the directory.
+            FileNotFoundError: if a file is missing from the store.
+        """
+        shared = [f"{path.rstrip('/')}/" for path in shared]
+
+        used: Counter[str] = collections.Counter()
+        for relpath, info in files.items():
+            if not is_safe_path(relpath):
+                raise ValueError(f"{relpath} is not a valid path")
+
+            blob = self.path(info["digest"])
+            dst = os.path.join(directory, *relpath.split("/"))
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+
+            mode = info.get("mode")
+            if mode is not None:
+                mode &= 0o777
+
+            strategies = COPY_STRATEGIES
+            executable = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+            if any(relpath.startswith(path) for path in shared) and \
+                    (mode is None or os.stat(blob).st_mode & executable == mode & executable):
+                strategies = LINK_STRATEGIES
+
+            strategy = transfer_file(blob, dst, strategies)
+            used[strategy] += 1
+            if strategies is COPY_STRATEGIES and mode is not None:
+                os.chmod(dst, mode)
+
+        return used
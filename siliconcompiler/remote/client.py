@@ -1,5 +1,6 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
 
+import contextlib
 import json
 import multiprocessing
 import os
@@ -12,6 +13,8 @@ import tempfile
 import os.path
 import urllib.parse
 
+from concurrent.futures import ThreadPoolExecutor
+
 from siliconcompiler import utils
 from siliconcompiler import NodeStatus as SCNodeStatus
 
@@ -19,7 +22,7 @@ from siliconcompiler._metadata import default_server
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 from siliconcompiler.scheduler import Scheduler
 from siliconcompiler.scheduler.error import SCRuntimeError
-from siliconcompiler.schema import Journal, Parameter
+from siliconcompiler.schema import Journal
 from siliconcompiler.package import PythonPathResolver, FileResolver, KeyPathResolver
 
 from siliconcompiler.utils.logging import get_console_formatter
@@ -28,6 +31,8 @@ from siliconcompiler.utils.curation import collect
 from siliconcompiler.utils.paths import collectiondir, jobdir, workdir
 
 from siliconcompiler.remote import JobStatus, NodeStatus
+from siliconcompiler.remote import results
+from siliconcompiler.remote.blobstore import build_manifest
 
 # Step name to use while logging
 remote_step_name = 'remote'
@@ -65,6 +70,10 @@ class Client():
         # Client / server timeout
         self.__timeout = 10
         self.__max_timeouts = 10
+
+        # Uploads
+        self.__upload_workers = 4
+        self.__max_upload_attempts = 3
         self.__tos_str = '''Please review the SiliconCompiler cloud's terms of service:
 
 https://www.siliconcompiler.com/terms
@@ -74,6 +83,8 @@ which is contained in designs that you upload to the service. This public
 service, provided by SiliconCompiler, is not intended to process proprietary IP.
 '''
         # Runtime
+        self.__download_workers = 4
+        self.__download_chunk_size = 1024 * 1024
         self.__download_pool = None
         self.__check_interval = None
         self.__node_information = None
@@ -285,23 +296,7 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             }
 
         def success_action(resp):
-            json_response = json.loads(resp.text)
-
-            if json_response['status'] != JobStatus.RUNNING:
-                if json_response['status'] == JobStatus.REJECTED:
-                    self.__logger.error(f'Job was rejected: {json_response["message"]}')
-                elif json_response['status'] != JobStatus.UNKNOWN:
-                    self.__logger.info(f'Job status: {json_response["status"]}')
-            info = {
-                'busy': json_response['status'] == JobStatus.RUNNING,
-                'message': None
-            }
-
-            if isinstance(json_response['message'], str):
-                info['message'] = json_response['message']
-            else:
-                info['message'] = json.dumps(json_response['message'])
-            return info
+            return self.__job_status_info(json.loads(resp.text))
 
         info = self.__post(
             '/check_progress/',
@@ -316,6 +311,28 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             }
         return info
 
+    def __job_status_info(self, json_response):
+        '''
+        Helper method to turn the job status reported by the server into the
+        form _report_job_status() takes.
+        '''
+
+        if json_response['status'] != JobStatus.RUNNING:
+            if json_response['status'] == JobStatus.REJECTED:
+                self.__logger.error(f'Job was rejected: {json_response["message"]}')
+            elif json_response['status'] != JobStatus.UNKNOWN:
+                self.__logger.info(f'Job status: {json_response["status"]}')
+        info = {
+            'busy': json_response['status'] == JobStatus.RUNNING,
+            'message': None
+        }
+
+        if isinstance(json_response['message'], str):
+            info['message'] = json_response['message']
+        else:
+            info['message'] = json.dumps(json_response['message'])
+        return info
+
     def __log_node_status(self, status, nodes):
         '''
         Helper method to log truncated information about flowgraph nodes
@@ -545,21 +562,25 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
         remote_resume = not self.__project.option.get_clean() and \
             self.__project.get('record', 'remoteid')
-        # Only package and upload the entry steps if starting a new job.
-        if not remote_resume:
-            upload_file = tempfile.TemporaryFile(prefix='sc', suffix='remote.tar.gz')
-            with tarfile.open(fileobj=upload_file, mode='w:gz') as tar:
-                tar.add(jobdir(self.__project), arcname='')
-            # Flush file to ensure everything is written
-            upload_file.flush()
-
-            # We no longer need the collected files
-            shutil.rmtree(collectiondir(self.__project))
 
         if 'pre_upload' in remote_status:
             self.__logger.info(remote_status['pre_upload']['message'])
             time.sleep(remote_status['pre_upload']['delay'])
 
+        # Only package and upload the entry steps if starting a new job.
+        files = None
+        upload_file = None
+        if not remote_resume:
+            files = self.__job_files()
+            if not self.__upload_files(files):
+                # The server predates deduplicated uploads, so send everything.
+                files = None
+                upload_file = tempfile.TemporaryFile(prefix='sc', suffix='remote.tar.gz')
+                with tarfile.open(fileobj=upload_file, mode='w:gz') as tar:
+                    tar.add(jobdir(self.__project), arcname='')
+                # Flush file to ensure everything is written
+                upload_file.flush()
+
         # Make the actual request, streaming the bulk data as a multipart file.
         # Redirected POST requests are translated to GETs. This is actually
         # part of the HTTP spec, so we need to manually follow the trail.
@@ -568,15 +589,18 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             'params': self.__get_post_params(include_job_id=True)
         }
 
-        post_files = {'params': json.dumps(post_params)}
-        if not remote_resume:
-            upload_file.seek(0)
-            # On Windows, tempfile.TemporaryFile returns _TemporaryFileWrapper;
-            # requests' multipart encoder hits a bytes-typed code path that
-            # doesn't go through __getattr__. Hand it the raw underlying file.
-            post_files['import'] = getattr(upload_file, 'file', upload_file)
+        post_files = {}
 
         def post_action(url):
+            if files is not None:
+                post_params['params']['files'] = files
+            post_files['params'] = json.dumps(post_params)
+            if upload_file:
+                upload_file.seek(0)
+                # On Windows, tempfile.TemporaryFile returns _TemporaryFileWrapper;
+                # requests' multipart encoder hits a bytes-typed code path that
+                # doesn't go through __getattr__. Hand it the raw underlying file.
+                post_files['import'] = getattr(upload_file, 'file', upload_file)
             return requests.post(
                 url,
                 files=post_files,
@@ -585,9 +609,32 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         def success_action(resp):
             return resp.json()
 
-        resp = self.__post('/remote_run/', post_action, success_action)
+        def error_action(code, msg):
+            # Files can drop out of the server's store between being checked
+            # and the job starting, in which case they are uploaded again.
+            if code == 409 and files is not None:
+                return None
+            raise RuntimeError(f'Server responded with {code}: {msg}')
+
+        try:
+            resp = None
+            for _ in range(self.__max_upload_attempts):
+                resp = self.__post('/remote_run/', post_action, success_action,
+                                   error_action=error_action)
+                if resp is not None:
+                    break
+                files = self.__job_files()
+                self.__upload_files(files)
+            if resp is None:
+                raise RuntimeError('Server is missing files of the job after uploading them '
+                                   f'{self.__max_upload_attempts} times.')
+        finally:
+            if upload_file:
+                upload_file.close()
+
         if not remote_resume:
-            upload_file.close()
+            # We no longer need the collected files
+            shutil.rmtree(collectiondir(self.__project))
 
         if 'message' in resp and resp['message']:
             self.__logger.info(resp['message'])
@@ -599,38 +646,120 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
         self.__check_interval = remote_status['progress_interval']
 
+    def __job_files(self):
+        '''
+        Describe the files of the job directory to upload.
+        '''
+
+        files = build_manifest(jobdir(self.__project))
+        # The log of this run is written to while the files are uploaded, so
+        # it would never match its digest, and the server starts its own.
+        files.pop('job.log', None)
+        return files
+
+    def __upload_files(self, files):
+        '''
+        Upload the files of the job which the server does not have yet.
+
+        Returns False if the server does not support deduplicated uploads, in
+        which case nothing was uploaded.
+        '''
+
+        digests = sorted({info['digest'] for info in files.values()})
+
+        def post_action(url):
+            return requests.post(
+                url,
+                data=json.dumps({**self.__get_post_params(), 'digests': digests}),
+                timeout=self.__timeout)
+
+        def success_action(resp):
+            return resp.json()
+
+        def error_action(code, msg):
+            if code == 404:
+                return None
+            raise RuntimeError(f'Server responded with {code}: {msg}')
+
+        response = self.__post('/check_blobs/', post_action, success_action,
+                               error_action=error_action)
+        if response is None:
+            return False
+
+        paths = {}
+        for relpath, info in files.items():
+            paths.setdefault(info['digest'], (relpath, info['size']))
+
+        chunk_size = response['chunk_size']
+        chunks = []
+        for digest in response['missing']:
+            if digest not in paths:
+                continue
+            _, size = paths[digest]
+            # An empty file is still sent once, to create it on the server.
+            for offset in range(0, max(size, 1), chunk_size):
+                chunks.append((digest, offset))
+
+        upload_size = sum(paths[digest][1] for digest in set(response['missing'])
+                          if digest in paths)
+        self.__logger.info(f'Uploading {len(response["missing"])} of {len(paths)} files '
+                           f'({upload_size / 1024 / 1024:.1f} MiB)')
+
+        def upload_chunk(digest, offset):
+            relpath, _ = paths[digest]
+            with open(os.path.join(jobdir(self.__project), *relpath.split('/')), 'rb') as f:
+                f.seek(offset)
+                data = f.read(chunk_size)
+
+            params = {**self.__get_post_params(), 'digest': digest, 'offset': offset}
+
+            def post_action(url):
+                return requests.post(
+                    url,
+                    files={
+                        'params': json.dumps(params),
+                        'data': ('blob', data)
+                    },
+                    timeout=self.__timeout)
+
+            self.__post('/upload_blob/', post_action, lambda resp: None)
+
+        if chunks:
+            with ThreadPoolExecutor(max_workers=self.__upload_workers) as executor:
+                # list() to raise the first error of the uploads
+                list(executor.map(lambda chunk: upload_chunk(*chunk), chunks))
+
+        return True
+
     def __run_preprocess(self):
         '''
         Helper method to run a local import stage for remote jobs.
         '''
 
         # Ensure dataroots with python sources are copied
-        for key in self.__project.allkeys():
+        for key, param in self.__project.iter_params(kind="path"):
             if key[0] == "history":
                 continue
 
-            param: Parameter = self.__project.get(*key, field=None)
-
-            if param.is_path:
-                schema_obj = self.__project.get(*key[:-1], field="schema")
-                dataroot_objs = schema_obj._find_files_dataroot_resolvers(True)
+            schema_obj = self.__project.get(*key[:-1], field="schema")
+            dataroot_objs = schema_obj._find_files_dataroot_resolvers(True)
 
-                for value, step, index in param.getvalues():
-                    if not value:
+            for value, step, index in param.getvalues():
+                if not value:
+                    continue
+                dataroots = param.get(field='dataroot', step=step, index=index)
+                if not isinstance(dataroots, list):
+                    dataroots = [dataroots]
+                force_copy = False
+                for dataroot in dataroots:
+                    if not dataroot:
                         continue
-                    dataroots = param.get(field='dataroot', step=step, index=index)
-                    if not isinstance(dataroots, list):
-                        dataroots = [dataroots]
-                    force_copy = False
-                    for dataroot in dataroots:
-                        if not dataroot:
-                            continue
-                        dataroot_resolver = dataroot_objs.get(dataroot, None)
-                        if isinstance(dataroot_resolver,
-                                      (PythonPathResolver, FileResolver, KeyPathResolver)):
-                            force_copy = True
-                    if force_copy:
-                        self.__project.set(*key, True, field='copy', step=step, index=index)
+                    dataroot_resolver = dataroot_objs.get(dataroot, None)
+                    if isinstance(dataroot_resolver,
+                                  (PythonPathResolver, FileResolver, KeyPathResolver)):
+                        force_copy = True
+                if force_copy:
+                    self.__project.set(*key, True, field='copy', step=step, index=index)
 
         # Collect inputs into a collection directory only for remote runs, since
         # we need to send inputs up to the server.
@@ -671,11 +800,23 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             if node_info["imported"]:
                 continue
 
-            manifest = os.path.join(
-                workdir(self.__project, step=node_info["step"], index=node_info["index"]),
-                'outputs',
-                f'{self.__name}.pkg.json')
+            if node_info.get("journal") is not None:
+                # Sent by the server as the node ended, so there is no need
+                # to wait for its results
+                journal = Journal()
+                journal.from_dict(node_info["journal"])
+                journal.replay(self.__project)
+                node_info["imported"] = True
+                changed = True
+                continue
+
+            node_dir = workdir(self.__project, step=node_info["step"], index=node_info["index"])
+            manifest = os.path.join(node_dir, 'outputs', f'{self.__name}.pkg.json')
             if os.path.exists(manifest):
+                # Prefer the journal file, since it avoids loading the full manifest
+                journal = os.path.join(node_dir, f'{self.__name}.journal.jsonl')
+                if os.path.exists(journal):
+                    manifest = journal
                 try:
                     Journal.replay_file(self.__project, manifest)
                     node_info["imported"] = True
@@ -700,7 +841,7 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             get_console_formatter(self.__project, True, self.STEP_NAME, None))
         if not self.__download_pool:
             with forking():
-                self.__download_pool = multiprocessing.Pool()
+                self.__download_pool = multiprocessing.Pool(processes=self.__download_workers)
 
         if self.__check_interval is None:
             check_info = self.__check()
@@ -731,11 +872,33 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
     def __run_loop(self):
         self.__ensure_run_loop_information()
 
-        # Check the job's progress periodically until it finishes.
-        running = True
-
         starttimes = {}
+        if not self.__follow_progress(starttimes):
+            self.__poll_progress(starttimes)
+
+        # Done: try to fetch any node results which still haven't been retrieved.
+        self.__logger.info('Remote job completed! Retrieving final results...')
+        if not self.__setup_information_fetched:
+            self.__schedule_fetch_result(None)
+        for node, node_info in self.__node_information.items():
+            if not node_info["fetched"]:
+                self.__schedule_fetch_result(node)
+
+        self._finalize_loop()
+
+        # Un-set the 'remote' option to avoid from/to-based summary/show errors
+        self.__project.option.unset('remote')
+
+        if self.__dashboard:
+            self.__dashboard.update_manifest()
 
+    def __poll_progress(self, starttimes):
+        '''
+        Helper method to check the job's progress periodically until it
+        finishes.
+        '''
+
+        running = True
         while running:
             sleepremaining = self.__check_interval
             while any([nodeinfo["fetched"] and not nodeinfo["imported"]
@@ -753,42 +916,148 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             completed, new_starttimes, running = self._report_job_status(job_info)
 
             # preserve old starttimes
-            starttimes = {**starttimes, **new_starttimes}
+            starttimes.update(new_starttimes)
 
             if self.__dashboard:
                 # Update dashboard if active
                 self.__dashboard.update_manifest({"starttimes": starttimes})
 
-            if None in completed:
-                completed.remove(None)
-                if not self.__setup_information_fetched:
-                    self.__schedule_fetch_result(None)
+            self.__fetch_completed(completed)
 
-            nodes_to_fetch = []
-            for node in completed:
-                if not self.__node_information[node]["fetched"]:
-                    nodes_to_fetch.append(node)
+    def __follow_progress(self, starttimes):
+        '''
+        Helper method to follow the job's progress through the events the
+        server pushes, fetching the results of each node as soon as it ends.
 
-            if nodes_to_fetch:
-                self.__logger.info('  Fetching completed results:')
-                for node in nodes_to_fetch:
-                    self.__schedule_fetch_result(node)
+        Returns False if the server does not stream the progress, in which
+        case it needs to be polled.
+        '''
 
-        # Done: try to fetch any node results which still haven't been retrieved.
-        self.__logger.info('Remote job completed! Retrieving final results...')
-        if not self.__setup_information_fetched:
-            self.__schedule_fetch_result(None)
-        for node, node_info in self.__node_information.items():
-            if not node_info["fetched"]:
-                self.__schedule_fetch_result(node)
+        def post_action(url):
+            # The server sends a comment every check interval while the job
+            # is quiet, so a read which takes much longer is a lost connection.
+            return requests.post(
+                url,
+                data=json.dumps(self.__get_post_params(include_job_id=True, include_job_name=True)),
+                stream=True,
+                timeout=(self.__timeout, self.__timeout + 2 * self.__check_interval))
 
-        self._finalize_loop()
+        def success_action(resp):
+            return resp
 
-        # Un-set the 'remote' option to avoid from/to-based summary/show errors
-        self.__project.option.unset('remote')
+        def error_action(code, msg):
+            return None
 
-        if self.__dashboard:
-            self.__dashboard.update_manifest()
+        reconnects = 0
+        while reconnects <= self.__max_timeouts:
+            resp = self.__post('/progress_stream/', post_action, success_action,
+                               error_action=error_action)
+            if resp is None:
+                return False
+
+            try:
+                with resp:
+                    for event, data in self.__read_events(resp):
+                        reconnects = 0
+                        if self.__handle_event(event, data, starttimes):
+                            return True
+            except requests.RequestException as e:
+                self.__logger.debug(f'Progress stream failed: {e}')
+
+            # The stream is over, but the job is not. Everything which
+            # happened in between is in the status it starts with.
+            reconnects += 1
+            self.__logger.warning('Lost connection to the job progress, reconnecting')
+
+        return False
+
+    @staticmethod
+    def __read_events(resp):
+        '''
+        Helper method to parse a stream of server-sent events into
+        (event, data) pairs. Comments are yielded as (None, None).
+        '''
+
+        event = None
+        data = []
+        # Unbuffered, so each event is handled when it arrives
+        resp.encoding = 'utf-8'
+        for line in resp.iter_lines(chunk_size=None, decode_unicode=True):
+            if not line:
+                if data:
+                    yield event or 'message', json.loads('\n'.join(data))
+                event = None
+                data = []
+            elif line.startswith(':'):
+                yield None, None
+            elif line.startswith('event:'):
+                event = line[len('event:'):].strip()
+            elif line.startswith('data:'):
+                data.append(line[len('data:'):].lstrip())
+
+    def __handle_event(self, event, data, starttimes):
+        '''
+        Helper method to act on an event of the job progress.
+
+        Returns True once the job has finished.
+        '''
+
+        if event == 'status':
+            completed, new_starttimes, running = \
+                self._report_job_status(self.__job_status_info(data))
+            starttimes.update(new_starttimes)
+            self.__fetch_completed(completed)
+            if not running:
+                return True
+        elif event == 'job_end':
+            self.__logger.info(f'Job status: {data["status"]}')
+            return True
+        elif event in ('node_start', 'node_end'):
+            node = data['node']
+            if node is None:
+                # The job is set up
+                self.__fetch_completed([None])
+            elif node in self.__node_information:
+                node_info = self.__node_information[node]
+                self.__project.set('record', 'status', data['status'],
+                                   step=node_info["step"], index=node_info["index"])
+                self.__logger.info(f'  {data["status"].title()}: {node_info["print"]}')
+                if event == 'node_start':
+                    starttimes[(node_info["step"], node_info["index"])] = time.time()
+                elif not node_info["fetched"]:
+                    node_info["journal"] = data.get('journal')
+                    self.__schedule_fetch_result(node, log=False)
+
+        # Pick up the results downloaded in the meantime
+        self.__import_run_manifests(starttimes)
+
+        if event and self.__dashboard:
+            # Update dashboard if active
+            self.__dashboard.update_manifest({"starttimes": starttimes})
+
+        return False
+
+    def __fetch_completed(self, completed):
+        '''
+        Helper method to fetch the results of the completed nodes which have
+        not been fetched yet.
+        '''
+
+        completed = list(completed)
+        if None in completed:
+            completed.remove(None)
+            if not self.__setup_information_fetched:
+                self.__schedule_fetch_result(None)
+
+        nodes_to_fetch = []
+        for node in completed:
+            if not self.__node_information[node]["fetched"]:
+                nodes_to_fetch.append(node)
+
+        if nodes_to_fetch:
+            self.__logger.info('  Fetching completed results:')
+            for node in nodes_to_fetch:
+                self.__schedule_fetch_result(node)
 
     def _finalize_loop(self):
         if self.__download_pool:
@@ -798,10 +1067,11 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
         self.__import_run_manifests({})
 
-    def __schedule_fetch_result(self, node):
+    def __schedule_fetch_result(self, node, log=True):
         if node:
             self.__node_information[node]["fetched"] = True
-            self.__logger.info(f'    {self.__node_information[node]["print"]}')
+            if log:
+                self.__logger.info(f'    {self.__node_information[node]["print"]}')
         else:
             self.__setup_information_fetched = True
         self.__download_pool.apply_async(Client._fetch_result, (self, node),
@@ -818,65 +1088,124 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         job_hash = self.__project.get('record', 'remoteid')
         local_dir = self.__project.option.get_builddir()
 
-        # Set default results archive path if necessary, and fetch it.
-        with tempfile.TemporaryDirectory(prefix=f'sc_{job_hash}_', suffix=f'_{node}') as tmpdir:
-            results_path = os.path.join(tmpdir, 'result.tar.gz')
-
-            with open(results_path, 'wb') as rd:
-                # Fetch results archive.
-                def post_action(url):
-                    post_params = self.__get_post_params()
-                    if node:
-                        post_params['node'] = node
-                    return requests.post(
-                        url,
-                        data=json.dumps(post_params),
-                        stream=True,
-                        timeout=self.__timeout)
-
-                def success_action(resp):
-                    shutil.copyfileobj(resp.raw, rd)
-                    return 0
-
-                def error_action(code, msg):
-                    # Results are fetched in parallel, and a failure in one node
-                    # does not necessarily mean that the whole job failed.
-                    if node:
-                        self.__logger.warning(f'Could not fetch results for node: {node}')
-                    else:
-                        self.__logger.warning('Could not fetch results for final results.')
-                    return 404
+        # Kept in the build directory until it is extracted, so a download
+        # which is cut off resumes from where it stopped, even in a later run.
+        os.makedirs(local_dir, exist_ok=True)
+        results_path = os.path.join(local_dir, f'.{job_hash}_{node}.part')
+
+        # Note: the server should eventually delete the results as they age out (~8h),
+        # but this will give us a brief period to look at failed results.
+        if not self.__download_result(node, results_path):
+            return
+
+        # Archive contents: server-side build directory. Format:
+        # [job_hash]/[design]/[job_name]/[step]/[index]/...
+        # The job hash is stripped, so the results land in the local build directory.
+        try:
+            with open(results_path, 'rb') as rd:
+                found = results.extract_archive(rd, local_dir, job_hash)
+        except (tarfile.TarError, ModuleNotFoundError, *utils.zstd_errors()) as e:
+            self.__logger.error(f'Failed to extract data from {results_path}: {e}')
+            return
+        finally:
+            for path in (results_path, f'{results_path}.etag'):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+
+        if not found:
+            self.__logger.error(f'Empty file returned from remote for: {node}')
+
+    def __download_result(self, node, results_path):
+        '''
+        Helper method to download the results archive of a node, resuming
+        a previous download of it if it was cut off.
+        Returns True if the archive was downloaded.
+        '''
+        job_hash = self.__project.get('record', 'remoteid')
+        etag_path = f'{results_path}.etag'
+
+        def post_action(url):
+            post_params = self.__get_post_params()
+            if node:
+                post_params['node'] = node
+            post_params['compression'] = results.compressions()
+
+            headers = {}
+            if os.path.isfile(results_path) and os.path.isfile(etag_path):
+                with open(etag_path) as f:
+                    etag = f.read()
+                # Only resumed from the same archive, else the server
+                # answers 412 and the download starts over.
+                headers['Range'] = f'bytes={os.path.getsize(results_path)}-'
+                headers['If-Match'] = etag
+            return requests.post(
+                url,
+                data=json.dumps(post_params),
+                headers=headers,
+                stream=True,
+                timeout=self.__timeout)
+
+        def success_action(resp):
+            # Anything but a partial response is the whole archive.
+            if resp.status_code == 206:
+                mode = 'ab'
+                size = int(resp.headers['Content-Range'].rsplit('/', 1)[1])
+            else:
+                mode = 'wb'
+                size = int(resp.headers.get('Content-Length', -1))
+
+            if 'ETag' in resp.headers:
+                with open(etag_path, 'w') as f:
+                    f.write(resp.headers['ETag'])
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(etag_path)
+
+            with open(results_path, mode) as rd:
+                for chunk in resp.iter_content(chunk_size=self.__download_chunk_size):
+                    rd.write(chunk)
+            if size >= 0 and os.path.getsize(results_path) != size:
+                raise requests.exceptions.ChunkedEncodingError(
+                    'Results archive ended early')
+            return True
 
-                results_code = self.__post(
+        def error_action(code, msg):
+            if code in (412, 416):
+                # The archive changed since the download started
+                return None
+            # Results are fetched in parallel, and a failure in one node
+            # does not necessarily mean that the whole job failed.
+            if node:
+                self.__logger.warning(f'Could not fetch results for node: {node}')
+            else:
+                self.__logger.warning('Could not fetch results for final results.')
+            return False
+
+        interruptions = 0
+        while True:
+            try:
+                downloaded = self.__post(
                     f'/get_results/{job_hash}.tar.gz',
                     post_action,
                     success_action,
                     error_action=error_action
                 )
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                interruptions += 1
+                if interruptions > self.__max_timeouts:
+                    raise RuntimeError(f'Download of results for {node} failed: {e}')
+                self.__logger.warning(f'Download of results for {node} was interrupted, '
+                                      'resuming')
+                time.sleep(self.__timeout)
+                continue
 
-            # Note: the server should eventually delete the results as they age out (~8h),
-            # but this will give us a brief period to look at failed results.
-            if results_code:
-                return
-
-            # Unzip the results.
-            # Unauthenticated jobs get a gzip archive, authenticated jobs get nested archives.
-            # So we need to extract and delete those.
-            # Archive contents: server-side build directory. Format:
-            # [job_hash]/[design]/[job_name]/[step]/[index]/...
-            try:
-                with tarfile.open(results_path, 'r:gz') as tar:
-                    tar.extractall(path=tmpdir, **utils.tar_extract_kwargs())
-            except tarfile.TarError as e:
-                self.__logger.error(f'Failed to extract data from {results_path}: {e}')
-                return
-
-            work_dir = os.path.join(tmpdir, job_hash)
-            if os.path.exists(work_dir):
-                shutil.copytree(work_dir, local_dir, dirs_exist_ok=True)
-            else:
-                self.__logger.error(f'Empty file returned from remote for: {node}')
-                return
+            if downloaded is None:
+                for path in (results_path, etag_path):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)
+                continue
+            return downloaded
 
     def configure_server(self, server=None, username=None, password=None):
 
@@ -0,0 +1,170 @@
+"""
+Persistent record of the jobs of a remote server.
+
+The server keeps the jobs it is running in memory, and records each of them
+here as it is queued, started and ended, along with the progress of its
+nodes. A server which is restarted finds the jobs it had not finished in the
+store, and queues them again, see :meth:`JobStore.get_jobs`.
+
+The store is an SQLite database, so it needs no service of its own and lives
+with the jobs' data in the server's mount.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+from typing import Dict, List, Optional
+
+from siliconcompiler.remote import JobStatus
+
+
+class JobStore:
+    """
+    Store of the jobs of a server.
+
+    Each job is keyed by its name on the server, see :meth:`Server.job_name`,
+    and is recorded with the status it has in the store: ``queued`` until it
+    starts, ``running`` until it ends, then the status it ended with.
+
+    Args:
+        path (path): path to the database, which is created if it does not
+            exist.
+    """
+
+    def __init__(self, path: str):
+        # Shared by the event loop and the job threads, so access to the
+        # connection is serialized here.
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__db:
+            self.__db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "name TEXT PRIMARY KEY, "
+                "job_hash TEXT NOT NULL, "
+                "username TEXT, "
+                "status TEXT NOT NULL, "
+                "cores INTEGER NOT NULL DEFAULT 0, "
+                "memory INTEGER NOT NULL DEFAULT 0, "
+                "nodes TEXT NOT NULL DEFAULT '{}', "
+                "submitted REAL NOT NULL, "
+                "started REAL, "
+                "ended REAL)")
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        with self.__lock:
+            self.__db.close()
+
+    def __execute(self, sql: str, params=()) -> List[Dict]:
+        with self.__lock, self.__db:
+            cursor = self.__db.execute(sql, params)
+            if cursor.description is None:
+                return []
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def add(self, name: str, job_hash: str, username: Optional[str],
+            cores: int = 0, memory: int = 0) -> None:
+        """
+        Records a job as queued.
+
+        Args:
+            name (str): name of the job on the server.
+            job_hash (str): hash of the job.
+            username (str): user who submitted the job, if any.
+            cores (int): number of cores the job needs.
+            memory (int): memory the job needs, in bytes.
+        """
+        self.__execute(
+            "INSERT OR REPLACE INTO jobs "
+            "(name, job_hash, username, status, cores, memory, submitted) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, job_hash, username, JobStatus.QUEUED, cores, memory, time.time()))
+
+    def start(self, name: str) -> None:
+        """
+        Records that a job started running.
+
+        Args:
+            name (str): name of the job on the server.
+        """
+        self.__execute("UPDATE jobs SET status = ?, started = ? WHERE name = ?",
+                       (JobStatus.RUNNING, time.time(), name))
+
+    def requeue(self, name: str) -> None:
+        """
+        Records that a job needs to run again, because it was interrupted.
+
+        Args:
+            name (str): name of the job on the server.
+        """
+        self.__execute("UPDATE jobs SET status = ?, started = NULL WHERE name = ?",
+                       (JobStatus.QUEUED, name))
+
+    def end(self, name: str, status: str) -> None:
+        """
+        Records that a job ended.
+
+        Args:
+            name (str): name of the job on the server.
+            status (str): status the job ended with.
+        """
+        self.__execute("UPDATE jobs SET status = ?, ended = ? WHERE name = ?",
+                       (status, time.time(), name))
+
+    def set_nodes(self, name: str, nodes: Dict) -> None:
+        """
+        Records the progress of the nodes of a job.
+
+        Args:
+            name (str): name of the job on the server.
+            nodes (dict): progress of each node, keyed by node name, with the
+                setup of the job under None.
+        """
+        self.__execute("UPDATE jobs SET nodes = ? WHERE name = ?",
+                       (json.dumps(nodes), name))
+
+    def remove(self, name: str) -> None:
+        """
+        Removes a job from the store.
+
+        Args:
+            name (str): name of the job on the server.
+        """
+        self.__execute("DELETE FROM jobs WHERE name = ?", (name,))
+
+    def get_job(self, name: str) -> Optional[Dict]:
+        """
+        Returns the record of a job, or None if it is not in the store.
+
+        Args:
+            name (str): name of the job on the server.
+        """
+        jobs = self.__select("WHERE name = ?", (name,))
+        return jobs[0] if jobs else None
+
+    def get_jobs(self, *status: str) -> List[Dict]:
+        """
+        Returns the records of the jobs, in the order they were submitted.
+
+        Args:
+            status (str): statuses of the jobs to return, all jobs are
+                returned if none are given.
+        """
+        if not status:
+            return self.__select()
+        return self.__select(f"WHERE status IN ({', '.join('?' * len(status))})", status)
+
+    def __select(self, where: str = "", params=()) -> List[Dict]:
+        jobs = self.__execute(
+            "SELECT name, job_hash, username, status, cores, memory, nodes, "
+            f"submitted, started, ended FROM jobs {where} ORDER BY submitted, rowid",
+            params)
+        for job in jobs:
+            # JSON turns the None key of the job's setup into "null"
+            job["nodes"] = {None if node == "null" else node: info
+                            for node, info in json.loads(job["nodes"]).items()}
+        return jobs
@@ -0,0 +1,194 @@
+"""
+Archives of the results of the nodes of remote jobs.
+
+The server archives the results of each node once, as the node ends, see
+:func:`write_archive`. The archive is compressed with Zstandard where the
+bindings for it are available, using several threads, and with gzip
+otherwise; a client which cannot read the stored archive is sent a copy in a
+compression it can read, made the first time it is asked for.
+
+Each file in an archive records its SHA-256 digest in a PAX header, so a client
+extracting the archive over the results it already has leaves the files which
+did not change untouched, see :func:`extract_archive`.
+"""
+import contextlib
+import hashlib
+import os
+import tarfile
+import tempfile
+
+from typing import IO, Iterator, List, Optional
+
+from siliconcompiler.remote.blobstore import ALGORITHM
+from siliconcompiler.schema.filehash import FileHashCache, digest_file
+from siliconcompiler.utils import is_zstd, open_zstd_stream, open_zstd_writer, \
+    tar_extract_kwargs, zstd_available
+
+#: Zstandard compression
+ZSTD = "zstd"
+
+#: gzip compression
+GZIP = "gzip"
+
+#: PAX header holding the digest of a file
+DIGEST_HEADER = "SC.sha256"
+
+_EXTENSIONS = {
+    ZSTD: ".tar.zst",
+    GZIP: ".tar.gz"
+}
+
+
+def compressions() -> List[str]:
+    """
+    Returns the compressions archives can be read and written with, preferred
+    first.
+    """
+    if zstd_available():
+        return [ZSTD, GZIP]
+    return [GZIP]
+
+
+def archive_path(prefix: str, compression: str) -> str:
+    """
+    Returns the path of an archive.
+
+    Args:
+        prefix (path): path of the archive, without its extension.
+        compression (str): compression of the archive.
+    """
+    return prefix + _EXTENSIONS[compression]
+
+
+class _DigestTarFile(tarfile.TarFile):
+    """
+    Tar file recording the digest of each regular file added to it.
+    """
+
+    def gettarinfo(self, name=None, arcname=None, fileobj=None):
+        tarinfo = super().gettarinfo(name=name, arcname=arcname, fileobj=fileobj)
+        if tarinfo is not None and tarinfo.isreg():
+            path = name if name is not None else fileobj.name
+            tarinfo.pax_headers[DIGEST_HEADER] = digest_file(path, hashlib.sha256)
+        return tarinfo
+
+
+@contextlib.contextmanager
+def write_archive(path: str, compression: str, threads: int = 0) -> Iterator[tarfile.TarFile]:
+    """
+    Opens an archive to write.
+
+    The archive is written next to its path and moved into place once it is
+    complete, so a partial archive is never served.
+
+    Args:
+        path (path): path of the archive.
+        compression (str): compression of the archive.
+        threads (int): number of threads to compress a Zstandard archive with,
+            0 to compress it in the calling thread.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.",
+                                    dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if compression == ZSTD:
+                with open_zstd_writer(f, threads=threads) as stream, \
+                        _DigestTarFile.open(fileobj=stream, mode="w|",
+                                            format=tarfile.PAX_FORMAT) as tar:
+                    yield tar
+            else:
+                with _DigestTarFile.open(fileobj=f, mode="w|gz",
+                                         format=tarfile.PAX_FORMAT) as tar:
+                    yield tar
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def read_archive(fileobj: IO[bytes]) -> Iterator[tarfile.TarFile]:
+    """
+    Opens an archive to read its members in order, whatever its compression.
+
+    Args:
+        fileobj (file): archive, positioned at its start.
+
+    Raises:
+        ModuleNotFoundError: if the archive is compressed with Zstandard and
+            the bindings for it are not available.
+    """
+    start = fileobj.tell()
+    header = fileobj.read(4)
+    fileobj.seek(start)
+
+    if is_zstd(header):
+        with open_zstd_stream(fileobj) as stream, \
+                tarfile.open(fileobj=stream, mode="r|") as tar:
+            yield tar
+    else:
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+            yield tar
+
+
+def transcode(src: str, dst: str, compression: str) -> None:
+    """
+    Copies an archive into another compression.
+
+    Args:
+        src (path): path of the archive to copy.
+        dst (path): path of the copy.
+        compression (str): compression of the copy.
+    """
+    with open(src, "rb") as f, read_archive(f) as src_tar, \
+            write_archive(dst, compression) as dst_tar:
+        for member in src_tar:
+            dst_tar.addfile(member, src_tar.extractfile(member) if member.isreg() else None)
+
+
+def _strip(name: str, prefix: str) -> Optional[str]:
+    if not name.startswith(f"{prefix}/"):
+        return None
+    return name[len(prefix) + 1:] or None
+
+
+def extract_archive(fileobj: IO[bytes], directory: str, prefix: str) -> int:
+    """
+    Extracts the members of an archive which are under a directory of it.
+
+    Files whose digest matches the file already at their destination are not
+    written.
+
+    Args:
+        fileobj (file): archive, positioned at its start.
+        directory (path): directory to extract into.
+        prefix (str): directory of the archive to extract, which is stripped
+            from the names of its members.
+
+    Returns:
+        int: number of members under the prefix.
+    """
+    cache = FileHashCache.default()
+
+    found = 0
+    with read_archive(fileobj) as tar:
+        for member in tar:
+            name = _strip(member.name, prefix)
+            if name is None:
+                continue
+            found += 1
+
+            dst = os.path.join(directory, name)
+            digest = member.pax_headers.get(DIGEST_HEADER)
+            if digest and member.isreg() and os.path.isfile(dst) and \
+                    not os.path.islink(dst) and \
+                    cache.hash_file(dst, ALGORITHM, hashlib.sha256) == digest:
+                continue
+
+            member.name = name
+            if member.islnk():
+                member.linkname = _strip(member.linkname, prefix) or member.linkname
+            tar.extract(member, path=directory, **tar_extract_kwargs())
+
+    return found
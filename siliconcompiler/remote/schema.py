@@ -104,3 +104,84 @@ class ServerSchema(CommandLineSchema, BaseSchema):
                 unit="s",
                 help="""
                 Interval between checks to announce to clients"""))
+
+        schema.insert(
+            'option', 'cores',
+            Parameter(
+                'int<0..>',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                shorthelp="Number of cores shared by the running jobs.",
+                switch="-cores <int>",
+                example=["cli: -cores 32",
+                         "api: server.set('option', 'cores', 32)"],
+                help="""
+                Number of cores shared by the jobs running at once. Zero, the
+                default, shares every core available to the server. A job only
+                starts once there are enough free cores for it, see
+                ``-jobcores``, and its nodes are confined to the cores it was
+                given where the platform supports it."""))
+
+        schema.insert(
+            'option', 'jobcores',
+            Parameter(
+                'int<0..>',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                shorthelp="Number of cores given to each job.",
+                switch="-jobcores <int>",
+                example=["cli: -jobcores 8",
+                         "api: server.set('option', 'jobcores', 8)"],
+                help="""
+                Number of cores given to each job. Zero, the default, gives a
+                job all of the cores in ``-cores``, so jobs run one at a time.
+                Jobs sent to slurm do not use the server's cores."""))
+
+        schema.insert(
+            'option', 'memory',
+            Parameter(
+                'int<0..>',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                unit="MB",
+                shorthelp="Memory shared by the running jobs.",
+                switch="-memory <int>",
+                example=["cli: -memory 65536",
+                         "api: server.set('option', 'memory', 65536)"],
+                help="""
+                Memory shared by the jobs running at once. Zero, the default,
+                uses the memory available when the server starts. A job
+                reserves the largest ``[option,scheduler,memory]`` of its
+                nodes, and only starts once that fits, unless it would be the
+                only job running."""))
+
+        schema.insert(
+            'option', 'maxjobs',
+            Parameter(
+                'int<0..>',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                shorthelp="Maximum number of running jobs.",
+                switch="-maxjobs <int>",
+                example=["cli: -maxjobs 4",
+                         "api: server.set('option', 'maxjobs', 4)"],
+                help="""
+                Maximum number of jobs running at once. Zero, the default,
+                runs as many as fit in ``-cores`` and ``-memory``. Other jobs
+                are queued."""))
+
+        schema.insert(
+            'option', 'userjobs',
+            Parameter(
+                'int<0..>',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                shorthelp="Maximum number of running jobs of a user.",
+                switch="-userjobs <int>",
+                example=["cli: -userjobs 2",
+                         "api: server.set('option', 'userjobs', 2)"],
+                help="""
+                Maximum number of jobs of a single user running at once. Zero,
+                the default, does not limit them. Queued jobs are started
+                in turn across users: the next job to start belongs to the
+                user with the fewest running jobs."""))
@@ -1,11 +1,14 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
 
 import asyncio
+import collections
 import contextlib
 import fastjsonschema
+import hashlib
 import json
 import logging
 import os
+import psutil
 import shutil
 import sys
 import tarfile
@@ -24,6 +27,7 @@ from siliconcompiler import NodeStatus as SCNodeStatus
 from siliconcompiler._metadata import detailed_version as sc_version
 
 from siliconcompiler.schema import __version__ as sc_schema_version
+from siliconcompiler.schema import Journal
 
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 from siliconcompiler.scheduler import SchedulerNode
@@ -31,9 +35,13 @@ from siliconcompiler.scheduler import SlurmSchedulerNode
 from siliconcompiler.scheduler import TaskScheduler
 
 from siliconcompiler.remote import JobStatus, NodeStatus
+from siliconcompiler.remote.blobstore import BlobStore, CHUNK_SIZE, MAX_BLOB_SIZE
+from siliconcompiler.remote.jobstore import JobStore
+from siliconcompiler.remote.results import archive_path, compressions, transcode, \
+    write_archive
 from siliconcompiler.remote.schema import ServerSchema
-from siliconcompiler.utils import tar_extract_kwargs
-from siliconcompiler.utils.paths import jobdir
+from siliconcompiler.utils import get_cores, tar_extract_kwargs
+from siliconcompiler.utils.paths import collectiondir, jobdir
 
 
 # Compile validation code for API request bodies.
@@ -47,6 +55,10 @@ with open(api_dir / 'remote_run.json') as schema:
 with open(api_dir / 'check_progress.json') as schema:
     validate_check_progress = fastjsonschema.compile(json.loads(schema.read()))
 
+# 'progress_stream': Follow the progress of a job as it runs.
+with open(api_dir / 'progress_stream.json') as schema:
+    validate_progress_stream = fastjsonschema.compile(json.loads(schema.read()))
+
 # 'check_server': Check whether a given job stage is currently running.
 with open(api_dir / 'check_server.json') as schema:
     validate_check_server = fastjsonschema.compile(json.loads(schema.read()))
@@ -59,6 +71,14 @@ with open(api_dir / 'cancel_job.json') as schema:
 with open(api_dir / 'delete_job.json') as schema:
     validate_delete_job = fastjsonschema.compile(json.loads(schema.read()))
 
+# 'check_blobs': Check which files of a job need to be uploaded.
+with open(api_dir / 'check_blobs.json') as schema:
+    validate_check_blobs = fastjsonschema.compile(json.loads(schema.read()))
+
+# 'upload_blob': Upload a chunk of a file of a job.
+with open(api_dir / 'upload_blob.json') as schema:
+    validate_upload_blob = fastjsonschema.compile(json.loads(schema.read()))
+
 # 'get_results': Fetch the results of a job run.
 # Currently, the 'job_hash' is included in the URL for this call.
 with open(api_dir / 'get_results.json') as schema:
@@ -101,11 +121,43 @@ class Server(ServerSchema):
         #   sc_job_threads  the thread running each job, so 'cancel_job' and
         #                   server shutdown can reach a job in flight
         #   sc_canceled_jobs  jobs a client has asked to stop
+        #   sc_job_listeners  the event loop and queue of each
+        #                   'progress_stream' following a job
+        # and sc_job_queue, the jobs waiting for room to run, in the order
+        # they were submitted.
         self.sc_jobs_lock = threading.Lock()
         self.sc_jobs = {}
         self.sc_job_threads = {}
         self.sc_canceled_jobs = set()
         self.sc_project_lookup = {}
+        self.sc_job_listeners = {}
+        self.sc_job_queue = []
+
+        # Persistent record of the jobs, see job_store
+        self.__job_store = None
+        self.__job_store_lock = threading.Lock()
+
+        # Resources shared by the running jobs, measured on first use
+        self.__cpus = None
+        self.__memory = None
+
+        # Set once the server is going down, so the jobs it interrupts are
+        # run again when it is back
+        self.__stopping = False
+
+    @staticmethod
+    def __notify(listeners, event, data):
+        '''
+        Hand an event to the 'progress_stream' requests following a job.
+
+        Called from the job threads, so the event is queued through the loop
+        each stream runs on. A loop which has already been closed, because the
+        server is shutting down, has nobody left to tell.
+        '''
+
+        for loop, queue in listeners:
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(queue.put_nowait, (event, data))
 
     def __run_start(self, project):
         nodes = project.get_flow().get_nodes()
@@ -113,9 +165,9 @@ class Server(ServerSchema):
         with self.sc_jobs_lock:
             job_hash = self.sc_project_lookup[project]["jobhash"]
 
-        start_tar = os.path.join(self.nfs_mount, job_hash, f'{job_hash}_None.tar.gz')
+        start_tar = archive_path(self.__results_prefix(job_hash, None), compressions()[0])
         start_status = NodeStatus.SUCCESS
-        with tarfile.open(start_tar, "w:gz") as tf:
+        with write_archive(start_tar, compressions()[0]) as tf:
             start_manifest = os.path.join(jobdir(project), f"{project.name}.pkg.json")
             tf.add(start_manifest, arcname=os.path.relpath(start_manifest, self.nfs_mount))
 
@@ -131,6 +183,12 @@ class Server(ServerSchema):
                 self.sc_jobs[job_name][name]["status"] = \
                     project.get('record', 'status', step=step, index=index)
 
+            nodes = self.__copy_nodes(job_name)
+            listeners = list(self.sc_job_listeners.get(job_name, ()))
+
+        self.job_store.set_nodes(job_name, nodes)
+        self.__notify(listeners, 'node_end', {'node': None, 'status': start_status})
+
     def __node_start(self, project, step, index):
         with self.sc_jobs_lock:
             job_name = self.sc_project_lookup[project]["name"]
@@ -138,6 +196,13 @@ class Server(ServerSchema):
             node["status"] = NodeStatus.RUNNING
             node["starttime"] = time.time()
 
+            nodes = self.__copy_nodes(job_name)
+            listeners = list(self.sc_job_listeners.get(job_name, ()))
+
+        self.job_store.set_nodes(job_name, nodes)
+        self.__notify(listeners, 'node_start', {'node': f"{step}{index}",
+                                                'status': NodeStatus.RUNNING})
+
     def __node_end(self, project, step, index):
         with self.sc_jobs_lock:
             job_hash = self.sc_project_lookup[project]["jobhash"]
@@ -145,17 +210,42 @@ class Server(ServerSchema):
 
         project = project.copy()
         project._Project__cwd = os.path.join(project.option.get_builddir(), '..')
-        with tarfile.open(os.path.join(self.nfs_mount,
-                                       job_hash,
-                                       f'{job_hash}_{step}{index}.tar.gz'),
-                          mode='w:gz') as tf:
-            SchedulerNode(project, step, index).archive(tf, include="*")
-
+        scheduler_node = SchedulerNode(project, step, index)
+        # Archived once, on the cores of the job, for every client to download
+        compression = compressions()[0]
+        with write_archive(archive_path(self.__results_prefix(job_hash, f"{step}{index}"),
+                                        compression),
+                           compression, threads=get_cores()) as tf:
+            scheduler_node.archive(tf, include="*")
+
+        # The node's changes to the manifest, so a client following the job
+        # can apply them without waiting for its results.
+        journal = None
+        if os.path.isfile(scheduler_node.get_journal()):
+            journal = Journal.read_file(scheduler_node.get_journal())
+
+        status = project.get('record', 'status', step=step, index=index)
         with self.sc_jobs_lock:
             node = self.sc_jobs[job_name][f"{step}{index}"]
-            node["status"] = project.get('record', 'status', step=step, index=index)
+            node["status"] = status
             node["endtime"] = time.time()
 
+            nodes = self.__copy_nodes(job_name)
+            listeners = list(self.sc_job_listeners.get(job_name, ()))
+
+        self.job_store.set_nodes(job_name, nodes)
+        self.__notify(listeners, 'node_end', {'node': f"{step}{index}",
+                                              'status': status,
+                                              'journal': journal})
+
+    def __copy_nodes(self, job_name):
+        '''
+        Copy the node progress of a job, to be recorded in the job store.
+        Callers must hold sc_jobs_lock.
+        '''
+
+        return {node: dict(info) for node, info in self.sc_jobs[job_name].items()}
+
     def run(self):
         # makedirs() raises if it cannot deliver the directory, so there is
         # nothing left to test for afterwards.
@@ -164,6 +254,9 @@ class Server(ServerSchema):
         with open(os.path.join(self.nfs_mount, ".gitignore"), "w") as f:
             f.write("*")
 
+        # Uploads can be abandoned and jobs deleted while the server is down
+        self.__collect_blobs()
+
         self.logger.info(f"Running in: {self.nfs_mount}")
         # If authentication is enabled, try connecting to the SQLite3 database.
         # (An empty one will be created if it does not exist.)
@@ -200,13 +293,19 @@ class Server(ServerSchema):
         TaskScheduler.register_callback("pre_node", self.__node_start)
         TaskScheduler.register_callback("post_node", self.__node_end)
 
+        # Pick up the jobs a previous run of the server did not finish
+        self.__resume_jobs()
+
         # Create a minimal web server to process the 'remote_run' API call.
         # aiohttp's own default body limit is 1MB, which no real job fits in:
         # 'remote_run' carries the manifest and the collected sources together.
         self.app = web.Application(client_max_size=self.max_upload_size)
         self.app.add_routes([
             web.post('/remote_run/', self.handle_remote_run),
+            web.post('/check_blobs/', self.handle_check_blobs),
+            web.post('/upload_blob/', self.handle_upload_blob),
             web.post('/check_progress/', self.handle_check_progress),
+            web.post('/progress_stream/', self.handle_progress_stream),
             web.post('/check_server/', self.handle_check_server),
             web.post('/cancel_job/', self.handle_cancel_job),
             web.post('/delete_job/', self.handle_delete_job),
@@ -219,7 +318,9 @@ class Server(ServerSchema):
         # under it -- to any unauthenticated GET.
 
         # Jobs in flight when the server goes down are canceled rather than
-        # abandoned; see __shutdown().
+        # abandoned; see __shutdown(). The clients following them are let go
+        # first, see __close_streams().
+        self.app.on_shutdown.append(self.__close_streams)
         self.app.on_cleanup.append(self.__shutdown)
 
         # Start the async server.
@@ -291,18 +392,36 @@ class Server(ServerSchema):
         job_dir = os.path.join(job_root, design, job_name)
         os.makedirs(job_dir, exist_ok=True)
 
-        # Move the uploaded archive and un-zip it.
-        # (Contents will be encrypted for authenticated jobs)
-        try:
-            with tarfile.open(tmp_file, "r:gz") as tar:
-                tar.extractall(path=job_dir, **tar_extract_kwargs())
-        finally:
-            # Drop the staged upload even if the extract raised: on that path
-            # the old code kept it forever. suppress() rather than a prior
-            # exists() check, which only narrows the window for the file to go
-            # away underneath us.
+        if 'files' in job_params:
+            # The files were uploaded beforehand with 'upload_blob', and only
+            # the ones the server did not have yet.
             with contextlib.suppress(FileNotFoundError):
                 os.remove(tmp_file)
+            try:
+                missing = await asyncio.to_thread(
+                    self.__materialize_job, project, job_params['files'],
+                    job_params['username'], job_dir)
+            except ValueError as e:
+                shutil.rmtree(job_root, ignore_errors=True)
+                return self.__response(f"Error: {e}.", status=400)
+            if missing:
+                shutil.rmtree(job_root, ignore_errors=True)
+                return web.json_response({'message': 'Files of the job are missing.',
+                                          'missing': missing},
+                                         status=409)
+        else:
+            # Move the uploaded archive and un-zip it.
+            # (Contents will be encrypted for authenticated jobs)
+            try:
+                with tarfile.open(tmp_file, "r:gz") as tar:
+                    tar.extractall(path=job_dir, **tar_extract_kwargs())
+            finally:
+                # Drop the staged upload even if the extract raised: on that
+                # path the old code kept it forever. suppress() rather than a
+                # prior exists() check, which only narrows the window for the
+                # file to go away underneath us.
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_file)
 
         # Create the working directory for the given 'job hash' if necessary.
         project.option.set_builddir(job_root)
@@ -319,32 +438,337 @@ class Server(ServerSchema):
         # Log job received
         self.logger.info(f"Received job: {job_hash}")
 
-        # Run the job with the configured clustering option. (Non-blocking)
-        # The thread is a daemon so a job that never returns cannot hold the
-        # interpreter open after web.run_app() has exited; __shutdown() gives
-        # running jobs a bounded chance to finish before that happens.
-        job_proc = threading.Thread(target=self.remote_sc,
-                                    args=[project,
-                                          job_params['username']],
-                                    daemon=True)
-
-        sc_job_name = self.job_name(job_params['username'], job_hash)
-        with self.sc_jobs_lock:
-            self.sc_job_threads[sc_job_name] = {
-                "thread": job_proc,
-                "jobhash": job_hash
-            }
-            # Claim the job before the thread runs: remote_sc() fills in the
-            # node list, and until it does a 'check_progress' call that beat it
-            # here would be told the job had already completed.
-            self.sc_jobs[sc_job_name] = {}
-        job_proc.start()
+        # Saved so the job can be run again if the server is restarted before
+        # it ends, then queued to run with the configured clustering option.
+        # (Non-blocking)
+        await asyncio.to_thread(project.write_manifest, self.__job_manifest(job_hash))
+        await asyncio.to_thread(self.__submit_job, project, job_params['username'], job_hash)
 
         # Return a response to the client.
         return web.json_response({'message': f"Starting job: {job_hash}",
                                   'interval': self.checkinterval,
                                   'job_hash': job_hash})
 
+    def __job_manifest(self, job_hash):
+        '''
+        Path to the manifest a job was submitted with.
+        '''
+
+        return os.path.join(self.nfs_mount, job_hash, 'job.pkg.json')
+
+    def __submit_job(self, project, username, job_hash, resumed=False):
+        '''
+        Queue a job, and start it if there is room for it.
+        '''
+
+        sc_job_name = self.job_name(username, job_hash)
+        job = {
+            'name': sc_job_name,
+            'jobhash': job_hash,
+            'username': username,
+            'project': project,
+            'cores': self.__job_cores(),
+            'memory': self.__job_memory(project)
+        }
+        if not resumed:
+            self.job_store.add(sc_job_name, job_hash, username,
+                               cores=job['cores'], memory=job['memory'])
+
+        with self.sc_jobs_lock:
+            # Claim the job before it runs: until remote_sc() has set it up, a
+            # 'check_progress' call would be told the job had already
+            # completed.
+            self.sc_jobs[sc_job_name] = self.__job_nodes(project)
+            self.sc_job_queue.append(job)
+
+        self.__start_jobs()
+
+    def __resume_jobs(self):
+        '''
+        Queue the jobs which were queued or running when the server last went
+        down. A job runs again from the manifest it was submitted with, and
+        the nodes it had finished are not run again.
+        '''
+
+        for job in self.job_store.get_jobs(JobStatus.QUEUED, JobStatus.RUNNING):
+            try:
+                project = Project.from_manifest(filepath=self.__job_manifest(job['job_hash']))
+            except Exception as e:
+                self.logger.warning(f"Unable to resume job {job['job_hash']}: {e}")
+                self.job_store.end(job['name'], JobStatus.FAILED)
+                continue
+
+            self.logger.info(f"Resuming job: {job['job_hash']}")
+            self.__submit_job(project, job['username'], job['job_hash'], resumed=True)
+
+    def __start_jobs(self):
+        '''
+        Start the queued jobs there is room for.
+        '''
+
+        started = []
+        with self.sc_jobs_lock:
+            while not self.__stopping:
+                job, cpus = self.__next_job()
+                if job is None:
+                    break
+                self.sc_job_queue.remove(job)
+
+                # The thread is a daemon so a job that never returns cannot
+                # hold the interpreter open after web.run_app() has exited;
+                # __shutdown() gives running jobs a bounded chance to finish
+                # before that happens.
+                thread = threading.Thread(target=self.remote_sc,
+                                          args=[job['project'], job['username']],
+                                          daemon=True)
+                self.sc_job_threads[job['name']] = {
+                    "thread": thread,
+                    "jobhash": job['jobhash'],
+                    "username": job['username'],
+                    "cpus": cpus,
+                    "memory": job['memory']
+                }
+                started.append((job, thread))
+
+        for job, thread in started:
+            self.job_store.start(job['name'])
+            thread.start()
+
+    def __next_job(self):
+        '''
+        Pick the queued job to start next, and the cores to run it on.
+        Returns (None, None) if no job can start. Callers must hold
+        sc_jobs_lock.
+
+        Jobs are taken in turn across users: the next job is the oldest one
+        of the user with the fewest running jobs. If it does not fit yet,
+        nothing starts, so that smaller jobs cannot hold it back forever.
+        '''
+
+        running = list(self.sc_job_threads.values())
+
+        max_jobs = self.get('option', 'maxjobs')
+        if max_jobs and len(running) >= max_jobs:
+            return None, None
+
+        user_jobs = collections.Counter(info.get('username') for info in running)
+        max_user_jobs = self.get('option', 'userjobs')
+        waiting = [job for job in self.sc_job_queue
+                   if not max_user_jobs or user_jobs[job['username']] < max_user_jobs]
+        if not waiting:
+            return None, None
+        job = min(waiting, key=lambda job: user_jobs[job['username']])
+
+        used_cpus = set()
+        used_memory = 0
+        for info in running:
+            used_cpus.update(info.get('cpus') or ())
+            used_memory += info.get('memory', 0)
+        free_cpus = [cpu for cpu in self.__core_budget() if cpu not in used_cpus]
+
+        # A job always fits on an idle server, like a node does in a job.
+        if running:
+            if len(free_cpus) < job['cores']:
+                return None, None
+            if job['memory'] and used_memory + job['memory'] > self.__memory_budget():
+                return None, None
+
+        return job, free_cpus[:job['cores']]
+
+    def __core_budget(self):
+        '''
+        The cores shared by the running jobs.
+        '''
+
+        if self.__cpus is None:
+            # Measured before any job thread has been confined, see remote_sc()
+            if hasattr(os, 'sched_getaffinity'):
+                cpus = sorted(os.sched_getaffinity(0))
+            else:
+                cpus = list(range(get_cores()))
+            if self.get('option', 'cores'):
+                cpus = cpus[:self.get('option', 'cores')]
+            self.__cpus = cpus
+        return self.__cpus
+
+    def __memory_budget(self):
+        '''
+        The memory shared by the running jobs, in bytes.
+        '''
+
+        if self.__memory is None:
+            memory = self.get('option', 'memory') * 1024 * 1024
+            if not memory:
+                try:
+                    memory = psutil.virtual_memory().available
+                except psutil.Error:
+                    memory = 0
+            self.__memory = memory
+        return self.__memory
+
+    def __job_cores(self):
+        '''
+        The number of cores a job is given.
+        '''
+
+        if self.get('option', 'cluster') == 'slurm':
+            # The nodes run elsewhere
+            return 0
+
+        cores = len(self.__core_budget())
+        if self.get('option', 'jobcores'):
+            cores = min(cores, self.get('option', 'jobcores'))
+        return cores
+
+    def __job_memory(self, project):
+        '''
+        The memory a job reserves, in bytes: the most any of its nodes
+        declares it needs.
+        '''
+
+        if self.get('option', 'cluster') == 'slurm':
+            # The nodes run elsewhere
+            return 0
+
+        runtime = RuntimeFlowgraph(
+            project.get_flow(),
+            from_steps=project.option.get_from(),
+            to_steps=project.option.get_to(),
+            prune_nodes=project.option.get_prune())
+
+        memory = 0
+        for step, index in runtime.get_nodes():
+            declared = project.option.scheduler.get_memory(step=step, index=index)
+            if declared:
+                memory = max(memory, declared)
+        return memory * 1024 * 1024
+
+    def __materialize_job(self, project, files, username, job_dir):
+        '''
+        Create the job directory of an upload from the blob store.
+
+        Returns the digests of the files which were not uploaded, in which
+        case nothing is created.
+        '''
+
+        store = self.__blob_store(username)
+        missing = sorted(digest for digest in {info['digest'] for info in files.values()}
+                         if not store.commit(digest))
+        if missing:
+            return missing
+
+        # The collected sources are only read by the job, so they can be
+        # hardlinked to the store.
+        shared = os.path.relpath(collectiondir(project), jobdir(project))
+        used = store.materialize(files, job_dir, shared=[Path(shared).as_posix()])
+        self.logger.info(f"Created {len(files)} files for job: "
+                         f"{', '.join(f'{count} {strategy}' for strategy, count in used.items())}")
+        return []
+
+    def __blob_store(self, username):
+        '''
+        Return the store of the files uploaded by a user.
+
+        Each user has their own store: in a shared one, 'check_blobs' would
+        tell anyone whether some other user had uploaded a given file. The
+        directory is named after a digest of the username, which is not
+        restricted to characters that are safe in a path.
+        '''
+
+        user = hashlib.sha256((username or '').encode('utf-8')).hexdigest()
+        return self.__user_blob_store(user)
+
+    def __user_blob_store(self, user):
+        return BlobStore(os.path.join(self.blob_mount, user),
+                         os.path.join(self.staging_mount, 'blobs', user))
+
+    def __collect_blobs(self):
+        '''
+        Remove the uploaded files which no job uses, and the abandoned
+        uploads, of every user.
+        '''
+
+        users = set()
+        for directory in (self.blob_mount, os.path.join(self.staging_mount, 'blobs')):
+            with contextlib.suppress(FileNotFoundError):
+                users.update(entry.name for entry in os.scandir(directory) if entry.is_dir())
+
+        freed = sum(self.__user_blob_store(user).collect() for user in sorted(users))
+        if freed:
+            self.logger.info(f"Removed {freed / 1024 / 1024:.1f} MB of unused uploaded files")
+
+    ####################
+    async def handle_check_blobs(self, request):
+        '''
+        API handler for 'check_blobs' requests. Report which of the files of
+        a job are not in the server's store, so only those are uploaded.
+        '''
+
+        # Process input parameters
+        job_params, response = self._check_request(await request.json(),
+                                                   validate_check_blobs)
+        if response is not None:
+            return response
+
+        store = self.__blob_store(job_params['username'])
+        missing = await asyncio.to_thread(store.missing, job_params['digests'])
+
+        return web.json_response({'missing': missing,
+                                  'chunk_size': self.upload_chunk_size})
+
+    ####################
+    async def handle_upload_blob(self, request):
+        '''
+        API handler for 'upload_blob' requests. Store a chunk of a file of a
+        job, which 'remote_run' moves into the store once every chunk is in.
+        '''
+
+        # The parameters come first, so the chunk can be streamed straight
+        # into place once they are checked.
+        reader = await request.multipart()
+        part = await reader.next()
+        if part is None or part.name != 'params':
+            return self.__response('Upload parameters not provided.', status=400)
+
+        job_params, response = self._check_request(await part.json(),
+                                                   validate_upload_blob)
+        if response is not None:
+            return response
+
+        # Chunks are cut at multiples of the size reported by 'check_blobs',
+        # and a file cannot be larger than a whole job upload.
+        chunk_size = self.upload_chunk_size
+        offset = job_params['offset']
+        if offset % chunk_size or offset >= min(self.max_upload_size, MAX_BLOB_SIZE):
+            return self.__response('Invalid chunk offset.', status=400)
+
+        part = await reader.next()
+        if part is None or part.name != 'data':
+            return self.__response('Upload data not provided.', status=400)
+
+        # A chunk is small enough to be held in memory, which lets it be
+        # written in one go off the event loop.
+        data = bytearray()
+        while True:
+            chunk = await part.read_chunk()
+            if not chunk:
+                break
+            data.extend(chunk)
+            if len(data) > chunk_size:
+                return self.__response(f'Chunk is larger than {chunk_size} bytes.',
+                                       status=400)
+
+        store = self.__blob_store(job_params['username'])
+        await asyncio.to_thread(self.__write_blob_chunk, store, job_params['digest'],
+                                offset, data)
+
+        return self.__response('Chunk received.')
+
+    @staticmethod
+    def __write_blob_chunk(store, digest, offset, data):
+        with store.write(digest, offset) as f:
+            f.write(data)
+
     ####################
     async def handle_get_results(self, request):
         '''
@@ -366,15 +790,49 @@ class Server(ServerSchema):
 
         job_hash = job_params['job_hash']
         node = job_params['node'] if 'node' in job_params else None
+        # Clients from before the archives were compressed with Zstandard
+        # only read gzip.
+        accepted = job_params.get('compression', ['gzip'])
 
-        zipfn = os.path.join(self.nfs_mount, job_hash, f'{job_hash}_{node}.tar.gz')
-        if not os.path.exists(zipfn):
+        zipfn = await asyncio.to_thread(self.__results_archive, job_hash, node, accepted)
+        if not zipfn:
             return web.json_response(
                 {'message': 'Could not find results for the requested job/node.'},
                 status=404)
 
+        # Serves ranges of the archive, and its ETag, so an interrupted
+        # download can be resumed.
         return web.FileResponse(zipfn)
 
+    def __results_prefix(self, job_hash, node):
+        '''
+        Path of the results archive of a node, without its extension.
+        '''
+        return os.path.join(self.nfs_mount, job_hash, f'{job_hash}_{node}')
+
+    def __results_archive(self, job_hash, node, accepted):
+        '''
+        Find the results archive of a node in a compression the client
+        accepts, making a copy in one if there is none yet.
+        Returns None if the node has no results.
+        '''
+        prefix = self.__results_prefix(job_hash, node)
+        accepted = [compression for compression in accepted if compression in compressions()]
+
+        for compression in accepted:
+            path = archive_path(prefix, compression)
+            if os.path.isfile(path):
+                return path
+
+        for compression in compressions():
+            path = archive_path(prefix, compression)
+            if accepted and os.path.isfile(path):
+                copy = archive_path(prefix, accepted[0])
+                transcode(path, copy, accepted[0])
+                return copy
+
+        return None
+
     ####################
     async def handle_cancel_job(self, request):
         '''
@@ -454,6 +912,13 @@ class Server(ServerSchema):
             with contextlib.suppress(FileNotFoundError):
                 os.remove(f'{build_dir}.tar.gz')
 
+        await asyncio.to_thread(self.job_store.remove,
+                                self.job_name(job_params['username'], job_hash))
+
+        # The uploaded files of the job are no longer linked to by its
+        # directory, so the ones no other job uses can be removed.
+        await asyncio.to_thread(self.__blob_store(job_params['username']).collect)
+
         return web.Response(text="Job deleted.")
 
     ####################
@@ -530,6 +995,104 @@ class Server(ServerSchema):
         minutes, seconds = divmod(seconds, 60)
         return f'{hours}:{minutes:02d}:{seconds:02d}'
 
+    ####################
+    async def handle_progress_stream(self, request):
+        '''
+        API handler for 'progress_stream' requests. Push the progress of a
+        job to the client as server-sent events, so it does not have to poll
+        'check_progress' to learn that a node has finished.
+
+        The stream opens with a 'status' event holding what 'check_progress'
+        reports, then carries a 'node_start' and a 'node_end' event as each
+        node starts and ends, and closes after the 'job_end' event. While
+        nothing happens a comment is sent every 'checkinterval' seconds, so
+        the client can tell a quiet job from a dropped connection.
+        '''
+
+        # Process input parameters
+        job_params, response = self._check_request(await request.json(),
+                                                   validate_progress_stream)
+        if response is not None:
+            return response
+
+        jobname = self.job_name(job_params['username'], job_params['job_hash'])
+
+        # The snapshot is taken as the listener is added, so every change
+        # after the snapshot reaches the queue.
+        listener = (asyncio.get_running_loop(), asyncio.Queue())
+        with self.sc_jobs_lock:
+            if jobname in self.sc_jobs:
+                if jobname in self.sc_canceled_jobs:
+                    status = JobStatus.CANCELED
+                else:
+                    status = JobStatus.RUNNING
+                snapshot = {
+                    'status': status,
+                    'message': self.__progress_message(jobname),
+                }
+                self.sc_job_listeners.setdefault(jobname, []).append(listener)
+            else:
+                snapshot = {
+                    'status': JobStatus.COMPLETED,
+                    'message': 'Job has no running steps.',
+                }
+                listener = None
+
+        stream = web.StreamResponse(headers={'Content-Type': 'text/event-stream',
+                                             'Cache-Control': 'no-cache'})
+        try:
+            await stream.prepare(request)
+            await self.__send_event(stream, 'status', snapshot)
+
+            while listener:
+                try:
+                    event, data = await asyncio.wait_for(listener[1].get(),
+                                                         timeout=self.checkinterval)
+                except asyncio.TimeoutError:
+                    await stream.write(b': keepalive\n\n')
+                    continue
+
+                if event is None:
+                    # The server is shutting down.
+                    break
+                await self.__send_event(stream, event, data)
+                if event == 'job_end':
+                    break
+        except ConnectionResetError:
+            # The client went away, and reconnects if it still cares.
+            pass
+        finally:
+            if listener:
+                with self.sc_jobs_lock:
+                    listeners = self.sc_job_listeners.get(jobname, [])
+                    if listener in listeners:
+                        listeners.remove(listener)
+                    if not listeners:
+                        self.sc_job_listeners.pop(jobname, None)
+
+        return stream
+
+    @staticmethod
+    async def __send_event(stream, event, data):
+        '''
+        Write a server-sent event.
+        '''
+
+        await stream.write(f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode('utf-8'))
+
+    async def __close_streams(self, app):
+        '''
+        aiohttp shutdown hook: end the 'progress_stream' requests, which would
+        otherwise hold up the shutdown until they time out.
+        '''
+
+        with self.sc_jobs_lock:
+            listeners = [listener for job_listeners in self.sc_job_listeners.values()
+                         for listener in job_listeners]
+            self.sc_job_listeners.clear()
+
+        self.__notify(listeners, None, None)
+
     ####################
     async def handle_check_server(self, request):
         '''
@@ -584,10 +1147,19 @@ class Server(ServerSchema):
                 # there is nothing to stop and no flag worth keeping: the job's
                 # own teardown has already run.
                 return
-            self.sc_canceled_jobs.add(job_name)
-            nodes = [(info['step'], info['index'])
-                     for info in self.sc_jobs[job_name].values()
-                     if 'step' in info and not SCNodeStatus.is_done(info['status'])]
+            queued = [job for job in self.sc_job_queue if job['name'] == job_name]
+            for job in queued:
+                self.sc_job_queue.remove(job)
+            if not queued:
+                self.sc_canceled_jobs.add(job_name)
+                nodes = [(info['step'], info['index'])
+                         for info in self.sc_jobs[job_name].values()
+                         if 'step' in info and not SCNodeStatus.is_done(info['status'])]
+
+        if queued:
+            # It never started, so there is nothing to stop.
+            self.__end_job(job_name, queued[0]['project'], status=JobStatus.CANCELED)
+            return
 
         if self.get('option', 'cluster') != 'slurm':
             return
@@ -607,6 +1179,9 @@ class Server(ServerSchema):
         '''
 
         with self.sc_jobs_lock:
+            # The jobs interrupted from here on run again once the server is
+            # back, and the queued ones wait for it in the job store.
+            self.__stopping = True
             running = dict(self.sc_job_threads)
 
         if not running:
@@ -643,17 +1218,49 @@ class Server(ServerSchema):
         job_hash = project.get('record', 'remoteid')
         sc_job_name = self.job_name(username, job_hash)
 
+        with self.sc_jobs_lock:
+            cpus = self.sc_job_threads.get(sc_job_name, {}).get('cpus')
+        if cpus and hasattr(os, 'sched_setaffinity'):
+            # Confine the job's thread, and the node processes it starts, to
+            # the job's cores: the scheduler sizes the job to the cores it sees.
+            os.sched_setaffinity(0, cpus)
+
         try:
             self.__run_job(project, job_hash, sc_job_name)
         finally:
             # Whatever happened, the job is over: a job left in sc_jobs is one
             # that 'check_progress' reports as running forever, and handle_
             # remote_run has already claimed the name by the time we get here.
-            with self.sc_jobs_lock:
-                self.sc_jobs.pop(sc_job_name, None)
-                self.sc_job_threads.pop(sc_job_name, None)
-                self.sc_canceled_jobs.discard(sc_job_name)
-                self.sc_project_lookup.pop(project, None)
+            self.__end_job(sc_job_name, project)
+
+    def __end_job(self, sc_job_name, project, status=None):
+        '''
+        Take down the tracking of a job which is over, and start the queued
+        jobs which were waiting for its room.
+        '''
+
+        with self.sc_jobs_lock:
+            # Interrupted by the server going down, rather than ended
+            interrupted = status is None and self.__stopping
+            if status is None:
+                if sc_job_name in self.sc_canceled_jobs:
+                    status = JobStatus.CANCELED
+                else:
+                    status = JobStatus.COMPLETED
+            self.sc_jobs.pop(sc_job_name, None)
+            self.sc_job_threads.pop(sc_job_name, None)
+            self.sc_canceled_jobs.discard(sc_job_name)
+            self.sc_project_lookup.pop(project, None)
+            listeners = self.sc_job_listeners.pop(sc_job_name, [])
+
+        self.__notify(listeners, 'job_end', {'status': status})
+
+        if interrupted:
+            self.job_store.requeue(sc_job_name)
+        else:
+            self.job_store.end(sc_job_name, status)
+
+        self.__start_jobs()
 
     ####################
     def __run_job(self, project, job_hash, sc_job_name):
@@ -662,6 +1269,34 @@ class Server(ServerSchema):
         thread by remote_sc(), which owns the tracking teardown.
         '''
 
+        nodes = self.__job_nodes(project)
+
+        # Mark the job run as busy.
+        with self.sc_jobs_lock:
+            self.sc_project_lookup[project] = {
+                "name": sc_job_name,
+                "jobhash": job_hash
+            }
+            self.sc_jobs[sc_job_name] = nodes
+        self.job_store.set_nodes(sc_job_name, nodes)
+
+        build_dir = os.path.join(self.nfs_mount, job_hash)
+        project.option.set_builddir(build_dir)
+        project.option.set_remote(False)
+
+        if self.get('option', 'cluster') == 'slurm':
+            # Run the job with slurm clustering.
+            project.option.scheduler.set_name('slurm')
+
+        # Run the job.
+        project.run()
+
+    @staticmethod
+    def __job_nodes(project):
+        '''
+        Build the progress of the nodes of a job, as it is about to run.
+        '''
+
         runtime = RuntimeFlowgraph(
             project.get_flow(),
             from_steps=project.option.get_from(),
@@ -686,24 +1321,7 @@ class Server(ServerSchema):
                 "index": index
             }
 
-        # Mark the job run as busy.
-        with self.sc_jobs_lock:
-            self.sc_project_lookup[project] = {
-                "name": sc_job_name,
-                "jobhash": job_hash
-            }
-            self.sc_jobs[sc_job_name] = nodes
-
-        build_dir = os.path.join(self.nfs_mount, job_hash)
-        project.option.set_builddir(build_dir)
-        project.option.set_remote(False)
-
-        if self.get('option', 'cluster') == 'slurm':
-            # Run the job with slurm clustering.
-            project.option.scheduler.set_name('slurm')
-
-        # Run the job.
-        project.run()
+        return nodes
 
     ####################
     def __auth_password(self, username, password):
@@ -757,6 +1375,17 @@ class Server(ServerSchema):
         # Ensure that NFS mounting path is absolute.
         return os.path.abspath(self.get('option', 'nfsmount'))
 
+    ###################
+    @property
+    def job_store(self):
+        # The persistent record of the jobs, opened on first use since the
+        # mount can be set after the server is created.
+        with self.__job_store_lock:
+            if self.__job_store is None:
+                os.makedirs(self.nfs_mount, exist_ok=True)
+                self.__job_store = JobStore(os.path.join(self.nfs_mount, '.jobs.sqlite'))
+            return self.__job_store
+
     ###################
     @property
     def staging_mount(self):
@@ -764,6 +1393,19 @@ class Server(ServerSchema):
         # one directory per job hash.
         return os.path.join(self.nfs_mount, '.staging')
 
+    ###################
+    @property
+    def blob_mount(self):
+        # Files uploaded for jobs, keyed by their digest. Next to the job
+        # directories, so they can be hardlinked into them.
+        return os.path.join(self.nfs_mount, '.blobs')
+
+    ###################
+    @property
+    def upload_chunk_size(self):
+        # Leaves room in a request under the upload limit for its other parts.
+        return min(CHUNK_SIZE, self.max_upload_size // 2)
+
     ###################
     @property
     def max_upload_size(self):
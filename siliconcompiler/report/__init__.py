@@ -1,5 +1,16 @@
-from .summary_image import _open_summary_image, generate_summary_image
-from .dashboard.web import WebDashboard
+from siliconcompiler._lazy import lazy_attributes
+
+# Imported on first access (PEP 562), since the summary image and the web
+# dashboard pull in imaging and web packages.
+_LAZY_ATTRIBUTES = {
+    "_open_summary_image": "siliconcompiler.report.summary_image",
+    "generate_summary_image": "siliconcompiler.report.summary_image",
+    "WebDashboard": "siliconcompiler.report.dashboard.web",
+}
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+
 
 __all__ = [
     "_open_summary_image",
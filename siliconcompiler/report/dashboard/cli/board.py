@@ -28,6 +28,7 @@ from siliconcompiler.utils.logging import SCColorLoggerFormatter
 from siliconcompiler.utils.paths import workdir
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 from siliconcompiler.utils.units import format_time
+from siliconcompiler.utils.graph import DirectedGraph
 from siliconcompiler.report.dashboard.cli.layout import Layout
 from siliconcompiler.report.dashboard.cli.keyboard import Keyboard
 from siliconcompiler import _metadata
@@ -1273,7 +1274,7 @@ class Board:
         nodes = []
         nodeorder = {}
         node_inputs = {}
-        node_outputs = {}
+        node_flow_inputs = {}
 
         for n, nodeset in enumerate(runtime_flow.get_execution_order()):
             for m, node in enumerate(nodeset):
@@ -1282,32 +1283,25 @@ class Board:
                 nodes.append(node)
                 nodeorder[node] = (n, m)
                 node_inputs[node] = runtime_flow.get_node_inputs(*node, record=record)
-                for in_node in project.get_flow(flow).get_graph_node(node[0],
-                                                                     node[1]).get_input():
-                    node_outputs.setdefault(in_node, set()).add(node)
+                node_flow_inputs[node] = project.get_flow(flow).get_graph_node(node[0],
+                                                                               node[1]).get_input()
 
         flow_entry_nodes = set(project.get_flow(flow).get_entry_nodes())
         flow_exit_nodes = set(runtime_flow.get_exit_nodes())
 
-        def get_node_distance(node, search, level=1):
-            dists = {}
-            if node not in search:
-                return dists
-            for snode in search[node]:
-                dists[snode] = level
-                dists.update(get_node_distance(snode, search, level=level + 1))
-            return dists
+        input_graph = DirectedGraph(node_inputs)
+        output_graph = DirectedGraph(node_flow_inputs)
 
         node_dists = {}
         for cnode in nodes:
             # use 2x + 1 to give completed nodes sorting priority
             node_dists[cnode] = {
                 node: 2 * level + 1
-                for node, level in get_node_distance(cnode, node_inputs).items()
+                for node, level in input_graph.get_distances(cnode, reverse=True).items()
             }
             node_dists[cnode].update({
                 node: 2 * level
-                for node, level in get_node_distance(cnode, node_outputs).items()
+                for node, level in output_graph.get_distances(cnode).items()
             })
 
         topology = _FlowTopology(
@@ -108,7 +108,7 @@ def _format_value(metric, value, metric_unit, metric_type, format_as_string):
         if format_as_string:
             return units.format_binary(value, metric_unit)
         value, metric = units.scale_binary(value, metric_unit)
-    elif metric in ['exetime', 'tasktime', 'totaltime']:
+    elif metric in ['exetime', 'tasktime', 'totaltime', 'overhead']:
         if format_as_string:
             return units.format_time(value)
     elif NodeType.istype(metric_type, 'int'):
@@ -1,9 +1,20 @@
+from siliconcompiler._lazy import lazy_attributes
+
 from siliconcompiler.scheduler.error import SCRuntimeError
-from siliconcompiler.scheduler.schedulernode import SchedulerNode
-from siliconcompiler.scheduler.slurm import SlurmSchedulerNode
-from siliconcompiler.scheduler.docker import DockerSchedulerNode
-from siliconcompiler.scheduler.taskscheduler import TaskScheduler
-from siliconcompiler.scheduler.scheduler import Scheduler
+
+# Imported on first access (PEP 562), so a node run only loads the schedulers
+# it uses, and the docker package is only loaded for docker nodes.
+_LAZY_ATTRIBUTES = {
+    "Scheduler": "siliconcompiler.scheduler.scheduler",
+    "SchedulerNode": "siliconcompiler.scheduler.schedulernode",
+    "TaskScheduler": "siliconcompiler.scheduler.taskscheduler",
+    "DockerSchedulerNode": "siliconcompiler.scheduler.docker",
+    "SlurmSchedulerNode": "siliconcompiler.scheduler.slurm",
+}
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+
 
 __all__ = [
     "Scheduler",
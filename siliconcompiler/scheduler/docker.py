@@ -66,28 +66,25 @@ def get_volumes_directories(project, cache_dir, workdir, step, index):
     """
     all_dirs = set()
     # Collect files
-    for key in project.allkeys():
-        param = project.get(*key, field=None)
-
-        if param.is_path:
-            cstep = step
-            cindex = index
-
-            if param.get(field='pernode').is_never():
-                cstep = None
-                cindex = None
-
-            files = project.find_files(*key, step=cstep, index=cindex, missing_ok=True)
-            if files:
-                if not isinstance(files, list):
-                    files = [files]
-                for path in files:
-                    if path is None:
-                        continue
-                    if param.is_file:
-                        all_dirs.add(os.path.dirname(path))
-                    else:
-                        all_dirs.add(path)
+    for key, param in project.iter_params(kind="path"):
+        cstep = step
+        cindex = index
+
+        if param.get(field='pernode').is_never():
+            cstep = None
+            cindex = None
+
+        files = project.find_files(*key, step=cstep, index=cindex, missing_ok=True)
+        if files:
+            if not isinstance(files, list):
+                files = [files]
+            for path in files:
+                if path is None:
+                    continue
+                if param.is_file:
+                    all_dirs.add(os.path.dirname(path))
+                else:
+                    all_dirs.add(path)
 
     # Collect caches
     # for resolver in project.get('package', field="schema").get_resolvers().values():
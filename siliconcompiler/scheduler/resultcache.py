@@ -0,0 +1,335 @@
+"""
+Content addressed cache for the results of flowgraph nodes.
+
+Each entry is stored in a directory named after its key and holds the
+``outputs/`` directory of the node, the journal of the schema changes made
+while it ran and a small ``entry.json`` describing it. The modification time
+of ``entry.json`` tracks the last use of the entry and the least recently used
+entries are removed once the cache grows past its size limit.
+
+All changes to the cache are made while holding a thread and an inter-process
+lock, so the cache directory can be shared by any number of jobs and users.
+Entries are copied in and out without holding the lock: an entry being stored
+is only moved into place under the lock, and an entry being restored is pinned
+under the lock so it is not evicted while it is copied.
+"""
+import contextlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+import os.path
+
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
+
+from fasteners import InterProcessLock
+
+from siliconcompiler.utils.transfer import COPY_STRATEGIES, copy_tree
+
+if TYPE_CHECKING:
+    from siliconcompiler.project import Project
+
+
+class ResultCache:
+    """
+    Local directory backend for the node result cache.
+
+    Args:
+        path (path): directory to store the cache in.
+        max_size (int): maximum size of the cache in bytes.
+        timeout (int): maximum time in seconds to wait for the cache lock.
+    """
+
+    __ENTRY_FILE = "entry.json"
+    __JOURNAL_FILE = "journal.jsonl"
+    __OUTPUTS_DIR = "outputs"
+    __PIN_DIR = "pins"
+    __TMP_DIR = "tmp"
+
+    # Pins left behind by a process which did not finish a restore are
+    # ignored after this many seconds
+    __PIN_TIMEOUT = 24 * 60 * 60
+
+    # File locks are held per process, so threads also need to be serialized
+    __thread_lock = threading.Lock()
+
+    def __init__(self, path: Union[str, Path], max_size: int, timeout: int = 60 * 10):
+        self.__path = Path(path)
+        self.__max_size = max_size
+        self.__timeout = timeout
+
+    @staticmethod
+    def from_project(project: "Project", step: str, index: str) -> Optional["ResultCache"]:
+        """
+        Returns the result cache to use for a node.
+
+        Args:
+            project (Project): project to get the cache settings from.
+            step (str): step name of the node.
+            index (str): index of the node.
+
+        Returns:
+            ResultCache: The cache or None if the cache is not enabled for the node.
+        """
+        from siliconcompiler.package import RemoteResolver
+
+        if not project.option.get_resultcache(step=step, index=index):
+            return None
+
+        return ResultCache(
+            RemoteResolver.determine_cache_dir(project) / "results",
+            project.option.get_resultcachesize() * 1024 * 1024)
+
+    @property
+    def path(self) -> Path:
+        """The directory of the cache."""
+        return self.__path
+
+    @property
+    def max_size(self) -> int:
+        """The maximum size of the cache in bytes."""
+        return self.__max_size
+
+    def __entry_path(self, key: str) -> Path:
+        return self.__path / key[0:2] / key
+
+    @contextlib.contextmanager
+    def lock(self):
+        """
+        A context manager that acquires the thread and inter-process locks of the cache.
+
+        Raises:
+            RuntimeError: If the lock cannot be acquired.
+        """
+        os.makedirs(self.__path, exist_ok=True)
+
+        lock_file = self.__path / "resultcache.lock"
+        if not ResultCache.__thread_lock.acquire(timeout=self.__timeout):
+            raise RuntimeError(f'Failed to access {self.__path}. '
+                               'Another thread is currently holding the lock.')
+        try:
+            lock = InterProcessLock(lock_file)
+            if not lock.acquire(timeout=self.__timeout):
+                raise RuntimeError(f'Failed to access {self.__path}. '
+                                   f'{lock_file} is still locked.')
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            ResultCache.__thread_lock.release()
+
+    @staticmethod
+    def __get_size(path: Path) -> int:
+        size = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                size += os.path.getsize(os.path.join(root, name))
+        return size
+
+    def has(self, key: str) -> bool:
+        """
+        Checks if the cache has an entry for a key.
+
+        Args:
+            key (str): key of the entry.
+        """
+        return os.path.isfile(self.__entry_path(key) / ResultCache.__ENTRY_FILE)
+
+    def restore(self, key: str, workdir: str, journal: str) -> bool:
+        """
+        Restores an entry into a node directory.
+
+        The outputs are copied into the ``outputs/`` directory of the node,
+        replacing what is there, and the journal is copied to ``journal``.
+
+        Args:
+            key (str): key of the entry.
+            workdir (path): working directory of the node.
+            journal (path): path to copy the journal to.
+
+        Returns:
+            bool: True if the entry was restored, False if it is not in the cache.
+        """
+        if not self.has(key):
+            return False
+
+        with self.lock():
+            if not self.has(key):
+                # removed while waiting for the lock
+                return False
+            pin = self.__pin(key)
+
+            # mark as recently used
+            os.utime(self.__entry_path(key) / ResultCache.__ENTRY_FILE)
+
+        # Copy next to the node directory without holding the lock, to avoid
+        # blocking other nodes while large outputs are copied.
+        entry = self.__entry_path(key)
+        outputs = os.path.join(workdir, ResultCache.__OUTPUTS_DIR)
+        tmp_id = uuid.uuid4().hex
+        tmp_outputs = f"{outputs}-{tmp_id}"
+        tmp_journal = f"{journal}-{tmp_id}"
+        try:
+            copy_tree(str(entry / ResultCache.__OUTPUTS_DIR), tmp_outputs, COPY_STRATEGIES,
+                      symlinks=True)
+            shutil.copy2(entry / ResultCache.__JOURNAL_FILE, tmp_journal)
+
+            shutil.rmtree(outputs, ignore_errors=True)
+            os.replace(tmp_outputs, outputs)
+            os.replace(tmp_journal, journal)
+        finally:
+            shutil.rmtree(tmp_outputs, ignore_errors=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_journal)
+            pin.unlink(missing_ok=True)
+
+        return True
+
+    def __pin(self, key: str) -> Path:
+        """
+        Pins an entry so it is not evicted. Must be called while holding the lock.
+
+        Args:
+            key (str): key of the entry.
+
+        Returns:
+            path: the pin, to remove once the entry is no longer used.
+        """
+        pin_dir = self.__path / ResultCache.__PIN_DIR
+        os.makedirs(pin_dir, exist_ok=True)
+        pin = pin_dir / f"{key}-{uuid.uuid4().hex}"
+        pin.touch()
+        return pin
+
+    def __get_pinned(self) -> Set[str]:
+        pinned = set()
+        stale = time.time() - ResultCache.__PIN_TIMEOUT
+        for pin in (self.__path / ResultCache.__PIN_DIR).glob("*-*"):
+            try:
+                if os.path.getmtime(pin) >= stale:
+                    pinned.add(pin.name.rsplit("-", 1)[0])
+            except OSError:
+                continue
+        return pinned
+
+    def store(self, key: str, workdir: str, journal: str,
+              info: Optional[Dict] = None,
+              exclude: Optional[List[str]] = None) -> bool:
+        """
+        Stores the results of a node.
+
+        Args:
+            key (str): key of the entry.
+            workdir (path): working directory of the node.
+            journal (path): path to the journal file of the node.
+            info (dict): additional information to record in the entry.
+            exclude (list of str): names of files in ``outputs/`` to leave out.
+
+        Returns:
+            bool: True if the entry was added, False if it was already in the cache.
+        """
+        if self.has(key):
+            return False
+
+        exclude = set(exclude or [])
+
+        # Copy into a temporary directory without holding the lock,
+        # to avoid blocking other nodes while large outputs are copied.
+        tmp_dir = self.__path / ResultCache.__TMP_DIR
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_entry = tmp_dir / f"{key}-{uuid.uuid4().hex}"
+        try:
+            copy_tree(
+                os.path.join(workdir, ResultCache.__OUTPUTS_DIR),
+                str(tmp_entry / ResultCache.__OUTPUTS_DIR),
+                COPY_STRATEGIES,
+                symlinks=True,
+                ignore=lambda _, names: [name for name in names if name in exclude])
+            shutil.copy2(journal, tmp_entry / ResultCache.__JOURNAL_FILE)
+
+            entry_info = {
+                "key": key,
+                "size": self.__get_size(tmp_entry),
+                "created": time.time()
+            }
+            if info:
+                entry_info.update(info)
+            with open(tmp_entry / ResultCache.__ENTRY_FILE, "w", encoding="utf-8") as f:
+                json.dump(entry_info, f, indent=2)
+
+            with self.lock():
+                if self.has(key):
+                    return False
+
+                entry = self.__entry_path(key)
+                shutil.rmtree(entry, ignore_errors=True)
+                os.makedirs(entry.parent, exist_ok=True)
+                os.replace(tmp_entry, entry)
+
+                self.__evict()
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        return True
+
+    def __get_entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for entry_file in self.__path.glob(f"*/*/{ResultCache.__ENTRY_FILE}"):
+            entry = entry_file.parent
+            if entry.parent.name != entry.name[0:2]:
+                # not a committed entry, such as one being stored under tmp/
+                continue
+            try:
+                with open(entry_file, "r", encoding="utf-8") as f:
+                    size = json.load(f)["size"]
+                entries.append((os.path.getmtime(entry_file), size, entry))
+            except (OSError, ValueError, KeyError):
+                continue
+        return entries
+
+    def size(self) -> int:
+        """
+        Returns the size of the entries in the cache in bytes.
+        """
+        return sum(size for _, size, _ in self.__get_entries())
+
+    def __evict(self) -> None:
+        entries = sorted(self.__get_entries())
+        total = sum(size for _, size, _ in entries)
+        pinned = self.__get_pinned()
+
+        for _, size, entry in entries:
+            if total <= self.__max_size:
+                break
+            if entry.name in pinned:
+                # being restored
+                continue
+            # remove the entry file first so a partial removal is not treated as an entry
+            (entry / ResultCache.__ENTRY_FILE).unlink(missing_ok=True)
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits in its size limit.
+        """
+        with self.lock():
+            self.__evict()
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache, except those being restored.
+        """
+        with self.lock():
+            pinned = self.__get_pinned()
+            for _, _, entry in self.__get_entries():
+                if entry.name in pinned:
+                    # being restored
+                    continue
+                (entry / ResultCache.__ENTRY_FILE).unlink(missing_ok=True)
+                shutil.rmtree(entry, ignore_errors=True)
@@ -17,8 +17,6 @@ from siliconcompiler import NodeStatus, Task
 from siliconcompiler.schema import Journal
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 from siliconcompiler.scheduler import SchedulerNode
-from siliconcompiler.scheduler import SlurmSchedulerNode
-from siliconcompiler.scheduler import DockerSchedulerNode
 from siliconcompiler.scheduler import TaskScheduler
 from siliconcompiler.scheduler.schedulernode import SchedulerFlowReset, SchedulerNodeReset
 from siliconcompiler.tool import TaskExecutableNotFound, TaskExecutableNotReceived
@@ -28,6 +26,7 @@ from siliconcompiler.utils.logging import SCLoggerFormatter
 from siliconcompiler.utils.multiprocessing import MPManager, get_process_context, forking
 from siliconcompiler.scheduler import send_messages, SCRuntimeError
 from siliconcompiler.utils.paths import collectiondir, jobdir
+from siliconcompiler.utils.transfer import LINK_STRATEGIES, copy_tree
 from siliconcompiler.utils.curation import collect
 
 if TYPE_CHECKING:
@@ -117,8 +116,10 @@ class Scheduler:
 
             node_scheduler = self.__project.option.scheduler.get_name(step=step, index=index)
             if node_scheduler == 'slurm':
+                from siliconcompiler.scheduler.slurm import SlurmSchedulerNode
                 node_cls = SlurmSchedulerNode
             elif node_scheduler == 'docker':
+                from siliconcompiler.scheduler.docker import DockerSchedulerNode
                 node_cls = DockerSchedulerNode
             elif node_scheduler is None:
                 pass
@@ -454,9 +455,7 @@ class Scheduler:
             self.__project.option.set_jobname(curret_job)
             copy_to = collectiondir(self.__project)
             if os.path.exists(copy_from):
-                shutil.copytree(copy_from, copy_to,
-                                dirs_exist_ok=True,
-                                copy_function=utils.link_copy)
+                copy_tree(copy_from, copy_to, LINK_STRATEGIES)
 
         self.__reset_flow_nodes()
 
@@ -1,5 +1,8 @@
+import collections
 import contextlib
 import glob
+import hashlib
+import json
 import logging
 import os
 import shutil
@@ -11,16 +14,23 @@ import os.path
 
 from siliconcompiler.utils.multiprocessing import MPQueueHandler as QueueHandler
 
-from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from siliconcompiler import utils, sc_open
 from siliconcompiler import NodeStatus
 from siliconcompiler.utils.logging import get_console_formatter, SCInRunLoggerFormatter
+from siliconcompiler.utils.logscan import LogScanner
+from siliconcompiler.utils.trace import Tracer
+from siliconcompiler.utils.transfer import LINK_STRATEGIES, LINK_SYMLINK_STRATEGIES, \
+    copy_tree, transfer_file
 
 from siliconcompiler.utils.multiprocessing import MPManager
 from siliconcompiler.schema_support.record import RecordTime, RecordTool
 from siliconcompiler.schema import Journal, Parameter
+from siliconcompiler.schema.filehash import FileHashCache
+from siliconcompiler.schema.parametervalue import PathNodeValue
 from siliconcompiler.scheduler import send_messages
+from siliconcompiler.scheduler.resultcache import ResultCache
 from siliconcompiler.utils.paths import workdir, jobdir, collectiondir, cwdir
 
 if TYPE_CHECKING:
@@ -113,6 +123,10 @@ class SchedulerNode:
         self.__replay = replay
         self.__hash = self.__project.option.get_hash()
         self.__builtin = False
+        self.__result_cache: Optional[ResultCache] = None
+        self.__result_cache_key: Optional[str] = None
+        self.__tracer = Tracer(f"{self.__step}/{self.__index}")
+        self.__transfers = collections.Counter()
 
         self.__enforce_inputfiles = True
         self.__enforce_outputfiles = True
@@ -259,6 +273,9 @@ class SchedulerNode:
             "sc": os.path.join(self.__workdir, f"sc_{self.__step}_{self.__index}.log"),
             "exe": os.path.join(self.__workdir, f"{self.__step}.log")
         }
+        self.__journal_file = os.path.join(self.__workdir, f"{self.__name}.journal.jsonl")
+        self.__trace_file = os.path.join(self.__workdir,
+                                         f"sc_{self.__step}_{self.__index}.trace.json")
         self.__replay_script = os.path.join(self.__workdir, "replay.sh")
         self.__collection_path = collectiondir(self.__project)
 
@@ -277,6 +294,55 @@ class SchedulerNode:
             return self.__manifests["input"]
         return self.__manifests["output"]
 
+    def get_journal(self) -> str:
+        """
+        Gets the path to the journal file for this node.
+
+        The journal file contains the same transactions as the journal in the
+        output manifest, but can be replayed without loading the full manifest.
+
+        Returns:
+            str: The absolute path to the journal file.
+        """
+        return self.__journal_file
+
+    def get_trace(self) -> str:
+        """
+        Gets the path to the trace file for this node.
+
+        The trace file records where the node spent its time as Chrome trace
+        events, see :class:`~siliconcompiler.utils.trace.Tracer`.
+
+        Returns:
+            str: The absolute path to the trace file.
+        """
+        return self.__trace_file
+
+    def get_transfers(self) -> Dict[str, int]:
+        """
+        Gets the number of files this node transferred with each strategy.
+
+        Files are transferred when inputs are forwarded, when a skipped node
+        forwards its inputs as outputs and when the node is copied from a
+        previous job, see :mod:`siliconcompiler.utils.transfer`.
+
+        Returns:
+            dict: number of files for each strategy used.
+        """
+        return dict(self.__transfers)
+
+    def __transfer(self, src: "os.DirEntry", dst: str, strategies: Tuple[str, ...]) -> None:
+        """
+        Private helper to transfer a file or directory and record the strategies used.
+        """
+        try:
+            if src.is_file() or src.is_symlink():
+                self.__transfers[transfer_file(src.path, dst, strategies)] += 1
+            elif src.is_dir():
+                self.__transfers.update(copy_tree(src.path, dst, strategies))
+        except OSError as e:
+            self.logger.warning(f"Unable to transfer {src.path}: {e}")
+
     def get_log(self, type: str = "exe") -> str:
         """
         Gets the path to a specific log file for this node.
@@ -386,7 +452,7 @@ class SchedulerNode:
 
             self.__record.set("status", NodeStatus.ERROR, step=self.__step, index=self.__index)
             try:
-                self.__project.write_manifest(self.__manifests["output"])
+                self.__write_output_manifest()
             except FileNotFoundError:
                 self.logger.error(f"Failed to write manifest for {self.__step}/{self.__index}.")
 
@@ -694,6 +760,162 @@ class SchedulerNode:
                     self.check_values_changed(previous_node, value_keys.union(path_keys))
                     self.check_files_changed(previous_node, previous_node_time, path_keys)
 
+    def get_result_cache_key(self) -> Optional[str]:
+        """
+        Computes the key of this node in the result cache.
+
+        The key covers the tool, task and tool version, the values of the keys
+        from :meth:`get_check_changed_keys`, the contents of the files those
+        keys point to and the contents of the 'inputs/' directory.
+
+        Returns:
+            str: The key, or None if the version of the tool cannot be determined.
+
+        Raises:
+            FileNotFoundError: If a file used by the node cannot be found.
+            KeyError: If a required keypath is not found in the schema.
+        """
+        hashobj = hashlib.sha256()
+
+        def update(*values):
+            hashobj.update(json.dumps(values, default=str).encode("utf-8"))
+
+        def update_path(path):
+            if os.path.isdir(path):
+                files = []
+                for path_root, _, path_files in os.walk(path):
+                    files.extend([os.path.join(path_root, f) for f in path_files])
+                for path_file in sorted(files):
+                    update(os.path.relpath(path_file, path),
+                           PathNodeValue.hash_file(path_file, hashfunction="sha256"))
+            else:
+                update(os.path.basename(path),
+                       PathNodeValue.hash_file(path, hashfunction="sha256"))
+
+        with self.__set_env():
+            exe = self.__task.get_exe()
+            version = None
+            if exe:
+                version = self.__task.get_exe_version(workdir=self.__workdir)
+                if version is None:
+                    return None
+
+        update(self.__step, self.__index, self.__topmodule,
+               self.__task.tool(), self.__task.task(), version)
+
+        value_keys, path_keys = self.get_check_changed_keys()
+        for key in sorted(value_keys):
+            param = self.__project.get(*key, field=None)
+            step, index = self.__step, self.__index
+            if param.get(field='pernode').is_never():
+                step, index = None, None
+            update(key, param.get(step=step, index=index))
+
+        for key in sorted(path_keys):
+            param = self.__project.get(*key, field=None)
+            step, index = self.__step, self.__index
+            if param.get(field='pernode').is_never():
+                step, index = None, None
+            files = self.__project.find_files(*key, step=step, index=index)
+            if not isinstance(files, (list, set, tuple)):
+                files = [files]
+            update(key)
+            for path in files:
+                if path is not None:
+                    update_path(path)
+
+        input_manifest = os.path.basename(self.__manifests["input"])
+        inputs_dir = os.path.join(self.__workdir, "inputs")
+        if os.path.isdir(inputs_dir):
+            update("inputs")
+            for entry in sorted(os.scandir(inputs_dir), key=lambda entry: entry.name):
+                if entry.name != input_manifest:
+                    update_path(entry.path)
+
+        return hashobj.hexdigest()
+
+    def __restore_result(self) -> bool:
+        """
+        Private helper to restore the results of this node from the result cache.
+
+        Returns:
+            bool: True if the results were restored, False if the node needs to run.
+        """
+        self.__result_cache = ResultCache.from_project(self.__project, self.__step, self.__index)
+        if not self.__result_cache or self.__replay or self.__task.has_breakpoint():
+            return False
+
+        try:
+            self.__result_cache_key = self.get_result_cache_key()
+        except Exception as e:
+            self.logger.warning(f"Unable to compute result cache key: {e}")
+            return False
+
+        if not self.__result_cache_key:
+            return False
+
+        starttime = self.__record.get("starttime", step=self.__step, index=self.__index)
+        inputnode = self.__record.get("inputnode", step=self.__step, index=self.__index)
+
+        try:
+            if not self.__result_cache.restore(self.__result_cache_key, self.__workdir,
+                                               self.__journal_file):
+                return False
+        except (OSError, RuntimeError) as e:
+            self.logger.warning(f"Unable to restore results from result cache: {e}")
+            return False
+
+        self.logger.info(f"Restored {self.__step}/{self.__index} from result cache")
+        Journal.replay_file(self.__project, self.__journal_file)
+
+        # Records from the cached run are replaced by this run
+        self.__record.record_version(self.__step, self.__index)
+        if self.__record_user_info:
+            self.__record.record_userinformation(self.__step, self.__index)
+        self.__record.set("starttime", starttime, step=self.__step, index=self.__index)
+        self.__record.set("inputnode", inputnode, step=self.__step, index=self.__index)
+        self.__record.set('status', NodeStatus.SUCCESS, step=self.__step, index=self.__index)
+
+        self.__record.record_time(self.__step, self.__index, RecordTime.END)
+        self.__metrics.record_tasktime(self.__step, self.__index, self.__record)
+        self.__metrics.record_overhead(self.__step, self.__index, 0.0)
+        self.__metrics.record_totaltime(
+            self.__step, self.__index,
+            self.__flow,
+            self.__record)
+
+        self.__write_output_manifest()
+
+        self.summarize()
+
+        send_messages.send(self.__project, "end", self.__step, self.__index)
+
+        return True
+
+    def __store_result(self) -> None:
+        """
+        Private helper to store the results of a successful run in the result cache.
+        """
+        if not self.__result_cache or not self.__result_cache_key:
+            return
+
+        if self.__record.get('status', step=self.__step, index=self.__index) != \
+                NodeStatus.SUCCESS:
+            return
+
+        try:
+            if self.__result_cache.store(
+                    self.__result_cache_key, self.__workdir, self.__journal_file,
+                    info={
+                        "tool": self.__task.tool(),
+                        "task": self.__task.task(),
+                        "step": self.__step,
+                        "index": self.__index},
+                    exclude=[os.path.basename(self.__manifests["output"])]):
+                self.logger.info(f"Stored {self.__step}/{self.__index} in result cache")
+        except (OSError, RuntimeError) as e:
+            self.logger.warning(f"Unable to store results in result cache: {e}")
+
     def setup_input_directory(self) -> None:
         """
         Prepares the 'inputs/' directory for the node's execution.
@@ -725,14 +947,8 @@ class SchedulerNode:
                     if outfile.name not in in_files and new_name not in in_files:
                         continue
 
-                if outfile.is_file() or outfile.is_symlink():
-                    utils.link_symlink_copy(outfile.path,
-                                            f'{self.__workdir}/inputs/{outfile.name}')
-                elif outfile.is_dir():
-                    shutil.copytree(outfile.path,
-                                    f'{self.__workdir}/inputs/{outfile.name}',
-                                    dirs_exist_ok=True,
-                                    copy_function=utils.link_symlink_copy)
+                self.__transfer(outfile, f'{self.__workdir}/inputs/{outfile.name}',
+                                LINK_SYMLINK_STRATEGIES)
 
                 if new_name in in_files:
                     # perform rename
@@ -826,8 +1042,26 @@ class SchedulerNode:
         Note: Since this method may run in its own process with a separate
         address space, any changes made to the schema are communicated through
         reading/writing the project manifest to the filesystem.
+
+        The time spent in each phase is written to the trace file of the node,
+        see :meth:`get_trace`, even if the node halts, along with the strategies
+        used to transfer files, see :meth:`get_transfers`.
         """
+        self.__tracer = Tracer(f"{self.__step}/{self.__index}")
+        try:
+            with self.__tracer.span("run") as info:
+                try:
+                    self.__run()
+                finally:
+                    if self.__transfers:
+                        info["transfers"] = self.get_transfers()
+        finally:
+            self.__write_trace()
 
+    def __run(self) -> None:
+        """
+        Private helper implementing :meth:`run`.
+        """
         # Setup logger
         self._init_run_logger()
 
@@ -854,7 +1088,8 @@ class SchedulerNode:
         cwd = os.getcwd()
         with self.runtime():
             # Setup run directory
-            self.__task.setup_work_directory(self.__workdir, remove_exist=not self.__replay)
+            with self.__tracer.span("setup_work_directory"):
+                self.__task.setup_work_directory(self.__workdir, remove_exist=not self.__replay)
 
             os.chdir(self.__workdir)
 
@@ -871,21 +1106,33 @@ class SchedulerNode:
             self.__record.set("inputnode", sel_inputs, step=self.__step, index=self.__index)
 
             if self.__hash:
-                self.__hash_files_pre_execute()
+                with self.__tracer.span("hash_inputs"):
+                    FileHashCache.default().load(self.__get_hash_cache_file())
+                    self.__hash_files_pre_execute()
 
             # Forward data
             if not self.__replay:
-                self.setup_input_directory()
+                with self.__tracer.span("setup_input_directory"):
+                    self.setup_input_directory()
 
             # Write manifest prior to step running into inputs
-            self.__project.write_manifest(self.__manifests["input"])
+            with self.__tracer.span("write_input_manifest"):
+                self.__project.write_manifest(self.__manifests["input"], definitions=False)
 
             # Check manifest
-            if not self.validate():
+            with self.__tracer.span("validate"):
+                valid = self.validate()
+            if not valid:
                 self.halt("Failed to validate node setup. See previous errors")
 
             try:
-                self.execute()
+                with self.__tracer.span("restore_result"):
+                    restored = self.__restore_result()
+                if not restored:
+                    with self.__tracer.span("execute"):
+                        self.execute()
+                    with self.__tracer.span("store_result"):
+                        self.__store_result()
             except KeyboardInterrupt:
                 self.halt(errmsg=f"Execution interrupted for {self.__step}/{self.__index}")
             except Exception as e:
@@ -900,6 +1147,17 @@ class SchedulerNode:
 
         self._send_pathcache()
 
+    def __write_trace(self) -> None:
+        """
+        Private helper to write the spans recorded by this node to its trace file.
+
+        Writing is best effort, a trace must never turn into a node failure.
+        """
+        try:
+            self.__tracer.write(self.__trace_file)
+        except OSError as e:
+            self.logger.debug(f"Unable to write trace file: {e}")
+
     def _send_pathcache(self) -> None:
         """
         Sends this node's resolved data source paths back to the parent process.
@@ -994,7 +1252,8 @@ class SchedulerNode:
         self.logger.info(f'Running in {self.__workdir}')
 
         try:
-            self.__task.pre_process()
+            with self.__tracer.span("pre_process"):
+                self.__task.pre_process()
         except TaskSkip as skip:
             self.logger.warning(f'Removing {self.__step}/{self.__index} due to {skip.why}')
             self.__record.set('status', NodeStatus.SKIPPED, step=self.__step, index=self.__index)
@@ -1019,20 +1278,14 @@ class SchedulerNode:
                         # Dont forward non-required outputs
                         continue
 
-                    if outfile.is_file() or outfile.is_symlink():
-                        utils.link_symlink_copy(outfile.path,
-                                                f'outputs/{outfile.name}')
-                    elif outfile.is_dir():
-                        shutil.copytree(outfile.path,
-                                        f'outputs/{outfile.name}',
-                                        dirs_exist_ok=True,
-                                        copy_function=utils.link_symlink_copy)
+                    self.__transfer(outfile, f'outputs/{outfile.name}', LINK_SYMLINK_STRATEGIES)
 
             send_messages.send(self.__project, "skipped", self.__step, self.__index)
         else:
             with self.__set_env():
-                toolpath = self.__task.get_exe()
-                version, version_pass = self.check_version()
+                with self.__tracer.span("check_version"):
+                    toolpath = self.__task.get_exe()
+                    version, version_pass = self.check_version()
 
                 if not version_pass:
                     self.halt()
@@ -1048,13 +1301,17 @@ class SchedulerNode:
 
                 try:
                     if not self.__replay:
-                        self.__task.generate_replay_script(self.__replay_script, self.__workdir)
-                    ret_code = self.__task.run_task(
-                        self.__workdir,
-                        self.__project.option.get_quiet(step=self.__step, index=self.__index),
-                        self.__task.has_breakpoint(),
-                        self.__project.option.get_nice(step=self.__step, index=self.__index),
-                        self.__project.option.get_timeout(step=self.__step, index=self.__index))
+                        with self.__tracer.span("generate_replay_script"):
+                            self.__task.generate_replay_script(self.__replay_script,
+                                                               self.__workdir)
+                    with self.__tracer.span("run_task"):
+                        ret_code = self.__task.run_task(
+                            self.__workdir,
+                            self.__project.option.get_quiet(step=self.__step, index=self.__index),
+                            self.__task.has_breakpoint(),
+                            self.__project.option.get_nice(step=self.__step, index=self.__index),
+                            self.__project.option.get_timeout(step=self.__step,
+                                                              index=self.__index))
                 except Exception:
                     raise
 
@@ -1073,21 +1330,28 @@ class SchedulerNode:
                 self.__error = True
 
             try:
-                self.__task.post_process()
+                with self.__tracer.span("post_process"):
+                    self.__task.post_process()
             except Exception as e:
                 self.logger.error(
                     f"Post-processing failed for {self.__task.tool()}/{self.__task.task()}")
                 utils.print_traceback(self.logger, e)
                 self.__error = True
 
-        self.check_logfile()
+        with self.__tracer.span("check_logfile"):
+            self.check_logfile()
 
-        if not self.__error and self.__hash:
-            self.__hash_files_post_execute()
+        if self.__hash:
+            with self.__tracer.span("hash_outputs"):
+                if not self.__error:
+                    self.__hash_files_post_execute()
+                self.__save_hash_cache()
 
         # Capture wall runtime
         self.__record.record_time(self.__step, self.__index, RecordTime.END)
         self.__metrics.record_tasktime(self.__step, self.__index, self.__record)
+        self.__metrics.record_overhead(self.__step, self.__index,
+                                       self.__tracer.get_duration("run_task"))
         self.__metrics.record_totaltime(
             self.__step, self.__index,
             self.__flow,
@@ -1100,7 +1364,8 @@ class SchedulerNode:
                 NodeStatus.SKIPPED:
             self.__record.set('status', NodeStatus.SUCCESS, step=self.__step, index=self.__index)
 
-        self.__project.write_manifest(self.__manifests["output"])
+        with self.__tracer.span("write_output_manifest"):
+            self.__write_output_manifest()
 
         self.summarize()
 
@@ -1120,6 +1385,16 @@ class SchedulerNode:
 
         send_messages.send(self.__project, "end", self.__step, self.__index)
 
+    def __write_output_manifest(self) -> None:
+        """
+        Private helper to write the output manifest and the journal file.
+
+        The journal file is written first, so a reader that finds the output
+        manifest can rely on the journal file being complete.
+        """
+        Journal.access(self.__project).write_file(self.__journal_file)
+        self.__project.write_manifest(self.__manifests["output"], definitions=False)
+
     def __generate_testcase(self) -> None:
         """
         Private helper to generate a test case upon failure.
@@ -1210,35 +1485,39 @@ class SchedulerNode:
         if 'errors' in checks:
             ordered_suffixes.append('errors')
 
-        print_paths = {}
-        # Looping through patterns for each line
+        # The number of lines is only known once the log is read, so the line
+        # numbers are aligned to the largest number of lines the log can have
+        right_align = len(str(os.path.getsize(self.__logs["exe"]) + 1))
+
+        # Only the lines shown on the display are kept, so they can be shown
+        # in the order of the suffixes
+        display = {suffix: [] for suffix in ordered_suffixes}
+
+        def on_match(suffix, num, string):
+            matches[suffix] += 1
+            # always print to file
+            line_with_num = f'{num: >{right_align}}: {string.strip()}'
+            print(line_with_num, file=checks[suffix]['report'])
+            # selectively print to display
+            if checks[suffix]["display"] and matches[suffix] <= SchedulerNode.__MAX_LOG_PRINT:
+                display[suffix].append(line_with_num)
+
+        # Scan the log once for all suffixes
+        scanner = LogScanner({suffix: info["args"] for suffix, info in checks.items()},
+                             logger=self.__project.logger)
         with sc_open(self.__logs["exe"]) as f:
-            line_count = sum(1 for _ in f)
-            right_align = len(str(line_count))
-            for suffix in ordered_suffixes:
-                print_paths[suffix] = False
-                # Start at the beginning of file again
-                f.seek(0)
-                for num, line in enumerate(f, start=1):
-                    string = line
-                    for item in checks[suffix]['args']:
-                        if string is None:
-                            break
-                        else:
-                            string = utils.grep(self.__project.logger, item, string)
-                    if string is not None:
-                        matches[suffix] += 1
-                        # always print to file
-                        line_with_num = f'{num: >{right_align}}: {string.strip()}'
-                        print(line_with_num, file=checks[suffix]['report'])
-                        # selectively print to display
-                        if checks[suffix]["display"]:
-                            if matches[suffix] <= SchedulerNode.__MAX_LOG_PRINT:
-                                checks[suffix]["display"](suffix, line_with_num)
-                            else:
-                                if not print_paths[suffix]:
-                                    checks[suffix]["display"](suffix, "print limit reached")
-                                print_paths[suffix] = True
+            scanner.scan(f, on_match)
+
+        print_paths = {}
+        for suffix in ordered_suffixes:
+            print_paths[suffix] = False
+            if not checks[suffix]["display"]:
+                continue
+            for line_with_num in display[suffix]:
+                checks[suffix]["display"](suffix, line_with_num)
+            if matches[suffix] > SchedulerNode.__MAX_LOG_PRINT:
+                checks[suffix]["display"](suffix, "print limit reached")
+                print_paths[suffix] = True
 
         for check in checks.values():
             check['report'].close()
@@ -1261,6 +1540,18 @@ class SchedulerNode:
 
                 self.__task.record_metric(metric, value, source_file=sources)
 
+    def __get_hash_cache_file(self) -> str:
+        """Private helper to get the path of the persistent file hash cache."""
+        from siliconcompiler.package import RemoteResolver
+        return str(RemoteResolver.determine_cache_dir(self.__project) / "filehashes.json")
+
+    def __save_hash_cache(self) -> None:
+        """Private helper to save the file hashes computed by this node."""
+        try:
+            FileHashCache.default().save(self.__get_hash_cache_file())
+        except OSError as e:
+            self.logger.warning(f"Unable to save file hash cache: {e}")
+
     def __hash_files_pre_execute(self) -> None:
         """Private helper to hash all relevant input files before execution."""
         for task_key in ('refdir', 'prescript', 'postscript', 'script'):
@@ -1363,10 +1654,7 @@ class SchedulerNode:
             return
 
         self.logger.info(f'Importing {self.__step}/{self.__index} from {source}')
-        shutil.copytree(
-            copy_from, self.__workdir,
-            dirs_exist_ok=True,
-            copy_function=utils.link_copy)
+        self.__transfers.update(copy_tree(copy_from, self.__workdir, LINK_STRATEGIES))
 
         # rewrite replay files
         if os.path.exists(self.__replay_script):
@@ -1382,7 +1670,7 @@ class SchedulerNode:
                 # delete file as it might be a hard link
                 os.remove(manifest)
                 schema.option.set_jobname(self.__job)
-                schema.write_manifest(manifest)
+                schema.write_manifest(manifest, definitions=False)
 
     def clean_directory(self) -> None:
         """Removes the working directory for this node."""
@@ -1468,7 +1756,7 @@ class SchedulerNode:
         path_keys = set()
         for key in self.get_required_keys():
             try:
-                if self.__project.get(*key, field=None).is_path:
+                if self.__project._get_param(*key).is_path:
                     path_keys.add(key)
             except KeyError:
                 # Key does not exist
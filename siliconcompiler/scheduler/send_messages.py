@@ -8,16 +8,12 @@ HTML-formatted emails with relevant job data and attachments (logs, images),
 and sends them to specified recipients.
 """
 import fastjsonschema
+import functools
 import json
 import os
-import smtplib
 import uuid
 
 import os.path
-from email.mime.multipart import MIMEMultipart
-
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
 from pathlib import Path
 
 from siliconcompiler import sc_open
@@ -30,9 +26,15 @@ from siliconcompiler.utils.paths import workdir
 # Compile validation code for API request bodies.
 api_dir = Path(__file__).parent / 'validation'
 
-# 'remote_run': Run a stage of a job using the server's cluster settings.
-with open(api_dir / 'email_credentials.json') as schema:
-    validate_creds = fastjsonschema.compile(json.loads(schema.read()))
+
+@functools.cache
+def __get_validator():
+    '''
+    Compiles the validator for the email credentials on first use, since
+    compiling it is slow and most runs do not send messages.
+    '''
+    with open(api_dir / 'email_credentials.json') as schema:
+        return fastjsonschema.compile(json.loads(schema.read()))
 
 
 def __load_config(project):
@@ -58,7 +60,7 @@ def __load_config(project):
         creds = json.load(f)
 
     try:
-        return validate_creds(creds)
+        return __get_validator()(creds)
     except fastjsonschema.JsonSchemaException as e:
         project.logger.error(f'Email credentials failed to validate: {e}')
         return {}
@@ -98,6 +100,12 @@ def send(project, msg_type, step, index):
     if not cred:
         return
 
+    import smtplib
+
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    from email.mime.application import MIMEApplication
+
     jobname = project.option.get_jobname()
     flow = project.option.get_flow()
 
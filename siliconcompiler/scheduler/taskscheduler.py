@@ -1,5 +1,6 @@
 import logging
 import multiprocessing
+import multiprocessing.connection
 import sys
 import threading
 import time
@@ -7,7 +8,9 @@ import weakref
 
 import os.path
 
-from typing import List, Dict, Tuple, Optional, Callable, Any, Literal, TYPE_CHECKING
+import psutil
+
+from typing import List, Dict, Set, Tuple, Optional, Callable, Any, Literal, TYPE_CHECKING
 
 from logging.handlers import QueueListener
 from multiprocessing.managers import RemoteError
@@ -21,6 +24,8 @@ from siliconcompiler.schema import Journal
 from siliconcompiler.utils.logging import SCBlankLoggerFormatter, \
     SCBlankColorlessLoggerFormatter, SCTeeLoggerHandler
 from siliconcompiler.utils.multiprocessing import MPManager, get_process_context, forking
+from siliconcompiler.utils.paths import jobdir
+from siliconcompiler.utils.trace import Tracer
 from siliconcompiler.scheduler import SCRuntimeError
 
 if TYPE_CHECKING:
@@ -118,12 +123,29 @@ class TaskScheduler:
 
         self.__nodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self.__startTimes: Dict[Optional[Tuple[str, str]], float] = {}
-        self.__dwellTime: float = 0.1
+
+        # Scheduling state, kept up to date as nodes start and finish so the
+        # run loop never has to scan every node.
+        #   waiting: nodes which still need to run (blocked or ready)
+        #   ready: waiting nodes whose inputs have all finished
+        #   running: nodes with a live process
+        self.__waiting: Set[Tuple[str, str]] = set()
+        self.__ready: Set[Tuple[str, str]] = set()
+        self.__running: Set[Tuple[str, str]] = set()
+        self.__running_threads: int = 0
+        self.__running_memory: int = 0
+        # Memory the nodes can use, sampled again for each launch pass
+        self.__memory_budget: Optional[int] = None
 
         # Guards __halt_running_nodes(): halt_all() can arrive on another thread
         # while this run's own cleanup is ending the same processes.
         self.__halt_lock = threading.Lock()
 
+        # Time spent by the scheduler itself, merged with the traces of the
+        # nodes into the trace of the job
+        self.__tracer = Tracer("scheduler")
+        self.__trace_file = os.path.join(jobdir(self.__project), "job.trace.json")
+
         self.__create_nodes(tasks)
 
         with TaskScheduler.__instances_lock:
@@ -155,8 +177,10 @@ class TaskScheduler:
                 "proc": None,
                 "parent_pipe": None,
                 "threads": None,
+                "memory": 0,
                 "running": False,
                 "manifest": None,
+                "journal": None,
                 "breakpoint": False,
                 "node": tasks[(step, index)]
             }
@@ -164,6 +188,7 @@ class TaskScheduler:
             with tasks[(step, index)].runtime():
                 threads = tasks[(step, index)].threads
                 task["manifest"] = tasks[(step, index)].get_manifest()
+                task["journal"] = tasks[(step, index)].get_journal()
                 task["breakpoint"] = tasks[(step, index)].task.has_breakpoint()
             if not threads:
                 threads = self.__max_threads
@@ -178,6 +203,225 @@ class TaskScheduler:
             for node in levelnodes:
                 if node in self.__nodes:
                     self.__ordered_nodes.append(node)
+        self.__node_order: Dict[Tuple[str, str], int] = {
+            node: n for n, node in enumerate(self.__ordered_nodes)}
+
+        # Link each node to the nodes which consume its outputs and count
+        # the inputs which have not finished yet.
+        for info in self.__nodes.values():
+            info["outputs"] = []
+        for node, info in self.__nodes.items():
+            info["pending"] = 0
+            for in_node in info["inputs"]:
+                if in_node in self.__nodes:
+                    self.__nodes[in_node]["outputs"].append(node)
+                    info["pending"] += 1
+                else:
+                    in_step, in_index = in_node
+                    in_status = self.__record.get('status', step=in_step, index=in_index)
+                    if not NodeStatus.is_done(in_status):
+                        info["pending"] += 1
+
+        self.__waiting.update(self.__nodes.keys())
+        for node in self.__ordered_nodes:
+            if self.__nodes[node]["pending"] == 0:
+                self.__mark_ready(node)
+
+        self.__compute_memory()
+        self.__compute_priorities()
+
+    def __collect_history(self, metrics: Tuple[str, ...]) \
+            -> Tuple[Dict[Tuple[str, str], List[float]],
+                     Dict[Tuple[str, str], List[float]],
+                     Dict[str, List[float]]]:
+        """
+        Private helper to collect a metric recorded by previous jobs.
+
+        Args:
+            metrics (tuple): Names of the metrics to look up, the first one
+                recorded for a node is used.
+
+        Returns:
+            tuple: Three dictionaries of recorded values, keyed by (step, index),
+            by (tool, task) and by tool.
+        """
+        node_values: Dict[Tuple[str, str], List[float]] = {}
+        task_values: Dict[Tuple[str, str], List[float]] = {}
+        tool_values: Dict[str, List[float]] = {}
+
+        for job in self.__project.getkeys("history"):
+            history = self.__project.history(job)
+            try:
+                flow = history.get_flow()
+            except (KeyError, ValueError):
+                continue
+
+            for step, index in flow.get_nodes():
+                value = None
+                for metric in metrics:
+                    value = history.get("metric", metric, step=step, index=index)
+                    if value is not None:
+                        break
+                if value is None:
+                    continue
+
+                graph_node = flow.get_graph_node(step, index)
+                tool = graph_node.get("tool")
+                task = graph_node.get("task")
+
+                node_values.setdefault((step, index), []).append(value)
+                task_values.setdefault((tool, task), []).append(value)
+                tool_values.setdefault(tool, []).append(value)
+
+        return node_values, task_values, tool_values
+
+    def __compute_memory(self) -> None:
+        """
+        Private helper to compute the memory reservation of each node.
+
+        The reservation is the memory declared in :keypath:`option,scheduler,memory`
+        for the node. Otherwise it is the peak :keypath:`metric,memory` recorded
+        in the job history for the same node, or else for the same tool and task.
+        Nodes without a reservation are only limited by the core count.
+        """
+        node_memory, task_memory, _ = self.__collect_history(("memory",))
+
+        for node, info in self.__nodes.items():
+            step, index = node
+
+            declared = self.__project.option.scheduler.get_memory(step=step, index=index)
+            if declared:
+                info["memory"] = declared * 1024 * 1024
+                continue
+
+            graph_node = self.__flow.get_graph_node(step, index)
+            tool = graph_node.get("tool")
+            task = graph_node.get("task")
+
+            if node in node_memory:
+                info["memory"] = int(max(node_memory[node]))
+            elif (tool, task) in task_memory:
+                info["memory"] = int(max(task_memory[(tool, task)]))
+
+    def __compute_priorities(self) -> None:
+        """
+        Private helper to compute the expected runtime and priority of each node.
+
+        With the critical_path policy, the expected runtime of a node is taken
+        from the job history for the same node, or else the average for the
+        same tool and task. Otherwise builtin nodes are expected to take no
+        time and other nodes use the average for the same tool, or else the
+        average runtime seen in the history.
+
+        The priority of a node is its expected runtime plus the largest
+        priority of the nodes consuming its outputs, which is the remaining
+        work on the longest path starting at the node.
+        """
+        self.__critical_path = \
+            self.__project.option.scheduler.get_priority() == "critical_path"
+
+        self.__weights: Dict[Tuple[str, str], float] = {node: 0.0 for node in self.__nodes}
+        self.__priority: Dict[Tuple[str, str], float] = {node: 0.0 for node in self.__nodes}
+
+        if not self.__critical_path:
+            return
+
+        def average(values: List[float]) -> float:
+            return sum(values) / len(values)
+
+        node_times, task_times, tool_times = self.__collect_history(("tasktime", "exetime"))
+        all_times = [runtime for times in node_times.values() for runtime in times]
+        default_time = average(all_times) if all_times else 1.0
+
+        for node, info in self.__nodes.items():
+            step, index = node
+            graph_node = self.__flow.get_graph_node(step, index)
+            tool = graph_node.get("tool")
+            task = graph_node.get("task")
+
+            if node in node_times:
+                weight = average(node_times[node])
+            elif (tool, task) in task_times:
+                weight = average(task_times[(tool, task)])
+            elif info["node"].is_builtin:
+                weight = 0.0
+            elif tool in tool_times:
+                weight = average(tool_times[tool])
+            else:
+                weight = default_time
+            self.__weights[node] = weight
+
+        for node in reversed(self.__ordered_nodes):
+            downstream = [self.__priority[out_node] for out_node in self.__nodes[node]["outputs"]]
+            self.__priority[node] = self.__weights[node] + max(downstream, default=0.0)
+
+    def __prioritize_nodes(self, nodes) -> List[Tuple[str, str]]:
+        """
+        Private helper to sort nodes in the order they should be started.
+
+        Args:
+            nodes (iterable): (step, index) tuples to sort.
+
+        Returns:
+            list: A list of (step, index) tuples, highest priority first.
+        """
+        if not self.__critical_path:
+            return self.__sort_nodes(nodes)
+
+        return sorted(nodes, key=lambda node: (-self.__priority[node], self.__node_order[node]))
+
+    def __sort_nodes(self, nodes) -> List[Tuple[str, str]]:
+        """
+        Private helper to sort nodes into execution order.
+
+        Args:
+            nodes (iterable): (step, index) tuples to sort.
+
+        Returns:
+            list: A list of (step, index) tuples in execution order.
+        """
+        return sorted(nodes, key=self.__node_order.__getitem__)
+
+    def __mark_ready(self, node: Tuple[str, str]) -> None:
+        """
+        Private helper to handle a node whose inputs have all finished.
+
+        The node is moved into the ready set if it is able to run, otherwise
+        it is removed from the set of waiting nodes.
+
+        Rules:
+            - a non-builtin node requires all of its inputs to have not failed.
+            - a builtin node requires at least one input to have succeeded.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        info = self.__nodes[node]
+
+        inputs = []
+        able_to_run = True
+        for in_step, in_index in info["inputs"]:
+            in_status = self.__record.get('status', step=in_step, index=in_index)
+            inputs.append(in_status)
+
+            if NodeStatus.is_error(in_status) and not info["node"].is_builtin:
+                # Fail if any dependency failed for non-builtin task
+                able_to_run = False
+
+        # Fail if no dependency successfully finished for builtin task
+        if inputs:
+            any_success = any([status == NodeStatus.SUCCESS for status in inputs])
+        else:
+            any_success = True
+        if info["node"].is_builtin and not any_success:
+            able_to_run = False
+
+        if not able_to_run:
+            info["proc"] = None
+            self.__waiting.discard(node)
+            return
+
+        self.__ready.add(node)
 
     def run(self, job_log_handler: logging.Handler) -> None:
         """
@@ -187,6 +431,10 @@ class TaskScheduler:
         calls the 'pre_run' callback, enters the main execution loop, and
         handles cleanup and the 'post_run' callback.
 
+        Once the run ends, the time spent by the scheduler and by each node
+        which was started is written as a Chrome trace to ``job.trace.json``
+        in the job directory.
+
         Args:
             job_log_handler (logging.FileHandler): The handler for the main job log file.
         """
@@ -219,7 +467,8 @@ class TaskScheduler:
             'TaskScheduler', 'pre_run', lambda project: None)(self.__project)
 
         try:
-            self.__run_loop()
+            with self.__tracer.span("run"):
+                self.__run_loop()
             MPManager.get_transient_settings().get(
                 'TaskScheduler', 'post_run', lambda project: None)(self.__project)
         except KeyboardInterrupt:
@@ -267,6 +516,27 @@ class TaskScheduler:
             job_log_handler.setFormatter(file_formatter)
             self.__logger.addHandler(job_log_handler)
 
+            self.__write_trace()
+
+    def __write_trace(self) -> None:
+        """
+        Private helper to write the trace of the job.
+
+        The events of the scheduler are merged with the trace files written by
+        the nodes which were started during this run. Writing is best effort,
+        a trace must never turn into a run failure.
+        """
+        events = []
+        for node in self.__startTimes:
+            if node is None:
+                continue
+            events.extend(Tracer.read(self.__nodes[node]["node"].get_trace()))
+
+        try:
+            self.__tracer.write(self.__trace_file, events)
+        except OSError as e:
+            self.__logger.debug(f"Unable to write trace file: {e}")
+
     def __run_loop(self) -> None:
         """
         The core execution loop of the scheduler.
@@ -277,7 +547,7 @@ class TaskScheduler:
         """
         self.__startTimes = {None: time.time()}
 
-        while len(self.get_nodes_waiting_to_run()) > 0 or len(self.get_running_nodes()) > 0:
+        while self.__waiting or self.__running:
             changed = self.__process_completed_nodes()
             changed |= self.__launch_nodes()
 
@@ -285,20 +555,18 @@ class TaskScheduler:
                 # Update dashboard if the manifest changed
                 self.__dashboard.update_manifest(payload={"starttimes": self.__startTimes})
 
-            running_nodes = self.get_running_nodes()
-
             # Check for situation where we have stuff left to run but don't
             # have any nodes running. This can happen when the flow generated an error
-            if len(self.get_nodes_waiting_to_run()) > 0 and len(running_nodes) == 0:
+            if not self.__running:
                 # Stop execution loop and report error
                 break
 
-            if len(running_nodes) == 1:
-                # if there is only one node running, just join the thread
-                self.__nodes[running_nodes[0]]["proc"].join()
-            elif len(running_nodes) > 1:
-                # if there are more than 1, join the first with a timeout
-                self.__nodes[running_nodes[0]]["proc"].join(timeout=self.__dwellTime)
+            # Sleep until at least one of the running nodes finishes, a node
+            # which has already finished is picked up on the next pass.
+            sentinels = [self.__nodes[node]["proc"].sentinel for node in self.__running
+                         if self.__nodes[node]["proc"].is_alive()]
+            if sentinels:
+                multiprocessing.connection.wait(sentinels)
 
     @staticmethod
     def halt_all() -> int:
@@ -373,12 +641,7 @@ class TaskScheduler:
         Returns:
             list: A list of (step, index) tuples for running nodes.
         """
-        nodes = []
-        for node in self.get_nodes():
-            info = self.__nodes[node]
-            if info["running"]:
-                nodes.append(node)
-        return nodes
+        return self.__sort_nodes(self.__running)
 
     def get_nodes_waiting_to_run(self) -> List[Tuple[str, str]]:
         """Gets an ordered list of all nodes that are pending execution.
@@ -386,12 +649,7 @@ class TaskScheduler:
         Returns:
             list: A list of (step, index) tuples for pending nodes.
         """
-        nodes = []
-        for node in self.get_nodes():
-            info = self.__nodes[node]
-            if not info["running"] and info["proc"]:
-                nodes.append(node)
-        return nodes
+        return self.__sort_nodes(self.__waiting)
 
     def __process_completed_nodes(self) -> bool:
         """
@@ -402,6 +660,9 @@ class TaskScheduler:
         back into the main project object. It updates the node's status based on
         the process exit code.
 
+        Once a node is complete, the nodes which consume its outputs are
+        updated and marked as ready if this was their last pending input.
+
         Returns:
             bool: True if any node's status changed, False otherwise.
         """
@@ -412,10 +673,15 @@ class TaskScheduler:
             if not info["proc"].is_alive():
                 manifest = info["manifest"]
 
+                # Prefer the journal file, since it avoids loading the full manifest
+                if os.path.exists(info["journal"]):
+                    manifest = info["journal"]
+
                 self.__logger.debug(f'{info["name"]} is complete merging: {manifest}')
 
                 if os.path.exists(manifest):
-                    Journal.replay_file(self.__schema, manifest)
+                    with self.__tracer.span("replay_journal", node=info["name"]):
+                        Journal.replay_file(self.__schema, manifest)
 
                 # The child either sent the package cache before exiting or
                 # it never will. poll(0) avoids blocking the scheduler loop
@@ -451,6 +717,15 @@ class TaskScheduler:
 
                 info["running"] = False
                 info["proc"] = None
+                self.__running.discard(node)
+                self.__running_threads -= info["threads"]
+                self.__running_memory -= info["memory"]
+
+                for out_node in info["outputs"]:
+                    out_info = self.__nodes[out_node]
+                    out_info["pending"] -= 1
+                    if out_info["pending"] == 0 and out_node in self.__waiting:
+                        self.__mark_ready(out_node)
 
                 changed = True
 
@@ -460,12 +735,73 @@ class TaskScheduler:
 
         return changed
 
+    @staticmethod
+    def __get_available_memory() -> int:
+        """
+        Private helper to get the memory available on the machine.
+
+        Returns:
+            int: The available memory in bytes, or 0 if it cannot be determined.
+        """
+        try:
+            return psutil.virtual_memory().available
+        except psutil.Error:
+            return 0
+
+    @staticmethod
+    def __get_process_memory(pid: int) -> int:
+        """
+        Private helper to get the memory used by a process and its children.
+
+        Args:
+            pid (int): The process ID.
+
+        Returns:
+            int: The resident memory in bytes, or 0 if it cannot be determined.
+        """
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc, *proc.children(recursive=True)]
+        except psutil.Error:
+            return 0
+
+        memory = 0
+        for proc in procs:
+            try:
+                memory += proc.memory_info().rss
+            except psutil.Error:
+                pass
+        return memory
+
+    def __get_memory_budget(self) -> int:
+        """
+        Private helper to get the memory the nodes of this run can use.
+
+        This is the memory available on the machine now, plus the memory the
+        running nodes already use, so memory freed or taken by other processes
+        while the run goes on is accounted for. It is sampled once per launch
+        pass.
+
+        Returns:
+            int: The memory in bytes, or 0 if it cannot be determined.
+        """
+        if self.__memory_budget is None:
+            available = self.__get_available_memory()
+            if available:
+                for node in self.__running:
+                    info = self.__nodes[node]
+                    if info["node"].is_local:
+                        available += self.__get_process_memory(info["proc"].pid)
+            self.__memory_budget = available
+        return self.__memory_budget
+
     def __allow_start(self, node: Tuple[str, str]) -> bool:
         """
         Private helper to check if a node is allowed to start based on resources.
 
         This method checks if launching a new node would exceed the configured
-        maximum number of parallel jobs or the total available CPU cores.
+        maximum number of parallel jobs, the total available CPU cores or the
+        memory the nodes can use, see :meth:`__get_memory_budget`.
 
         Args:
             node (tuple): The (step, index) of the node to check.
@@ -479,18 +815,21 @@ class TaskScheduler:
             # using a different scheduler, so allow
             return True
 
-        running_nodes = self.get_running_nodes()
-
-        if len(running_nodes) >= self.__max_parallel_run:
+        if len(self.__running) >= self.__max_parallel_run:
             # exceeding machine resources
             return False
 
-        current_threads = sum([self.__nodes[run_node]["threads"] for run_node in running_nodes])
-
-        if info["threads"] + current_threads > self.__max_cores:
+        if info["threads"] + self.__running_threads > self.__max_cores:
             # delay until there are enough core available
             return False
 
+        if info["memory"] and self.__running:
+            budget = self.__get_memory_budget()
+            if budget and info["memory"] + self.__running_memory > budget:
+                # delay until there is enough memory available, a node is
+                # always allowed to run by itself
+                return False
+
         # allow
         return True
 
@@ -518,18 +857,23 @@ class TaskScheduler:
 
         # Start the process
         info["running"] = True
+        self.__waiting.discard(node)
+        self.__ready.discard(node)
+        self.__running.add(node)
+        self.__running_threads += info["threads"]
+        self.__running_memory += info["memory"]
         info["parent_pipe"], pipe = get_process_context().Pipe()
         info["node"].set_queue(pipe, self.__log_queue)
-        with forking():
-            info["proc"].start()
+        with self.__tracer.span("start_node", node=info["name"]):
+            with forking():
+                info["proc"].start()
 
     def __launch_nodes(self) -> bool:
         """
         Private helper to launch new nodes whose dependencies are met.
 
-        This method iterates through pending nodes, checks if all their input
-        nodes have completed successfully, and if system resources are available.
-        If all conditions are met, it starts the node's process.
+        This method iterates through the nodes whose input nodes have all
+        completed and starts them if system resources are available.
 
         Breakpoint handling: a node with a breakpoint must execute in complete
         isolation. It takes priority over ordinary nodes, may only start once
@@ -541,6 +885,7 @@ class TaskScheduler:
             bool: True if any new node was launched, False otherwise.
         """
         changed = False
+        self.__memory_budget = None
 
         running_nodes = self.get_running_nodes()
 
@@ -549,42 +894,7 @@ class TaskScheduler:
         if any(self.__nodes[node]["breakpoint"] for node in running_nodes):
             return changed
 
-        # First evaluate every waiting node's dependencies. This determines
-        # which nodes are ready to launch and, as a side effect, prunes nodes
-        # whose dependencies failed (clearing their proc so they are no longer
-        # considered waiting). This evaluation must happen regardless of any
-        # breakpoint gating below.
-        ready_nodes: List[Tuple[str, str]] = []
-        for node in self.get_nodes_waiting_to_run():
-            info = self.__nodes[node]
-
-            ready = True
-            inputs = []
-            able_to_run = True
-            for in_step, in_index in info["inputs"]:
-                in_status = self.__record.get('status', step=in_step, index=in_index)
-                inputs.append(in_status)
-
-                if not NodeStatus.is_done(in_status):
-                    ready = False
-                if NodeStatus.is_error(in_status) and not info["node"].is_builtin:
-                    # Fail if any dependency failed for non-builtin task
-                    able_to_run = False
-
-            # Fail if no dependency successfully finished for builtin task
-            if inputs:
-                any_success = any([status == NodeStatus.SUCCESS for status in inputs])
-            else:
-                any_success = True
-            if ready and info["node"].is_builtin and not any_success:
-                able_to_run = False
-
-            if not able_to_run:
-                info["proc"] = None
-                continue
-
-            if ready:
-                ready_nodes.append(node)
+        ready_nodes = self.__sort_nodes(self.__ready)
 
         if not ready_nodes:
             return changed
@@ -608,13 +918,77 @@ class TaskScheduler:
             return changed
 
         # Normal scheduling: launch as many ready nodes as resources allow.
-        for node in ready_nodes:
+        reservation = None
+        for node in self.__prioritize_nodes(ready_nodes):
+            if reservation and not self.__allow_backfill(node, reservation):
+                continue
+
             if self.__allow_start(node):
                 self.__start_node(node)
                 changed = True
+            elif self.__critical_path and reservation is None:
+                # Keep cores for the highest priority node which does not fit
+                reservation = self.__reserve_cores(node)
 
         return changed
 
+    def __reserve_cores(self, node: Tuple[str, str]) -> Dict[str, float]:
+        """
+        Private helper to reserve cores for a node which does not fit yet.
+
+        Uses the expected runtime of the running nodes to find when enough
+        cores will be free to start the node.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+
+        Returns:
+            dict: The time the node is expected to start and the number of cores
+            which will still be free at that time.
+        """
+        now = time.time()
+        threads = self.__nodes[node]["threads"]
+
+        free_cores = self.__max_cores - self.__running_threads
+        start_time = now
+        ending = sorted((self.__startTimes[run_node] + self.__weights[run_node],
+                         self.__nodes[run_node]["threads"]) for run_node in self.__running)
+        for end_time, run_threads in ending:
+            if free_cores >= threads:
+                break
+            free_cores += run_threads
+            start_time = max(end_time, now)
+
+        return {"time": start_time, "cores": free_cores - threads}
+
+    def __allow_backfill(self, node: Tuple[str, str], reservation: Dict[str, float]) -> bool:
+        """
+        Private helper to check if a node can start ahead of a reserved node.
+
+        A node can start if it is expected to finish before the reserved node
+        starts, or if it only uses cores the reserved node will not need.
+
+        Args:
+            node (tuple): The (step, index) of the node to check.
+            reservation (dict): The reservation from :meth:`__reserve_cores`.
+
+        Returns:
+            bool: True if the node can start, False otherwise.
+        """
+        info = self.__nodes[node]
+
+        if not info["node"].is_local:
+            return True
+
+        if time.time() + self.__weights[node] <= reservation["time"]:
+            return True
+
+        if info["threads"] <= reservation["cores"]:
+            reservation["cores"] -= info["threads"]
+            return True
+
+        return False
+
     def check(self) -> None:
         """
         Checks if the flow completed successfully.
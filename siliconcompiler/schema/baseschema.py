@@ -10,6 +10,7 @@ import copy
 import importlib
 import logging
 import pathlib
+import sys
 
 try:
     import gzip
@@ -26,15 +27,26 @@ except ModuleNotFoundError:
     stdlib_json = json
     _has_orjson = False
 
+try:
+    if sys.version_info >= (3, 14):
+        from compression import zstd
+    else:
+        from backports import zstd
+    _has_zstd = True
+except ModuleNotFoundError:
+    _has_zstd = False
+
 import os.path
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from functools import cache, lru_cache
+from functools import cache, lru_cache, partial
 from typing import Dict, Type, Tuple, TypeVar, Union, Set, Callable, List, Optional, \
-    TextIO, Iterable, Any
+    TextIO, Iterable, Iterator, Any
 
 from .parameter import Parameter, NodeValue
 from .journal import Journal
+from .stringtable import StringTable
 from ._metadata import version
 
 TSchema = TypeVar('TSchema', bound='BaseSchema')
@@ -104,7 +116,13 @@ class BaseSchema:
     '''
 
     _version_key = "schemaversion"
+    # Key marking a manifest written without definitions
+    __VALUES_KEY = "__values__"
     __version = tuple([int(v) for v in version.split('.')])
+    # Number of bytes collected before compressing a compact manifest
+    __COMPACT_BLOCK_SIZE = 1024 * 1024
+    # Maximum number of files hashed at the same time
+    __HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
     def __init__(self):
         self.__manifest: Dict[str, Union["BaseSchema", Parameter]] = {}
@@ -114,7 +132,11 @@ class BaseSchema:
         self.__active: Optional[Dict] = None
         self.__key: Optional[str] = None
         self.__lazy: Optional[Tuple[Optional[Tuple[int, ...]], Dict]] = None
+        # False when the lazy manifest may only hold values
+        self.__lazy_definitions: bool = True
         self.__frozen: bool = False
+        # Keypath to parameter index, built on demand by iter_params
+        self.__index: Optional[Dict[Tuple[str, ...], Parameter]] = None
 
     @property
     def __is_root(self) -> bool:
@@ -161,6 +183,48 @@ class BaseSchema:
             nodes.extend(child.__iter_subtree())
         return nodes
 
+    def __invalidate_index(self) -> None:
+        '''
+        Drops the keypath index of this schema and of its parents, after a
+        parameter or schema has been added or removed below them.
+        '''
+        schema = self
+        while schema is not None:
+            try:
+                schema.__index = None
+                schema = schema.__parent
+            except AttributeError:
+                # Guard against partially constructed objects during serialization
+                break
+
+    def __get_index(self) -> Dict[Tuple[str, ...], Parameter]:
+        '''
+        Returns the keypath to parameter index of this schema, including the
+        keypaths through the default entries.
+        '''
+        index = self.__index
+        if index is None:
+            index = {}
+            self.__build_index(tuple(), index)
+            # Set after the walk, since elaborating a lazy child invalidates this index
+            self.__index = index
+        return index
+
+    def __build_index(self, keypath: Tuple[str, ...],
+                      index: Dict[Tuple[str, ...], Parameter]) -> None:
+        self.__ensure_lazy_elab()
+
+        items = []
+        if self.__default:
+            items.append(("default", self.__default))
+        items.extend(self.__manifest.items())
+
+        for key, item in items:
+            if isinstance(item, Parameter):
+                index[(*keypath, key)] = item
+            else:
+                item.__build_index((*keypath, key), index)
+
     @property
     def _is_frozen(self) -> bool:
         '''
@@ -328,6 +392,64 @@ class BaseSchema:
             clss.append(sc_type)
         return clss
 
+    @staticmethod
+    @cache
+    def __get_template(cls: Type["BaseSchema"]) -> Optional["BaseSchema"]:
+        """
+        Returns an unmodified instance of a schema class, which holds the
+        definitions a manifest is loaded into.
+        """
+        try:
+            return BaseSchema.__instantiate(cls)
+        except Exception:
+            return None
+
+    @staticmethod
+    def __get_meta_classes(schema: "BaseSchema") -> List[Type["BaseSchema"]]:
+        """
+        Returns the classes :meth:`_from_dict` tries for the ``__meta__`` section of a schema.
+        """
+        meta = {"class": f"{schema.__class__.__module__}/{schema.__class__.__name__}"}
+        try:
+            meta["sctype"] = schema._getdict_type()
+        except NotImplementedError:
+            pass
+        return BaseSchema.__process_meta_section(meta)
+
+    def __get_child_template(self, template: Optional["BaseSchema"], key: str,
+                             item: Union["BaseSchema", Parameter]) \
+            -> Optional[Union["BaseSchema", Parameter]]:
+        """
+        Returns the object :meth:`_from_dict` loads the manifest of a child
+        into, as it is before loading, or None if it is not known.
+
+        Args:
+            template (:class:`BaseSchema`): object this schema is loaded into
+            key (str): key of the child
+            item (:class:`BaseSchema` or :class:`Parameter`): child
+        """
+        if template is not None:
+            template.__ensure_lazy_elab()
+
+        if key == "default":
+            return template.__default if template is not None else None
+
+        if not self.__default and template is not None:
+            obj = template.__manifest.get(key, None)
+            if obj is not None:
+                return obj
+
+        if isinstance(item, BaseSchema) and item.__class__ is not BaseSchema:
+            clss = BaseSchema.__get_meta_classes(item)
+            if clss and clss[0] is BaseSchema and self.__default:
+                return self.__default
+            for cls in clss:
+                obj = BaseSchema.__get_template(cls)
+                if obj is not None:
+                    return obj
+
+        return self.__default
+
     @staticmethod
     def __extractversion(manifest: Dict) -> Optional[Tuple[int, ...]]:
         schema_version = manifest.get(BaseSchema._version_key, None)
@@ -347,6 +469,10 @@ class BaseSchema:
 
         self._from_dict(manifest, self._keypath, version=version, lazyload=LazyLoad.FORWARD)
 
+        if not self.__lazy_definitions:
+            for child in self.__child_schemas():
+                child.__lazy_definitions = False
+
     def _from_dict(self, manifest: Dict,
                    keypath: Union[List[str], Tuple[str, ...]],
                    version: Optional[Tuple[int, ...]] = None,
@@ -370,6 +496,9 @@ class BaseSchema:
         handled = set()
         missing = set()
 
+        self.__invalidate_index()
+        Journal._changed()
+
         if "__journal__" in manifest:
             self.__journal.from_dict(manifest["__journal__"])
             if lazyload != LazyLoad.ON:
@@ -455,6 +584,8 @@ class BaseSchema:
         if filepath:
             cfg = BaseSchema._read_manifest(filepath)
 
+        definitions = not cfg.pop(BaseSchema.__VALUES_KEY, False)
+
         new_clss = []
         if "__meta__" in cfg:
             # Determine correct class
@@ -475,6 +606,7 @@ class BaseSchema:
         else:
             do_lazyload = LazyLoad.OFF
 
+        schema.__lazy_definitions = definitions
         schema._from_dict(cfg, tuple(), lazyload=do_lazyload)
 
         return schema
@@ -500,11 +632,22 @@ class BaseSchema:
             filename (path): Path to a manifest file to be loaded.
         """
 
-        fin = BaseSchema.__open_file(filepath)
-        try:
-            manifest = json.loads(fin.read())
-        finally:
-            fin.close()
+        _, ext = os.path.splitext(filepath)
+        if ext.lower() == ".zst":
+            if not _has_zstd:
+                raise RuntimeError("zstd is not available")
+            with zstd.open(filepath, "rb") as fin:
+                manifest = json.loads(fin.read())
+        else:
+            fin = BaseSchema.__open_file(filepath)
+            try:
+                manifest = json.loads(fin.read())
+            finally:
+                fin.close()
+
+        strings = manifest.pop(StringTable.KEY, None)
+        if strings is not None:
+            StringTable(strings).decode(manifest)
 
         return manifest
 
@@ -520,31 +663,51 @@ class BaseSchema:
             Loads the file mychip.json into the current Schema object.
         """
 
-        self._from_dict(BaseSchema._read_manifest(filepath), [])
+        manifest = BaseSchema._read_manifest(filepath)
+        self.__lazy_definitions = not manifest.pop(BaseSchema.__VALUES_KEY, False)
+        self._from_dict(manifest, [])
 
-    def write_manifest(self, filepath: str) -> None:
+    def write_manifest(self, filepath: str, definitions: bool = True) -> None:
         '''
         Writes the manifest to a file.
 
+        Manifests ending in ``.zst`` are written in a compact encoding: JSON
+        without indentation, with the documentation of the parameters stored
+        once in a string table, compressed with zstd. The compact encoding is
+        streamed to the file without building the complete manifest in memory.
+
+        Without definitions, parameters which :meth:`from_manifest` rebuilds
+        from the schema classes recorded in the manifest only store their
+        values. Parameters added outside of the schema classes, or changed
+        from their definition, are still written in full.
+
         Args:
             filename (filepath): Output filepath.
+            definitions (bool): If false, only write the values of parameters
+                which are defined by the schema classes.
 
         Examples:
             >>> schema.write_manifest('mydump.json')
             Dumps the current manifest into mydump.json
+            >>> schema.write_manifest('mydump.pkg.json.zst')
+            Dumps the current manifest into mydump.pkg.json.zst in the compact encoding
         '''
 
+        _, ext = os.path.splitext(filepath)
+        if ext.lower() == ".zst":
+            self.__write_compact_manifest(filepath, definitions=definitions)
+            return
+
         fout = BaseSchema.__open_file(filepath, is_read=False)
 
         try:
-            def default(obj: Any) -> Any:
-                if isinstance(obj, pathlib.PurePath):
-                    # Cast everything to a windows path and convert to posix.
-                    # https://stackoverflow.com/questions/73682260
-                    return pathlib.PureWindowsPath(obj).as_posix()
-                raise TypeError
-
-            manifest = self.getdict()
+            default = BaseSchema.__json_default
+
+            if definitions:
+                manifest = self.getdict()
+            else:
+                manifest = self.__getdict_values_manifest(self.__get_root_template())
+                manifest[BaseSchema.__VALUES_KEY] = True
             if _has_orjson:
                 manifest_str = json.dumps(manifest, option=json.OPT_INDENT_2,
                                           default=default).decode()
@@ -574,6 +737,61 @@ class BaseSchema:
         finally:
             fout.close()
 
+    @staticmethod
+    def __json_default(obj: Any) -> Any:
+        if isinstance(obj, pathlib.PurePath):
+            # Cast everything to a windows path and convert to posix.
+            # https://stackoverflow.com/questions/73682260
+            return pathlib.PureWindowsPath(obj).as_posix()
+        raise TypeError
+
+    def __write_compact_manifest(self, filepath: str, definitions: bool = True) -> None:
+        """
+        Writes the manifest in the compact encoding, see :meth:`write_manifest`.
+
+        Args:
+            filepath (path): Output filepath.
+            definitions (bool): If false, only write the values of parameters
+                which are defined by the schema classes.
+        """
+        if not _has_zstd:
+            raise RuntimeError("zstd is not available")
+
+        default = BaseSchema.__json_default
+        if _has_orjson:
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj, default=default)
+        else:
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                                  default=default).encode("utf-8")
+
+        table = StringTable()
+        with zstd.open(filepath, "wb") as fout:
+            # Collect the small pieces into larger blocks before compressing
+            block = [b"{"]
+            block_size = 0
+            sep = b""
+            if definitions:
+                chunks = self.__iter_compact_items(table, dumps)
+            else:
+                chunks = self.__iter_compact_items(table, dumps, definitions=False,
+                                                   template=self.__get_root_template())
+            for chunk in chunks:
+                block.append(chunk)
+                block_size += len(chunk)
+                sep = b","
+                if block_size > BaseSchema.__COMPACT_BLOCK_SIZE:
+                    fout.write(b"".join(block))
+                    block = []
+                    block_size = 0
+
+            if not definitions:
+                block.append(sep + dumps(BaseSchema.__VALUES_KEY) + b":true")
+                sep = b","
+            block.append(sep + dumps(StringTable.KEY) + b":" + dumps(table.strings) + b"}")
+            fout.write(b"".join(block))
+
     # Accessor methods
     def __search(self,
                  *keypath: str,
@@ -607,6 +825,7 @@ class BaseSchema:
                     raise KeyError
                 key_param = self.__default.copy(key=complete_path)
                 self.__manifest[keypath[0]] = key_param
+                self.__invalidate_index()
                 # Keep lazily-materialized children as frozen as their parent so
                 # freezing cannot be escaped by reaching a not-yet-instantiated
                 # keypath (e.g. via get(field="schema")).
@@ -860,6 +1079,7 @@ class BaseSchema:
             return
 
         del key_param.__manifest[removal_key]
+        key_param.__invalidate_index()
         self.__journal.record("remove", keypath)
 
     def valid(self, *keypath: str, default_valid: bool = False,
@@ -959,6 +1179,66 @@ class BaseSchema:
             add(keys, key, item)
         return set(keys)
 
+    def iter_params(self, *keypath: str, kind: Optional[str] = None,
+                    include_default: bool = True) \
+            -> Iterator[Tuple[Tuple[str, ...], Parameter]]:
+        '''
+        Iterates over the parameters in the schema.
+
+        The keypaths are held in an index which is built on the first call and
+        kept until a parameter or schema is added or removed, so iterating does
+        not search the schema for every keypath.
+
+        Args:
+            keypath (list of str): Keypath prefix to search under. The
+                returned keypaths do not include the prefix.
+            kind (str): only return parameters of this kind: ``path`` for
+                files and directories, ``file`` or ``dir``.
+            include_default (bool): include the keypaths through default entries.
+
+        Yields:
+            tuple of the keypath and the :class:`Parameter`.
+
+        Examples:
+            >>> for keypath, param in schema.iter_params(kind="file"):
+            ...     print(keypath, param.get())
+            Prints the keypath and value of every file parameter.
+        '''
+        if kind not in (None, "path", "file", "dir"):
+            raise ValueError(f"{kind} is not a valid parameter kind")
+
+        try:
+            key_param = self.__search(*keypath, require_leaf=False)
+        except KeyError:
+            return
+
+        if isinstance(key_param, Parameter):
+            return
+
+        for param_keypath, param in key_param.__get_index().items():
+            if not include_default and "default" in param_keypath:
+                continue
+            if kind == "path" and not param.is_path:
+                continue
+            if kind == "file" and not param.is_file:
+                continue
+            if kind == "dir" and not param.is_directory:
+                continue
+            yield param_keypath, param
+
+    def _get_param(self, *keypath: str) -> Parameter:
+        '''
+        Returns the parameter at a keypath, looking it up in the keypath index.
+        Keypaths which are only matched by a default entry are searched for.
+
+        Args:
+            keypath (list of str): Keypath to access.
+        '''
+        param = self.__get_index().get(keypath)
+        if param is None:
+            param = self.get(*keypath, field=None)
+        return param
+
     @classmethod
     def _getdict_type(cls) -> str:
         """
@@ -1003,7 +1283,9 @@ class BaseSchema:
                                              values_only=values_only)
 
                 if key_param.__lazy:
-                    return key_param.__lazy[1]
+                    if key_param.__lazy_definitions:
+                        return key_param.__lazy[1]
+                    key_param.__ensure_lazy_elab()
             else:
                 key_param = self.__search(*keypath, require_leaf=False)
         except KeyError:
@@ -1028,23 +1310,150 @@ class BaseSchema:
             manifest["__journal__"] = key_param.__journal.get()
 
         if not values_only and key_param.__class__ is not BaseSchema:
-            manifest["__meta__"] = {}
+            manifest["__meta__"] = key_param.__getdict_meta_section()
 
-            try:
-                cls_meta = key_param._getdict_meta()
-                manifest["__meta__"].update(cls_meta)
-            except NotImplementedError:
-                pass
+        return manifest
 
-            manifest["__meta__"]["class"] = \
-                f"{key_param.__class__.__module__}/{key_param.__class__.__name__}"
-            try:
-                manifest["__meta__"]["sctype"] = key_param._getdict_type()
-            except NotImplementedError:
-                pass
+    def __getdict_meta_section(self) -> Dict:
+        """
+        Returns the ``__meta__`` section of the manifest, which records the class of this schema.
+        """
+        meta = {}
+
+        try:
+            meta.update(self._getdict_meta())
+        except NotImplementedError:
+            pass
+
+        meta["class"] = f"{self.__class__.__module__}/{self.__class__.__name__}"
+        try:
+            meta["sctype"] = self._getdict_type()
+        except NotImplementedError:
+            pass
+
+        return meta
+
+    def __get_root_template(self) -> Optional["BaseSchema"]:
+        """
+        Returns the object :meth:`from_manifest` loads the manifest of this
+        schema into, as it is before loading, or None if it is not known.
+        """
+        if self.__class__ is BaseSchema:
+            return None
+        for cls in BaseSchema.__get_meta_classes(self):
+            template = BaseSchema.__get_template(cls)
+            if template is not None:
+                return template
+        return None
+
+    def __getdict_values_manifest(self, template: Optional["BaseSchema"]) -> Dict:
+        """
+        Returns the manifest of this schema, with only the values of the
+        parameters which have the same definition as in the template.
+        The schema version is always written in full, since it is needed to
+        load the manifest.
+
+        Args:
+            template (:class:`BaseSchema`): object this schema is loaded into
+        """
+        if self.__lazy:
+            return self.__lazy[1]
+
+        items = []
+        if self.__default:
+            items.append(("default", self.__default))
+        items.extend(self.__manifest.items())
+
+        manifest = {}
+        for key, item in items:
+            item_template = self.__get_child_template(template, key, item)
+            if isinstance(item, BaseSchema):
+                if not isinstance(item_template, BaseSchema):
+                    item_template = None
+                manifest[key] = item.__getdict_values_manifest(item_template)
+            elif key != BaseSchema._version_key and isinstance(item_template, Parameter) and \
+                    item._has_same_definition(item_template):
+                manifest[key] = item._getdict_values()
+            else:
+                manifest[key] = item.getdict()
+
+        if self.__journal.has_journaling():
+            manifest["__journal__"] = self.__journal.get()
+
+        if self.__class__ is not BaseSchema:
+            manifest["__meta__"] = self.__getdict_meta_section()
 
         return manifest
 
+    def __iter_compact_items(self, table: StringTable,
+                             dumps: Callable[[Any], bytes],
+                             definitions: bool = True,
+                             template: Optional["BaseSchema"] = None) -> Iterator[bytes]:
+        """
+        Yields the encoded members of the manifest of this schema, without the
+        enclosing braces.
+
+        This produces the same manifest as :meth:`getdict` one parameter at a
+        time, with the documentation of the parameters moved into a string table.
+
+        Args:
+            table (:class:`StringTable`): table of documentation strings
+            dumps (function): encodes an object as JSON
+            definitions (bool): if false, produces the same manifest as
+                :meth:`__getdict_values_manifest`
+            template (:class:`BaseSchema`): object this schema is loaded into
+        """
+        sep = b""
+
+        if self.__lazy and not definitions and not self.__lazy_definitions:
+            # A manifest without definitions is written as loaded
+            for key, data in self.__lazy[1].items():
+                yield sep + dumps(key) + b":" + dumps(data)
+                sep = b","
+            return
+
+        if self.__lazy and not self.__lazy_definitions:
+            self.__ensure_lazy_elab()
+
+        if self.__lazy:
+            for key, data in self.__lazy[1].items():
+                if isinstance(data, dict) and key not in ("__journal__", "__meta__"):
+                    data = table.encode(data)
+                yield sep + dumps(key) + b":" + dumps(data)
+                sep = b","
+            return
+
+        items = []
+        if self.__default:
+            items.append(("default", self.__default))
+        items.extend(self.__manifest.items())
+
+        for key, item in items:
+            item_template = None
+            if not definitions:
+                item_template = self.__get_child_template(template, key, item)
+
+            if isinstance(item, BaseSchema):
+                if not isinstance(item_template, BaseSchema):
+                    item_template = None
+                yield sep + dumps(key) + b":{"
+                yield from item.__iter_compact_items(table, dumps, definitions=definitions,
+                                                     template=item_template)
+                yield b"}"
+            elif key != BaseSchema._version_key and isinstance(item_template, Parameter) and \
+                    item._has_same_definition(item_template):
+                yield sep + dumps(key) + b":" + dumps(item._getdict_values())
+            else:
+                yield sep + dumps(key) + b":" + dumps(table.encode_parameter(item.getdict()))
+            sep = b","
+
+        if self.__journal.has_journaling():
+            yield sep + b'"__journal__":' + dumps(self.__journal.get())
+            sep = b","
+
+        if self.__class__ is not BaseSchema:
+            yield sep + b'"__meta__":' + dumps(self.__getdict_meta_section())
+
     # Utility functions
     def copy(self: TSchema, key: Optional[Tuple[str, ...]] = None) -> TSchema:
         """
@@ -1055,9 +1464,13 @@ class BaseSchema:
         """
 
         parent = self.__parent
+        index = self.__index
         self.__parent = None
+        # The copy builds its own index when needed
+        self.__index = None
         schema_copy = copy.deepcopy(self)
         self.__parent = parent
+        self.__index = index
         schema_copy.__parent = self.__parent
 
         if key:
@@ -1216,7 +1629,7 @@ class BaseSchema:
         if dataroots is None:
             dataroots = base_schema._find_files_dataroot_resolvers()
 
-        resolved_paths = []
+        items = []
         root_search_paths = base_schema._find_files_search_paths(keypath[-1],
                                                                  step, index,
                                                                  missing_ok)
@@ -1244,31 +1657,49 @@ class BaseSchema:
                 if cwd:
                     search_paths.append(os.path.abspath(cwd))
 
-            try:
-                if hash:
-                    resolved = path.hash(hashalgo,
-                                         search=search_paths,
-                                         collection_dir=collection_dir)
-                else:
-                    resolved = path.resolve_path(search=search_paths,
-                                                 collection_dir=collection_dir)
-            except FileNotFoundError:
-                resolved = None
-                if not missing_ok:
-                    report_paths = ", ".join(search_paths)
-                    if dataroot:
-                        if dataroot_except:
+            items.append((path, search_paths, dataroot, dataroot_except))
+
+        def resolve(path, search_paths):
+            if hash:
+                return path.hash(hashalgo,
+                                 search=search_paths,
+                                 collection_dir=collection_dir)
+            return path.resolve_path(search=search_paths,
+                                     collection_dir=collection_dir)
+
+        with contextlib.ExitStack() as stack:
+            if hash and len(items) > 1:
+                # Hash the files in parallel, hashlib releases the GIL while hashing
+                executor = ThreadPoolExecutor(
+                    max_workers=min(len(items), BaseSchema.__HASH_WORKERS))
+                stack.callback(executor.shutdown, cancel_futures=True)
+                results = [executor.submit(resolve, path, search_paths).result
+                           for path, search_paths, _, _ in items]
+            else:
+                results = [partial(resolve, path, search_paths)
+                           for path, search_paths, _, _ in items]
+
+            resolved_paths = []
+            for (path, search_paths, dataroot, dataroot_except), result in zip(items, results):
+                try:
+                    resolved = result()
+                except FileNotFoundError:
+                    resolved = None
+                    if not missing_ok:
+                        report_paths = ", ".join(search_paths)
+                        if dataroot:
+                            if dataroot_except:
+                                raise FileNotFoundError(
+                                    f"Dataroot {dataroot} not found: {dataroot_except}") \
+                                        from dataroot_except
                             raise FileNotFoundError(
-                                f"Dataroot {dataroot} not found: {dataroot_except}") \
-                                    from dataroot_except
-                        raise FileNotFoundError(
-                            f'Could not find "{path._getunsafe()}" in {dataroot} '
-                            f'{self.__format_key(*keypath)}: {report_paths}')
-                    else:
-                        raise FileNotFoundError(
-                            f'Could not find "{path._getunsafe()}" {self.__format_key(*keypath)}: '
-                            f'{report_paths}')
-            resolved_paths.append(resolved)
+                                f'Could not find "{path._getunsafe()}" in {dataroot} '
+                                f'{self.__format_key(*keypath)}: {report_paths}')
+                        else:
+                            raise FileNotFoundError(
+                                f'Could not find "{path._getunsafe()}" '
+                                f'{self.__format_key(*keypath)}: {report_paths}')
+                resolved_paths.append(resolved)
 
         if not is_list:
             if not resolved_paths:
@@ -1306,15 +1737,10 @@ class BaseSchema:
 
         error = False
 
-        for keypath in self.allkeys():
+        for keypath, param in self.iter_params(kind="path"):
             if keypath in ignore_keys:
                 continue
 
-            param: Parameter = self.get(*keypath, field=None)
-
-            if not param.is_path:
-                continue
-
             for check_files, step, index in param.getvalues():
                 if not check_files:
                     # nothing set so continue
@@ -49,6 +49,7 @@ class EditableSchema:
                 self.__schema._BaseSchema__default = value
             else:
                 self.__schema._BaseSchema__manifest[key] = value
+            self.__schema._BaseSchema__invalidate_index()
             return
 
         new_schema = BaseSchema()
@@ -80,6 +81,7 @@ class EditableSchema:
                 self.__schema._BaseSchema__default = None
             else:
                 del self.__schema._BaseSchema__manifest[key]
+            self.__schema._BaseSchema__invalidate_index()
         else:
             EditableSchema(next_param).__remove(keypath, fullkey)
 
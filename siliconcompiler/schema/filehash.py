@@ -0,0 +1,352 @@
+"""
+Hashing of files and directories with a cache of computed digests.
+
+Digests are cached per hashing algorithm and validated against the size,
+modification time and inode of the file, so a file is only read again after
+it changes. A directory is validated against the same information for every
+file in it. Files modified within :attr:`FileHashCache.RACY_TIME` of being
+hashed are not cached, since a later change within the resolution of the
+file system clock would not be detected.
+
+The files in a directory are read ahead in a thread pool and hashed in order,
+so the digest of a directory is the same as when its files are read one at a
+time.
+
+The cache can be saved to and merged from a JSON file, to share digests
+between processes and runs.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import time
+import uuid
+
+import os.path
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+
+#: Number of bytes read from a file at a time
+BUFFER_SIZE = 1024 * 1024
+
+#: Number of threads used to read the files of a directory
+READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+#: Number of bytes of a directory read ahead of hashing, larger files are not read ahead
+READ_AHEAD_SIZE = 64 * 1024 * 1024
+
+
+def read_file(filename: Union[str, pathlib.Path]) -> bytes:
+    """
+    Reads the contents of a file.
+
+    Args:
+        filename (path): file to read
+    """
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+def update_hash(hashobj, filename: Union[str, pathlib.Path]) -> None:
+    """
+    Updates a hashing object with the contents of a file.
+
+    Args:
+        hashobj (hashlib.): hashing object
+        filename (path): file to read
+    """
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(filename, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hashobj.update(view[:size])
+
+
+def digest_file(filename: Union[str, pathlib.Path], hashfunc: Callable) -> str:
+    """
+    Computes the digest of a file.
+
+    Args:
+        filename (path): file to hash
+        hashfunc (callable): constructor of the hashing object
+    """
+    if hasattr(hashlib, "file_digest"):
+        with open(filename, "rb") as f:
+            return hashlib.file_digest(f, hashfunc).hexdigest()
+
+    hashobj = hashfunc()
+    update_hash(hashobj, filename)
+    return hashobj.hexdigest()
+
+
+class FileHashCache:
+    """
+    Cache of file and directory digests.
+    """
+
+    #: Files modified less than this many seconds before hashing are not cached
+    RACY_TIME = 2.0
+
+    __default: Optional["FileHashCache"] = None
+    __default_lock = threading.Lock()
+
+    __VERSION = 1
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        # {algorithm: {path: [size, mtime_ns, inode, digest]}}
+        self.__files: Dict[str, Dict[str, List]] = {}
+        # {algorithm: {path: [fingerprint, digest]}}
+        self.__dirs: Dict[str, Dict[str, List]] = {}
+        # Paths hashed by this process, which are written by save()
+        # {algorithm: {path}}
+        self.__new_files: Dict[str, Set[str]] = {}
+        self.__new_dirs: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def default() -> "FileHashCache":
+        """
+        Returns the cache used by :class:`PathNodeValue` in this process.
+        """
+        with FileHashCache.__default_lock:
+            if FileHashCache.__default is None:
+                FileHashCache.__default = FileHashCache()
+            return FileHashCache.__default
+
+    def __is_racy(self, mtime_ns: int) -> bool:
+        return time.time_ns() - mtime_ns < FileHashCache.RACY_TIME * 1e9
+
+    @staticmethod
+    def __signature(filename: str) -> Tuple[int, int, int]:
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+    @staticmethod
+    def __list_directory(dirname: Union[str, pathlib.Path]) -> List[Tuple[str, str]]:
+        all_files = []
+        for root, _, files in os.walk(dirname):
+            all_files.extend([os.path.join(root, f) for f in files])
+
+        # Cast everything to a windows path and convert to posix.
+        # https://stackoverflow.com/questions/73682260
+        return [(file, pathlib.PureWindowsPath(os.path.relpath(file, dirname)).as_posix())
+                for file in sorted(all_files)]
+
+    @staticmethod
+    def __digest_directory(files: List[Tuple[str, str, int]], hashfunc: Callable) -> str:
+        hashobj = hashfunc()
+        if len(files) == 1:
+            file, relpath, _ = files[0]
+            hashobj.update(relpath.encode("utf-8"))
+            update_hash(hashobj, file)
+            return hashobj.hexdigest()
+
+        with ThreadPoolExecutor(max_workers=min(len(files), READ_WORKERS)) as executor:
+            reads = {}
+            reads_size = 0
+            next_read = 0
+            for n, (file, relpath, size) in enumerate(files):
+                # Read the following files while this one is hashed
+                while next_read < len(files):
+                    read_size = files[next_read][2]
+                    if read_size > READ_AHEAD_SIZE:
+                        next_read += 1
+                        continue
+                    if reads_size + read_size > READ_AHEAD_SIZE:
+                        break
+                    reads[next_read] = executor.submit(read_file, files[next_read][0])
+                    reads_size += read_size
+                    next_read += 1
+
+                hashobj.update(relpath.encode("utf-8"))
+                read = reads.pop(n, None)
+                if read is None:
+                    update_hash(hashobj, file)
+                else:
+                    hashobj.update(read.result())
+                    reads_size -= size
+
+        return hashobj.hexdigest()
+
+    def hash_file(self, filename: Union[str, pathlib.Path], algorithm: str,
+                  hashfunc: Callable) -> str:
+        """
+        Computes the digest of a file, using the cached digest if the file is unchanged.
+
+        Args:
+            filename (path): file to hash
+            algorithm (str): name of the hashing function
+            hashfunc (callable): constructor of the hashing object
+        """
+        path = os.path.abspath(filename)
+        signature = self.__signature(path)
+
+        with self.__lock:
+            entry = self.__files.get(algorithm, {}).get(path)
+        if entry and tuple(entry[0:3]) == signature:
+            return entry[3]
+
+        digest = digest_file(path, hashfunc)
+
+        if not self.__is_racy(signature[1]):
+            with self.__lock:
+                self.__files.setdefault(algorithm, {})[path] = [*signature, digest]
+                self.__new_files.setdefault(algorithm, set()).add(path)
+
+        return digest
+
+    def hash_directory(self, dirname: Union[str, pathlib.Path], algorithm: str,
+                       hashfunc: Callable) -> Optional[str]:
+        """
+        Computes the digest of a directory, using the cached digest if no file
+        in the directory changed.
+
+        The digest covers the relative path and contents of every file in the
+        directory, in sorted order, and is None for a directory with no files.
+
+        Args:
+            dirname (path): directory to hash
+            algorithm (str): name of the hashing function
+            hashfunc (callable): constructor of the hashing object
+        """
+        files = self.__list_directory(dirname)
+        if not files:
+            return None
+
+        racy = False
+        fingerprint_obj = hashlib.sha1()
+        members = []
+        for file, relpath in files:
+            signature = self.__signature(file)
+            racy = racy or self.__is_racy(signature[1])
+            fingerprint_obj.update(json.dumps([relpath, *signature]).encode("utf-8"))
+            members.append((file, relpath, signature[0]))
+        fingerprint = fingerprint_obj.hexdigest()
+
+        path = os.path.abspath(dirname)
+        with self.__lock:
+            entry = self.__dirs.get(algorithm, {}).get(path)
+        if entry and entry[0] == fingerprint:
+            return entry[1]
+
+        digest = self.__digest_directory(members, hashfunc)
+
+        if not racy:
+            with self.__lock:
+                self.__dirs.setdefault(algorithm, {})[path] = [fingerprint, digest]
+                self.__new_dirs.setdefault(algorithm, set()).add(path)
+
+        return digest
+
+    def clear(self) -> None:
+        """
+        Removes all digests from the cache.
+        """
+        with self.__lock:
+            self.__files.clear()
+            self.__dirs.clear()
+            self.__new_files.clear()
+            self.__new_dirs.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return sum(len(entries) for entries in self.__files.values()) + \
+                sum(len(entries) for entries in self.__dirs.values())
+
+    @staticmethod
+    def __read(filepath: Union[str, pathlib.Path]) -> Dict:
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != FileHashCache.__VERSION:
+            return {}
+
+        return data
+
+    def load(self, filepath: Union[str, pathlib.Path]) -> None:
+        """
+        Merges digests from a file into the cache.
+
+        A missing or malformed file is ignored.
+
+        Args:
+            filepath (path): path to the cache file.
+        """
+        data = self.__read(filepath)
+
+        with self.__lock:
+            for store, name in ((self.__files, "files"), (self.__dirs, "dirs")):
+                for algorithm, entries in data.get(name, {}).items():
+                    current = store.setdefault(algorithm, {})
+                    for path, entry in entries.items():
+                        current.setdefault(path, entry)
+
+    def save(self, filepath: Union[str, pathlib.Path]) -> None:
+        """
+        Writes the digests computed by this process to a file.
+
+        Digests already in the file are kept, so several processes can share
+        one file. Digests computed by this process for files which no longer
+        match their recorded size, modification time and inode are removed.
+
+        Args:
+            filepath (path): path to the cache file.
+        """
+        data = self.__read(filepath)
+        files = {algorithm: dict(entries)
+                 for algorithm, entries in data.get("files", {}).items()}
+        dirs = {algorithm: dict(entries)
+                for algorithm, entries in data.get("dirs", {}).items()}
+
+        with self.__lock:
+            new_files = {algorithm: {path: self.__files[algorithm][path] for path in paths}
+                         for algorithm, paths in self.__new_files.items()}
+            new_dirs = {algorithm: {path: self.__dirs[algorithm][path] for path in paths}
+                        for algorithm, paths in self.__new_dirs.items()}
+
+        for algorithm, entries in new_files.items():
+            current = files.setdefault(algorithm, {})
+            for path, entry in entries.items():
+                try:
+                    valid = tuple(entry[0:3]) == self.__signature(path)
+                except OSError:
+                    valid = False
+                if valid:
+                    current[path] = entry
+                else:
+                    current.pop(path, None)
+        for algorithm, entries in new_dirs.items():
+            current = dirs.setdefault(algorithm, {})
+            for path, entry in entries.items():
+                if os.path.isdir(path):
+                    current[path] = entry
+                else:
+                    current.pop(path, None)
+
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file and move it into place, so readers never
+        # see a partially written file
+        tmp_file = f"{filepath}.{uuid.uuid4().hex}"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": FileHashCache.__VERSION,
+                    "files": files,
+                    "dirs": dirs
+                }, f)
+            os.replace(tmp_file, filepath)
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
@@ -17,6 +17,11 @@ class Journal:
         keyprefix (list of str): keypath to prefix on to recorded path
     """
 
+    FILE_EXTENSION = ".jsonl"
+
+    # Number of changes made to any schema in this process, see revision()
+    __revision = 0
+
     def __init__(self, keyprefix: Optional[Union[List[str], Tuple[str, ...]]] = None):
         if not keyprefix:
             self.__keyprefix = tuple()
@@ -48,6 +53,25 @@ class Journal:
         child.__parent = self.__parent
         return child
 
+    @staticmethod
+    def revision() -> int:
+        '''
+        Returns a counter which increases with every change to any schema.
+
+        Every set, add, unset and remove passes through the journal, whether it
+        is recording or not, so results derived from schemas can be cached and
+        discarded once this counter moves on.
+        '''
+        return Journal.__revision
+
+    @staticmethod
+    def _changed() -> None:
+        '''
+        Advances :meth:`revision` for a change that is not a journal transaction,
+        such as loading a manifest or replacing a dependency.
+        '''
+        Journal.__revision += 1
+
     def from_dict(self, manifest: List[Dict]) -> None:
         '''
         Import a journal from a manifest dictionary
@@ -121,6 +145,9 @@ class Journal:
         Record the schema transaction
         '''
 
+        if record_type != "get":
+            Journal.__revision += 1
+
         if self.__parent.__journal is None:
             return
 
@@ -159,26 +186,68 @@ class Journal:
         self.__parent.__journal = None
         self.__parent.__record_types.clear()
 
+    def write_file(self, filepath: str) -> None:
+        '''
+        Write the journal to a standalone file, one transaction per line.
+
+        This is a small sidecar to the manifest, which allows the journal to be
+        replayed without having to load the full manifest.
+
+        Args:
+            filepath (path): path to journal file
+        '''
+        journal = self.__parent.__journal
+        if journal is None:
+            journal = []
+
+        with open(filepath, "w", encoding="utf-8") as fid:
+            for action in journal:
+                fid.write(json.dumps(action))
+                fid.write("\n")
+
+    @staticmethod
+    def read_file(filepath: str) -> List[Dict]:
+        '''
+        Read the transactions of a journal file written by :meth:`write_file`.
+
+        Args:
+            filepath (path): path to journal file
+
+        Returns:
+            list of dict: the transactions, in the order they were recorded.
+        '''
+        journal = []
+        with open(filepath, "r", encoding="utf-8") as fid:
+            for line in fid:
+                line = line.strip()
+                if line:
+                    journal.append(json.loads(line))
+        return journal
+
     @staticmethod
     def replay_file(schema: "BaseSchema", filepath: str) -> None:
         '''
-        Replay a journal into a schema from a manifest
+        Replay a journal into a schema from a manifest or a journal file
+
+        Files ending in ``.jsonl`` are treated as journal files written by
+        :meth:`write_file`, all others as manifests in any of the formats
+        written by :meth:`BaseSchema.write_manifest`.
 
         Args:
             schema (:class:`BaseSchema`): schema to replay transactions to
-            filepath (path): path to manifest
+            filepath (path): path to manifest or journal file
         '''
-        # Manifests are written as UTF-8 (BaseSchema.__open_file); read them as
-        # UTF-8 rather than as whatever the host's locale happens to be. A
-        # server running under LANG=C decoded this as ASCII and failed the whole
-        # job on the first non-ASCII byte in a node's journal.
-        with open(filepath, "r", encoding="utf-8") as fid:
-            data = json.load(fid)
-        if "__journal__" not in data:
-            return
+        if filepath.endswith(Journal.FILE_EXTENSION):
+            records = Journal.read_file(filepath)
+        else:
+            from .baseschema import BaseSchema
+            data = BaseSchema._read_manifest(filepath)
+            if "__journal__" not in data:
+                return
+            records = data["__journal__"]
 
         journal = Journal()
-        journal.from_dict(data["__journal__"])
+        journal.from_dict(records)
         journal.replay(schema)
 
     def replay(self, schema: "BaseSchema") -> None:
@@ -7,6 +7,7 @@
 from typing import Dict, Tuple, Optional, Set, Type, Union, List
 
 from .baseschema import BaseSchema, LazyLoad, TSchema
+from .journal import Journal
 
 
 class NamedSchema(BaseSchema):
@@ -49,6 +50,7 @@ class NamedSchema(BaseSchema):
         except AttributeError:
             pass
         self.__name = name
+        Journal._changed()
 
     def type(self) -> str:
         """
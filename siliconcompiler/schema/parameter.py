@@ -42,6 +42,65 @@ class PerNode(Enum):
         return self == PerNode.NEVER
 
 
+class _ParameterDefinition:
+    '''
+    Definition of a parameter, which is every field except for the values.
+
+    Definitions are immutable and interned, so all parameters with the same
+    definition share one instance, see :meth:`get`.
+    '''
+
+    __slots__ = ("type", "require", "scope", "lock", "switch", "shorthelp", "example",
+                 "help", "notes", "pernode", "unit", "hashalgo", "copy")
+
+    FIELDS = __slots__
+
+    __interned: Dict[Tuple, "_ParameterDefinition"] = {}
+
+    @staticmethod
+    def get(type, require: bool, scope: Scope, lock: bool,
+            switch: Union[List[str], Tuple[str, ...]], shorthelp: Optional[str],
+            example: Union[List[str], Tuple[str, ...]], help: Optional[str],
+            notes: Optional[str], pernode: PerNode, unit: Optional[str],
+            hashalgo: Optional[str], copy: Optional[bool]) -> "_ParameterDefinition":
+        '''
+        Returns the definition with these fields.
+        '''
+        fields = (type, require, scope, lock, tuple(switch), shorthelp, tuple(example),
+                  help, notes, pernode, unit, hashalgo, copy)
+        # The class separates parsed types from types set as a string
+        key = (type.__class__, NodeType.encode(type), *fields[1:])
+
+        definition = _ParameterDefinition.__interned.get(key)
+        if definition is None:
+            definition = _ParameterDefinition()
+            for name, value in zip(_ParameterDefinition.FIELDS, fields):
+                object.__setattr__(definition, name, value)
+            definition = _ParameterDefinition.__interned.setdefault(key, definition)
+        return definition
+
+    def replace(self, **fields) -> "_ParameterDefinition":
+        '''
+        Returns the definition with the fields replaced.
+        '''
+        return _ParameterDefinition.get(**{
+            name: fields.get(name, getattr(self, name)) for name in _ParameterDefinition.FIELDS
+        })
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot set {name}: parameter definitions are immutable")
+
+    def __copy__(self) -> "_ParameterDefinition":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "_ParameterDefinition":
+        return self
+
+    def __reduce__(self):
+        return (_ParameterDefinition.get, tuple(getattr(self, name)
+                                                for name in _ParameterDefinition.FIELDS))
+
+
 class Parameter:
     '''
     Leaf nodes in the schema. This holds all the information for a given keypath.
@@ -67,6 +126,8 @@ class Parameter:
 
     GLOBAL_KEY = '*'
 
+    __slots__ = ("__definition", "__defvalue", "__node", "__shared")
+
     def __init__(self,
                  type: str,
                  require: bool = False,
@@ -84,77 +145,83 @@ class Parameter:
                  pernode: PerNode = PerNode.NEVER,
                  **kwargs):
 
-        self.__type = NodeType.parse(type)
-        self.__scope = Scope(scope)
-        self.__lock = lock
-        self.__require = require
+        type = NodeType.parse(type)
 
         if switch is None:
             switch = []
         elif isinstance(switch, str):
             switch = [switch]
-        self.__switch = switch
-
-        self.__shorthelp = shorthelp
 
         if example is None:
             example = []
         elif isinstance(example, str):
             example = [example]
-        self.__example = example
 
-        self.__help = help
-
-        self.__notes = notes
-
-        if self.__type == 'bool':
+        if type == 'bool':
             if defvalue is None:
                 defvalue = False
 
-        self.__pernode = PerNode(pernode)
+        if unit is not None and \
+                (NodeType.contains(type, 'int') or NodeType.contains(type, 'float')):
+            unit = str(unit)
+        else:
+            unit = None
+
+        if NodeType.contains(type, 'dir') or NodeType.contains(type, 'file'):
+            hashalgo = str(hashalgo)
+            copy = bool(copy)
+        else:
+            hashalgo = None
+            copy = None
+
+        self.__definition = _ParameterDefinition.get(
+            type=type,
+            require=require,
+            scope=Scope(scope),
+            lock=lock,
+            switch=switch,
+            shorthelp=shorthelp,
+            example=example,
+            help=help,
+            notes=notes,
+            pernode=PerNode(pernode),
+            unit=unit,
+            hashalgo=hashalgo,
+            copy=copy)
 
         self.__setdefvalue(defvalue, **kwargs)
 
         self.__node = {}
-
-        self.__unit = None
-        if unit is not None and \
-                (NodeType.contains(self.__type, 'int') or NodeType.contains(self.__type, 'float')):
-            self.__unit = str(unit)
-
-        self.__hashalgo = None
-        self.__copy = None
-        if NodeType.contains(self.__type, 'dir') or NodeType.contains(self.__type, 'file'):
-            self.__hashalgo = str(hashalgo)
-            self.__copy = bool(copy)
+        # True when the values are shared with a copy, see __deepcopy__
+        self.__shared = False
 
     def __setdefvalue(self, defvalue, **kwargs) -> None:
-        if NodeType.contains(self.__type, 'file'):
-            if isinstance(self.__type, list):
+        if NodeType.contains(self.__definition.type, 'file'):
+            if isinstance(self.__definition.type, list):
                 self.__defvalue = NodeListValue(FileNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__definition.type, set):
                 self.__defvalue = NodeSetValue(FileNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = FileNodeValue(defvalue, **kwargs)
-        elif NodeType.contains(self.__type, 'dir'):
-            if isinstance(self.__type, list):
+        elif NodeType.contains(self.__definition.type, 'dir'):
+            if isinstance(self.__definition.type, list):
                 self.__defvalue = NodeListValue(DirectoryNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__definition.type, set):
                 self.__defvalue = NodeSetValue(DirectoryNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = DirectoryNodeValue(defvalue, **kwargs)
         else:
             kwargs = {}
-            if isinstance(self.__type, list):
-                self.__defvalue = NodeListValue(NodeValue(self.__type[0], **kwargs))
+            if isinstance(self.__definition.type, list):
+                self.__defvalue = NodeListValue(NodeValue(self.__definition.type[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
-            elif isinstance(self.__type, set):
-                self.__defvalue = NodeSetValue(NodeValue(list(self.__type)[0], **kwargs))
+            elif isinstance(self.__definition.type, set):
+                self.__defvalue = NodeSetValue(NodeValue(list(self.__definition.type)[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
             else:
-                self.__defvalue = NodeValue(self.__type, value=defvalue, **kwargs)
+                self.__defvalue = NodeValue(self.__definition.type, value=defvalue, **kwargs)
 
     def __str__(self) -> str:
         return str(self.getvalues())
@@ -168,19 +235,19 @@ class Parameter:
         from docutils import nodes
         from sphinx.util.nodes import nested_parse_with_titles
 
-        entries = [[strong('Description'), para(self.__shorthelp)]]
-        type_str = NodeType.encode(self.__type)
+        entries = [[strong('Description'), para(self.__definition.shorthelp)]]
+        type_str = NodeType.encode(self.__definition.type)
         allowed = []
-        if NodeType.contains(self.__type, NodeEnumType):
+        if NodeType.contains(self.__definition.type, NodeEnumType):
             type_str = "enum"
             if self.istype("list"):
                 type_str = "[enum]"
-                values = next(iter(self.__type)).values
+                values = next(iter(self.__definition.type)).values
             elif self.istype("set"):
                 type_str = "{enum}"
-                values = next(iter(self.__type)).values
+                values = next(iter(self.__definition.type)).values
             else:
-                values = self.__type.values
+                values = self.__definition.type.values
             allowed = sorted(values)
 
         entries.append([strong('Type'), para(type_str)])
@@ -188,21 +255,22 @@ class Parameter:
             entries.append([strong('Allowed values'), build_list([para(a) for a in allowed])])
 
         if self.get(field='pernode').is_never():
-            entries.append([strong('Per step/index'), para(str(self.__pernode.value).lower())])
+            entries.append([strong('Per step/index'),
+                            para(str(self.__definition.pernode.value).lower())])
 
-        entries.append([strong('Scope'), para(str(self.__scope.value).lower())])
+        entries.append([strong('Scope'), para(str(self.__definition.scope.value).lower())])
 
-        if self.__unit:
-            entries.append([strong('Unit'), para(self.__unit)])
+        if self.__definition.unit:
+            entries.append([strong('Unit'), para(self.__definition.unit)])
 
         entries.append([strong('Default Value'), para(self.__defvalue.get())])
 
-        switch_list = [code(switch) for switch in self.__switch]
+        switch_list = [code(switch) for switch in self.__definition.switch]
         if switch_list:
             entries.append([strong('CLI Switch'), build_list(switch_list)])
 
         examples = {}
-        for example in self.__example:
+        for example in self.__definition.example:
             name, ex = example.split(':', 1)
             examples.setdefault(name, []).append(ex)
 
@@ -221,8 +289,8 @@ class Parameter:
 
         rst = ViewList()
         # use fake filename 'inline' for error # reporting
-        if self.__help:
-            for i, line in enumerate(self.__help.splitlines()):
+        if self.__definition.help:
+            for i, line in enumerate(self.__definition.help.splitlines()):
                 rst.append(line, 'inline', i)
         body = nodes.paragraph()
         nested_parse_with_titles(doc.state, rst, body)
@@ -254,34 +322,38 @@ class Parameter:
 
         self.__assert_step_index(field, step, index)
 
+        if field is None:
+            # The value object is returned and can be modified
+            self.__unshare()
+
         if field in self.__defvalue.fields:
             return self.__resolve(step, index).get(field=field)
         elif field == "type":
-            return NodeType.encode(self.__type)
+            return NodeType.encode(self.__definition.type)
         elif field == "scope":
-            return self.__scope
+            return self.__definition.scope
         elif field == "lock":
-            return self.__lock
+            return self.__definition.lock
         elif field == "switch":
-            return copy.deepcopy(self.__switch)
+            return list(self.__definition.switch)
         elif field == "shorthelp":
-            return self.__shorthelp
+            return self.__definition.shorthelp
         elif field == "example":
-            return copy.deepcopy(self.__example)
+            return list(self.__definition.example)
         elif field == "help":
-            return self.__help
+            return self.__definition.help
         elif field == "notes":
-            return self.__notes
+            return self.__definition.notes
         elif field == "pernode":
-            return self.__pernode
+            return self.__definition.pernode
         elif field == "unit":
-            return self.__unit
+            return self.__definition.unit
         elif field == "hashalgo":
-            return self.__hashalgo
+            return self.__definition.hashalgo
         elif field == "copy":
-            return self.__copy
+            return self.__definition.copy
         elif field == "require":
-            return self.__require
+            return self.__definition.require
 
         raise ValueError(f'"{field}" is not a valid field')
 
@@ -313,7 +385,7 @@ class Parameter:
         try:
             return self.__node[step][index]
         except KeyError:
-            if self.__pernode == PerNode.REQUIRED:
+            if self.__definition.pernode == PerNode.REQUIRED:
                 return self.__defvalue
 
         try:
@@ -336,10 +408,10 @@ class Parameter:
                     f': {", ".join([field for field in self.__defvalue.fields if field])}')
             return
 
-        if self.__pernode == PerNode.NEVER and (step is not None or index is not None):
+        if self.__definition.pernode == PerNode.NEVER and (step is not None or index is not None):
             raise KeyError('use of step and index are not valid')
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__definition.pernode == PerNode.REQUIRED and (step is None or index is None):
             raise KeyError('step and index are required')
 
         if step is None and index is not None:
@@ -377,7 +449,7 @@ class Parameter:
         step, index = self.__map_global(step, index)
 
         if field != "lock":
-            if self.__lock:
+            if self.__definition.lock:
                 return False
 
         if self.is_set(step, index) and not clobber:
@@ -389,6 +461,7 @@ class Parameter:
             if isinstance(index, int):
                 index = str(index)
 
+            self.__unshare()
             if step not in self.__node:
                 self.__node[step] = {}
             if index not in self.__node[step]:
@@ -396,40 +469,25 @@ class Parameter:
 
             return self.__node[step][index].set(value, field=field)
         elif field == "type":
-            self.__type = NodeType.normalize(value, "str")
+            self.__definition = self.__definition.replace(type=NodeType.normalize(value, "str"))
         elif field == "scope":
-            if isinstance(value, Scope):
-                self.__scope = value
-            else:
-                self.__scope = Scope(NodeType.normalize(value,
-                                                        NodeEnumType(*[v.value for v in Scope])))
-        elif field == "lock":
-            self.__lock = NodeType.normalize(value, "bool")
-        elif field == "switch":
-            self.__switch = NodeType.normalize(value, ["str"])
-        elif field == "shorthelp":
-            self.__shorthelp = NodeType.normalize(value, "str")
-        elif field == "example":
-            self.__example = NodeType.normalize(value, ["str"])
-        elif field == "help":
-            self.__help = NodeType.normalize(value, "str")
-        elif field == "notes":
-            self.__notes = NodeType.normalize(value, "str")
+            if not isinstance(value, Scope):
+                value = Scope(NodeType.normalize(value, NodeEnumType(*[v.value for v in Scope])))
+            self.__definition = self.__definition.replace(scope=value)
         elif field == "pernode":
-            if isinstance(value, PerNode):
-                self.__pernode = value
-            else:
-                self.__pernode = PerNode(NodeType.normalize(value,
-                                                            NodeEnumType(
-                                                                *[v.value for v in PerNode])))
-        elif field == "unit":
-            self.__unit = NodeType.normalize(value, "str")
-        elif field == "hashalgo":
-            self.__hashalgo = NodeType.normalize(value, "str")
-        elif field == "copy":
-            self.__copy = NodeType.normalize(value, "bool")
-        elif field == "require":
-            self.__require = NodeType.normalize(value, "bool")
+            if not isinstance(value, PerNode):
+                value = PerNode(NodeType.normalize(value,
+                                                   NodeEnumType(*[v.value for v in PerNode])))
+            self.__definition = self.__definition.replace(pernode=value)
+        elif field in ("lock", "copy", "require"):
+            self.__definition = self.__definition.replace(
+                **{field: NodeType.normalize(value, "bool")})
+        elif field in ("switch", "example"):
+            self.__definition = self.__definition.replace(
+                **{field: NodeType.normalize(value, ["str"])})
+        elif field in ("shorthelp", "help", "notes", "unit", "hashalgo"):
+            self.__definition = self.__definition.replace(
+                **{field: NodeType.normalize(value, "str")})
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
@@ -457,7 +515,7 @@ class Parameter:
 
         step, index = self.__map_global(step, index)
 
-        if self.__lock:
+        if self.__definition.lock:
             return False
 
         self.__assert_step_index(field, step, index)
@@ -469,16 +527,17 @@ class Parameter:
             if isinstance(index, int):
                 index = str(index)
 
+            self.__unshare()
             if step not in self.__node:
                 self.__node[step] = {}
             if index not in self.__node[step]:
                 self.__node[step][index] = self.__defvalue.copy()
 
             return self.__node[step][index].add(value, field=field)
-        elif field == "switch":
-            self.__switch.extend(NodeType.normalize(value, ["str"]))
-        elif field == "example":
-            self.__example.extend(NodeType.normalize(value, ["str"]))
+        elif field in ("switch", "example"):
+            self.__definition = self.__definition.replace(
+                **{field: (*getattr(self.__definition, field),
+                           *NodeType.normalize(value, ["str"]))})
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
@@ -509,7 +568,7 @@ class Parameter:
                 on a per-node basis.
         '''
 
-        if self.__lock:
+        if self.__definition.lock:
             return False
 
         step, index = self.__map_global(step, index)
@@ -517,6 +576,7 @@ class Parameter:
         if isinstance(index, int):
             index = str(index)
 
+        self.__unshare()
         try:
             del self.__node[step][index]
         except KeyError:
@@ -560,36 +620,63 @@ class Parameter:
             return dictvals
 
         dictvals = {
-            "type": NodeType.encode(self.__type),
-            "require": self.__require,
-            "scope": self.__scope.value,
-            "lock": self.__lock,
-            "switch": self.__switch.copy(),
-            "shorthelp": self.__shorthelp,
-            "example": self.__example.copy(),
-            "help": self.__help,
-            "notes": self.__notes,
-            "pernode": self.__pernode.value,
-            "node": {}
+            "type": NodeType.encode(self.__definition.type),
+            "require": self.__definition.require,
+            "scope": self.__definition.scope.value,
+            "lock": self.__definition.lock,
+            "switch": list(self.__definition.switch),
+            "shorthelp": self.__definition.shorthelp,
+            "example": list(self.__definition.example),
+            "help": self.__definition.help,
+            "notes": self.__definition.notes,
+            "pernode": self.__definition.pernode.value,
+            "node": self.__getdict_node()
         }
 
+        if include_default:
+            dictvals["node"].setdefault("default", {})["default"] = self.__defvalue.getdict()
+
+        if self.__definition.unit:
+            dictvals["unit"] = self.__definition.unit
+        if self.__definition.hashalgo:
+            dictvals["hashalgo"] = self.__definition.hashalgo
+        if self.__definition.copy is not None:
+            dictvals["copy"] = self.__definition.copy
+        return dictvals
+
+    def __getdict_node(self) -> Dict:
+        node = {}
         for step in self.__node:
             out_step = Parameter.GLOBAL_KEY if step is None else step
-            dictvals["node"][out_step] = {}
+            node[out_step] = {}
             for index, val in self.__node[step].items():
                 out_index = Parameter.GLOBAL_KEY if index is None else index
-                dictvals["node"][out_step][out_index] = val.getdict()
+                node[out_step][out_index] = val.getdict()
+        return node
 
-        if include_default:
-            dictvals["node"].setdefault("default", {})["default"] = self.__defvalue.getdict()
+    def _getdict_values(self) -> Dict:
+        """
+        Returns the dictionary of the values of this parameter, without its
+        definition.
 
-        if self.__unit:
-            dictvals["unit"] = self.__unit
-        if self.__hashalgo:
-            dictvals["hashalgo"] = self.__hashalgo
-        if self.__copy is not None:
-            dictvals["copy"] = self.__copy
-        return dictvals
+        :meth:`_from_dict` keeps the current definition when it is passed this
+        dictionary, so it can only be loaded into a parameter with the same
+        definition, see :meth:`_has_same_definition`.
+        """
+        return {"node": self.__getdict_node()}
+
+    def _has_same_definition(self, other: "Parameter") -> bool:
+        """
+        Returns true if the other parameter has the same definition as this
+        parameter, which is every field except for the values.
+
+        Args:
+            other (:class:`Parameter`): parameter to compare with.
+        """
+        if self is other:
+            return True
+        return self.__definition is other.__definition and \
+            self.__defvalue.getdict() == other.__defvalue.getdict()
 
     @classmethod
     def from_dict(cls,
@@ -617,50 +704,59 @@ class Parameter:
         '''
         Copies the information from the manifest into this parameter.
 
+        A manifest without a type only holds values, see :meth:`_getdict_values`,
+        and the current definition of the parameter is kept.
+
         Args:
             manifest (dict): Manifest to decide.
             keypath (list of str): Path to the current keypath.
             version (Tuple[int, ...]): Version of the dictionary schema
         '''
 
-        if self.__lock:
+        if self.__definition.lock:
             return
 
-        if version and version > (0, 50, 0):
-            self.__type = NodeType.parse(manifest["type"])
-        else:
-            if "enum" in manifest:
-                self.__type = NodeType.parse(
-                    re.sub("enum", f"<{','.join(manifest['enum'])}>", manifest['type']))
+        if "type" in manifest:
+            if version and version > (0, 50, 0):
+                sctype = NodeType.parse(manifest["type"])
             else:
-                self.__type = NodeType.parse(manifest["type"])
-
-        self.__require = manifest.get("require", self.__require)
-        self.__scope = Scope(manifest.get("scope", self.__scope))
-        self.__lock = manifest.get("lock", self.__lock)
-        self.__switch = manifest.get("switch", self.__switch)
-        self.__shorthelp = manifest.get("shorthelp", self.__shorthelp)
-        self.__example = manifest.get("example", self.__example)
-        self.__help = manifest.get("help", self.__help)
-        self.__notes = manifest.get("notes", self.__notes)
-        self.__pernode = PerNode(manifest.get("pernode", self.__pernode))
-        self.__node = {}
-
-        self.__unit = manifest.get("unit", self.__unit)
-        self.__hashalgo = manifest.get("hashalgo", self.__hashalgo)
-        self.__copy = manifest.get("copy", self.__copy)
-
-        requires_set = NodeType.contains(self.__type, tuple) or NodeType.contains(self.__type, set)
+                if "enum" in manifest:
+                    sctype = NodeType.parse(
+                        re.sub("enum", f"<{','.join(manifest['enum'])}>", manifest['type']))
+                else:
+                    sctype = NodeType.parse(manifest["type"])
+
+            self.__definition = self.__definition.replace(
+                type=sctype,
+                require=manifest.get("require", self.__definition.require),
+                scope=Scope(manifest.get("scope", self.__definition.scope)),
+                lock=manifest.get("lock", self.__definition.lock),
+                switch=manifest.get("switch", self.__definition.switch),
+                shorthelp=manifest.get("shorthelp", self.__definition.shorthelp),
+                example=manifest.get("example", self.__definition.example),
+                help=manifest.get("help", self.__definition.help),
+                notes=manifest.get("notes", self.__definition.notes),
+                pernode=PerNode(manifest.get("pernode", self.__definition.pernode)),
+                unit=manifest.get("unit", self.__definition.unit),
+                hashalgo=manifest.get("hashalgo", self.__definition.hashalgo),
+                copy=manifest.get("copy", self.__definition.copy))
 
-        try:
-            defvalue = manifest["node"]["default"]["default"]
-            del manifest["node"]["default"]
-        except KeyError:
-            defvalue = None
+            try:
+                defvalue = manifest["node"]["default"]["default"]
+                del manifest["node"]["default"]
+            except KeyError:
+                defvalue = None
+
+            self.__setdefvalue(None)
+            if defvalue:
+                self.__defvalue._from_dict(defvalue, keypath, version)
+        else:
+            # Values only, keep the current definition
+            manifest["node"].pop("default", None)
 
-        self.__setdefvalue(None)
-        if defvalue:
-            self.__defvalue._from_dict(defvalue, keypath, version)
+        self.__node = {}
+        sctype = self.__definition.type
+        requires_set = NodeType.contains(sctype, tuple) or NodeType.contains(sctype, set)
 
         # GLOBAL_KEY is the wire alias for the internal None sentinel. It changed
         # from the bare word "global" to "*" in schema 0.55.0; read the legacy
@@ -700,7 +796,7 @@ class Parameter:
 
         step, index = self.__map_global(step, index)
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__definition.pernode == PerNode.REQUIRED and (step is None or index is None):
             return None
 
         return self.__resolve(step, index).gettcl()
@@ -718,6 +814,10 @@ class Parameter:
         list in place of a global value if a global value is not set.
         """
 
+        if not return_values:
+            # The value objects are returned and can be modified
+            self.__unshare()
+
         vals = []
         has_global = False
         for step in self.__node:
@@ -729,7 +829,7 @@ class Parameter:
                 else:
                     vals.append((self.__node[step][index], step, index))
 
-        if self.__pernode != PerNode.REQUIRED and not has_global and return_defvalue:
+        if self.__definition.pernode != PerNode.REQUIRED and not has_global and return_defvalue:
             if return_values:
                 vals.append((self.__defvalue.get(), None, None))
             else:
@@ -747,6 +847,31 @@ class Parameter:
 
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo: Dict) -> "Parameter":
+        # Copy-on-write: the copy shares the values of this parameter until
+        # either one of them modifies them, see __unshare
+        param = self.__class__.__new__(self.__class__)
+        memo[id(self)] = param
+        param.__definition = self.__definition
+        param.__defvalue = self.__defvalue
+        param.__node = self.__node
+        self.__shared = True
+        param.__shared = True
+        return param
+
+    def __unshare(self) -> None:
+        '''
+        Gives this parameter its own copy of the values it shares with a copy
+        before they are modified.
+        '''
+        if not self.__shared:
+            return
+
+        self.__node = {step: {index: value.copy() for index, value in indexdata.items()}
+                       for step, indexdata in self.__node.items()}
+        self.__defvalue = self.__defvalue.copy()
+        self.__shared = False
+
     # Utility functions
     def istype(self, *types) -> bool:
         """
@@ -759,7 +884,7 @@ class Parameter:
         container tokens, and ``'enum'``/``'range'``).
         """
 
-        return NodeType.istype(self.__type, *types)
+        return NodeType.istype(self.__definition.type, *types)
 
     def basetype(self) -> Optional[str]:
         """
@@ -769,7 +894,7 @@ class Parameter:
         heterogeneous tuples. See :meth:`NodeType.basetype`.
         """
 
-        return NodeType.basetype(self.__type)
+        return NodeType.basetype(self.__definition.type)
 
     def is_list(self) -> bool:
         """
@@ -783,7 +908,7 @@ class Parameter:
             "is_list is deprecated, use istype('list', 'set') instead",
             DeprecationWarning,
             stacklevel=2)
-        return NodeType.istype(self.__type, "list", "set")
+        return NodeType.istype(self.__definition.type, "list", "set")
 
     @property
     def is_file(self) -> bool:
@@ -795,7 +920,7 @@ class Parameter:
         containing ``file``).
         """
 
-        return NodeType.contains(self.__type, 'file')
+        return NodeType.contains(self.__definition.type, 'file')
 
     @property
     def is_directory(self) -> bool:
@@ -807,7 +932,7 @@ class Parameter:
         containing ``dir``).
         """
 
-        return NodeType.contains(self.__type, 'dir')
+        return NodeType.contains(self.__definition.type, 'dir')
 
     @property
     def is_path(self) -> bool:
@@ -869,13 +994,14 @@ class Parameter:
         """
         Gets a copy of the default value.
         """
-        return self._default.copy()
+        return self.__defvalue.copy()
 
     @property
     def _default(self) -> Union[NodeValue, NodeSetValue, NodeListValue]:
         """
         Gets an editable version the default value.
         """
+        self.__unshare()
         return self.__defvalue
 
     def add_commandline_arguments(self,
@@ -896,7 +1022,7 @@ class Parameter:
             dest (str): key for argument parsing to lookup values in.
             switches (list of str): list of switches added.
         '''
-        if not self.__switch:
+        if not self.__definition.switch:
             # no switches available to this parameter
             return None, None
 
@@ -907,7 +1033,7 @@ class Parameter:
 
         switches = []
         metavar = None
-        for switch in self.__switch:
+        for switch in self.__definition.switch:
             switchmatch = re.match(r'(-[\w_]+)\s+(\'([\w]+\s)*<.*>\'|<.*>)', switch)
             gccmatch = re.match(r'(-[\w_]+)(<.*>)', switch)
             plusmatch = re.match(r'(\+[\w_\+]+)(<.*>)', switch)
@@ -935,16 +1061,16 @@ class Parameter:
         # argparse 'dest' must be a string, so join keypath with commas
         dest = '_'.join(keypath)
 
-        if self.__type == "bool":
+        if self.__definition.type == "bool":
             # Boolean type arguments
-            if self.__pernode.is_never():
+            if self.__definition.pernode.is_never():
                 argparser.add_argument(
                     *switches,
                     nargs='?',
                     metavar=metavar,
                     dest=dest,
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__definition.shorthelp,
                     default=argparse.SUPPRESS)
             else:
                 argparser.add_argument(
@@ -954,16 +1080,16 @@ class Parameter:
                     dest=dest,
                     action='append',
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__definition.shorthelp,
                     default=argparse.SUPPRESS)
-        elif isinstance(self.__type, list) or self.__pernode != PerNode.NEVER:
+        elif isinstance(self.__definition.type, list) or self.__definition.pernode != PerNode.NEVER:
             # list type arguments
             argparser.add_argument(
                 *switches,
                 metavar=metavar,
                 dest=dest,
                 action='append',
-                help=self.__shorthelp,
+                help=self.__definition.shorthelp,
                 default=argparse.SUPPRESS)
         else:
             # all the rest
@@ -971,7 +1097,7 @@ class Parameter:
                 *switches,
                 metavar=metavar,
                 dest=dest,
-                help=self.__shorthelp,
+                help=self.__definition.shorthelp,
                 default=argparse.SUPPRESS)
 
         return dest, switches
@@ -986,11 +1112,12 @@ class Parameter:
             keypath (list of str): keypath to this parameter
         """
         num_free_keys = keypath.count('default')
+        switches = "/".join(self.__definition.switch)
 
         if num_free_keys > 0:
             valueitem = shlex.split(value)
             if len(valueitem) != num_free_keys + 1:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}')
+                raise ValueError(f'Invalid value "{value}" for switch {switches}')
 
             free_keys = valueitem[0:num_free_keys]
             remainder = valueitem[-1]
@@ -999,19 +1126,19 @@ class Parameter:
             remainder = value
 
         step, index = None, None
-        if self.__pernode == PerNode.REQUIRED:
+        if self.__definition.pernode == PerNode.REQUIRED:
             try:
                 step, index, val = shlex.split(remainder)
             except ValueError:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Requires step and index before final value')
-        elif self.__pernode == PerNode.OPTIONAL:
+        elif self.__definition.pernode == PerNode.OPTIONAL:
             # Split on spaces, preserving items that are grouped in quotes
             items = shlex.split(remainder)
             if len(items) > 3:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Too many arguments')
-            if self.__type == 'bool':
+            if self.__definition.type == 'bool':
                 if len(items) == 3:
                     step, index, val = items
                 elif len(items) == 2:
@@ -7,6 +7,7 @@ import os.path
 
 from typing import Dict, List, Tuple, Union, Optional
 
+from .filehash import FileHashCache, update_hash
 from .parametertype import NodeType
 
 try:
@@ -25,6 +26,8 @@ class NodeListValue:
         base (:class:`NodeValue`): base type for this list.
     '''
 
+    __slots__ = ("__base", "__values")
+
     def __init__(self, base: Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]):
         self.__base = base
         self.__values = []
@@ -222,6 +225,13 @@ class NodeListValue:
 
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo: Dict) -> "NodeListValue":
+        value = self.__class__.__new__(self.__class__)
+        memo[id(self)] = value
+        value.__base = copy.deepcopy(self.__base, memo)
+        value.__values = [copy.deepcopy(val, memo) for val in self.__values]
+        return value
+
     def _set_type(self, sctype) -> None:
         sctype = NodeType.parse(sctype)[0]
         self.__base._set_type(sctype)
@@ -244,6 +254,8 @@ class NodeSetValue:
         base (:class:`NodeValue`): base type for this set.
     '''
 
+    __slots__ = ("__base", "__values")
+
     def __init__(self, base: Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]):
         self.__base = base
         self.__values = []
@@ -452,6 +464,13 @@ class NodeSetValue:
 
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo: Dict) -> "NodeSetValue":
+        value = self.__class__.__new__(self.__class__)
+        memo[id(self)] = value
+        value.__base = copy.deepcopy(self.__base, memo)
+        value.__values = [copy.deepcopy(val, memo) for val in self.__values]
+        return value
+
     def _set_type(self, sctype):
         sctype = NodeType.parse(sctype)[0]
         self.__base._set_type(sctype)
@@ -475,6 +494,8 @@ class NodeValue:
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__type", "__value", "__signature")
+
     def __init__(self, sctype, value=None):
         self._set_type(sctype)
         self.__value = value
@@ -622,6 +643,15 @@ class NodeValue:
 
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo: Dict) -> "NodeValue":
+        # The type is never modified in place, so it is shared with the copy
+        value = self.__class__.__new__(self.__class__)
+        memo[id(self)] = value
+        value.__type = self.__type
+        value.__value = copy.deepcopy(self.__value, memo)
+        value.__signature = self.__signature
+        return value
+
     def _set_type(self, sctype) -> None:
         self.__type = NodeType.parse(sctype)
 
@@ -707,12 +737,20 @@ class PathNodeValue(NodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__filehash", "__dataroot")
+
     def __init__(self, type, value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
         super().__init__(type, value=value)
         self.__filehash = None
         self.__dataroot = dataroot
 
+    def __deepcopy__(self, memo: Dict) -> "PathNodeValue":
+        value = super().__deepcopy__(memo)
+        value.__filehash = self.__filehash
+        value.__dataroot = self.__dataroot
+        return value
+
     def getdict(self) -> Dict:
         return {
             **super().getdict(),
@@ -882,6 +920,9 @@ class PathNodeValue(NodeValue):
         """
         Compute the hash for this directory.
 
+        If a hashing object is not provided, the digest is looked up in
+        :meth:`FileHashCache.default` before the files are read.
+
         Args:
             dirname (path): directory to hash
             hashobj (hashlib.): hashing object
@@ -899,13 +940,12 @@ class PathNodeValue(NodeValue):
             if not hashfunc:
                 raise RuntimeError("Unable to hash directory due to missing "
                                    f"hash function: {hashfunction}")
-            hashobj = hashfunc()
+            return FileHashCache.default().hash_directory(dirname, hashfunction, hashfunc)
 
         all_files = []
         for root, _, files in os.walk(dirname):
             all_files.extend([os.path.join(root, f) for f in files])
         dirhash = None
-        hashobj = hashfunc()
         for file in sorted(all_files):
             # Cast everything to a windows path and convert to posix.
             # https://stackoverflow.com/questions/73682260
@@ -921,6 +961,9 @@ class PathNodeValue(NodeValue):
         """
         Compute the hash for this file.
 
+        If a hashing object is not provided, the digest is looked up in
+        :meth:`FileHashCache.default` before the file is read.
+
         Args:
             filename (path): file to hash
             hashobj (hashlib.): hashing object
@@ -938,11 +981,9 @@ class PathNodeValue(NodeValue):
             if not hashfunc:
                 raise RuntimeError("Unable to hash file due to missing "
                                    f"hash function: {hashfunction}")
-            hashobj = hashfunc()
+            return FileHashCache.default().hash_file(filename, hashfunction, hashfunc)
 
-        with open(filename, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                hashobj.update(byte_block)
+        update_hash(hashobj, filename)
         return hashobj.hexdigest()
 
     @property
@@ -962,6 +1003,8 @@ class DirectoryNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ()
+
     def __init__(self,
                  value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
@@ -992,6 +1035,8 @@ class FileNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__date", "__author")
+
     def __init__(self,
                  value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
@@ -999,6 +1044,12 @@ class FileNodeValue(PathNodeValue):
         self.__date = None
         self.__author = []
 
+    def __deepcopy__(self, memo: Dict) -> "FileNodeValue":
+        value = super().__deepcopy__(memo)
+        value.__date = self.__date
+        value.__author = self.__author.copy()
+        return value
+
     def getdict(self) -> Dict:
         return {
             **super().getdict(),
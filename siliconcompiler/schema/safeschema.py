@@ -44,6 +44,8 @@ class SafeSchema(BaseSchema):
         if "__meta__" in manifest:
             del manifest["__meta__"]
 
+        self._BaseSchema__invalidate_index()
+
         lazyload = LazyLoad.OFF
 
         for key, data in manifest.items():
@@ -0,0 +1,108 @@
+"""
+String table for compact manifests.
+
+The documentation of a parameter is identical in every copy of the schema
+that defines it, so a compact manifest stores each of these strings once in
+a table and refers to it by its index in the table.
+"""
+from typing import Dict, List, Optional
+
+
+class StringTable:
+    """
+    Deduplicates the documentation strings of parameters in a manifest.
+
+    Args:
+        strings (list of str): existing table to decode with.
+    """
+
+    #: Manifest key holding the table
+    KEY = "__strings__"
+
+    #: Parameter fields stored in the table
+    FIELDS = ("switch", "shorthelp", "example", "help", "notes")
+
+    def __init__(self, strings: Optional[List[str]] = None):
+        self.__strings: List[str] = list(strings or [])
+        self.__index: Dict[str, int] = {string: n for n, string in enumerate(self.__strings)}
+
+    @property
+    def strings(self) -> List[str]:
+        """The strings in the table."""
+        return self.__strings
+
+    @staticmethod
+    def is_parameter(data: Dict) -> bool:
+        """
+        Returns true if the manifest data belongs to a parameter.
+
+        Args:
+            data (dict): manifest data.
+        """
+        return isinstance(data.get("type"), str) and isinstance(data.get("node"), dict)
+
+    def __ref(self, string: str) -> int:
+        ref = self.__index.get(string)
+        if ref is None:
+            ref = len(self.__strings)
+            self.__strings.append(string)
+            self.__index[string] = ref
+        return ref
+
+    def encode_parameter(self, data: Dict) -> Dict:
+        """
+        Returns a copy of the manifest data of a parameter with the
+        documentation replaced by references to the table.
+
+        Args:
+            data (dict): manifest data of a parameter.
+        """
+        data = dict(data)
+        for field in StringTable.FIELDS:
+            value = data.get(field)
+            if isinstance(value, str):
+                data[field] = self.__ref(value)
+            elif isinstance(value, list):
+                data[field] = [self.__ref(v) if isinstance(v, str) else v for v in value]
+        return data
+
+    def encode(self, manifest: Dict) -> Dict:
+        """
+        Returns a copy of a manifest with the documentation of every parameter
+        replaced by references to the table.
+
+        Args:
+            manifest (dict): manifest to encode.
+        """
+        if StringTable.is_parameter(manifest):
+            return self.encode_parameter(manifest)
+
+        encoded = {}
+        for key, data in manifest.items():
+            if isinstance(data, dict) and key not in ("__journal__", "__meta__"):
+                data = self.encode(data)
+            encoded[key] = data
+        return encoded
+
+    def __decode_parameter(self, data: Dict) -> None:
+        for field in StringTable.FIELDS:
+            value = data.get(field)
+            if isinstance(value, int):
+                data[field] = self.__strings[value]
+            elif isinstance(value, list):
+                data[field] = [self.__strings[v] if isinstance(v, int) else v for v in value]
+
+    def decode(self, manifest: Dict) -> None:
+        """
+        Replaces the references to the table in a manifest, in place.
+
+        Args:
+            manifest (dict): manifest to decode.
+        """
+        if StringTable.is_parameter(manifest):
+            self.__decode_parameter(manifest)
+            return
+
+        for key, data in manifest.items():
+            if isinstance(data, dict) and key not in ("__journal__", "__meta__"):
+                self.decode(data)
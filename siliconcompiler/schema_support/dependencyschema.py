@@ -4,6 +4,7 @@ from typing import Dict, Union, Tuple, List, Optional, Set
 
 from siliconcompiler.schema.baseschema import BaseSchema, LazyLoad
 from siliconcompiler.schema.editableschema import EditableSchema
+from siliconcompiler.schema.journal import Journal
 from siliconcompiler.schema.parameter import Parameter, Scope
 from siliconcompiler.schema.namedschema import NamedSchema
 
@@ -144,6 +145,7 @@ class DependencySchema(BaseSchema):
             self.set("deps", True, field="lock")
 
         self.__deps[obj.name] = obj
+        Journal._changed()
 
         return True
 
@@ -307,8 +309,9 @@ class DependencySchema(BaseSchema):
         '''
 
         # Ensure a deferred (lazily-loaded) manifest is elaborated so the
-        # internal dependency map is populated before it is read.
-        self.get("deps")
+        # internal dependency map is populated before it is read. The parameter
+        # object is fetched rather than its value to avoid copying the list.
+        self.get("deps", field=None)
 
         if name:
             if not self.has_dep(name):
@@ -384,10 +387,12 @@ class DependencySchema(BaseSchema):
 
             if isinstance(self.__deps[module], DependencySchema):
                 self.__deps[module]._populate_deps(module_map)
+        Journal._changed()
 
     def _reset_deps(self) -> None:
         '''Resets the internal dependency dictionary.'''
         self.__deps = {}
+        Journal._changed()
 
     def check_filepaths(self, ignore_keys: Optional[List[Tuple[str, ...]]] = None) -> bool:
         '''
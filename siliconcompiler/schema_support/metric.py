@@ -117,6 +117,26 @@ class MetricSchema(BaseSchema):
                 Metric tracking the total amount of time spent from the beginning
                 of the run up to and including the current step and index.""")))
 
+        schema.insert(
+            'overhead',
+            Parameter(
+                'float<0.0..>',
+                unit='s',
+                scope=Scope.JOB,
+                shorthelp="Metric: overhead",
+                switch="-metric_overhead 'step index <float>'",
+                example=[
+                    "cli: -metric_overhead 'dfm 0 10.0'",
+                    "api: project.set('metric', 'overhead', 10.0, step='dfm', index=0)"],
+                pernode=PerNode.REQUIRED,
+                help=trim("""
+                Metric tracking the time spent by SiliconCompiler on a task outside
+                of running the tool, such as setting up the inputs, writing the input
+                manifest, hashing files, checking the tool version, pre/post processing
+                and scanning the logs, on a per step and index basis. Writing the
+                output manifest happens after the task time is recorded and is not
+                included.""")))
+
     def clear(self, step: str, index: Union[int, str]) -> None:
         '''
         Clears all saved metrics for a given step and index.
@@ -183,6 +203,26 @@ class MetricSchema(BaseSchema):
 
         return self.record(step, index, "tasktime", end_time-start_time, unit="s")
 
+    def record_overhead(self, step: str, index: Union[str, int], tooltime: float):
+        """
+        Records the time spent on a node outside of running the tool.
+
+        The task time must have been recorded first, see :meth:`record_tasktime`.
+
+        Args:
+            step (str): The step of the node.
+            index (str or int): The index of the node.
+            tooltime (float): The time in seconds spent running the tool.
+
+        Returns:
+            bool: True if the time was successfully recorded, False otherwise.
+        """
+        tasktime = self.get("tasktime", step=step, index=str(index))
+        if tasktime is None:
+            return False
+
+        return self.record(step, index, "overhead", max(0.0, tasktime - tooltime), unit="s")
+
     def record_totaltime(self,
                          step: str, index: Union[str, int],
                          flow: "Flowgraph",
@@ -268,7 +308,7 @@ class MetricSchema(BaseSchema):
         if metric == 'memory':
             return units.format_binary(self.get(metric, step=step, index=index),
                                        self.get(metric, field="unit"))
-        elif metric in ['exetime', 'tasktime', 'totaltime']:
+        elif metric in ['exetime', 'tasktime', 'totaltime', 'overhead']:
             return units.format_time(self.get(metric, step=step, index=index))
         elif NodeType.istype(self.get(metric, field="type"), 'int'):
             return str(self.get(metric, step=step, index=index))
@@ -316,6 +356,7 @@ class MetricSchema(BaseSchema):
         sort_map["exetime"] = 2
         sort_map["tasktime"] = 3
         sort_map["totaltime"] = 4
+        sort_map["overhead"] = 5
         row_labels = sorted(row_labels, key=lambda row: sort_map[row])
 
         if trim_empty_metrics:
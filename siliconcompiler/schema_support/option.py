@@ -73,7 +73,12 @@ class SchedulerSchema(BaseSchema):
                 Specifies the amount of memory required to run the job,
                 specified in MB. For the slurm scheduler, this translates to
                 the '--mem' switch. For more information, see the job
-                scheduler documentation"""))
+                scheduler documentation. When running locally, nodes are only
+                run in parallel while the sum of their memory fits in the memory
+                available on the machine, which is sampled again each time nodes
+                are started. If this is not set, the peak
+                :keypath:`metric,memory` from the job history for the same tool
+                and task is used."""))
 
         schema.insert(
             'queue',
@@ -190,6 +195,27 @@ class SchedulerSchema(BaseSchema):
                 Maximum number of threads for each task in a job. If not set this will default
                 to the number of cpu cores available."""))
 
+        schema.insert(
+            'priority',
+            Parameter(
+                '<order,critical_path>',
+                scope=Scope.GLOBAL,
+                defvalue='order',
+                shorthelp="Option: node scheduling priority",
+                switch="-scheduler_priority <str>",
+                example=["cli: -scheduler_priority critical_path",
+                         "api: option.set('priority', 'critical_path')"],
+                help="""
+                Policy used to pick which of the nodes that are ready to run are started
+                first when there are not enough resources to start all of them.
+
+                * order: nodes are started in flowgraph execution order.
+                * critical_path: nodes with the most remaining downstream work are started
+                  first. The work of a node is estimated from the :keypath:`metric,tasktime`
+                  recorded in the job history, falling back to the average for the same
+                  tool and task. Nodes which do not fit in the available cores only allow
+                  smaller nodes to start ahead of them if those do not delay them."""))
+
     def get_name(self, step: Optional[str] = None, index: Optional[str] = None) -> str:
         """Gets the scheduler platform name.
 
@@ -419,6 +445,22 @@ class SchedulerSchema(BaseSchema):
         """
         return self.set('maxthreads', value)
 
+    def get_priority(self) -> str:
+        """Gets the policy used to prioritize nodes which are ready to run.
+
+        Returns:
+            str: The priority policy.
+        """
+        return self.get('priority')
+
+    def set_priority(self, value: str):
+        """Sets the policy used to prioritize nodes which are ready to run.
+
+        Args:
+            value (str): The priority policy, either 'order' or 'critical_path'.
+        """
+        return self.set('priority', value)
+
 
 class OptionSchema(BaseSchema):
     """
@@ -666,6 +708,39 @@ class OptionSchema(BaseSchema):
                 compilation. The hash values are stored in the hashvalue
                 field of the individual parameters."""))
 
+        schema.insert(
+            'resultcache',
+            Parameter(
+                'bool',
+                scope=Scope.GLOBAL,
+                pernode=PerNode.OPTIONAL,
+                shorthelp="Option: result cache",
+                switch="-resultcache <bool>",
+                example=["cli: -resultcache",
+                         "api: option.set('resultcache', True)"],
+                help="""
+                Enables the result cache. Before running a node, its outputs
+                and schema changes are restored from the cache if another run
+                used the same tool, tool version, task settings and input files.
+                Successful nodes are stored in the cache, which is located in
+                the "results" directory of :keypath:`option,cachedir` and
+                shared by all jobs using the same cache directory."""))
+
+        schema.insert(
+            'resultcachesize',
+            Parameter(
+                'int<1..>',
+                unit='MB',
+                scope=Scope.GLOBAL,
+                defvalue=10240,
+                shorthelp="Option: result cache size",
+                switch="-resultcachesize <int>",
+                example=["cli: -resultcachesize 50000",
+                         "api: option.set('resultcachesize', 50000)"],
+                help="""
+                Maximum size of the result cache, specified in MB. When the cache
+                grows past this size, the least recently used results are removed."""))
+
         schema.insert(
             'nodisplay',
             Parameter(
@@ -1185,6 +1260,45 @@ class OptionSchema(BaseSchema):
         """
         return self.set('hash', value)
 
+    def get_resultcache(self, step: Optional[str] = None, index: Optional[str] = None) -> bool:
+        """Gets the result cache flag.
+
+        Args:
+            step (str, optional): The flowgraph step. Defaults to None.
+            index (str, optional): The flowgraph step index. Defaults to None.
+
+        Returns:
+            bool: True if the result cache is enabled.
+        """
+        return self.get('resultcache', step=step, index=index)
+
+    def set_resultcache(self, value: bool, step: Optional[str] = None,
+                        index: Optional[str] = None):
+        """Sets the result cache flag.
+
+        Args:
+            value (bool): The value to set for the result cache flag.
+            step (str, optional): The flowgraph step. Defaults to None.
+            index (str, optional): The flowgraph step index. Defaults to None.
+        """
+        return self.set('resultcache', value, step=step, index=index)
+
+    def get_resultcachesize(self) -> int:
+        """Gets the maximum size of the result cache in megabytes.
+
+        Returns:
+            int: The size of the result cache in MB.
+        """
+        return self.get('resultcachesize')
+
+    def set_resultcachesize(self, value: int):
+        """Sets the maximum size of the result cache in megabytes.
+
+        Args:
+            value (int): The size of the result cache in MB.
+        """
+        return self.set('resultcachesize', value)
+
     def get_nodisplay(self) -> bool:
         """Gets the headless execution (no-display) flag.
 
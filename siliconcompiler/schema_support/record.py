@@ -3,7 +3,6 @@
 import distro
 import getpass
 import platform
-import psutil
 import shlex
 import socket
 
@@ -154,6 +153,8 @@ class RecordSchema(BaseSchema):
             "mac": str
             }
         '''
+        import psutil
+
         try:
             for interface, addrs in psutil.net_if_addrs().items():
                 if interface == 'lo':
@@ -1,6 +1,7 @@
 import contextlib
 import copy
 import csv
+import hashlib
 import json
 import logging
 import os
@@ -11,7 +12,6 @@ import shutil
 import subprocess
 import sys
 import time
-import yaml
 
 try:
     # 'resource' is not available on Windows, so we handle its absence gracefully.
@@ -27,9 +27,6 @@ except ModuleNotFoundError:
 
 import os.path
 
-from packaging.version import Version, InvalidVersion
-from packaging.specifiers import SpecifierSet, InvalidSpecifier
-
 from typing import List, Dict, Tuple, Union, Optional, Set, TextIO, Type, TypeVar, TYPE_CHECKING
 from pathlib import Path
 
@@ -476,6 +473,8 @@ class Task(NamedSchema, PathSchema, DocsSchema):
     __MEM_POLL_INTERVAL: float = 0.5
     __MEMORY_WARN_LIMIT: int = 90
     __MEMORY_KILL_LIMIT_MB: int = 256
+    # Category of the version checks in the version cache
+    __VERSION_CACHE: str = "toolversions"
 
     def __init__(self):
         super().__init__()
@@ -785,28 +784,46 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         cmdlist = [exe]
         cmdlist.extend(veropt)
 
-        self.logger.debug(f'Running {self.tool()}/{self.task()} version check: '
-                          f'{shlex.join(cmdlist)}')
-
-        proc = subprocess.run(cmdlist,
-                              stdin=subprocess.DEVNULL,
-                              stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT,
-                              universal_newlines=True,
-                              cwd=workdir)
-
-        if proc.returncode != 0:
-            self.logger.warning(f"Version check on '{exe_base}' ended with "
-                                f"code {proc.returncode}")
+        cache_key, cache_entry = self.__get_version_cache_entry(exe, veropt)
+        cache = MPManager.get_version_cache()
+        cached = cache.get(Task.__VERSION_CACHE, cache_key) if cache_key else None
+        if isinstance(cached, dict) and "stdout" in cached and \
+                all(cached.get(key) == value for key, value in cache_entry.items()):
+            self.logger.debug(f'Using cached {self.tool()}/{self.task()} version check: '
+                              f'{shlex.join(cmdlist)}')
+            stdout = cached["stdout"]
+        else:
+            self.logger.debug(f'Running {self.tool()}/{self.task()} version check: '
+                              f'{shlex.join(cmdlist)}')
+
+            proc = subprocess.run(cmdlist,
+                                  stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT,
+                                  universal_newlines=True,
+                                  cwd=workdir)
+            stdout = proc.stdout
+
+            if proc.returncode != 0:
+                self.logger.warning(f"Version check on '{exe_base}' ended with "
+                                    f"code {proc.returncode}")
+            elif cache_key:
+                # Only successful checks are kept, failures may be transient
+                cache.set(Task.__VERSION_CACHE, cache_key, {**cache_entry, "stdout": stdout})
+                try:
+                    cache.save(quiet=True)
+                except Exception:
+                    # cache could not be written, version will be checked again next time
+                    pass
 
         try:
-            version = self.parse_version(proc.stdout)
+            version = self.parse_version(stdout)
         except NotImplementedError:
             raise NotImplementedError(f'{self.tool()}/{self.task()} does not implement '
                                       'parse_version()')
         except Exception:
             self.logger.error(f'{self.tool()}/{self.task()} failed to parse version string: '
-                              f'{proc.stdout}')
+                              f'{stdout}')
             raise
 
         self.logger.info(f"Tool '{exe_base}' found with version '{version}' "
@@ -814,6 +831,39 @@ class Task(NamedSchema, PathSchema, DocsSchema):
 
         return version
 
+    def __get_version_cache_entry(self, exe: str, veropt: List[str]) \
+            -> Tuple[Optional[str], Dict[str, Union[str, int]]]:
+        """
+        Private helper to determine how a version check is stored in the version cache.
+
+        The key identifies the resolved executable, the version switch and the
+        environment the check runs in. The entry records the modification time
+        and size of the executable, so a cached check is only used while the
+        executable is unchanged.
+
+        Args:
+            exe (str): path to the executable.
+            veropt (list of str): version switch.
+
+        Returns:
+            tuple: The cache key, or None if the executable cannot be cached, and
+            the entry to compare against the cached entry.
+        """
+        exe = os.path.realpath(exe)
+        try:
+            stat = os.stat(exe)
+        except OSError:
+            return None, {}
+
+        env = self.get_runtime_environmental_variables(include_path=True)
+        key = hashlib.sha256(json.dumps([exe, veropt, env], sort_keys=True).encode()).hexdigest()
+
+        return key, {
+            "exe": exe,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size
+        }
+
     def check_exe_version(self, reported_version: str) -> bool:
         """
         Checks if the reported version of a tool satisfies the requirements
@@ -831,6 +881,9 @@ class Task(NamedSchema, PathSchema, DocsSchema):
             # No requirement, so always true
             return True
 
+        from packaging.version import Version, InvalidVersion
+        from packaging.specifiers import SpecifierSet, InvalidSpecifier
+
         for spec_set in spec_sets:
             split_specs = [s.strip() for s in spec_set.split(",") if s.strip()]
             specs_list = []
@@ -1044,6 +1097,8 @@ class Task(NamedSchema, PathSchema, DocsSchema):
 
     def __write_yaml_manifest(self, fout: TextIO, manifest: BaseSchema) -> None:
         """Private helper to write a manifest in YAML format."""
+        import yaml
+
         class YamlIndentDumper(yaml.Dumper):
             def increase_indent(self, flow=False, indentless=False):
                 return super().increase_indent(flow=flow, indentless=indentless)
@@ -1186,15 +1241,11 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         root = self.project
         schema = root.copy()
 
-        for keypath in root.allkeys():
+        for keypath, param in root.iter_params(kind="path"):
             if keypath[0] == "history":
                 # Ignore history as this is not relevant to the task
                 continue
 
-            param = root.get(*keypath, field=None)
-            if not param.is_path:
-                continue
-
             for value, step, index in param.getvalues():
                 if not value:
                     continue
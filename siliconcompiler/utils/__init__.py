@@ -1,10 +1,7 @@
 import contextlib
 import functools
 import logging
-import re
 import pathlib
-import psutil
-import shutil
 import stat
 import sys
 import tarfile
@@ -14,7 +11,6 @@ import os.path
 
 from io import StringIO
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, Template
 
 from typing import IO, Dict, Optional, Tuple, Type, Union, Callable, List, cast, TYPE_CHECKING
 
@@ -41,8 +37,12 @@ except ImportError:  # pragma: no cover - a build or install without Zstandard
     _zstd = None
 
 from siliconcompiler.utils.paths import builddir
+from siliconcompiler.utils.logscan import GrepPattern
+from siliconcompiler.utils.transfer import LINK_STRATEGIES, LINK_SYMLINK_STRATEGIES, \
+    transfer_file
 
 if TYPE_CHECKING:
+    from jinja2 import Template
     from siliconcompiler.project import Project
 
 
@@ -276,43 +276,59 @@ def open_zstd_stream(fileobj: IO[bytes]) -> IO[bytes]:
     return cast(IO[bytes], _zstd.ZstdFile(fileobj))
 
 
+def open_zstd_writer(fileobj: IO[bytes], threads: int = 0) -> IO[bytes]:
+    """Wraps a stream in a Zstandard compressor, the writing side of
+    :func:`open_zstd_stream`.
+
+    Args:
+        fileobj (IO[bytes]): The stream to write the compressed frame to.
+        threads (int): The number of worker threads to compress with. 0 compresses
+            in the calling thread.
+
+    Returns:
+        IO[bytes]: A file object to write the uncompressed contents to. Closing it
+            ends the frame, but does not close ``fileobj``.
+
+    Raises:
+        ModuleNotFoundError: If this interpreter has no Zstandard bindings.
+    """
+    if _zstd is None:
+        raise ModuleNotFoundError(zstd_unavailable_message())
+
+    options = {}
+    if threads > 0:
+        options[_zstd.CompressionParameter.nb_workers] = threads
+    return cast(IO[bytes], _zstd.ZstdFile(fileobj, "wb", options=options))
+
+
 def link_symlink_copy(srcfile, dstfile):
     """
-    Attempts to link a source file to a destination using hard link, symbolic link,
-    or copy, in that order.
+    Attempts to link a source file to a destination using hard link, reflink,
+    kernel copy, symbolic link, or copy, in that order.
 
     Args:
         srcfile (str): Path to the source file.
         dstfile (str): Path to the destination file.
     """
-    # first try hard linking, then symbolic linking,
-    # and finally just copy the file
-    for method in [os.link, os.symlink, shutil.copy2]:
-        try:
-            # create link
-            return method(srcfile, dstfile)
-            # success, no need to continue trying
-        except OSError:
-            pass
+    try:
+        transfer_file(srcfile, dstfile, LINK_SYMLINK_STRATEGIES)
+    except OSError:
+        pass
 
 
 def link_copy(srcfile, dstfile):
     """
-    Attempts to link a source file to a destination using hard link or copy,
-    in that order.
+    Attempts to link a source file to a destination using hard link, reflink,
+    kernel copy, or copy, in that order.
 
     Args:
         srcfile (str): Path to the source file.
         dstfile (str): Path to the destination file.
     """
-    # first try hard linking or just copy the file
-    for method in [os.link, shutil.copy2]:
-        try:
-            # create link
-            return method(srcfile, dstfile)
-            # success, no need to continue trying
-        except OSError:
-            pass
+    try:
+        transfer_file(srcfile, dstfile, LINK_STRATEGIES)
+    except OSError:
+        pass
 
 
 def get_file_ext(filename: Union[Path, str]) -> str:
@@ -567,7 +583,7 @@ def get_file_template(path: str,
                           os.path.dirname(
                               os.path.dirname(os.path.abspath(__file__))),
                           'data',
-                          'templates')) -> Template:
+                          'templates')) -> "Template":
     """
     Retrieves a Jinja2 template object for the specified file.
 
@@ -583,6 +599,8 @@ def get_file_template(path: str,
         root = os.path.dirname(path)
         path = os.path.basename(path)
 
+    from jinja2 import Environment, FileSystemLoader
+
     import siliconcompiler
     scroot = os.path.dirname(siliconcompiler.__file__)
 
@@ -629,6 +647,9 @@ def grep(logger: logging.Logger, args: str, line: str) -> Union[None, str]:
     """
     Emulates the Unix grep command on a string.
 
+    The arguments are parsed on every call, use
+    :class:`~siliconcompiler.utils.logscan.GrepPattern` to match many lines.
+
     Args:
         logger (logging.Logger): used for logging errors.
         args (str): Command line arguments for grep command.
@@ -642,97 +663,7 @@ def grep(logger: logging.Logger, args: str, line: str) -> Union[None, str]:
     if line is None:
         return None
 
-    # --- 1. Initialize Options and Parse Arguments ---
-    options = {
-        '-v': False,  # Invert the sense of matching
-        '-i': False,  # Ignore case distinctions
-        '-E': False,  # Extended regular expressions (Python's 're' module is ERE by default)
-        '-e': False,  # Pattern starts with '-' (simplified logic)
-        '-x': False,  # Exact line match
-        '-o': False,  # Print only the match
-        '-w': False}  # Whole word match
-
-    parts = args.split()
-    pattern = ""
-    pattern_start_index = -1
-
-    # Identify switches and the start of the pattern
-    for i, part in enumerate(parts):
-        # Check for switch starting with '-' and not just '-'
-        if part.startswith('-') and len(part) > 1 and part != '-e':
-            # Handle concatenated switches (e.g., -vi)
-            is_valid_switch_group = True
-            for char in part[1:]:
-                switch = f"-{char}"
-                if switch in options:
-                    options[switch] = True
-                else:
-                    logger.error(f"Unknown switch: {switch}")
-                    is_valid_switch_group = False
-                    break
-            if not is_valid_switch_group:
-                # If an invalid switch was found, the rest must be the pattern
-                pattern_start_index = i
-                break
-        elif part == '-e':
-            # The next part is the pattern, regardless of what it looks like
-            options['-e'] = True
-            if i + 1 < len(parts):
-                pattern_start_index = i + 1
-            break
-        elif not pattern.strip():
-            # First non-switch part is the start of the pattern
-            pattern_start_index = i
-            break
-
-    # Assemble the pattern from the determined starting index
-    if pattern_start_index != -1:
-        pattern = " ".join(parts[pattern_start_index:])
-
-    if not pattern:
-        return None
-
-    # --- 2. Prepare Regex Flags and Pattern Modifiers ---
-
-    regex_flags = 0
-    if options['-i']:
-        regex_flags |= re.IGNORECASE
-
-    # Apply Whole Word (-w)
-    pattern_to_search = pattern
-    if options['-w']:
-        # Apply word boundaries
-        pattern_to_search = rf"\b({pattern})\b"
-
-    # Apply Whole Line (-x)
-    if options['-x']:
-        # Exact line match, using the prepared pattern (which may have \b already)
-        pattern_to_search = rf"^{pattern_to_search}$"
-
-    # --- 3. Perform Search ---
-    try:
-        # re.search is used to find the pattern anywhere in the line
-        match = re.search(pattern_to_search, line, regex_flags)
-    except re.error as e:
-        # Handle cases where the pattern itself is invalid regex
-        logger.error(f"Invalid regex pattern '{pattern}': {e}")
-        return None
-
-    # --- 4. Handle Inversion (-v) and Final Return ---
-
-    # Check if a result should be returned: (Match found) XOR (Invert is on)
-    should_return = bool(match) != options["-v"]
-
-    if should_return:
-        if options['-o'] and match:
-            # Print only the match part (which is match.group(0))
-            return match.group(0)
-        else:
-            # Return the whole line (standard behavior)
-            return line
-    else:
-        # Match found AND inverted, OR Match NOT found AND not inverted
-        return None
+    return GrepPattern(args, logger=logger).match(line)
 
 
 def get_plugins(system: str, name: Optional[str] = None) -> List[Callable]:
@@ -807,6 +738,8 @@ def get_cores(physical: bool = False) -> int:
         int: The number of available cores. Defaults to 1 if detection fails.
     '''
 
+    import psutil
+
     cores = None
 
     try:
@@ -5,10 +5,11 @@ import os.path
 
 from typing import List, Optional, TYPE_CHECKING
 
-from siliconcompiler.schema import BaseSchema, Parameter
+from siliconcompiler.schema import BaseSchema
 from siliconcompiler.schema.parametervalue import NodeListValue, NodeSetValue
 from siliconcompiler.utils import FilterDirectories
 from siliconcompiler.utils.paths import collectiondir, cwdir
+from siliconcompiler.utils.transfer import COPY_STRATEGIES, copy_tree, transfer_file
 from siliconcompiler.scheduler import SchedulerNode
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
@@ -83,7 +84,7 @@ def collect(project: "Project",
     dirs = {}
     files = {}
 
-    for key in project.allkeys():
+    for key, param in project.iter_params(kind="path"):
         if key[0] == 'history':
             # skip history
             continue
@@ -102,11 +103,6 @@ def collect(project: "Project",
             # skip flow files files from builds
             continue
 
-        param: Parameter = project.get(*key, field=None)
-
-        if not param.is_path:
-            continue
-
         if not param.get(field='copy'):
             continue
 
@@ -164,7 +160,7 @@ def collect(project: "Project",
                 if verbose:
                     project.logger.info(f"  Collecting directory: {abs_path}")
                 path_filter.abspath = abs_path
-                shutil.copytree(abs_path, import_path, ignore=path_filter.filter)
+                copy_tree(abs_path, import_path, COPY_STRATEGIES, ignore=path_filter.filter)
                 path_filter.abspath = None
 
         for key, step, index in sorted(files.keys()):
@@ -200,7 +196,7 @@ def collect(project: "Project",
 
                 if verbose:
                     project.logger.info(f"  Collecting file: {abs_path}")
-                shutil.copy2(abs_path, import_path)
+                transfer_file(abs_path, import_path, COPY_STRATEGIES)
     finally:
         if prev_dir:
             # Delete existing directory
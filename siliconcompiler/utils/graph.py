@@ -0,0 +1,245 @@
+"""
+Directed graph algorithms for flowgraphs.
+
+:class:`DirectedGraph` indexes the inputs and outputs of every node once, so
+reachability, loop detection and distances are computed iteratively in time
+linear in the size of the graph, instead of by enumerating paths, which grows
+exponentially with stacked fan-out and fan-in.
+"""
+from collections import deque
+
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+class DirectedGraph:
+    """
+    Directed graph with indexed inputs and outputs.
+
+    Nodes must be sortable, such as the ``(step, index)`` tuples of a flowgraph.
+
+    Args:
+        inputs (dict): inputs of each node. Nodes which are only used as an
+            input are added to the graph without inputs.
+    """
+
+    def __init__(self, inputs: Mapping[Hashable, Iterable[Hashable]]):
+        self.__inputs: Dict[Hashable, Tuple[Hashable, ...]] = {}
+        outputs: Dict[Hashable, Set[Hashable]] = {}
+        for node, node_inputs in inputs.items():
+            self.__inputs[node] = tuple(node_inputs)
+            outputs.setdefault(node, set())
+            for in_node in self.__inputs[node]:
+                outputs.setdefault(in_node, set()).add(node)
+
+        for node in outputs:
+            self.__inputs.setdefault(node, tuple())
+
+        self.__nodes: Tuple[Hashable, ...] = tuple(sorted(self.__inputs))
+        self.__outputs: Dict[Hashable, Tuple[Hashable, ...]] = {
+            node: tuple(sorted(node_outputs)) for node, node_outputs in outputs.items()
+        }
+
+    @property
+    def nodes(self) -> Tuple[Hashable, ...]:
+        """
+        Sorted nodes of the graph.
+        """
+        return self.__nodes
+
+    def get_inputs(self, node: Hashable) -> Tuple[Hashable, ...]:
+        """
+        Returns the inputs of a node, in the order they were given.
+
+        Args:
+            node: node in the graph.
+        """
+        return self.__inputs.get(node, tuple())
+
+    def get_outputs(self, node: Hashable) -> Tuple[Hashable, ...]:
+        """
+        Returns the sorted nodes which have this node as an input.
+
+        Args:
+            node: node in the graph.
+        """
+        return self.__outputs.get(node, tuple())
+
+    def get_entry_nodes(self) -> Tuple[Hashable, ...]:
+        """
+        Returns the sorted nodes without inputs.
+        """
+        return tuple(node for node in self.__nodes if not self.__inputs[node])
+
+    def get_exit_nodes(self) -> Tuple[Hashable, ...]:
+        """
+        Returns the sorted nodes without outputs.
+        """
+        return tuple(node for node in self.__nodes if not self.__outputs[node])
+
+    def reachable(self, start: Iterable[Hashable], reverse: bool = False,
+                  stop: Optional[Iterable[Hashable]] = None,
+                  exclude: Optional[Iterable[Hashable]] = None) -> Set[Hashable]:
+        """
+        Returns the nodes reachable from the start nodes, including the start nodes.
+
+        Args:
+            start (list): nodes to start from.
+            reverse (bool): if true, follow the inputs instead of the outputs.
+            stop (list): nodes which are reached but not followed.
+            exclude (list): nodes which are never reached.
+        """
+        stop = set(stop or [])
+        exclude = set(exclude or [])
+        edges = self.__inputs if reverse else self.__outputs
+
+        visited = set()
+        pending = [node for node in start if node not in exclude]
+        while pending:
+            node = pending.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            if node in stop:
+                continue
+            pending.extend(next_node for next_node in edges.get(node, tuple())
+                           if next_node not in visited and next_node not in exclude)
+        return visited
+
+    def get_distances(self, node: Hashable, reverse: bool = False) -> Dict[Hashable, int]:
+        """
+        Returns the number of edges on the shortest path to each node reachable
+        from a node, excluding the node itself.
+
+        Args:
+            node: node to start from.
+            reverse (bool): if true, follow the inputs instead of the outputs.
+        """
+        edges = self.__inputs if reverse else self.__outputs
+
+        distances = {node: 0}
+        pending = deque([node])
+        while pending:
+            current = pending.popleft()
+            for next_node in edges.get(current, tuple()):
+                if next_node not in distances:
+                    distances[next_node] = distances[current] + 1
+                    pending.append(next_node)
+        del distances[node]
+        return distances
+
+    def get_levels(self, reverse: bool = False) -> List[Tuple[Hashable, ...]]:
+        """
+        Returns the sorted nodes grouped by the number of edges on the longest
+        path to them from the entry nodes, using Kahn's algorithm.
+
+        Nodes which are part of, or only reachable through, a loop are omitted.
+
+        Args:
+            reverse (bool): if true, follow the inputs from the exit nodes
+                instead of the outputs from the entry nodes.
+        """
+        edges = self.__inputs if reverse else self.__outputs
+        back_edges = self.__outputs if reverse else self.__inputs
+
+        pending_inputs = {node: len(set(back_edges[node])) for node in self.__nodes}
+        level = [node for node, count in pending_inputs.items() if count == 0]
+
+        levels = []
+        while level:
+            levels.append(tuple(sorted(level)))
+            next_level = []
+            for node in level:
+                for next_node in set(edges[node]):
+                    pending_inputs[next_node] -= 1
+                    if pending_inputs[next_node] == 0:
+                        next_level.append(next_node)
+            level = next_level
+        return levels
+
+    def find_loop(self, start: Hashable,
+                  acyclic: Optional[Set[Hashable]] = None) -> Optional[List[Hashable]]:
+        """
+        Searches depth first along the outputs of a node for a loop.
+
+        Args:
+            start: node to start from.
+            acyclic (set): nodes known to not lead to a loop. Nodes found to
+                not lead to a loop are added to it, so it can be shared
+                between searches.
+
+        Returns:
+            list: the path from the start node to the first node found twice,
+            or None if there is no loop.
+        """
+        if acyclic is None:
+            acyclic = set()
+        if start in acyclic:
+            return None
+
+        path = [start]
+        on_path = {start}
+        pending = [iter(self.get_outputs(start))]
+        while pending:
+            for node in pending[-1]:
+                if node in on_path:
+                    return [*path, node]
+                if node in acyclic:
+                    continue
+                path.append(node)
+                on_path.add(node)
+                pending.append(iter(self.get_outputs(node)))
+                break
+            else:
+                pending.pop()
+                node = path.pop()
+                on_path.remove(node)
+                acyclic.add(node)
+        return None
+
+    def get_loops(self) -> List[Tuple[Hashable, ...]]:
+        """
+        Returns the sorted nodes of each strongly connected component of the
+        graph which contains a loop, using Tarjan's algorithm.
+        """
+        order: Dict[Hashable, int] = {}
+        low: Dict[Hashable, int] = {}
+        stack: List[Hashable] = []
+        on_stack: Set[Hashable] = set()
+        loops = []
+
+        def visit(node):
+            order[node] = low[node] = len(order)
+            stack.append(node)
+            on_stack.add(node)
+            return node, iter(self.get_outputs(node))
+
+        for root in self.__nodes:
+            if root in order:
+                continue
+
+            pending = [visit(root)]
+            while pending:
+                node, outputs = pending[-1]
+                for out_node in outputs:
+                    if out_node not in order:
+                        pending.append(visit(out_node))
+                        break
+                    if out_node in on_stack:
+                        low[node] = min(low[node], order[out_node])
+                else:
+                    pending.pop()
+                    if pending:
+                        parent = pending[-1][0]
+                        low[parent] = min(low[parent], low[node])
+
+                    if low[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in self.get_outputs(node):
+                            loops.append(tuple(sorted(component)))
+        return loops
@@ -44,7 +44,7 @@ def generate_testcase(project: "Project",
 
     project.option.set_continue(True)
     if hash_files:
-        for key in project.allkeys():
+        for key, param in project.iter_params(kind="path"):
             if key[0] == 'history':
                 continue
             if len(key) > 1:
@@ -52,9 +52,6 @@ def generate_testcase(project: "Project",
                     continue
                 if key[-2] == 'option' and key[-1] == 'cachedir':
                     continue
-            param = project.get(*key, field=None)
-            if not param.is_path:
-                continue
             for _, key_step, key_index in param.getvalues():
                 project.hash_files(
                     *key,
@@ -111,13 +108,7 @@ def generate_testcase(project: "Project",
 
         return copy
 
-    for keypath in project.allkeys():
-        if 'default' in keypath:
-            continue
-
-        if not project.get(*keypath, field=None).is_path:
-            continue
-
+    for keypath, _ in project.iter_params(kind="path", include_default=False):
         project.set(
             *keypath,
             determine_copy(*keypath,
@@ -0,0 +1,311 @@
+"""
+Matching of grep style patterns against tool logs.
+
+The patterns used by :keypath:`tool,<tool>,task,<task>,regex` follow the
+arguments of the Unix grep command. :class:`GrepPattern` parses one of these
+arguments once into a compiled regular expression and :class:`LogScanner`
+applies the patterns of every suffix to a log in a single pass.
+"""
+import logging
+import re
+
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+
+class GrepPattern:
+    """
+    A grep style argument string compiled into a regular expression.
+
+    Supported switches are ``-v``, ``-i``, ``-E``, ``-e``, ``-x``, ``-o``
+    and ``-w``.
+
+    Args:
+        args (str): Command line arguments for grep command.
+        logger (logging.Logger): used for logging errors.
+    """
+
+    def __init__(self, args: str, logger: Optional[logging.Logger] = None):
+        if logger is None:
+            logger = logging.getLogger(__name__)
+
+        self.__args = args
+        self.__regex: Optional[re.Pattern] = None
+
+        options = {
+            '-v': False,  # Invert the sense of matching
+            '-i': False,  # Ignore case distinctions
+            '-E': False,  # Extended regular expressions (Python's 're' module is ERE by default)
+            '-e': False,  # Pattern starts with '-' (simplified logic)
+            '-x': False,  # Exact line match
+            '-o': False,  # Print only the match
+            '-w': False}  # Whole word match
+
+        parts = args.split()
+        pattern = ""
+        pattern_start_index = -1
+
+        # Identify switches and the start of the pattern
+        for i, part in enumerate(parts):
+            # Check for switch starting with '-' and not just '-'
+            if part.startswith('-') and len(part) > 1 and part != '-e':
+                # Handle concatenated switches (e.g., -vi)
+                is_valid_switch_group = True
+                for char in part[1:]:
+                    switch = f"-{char}"
+                    if switch in options:
+                        options[switch] = True
+                    else:
+                        logger.error(f"Unknown switch: {switch}")
+                        is_valid_switch_group = False
+                        break
+                if not is_valid_switch_group:
+                    # If an invalid switch was found, the rest must be the pattern
+                    pattern_start_index = i
+                    break
+            elif part == '-e':
+                # The next part is the pattern, regardless of what it looks like
+                options['-e'] = True
+                if i + 1 < len(parts):
+                    pattern_start_index = i + 1
+                break
+            elif not pattern.strip():
+                # First non-switch part is the start of the pattern
+                pattern_start_index = i
+                break
+
+        # Assemble the pattern from the determined starting index
+        if pattern_start_index != -1:
+            pattern = " ".join(parts[pattern_start_index:])
+
+        self.__invert = options['-v']
+        self.__only_match = options['-o']
+        self.__flags = 0
+        if options['-i']:
+            self.__flags |= re.IGNORECASE
+
+        self.__pattern = pattern
+        if not pattern:
+            return
+
+        # Apply Whole Word (-w)
+        if options['-w']:
+            pattern = rf"\b({pattern})\b"
+
+        # Apply Whole Line (-x)
+        if options['-x']:
+            pattern = rf"^{pattern}$"
+
+        try:
+            self.__regex = re.compile(pattern, self.__flags)
+        except re.error as e:
+            # Handle cases where the pattern itself is invalid regex
+            logger.error(f"Invalid regex pattern '{self.__pattern}': {e}")
+
+    @property
+    def args(self) -> str:
+        """The grep arguments this pattern was created from."""
+        return self.__args
+
+    @property
+    def regex(self) -> Optional[re.Pattern]:
+        """The compiled regular expression, or None if the pattern is empty or invalid."""
+        return self.__regex
+
+    @property
+    def invert(self) -> bool:
+        """True if lines which do not match are selected."""
+        return self.__invert
+
+    @property
+    def only_match(self) -> bool:
+        """True if only the matching part of the line is returned."""
+        return self.__only_match
+
+    def match(self, line: Optional[str]) -> Optional[str]:
+        """
+        Applies the pattern to a line.
+
+        Args:
+            line (str): Line to process.
+
+        Returns:
+            str: The line, or the matching part of the line when ``-o`` is used,
+            or None if the line is not selected.
+        """
+        if line is None or self.__regex is None:
+            return None
+
+        match = self.__regex.search(line)
+
+        # Check if a result should be returned: (Match found) XOR (Invert is on)
+        if bool(match) == self.__invert:
+            return None
+
+        if self.__only_match and match:
+            return match.group(0)
+        return line
+
+
+class LogScanner:
+    """
+    Applies sets of grep style patterns to a log in a single pass.
+
+    Each suffix maps to a list of patterns which are applied in sequence, like
+    piping grep commands, and a line is selected for the suffix when it makes
+    it through all of them.
+
+    When possible, the first pattern of every suffix is searched for over
+    large blocks of the log, so only the lines which may match are handled
+    one at a time. Selected lines are passed on as they are found, so no
+    more than a block of the log is held in memory.
+
+    Args:
+        checks (dict): Mapping of suffix to a list of grep arguments.
+        logger (logging.Logger): used for logging errors.
+    """
+
+    # Approximate number of characters read from the log at a time
+    CHUNK_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, checks: Dict[str, List[str]], logger: Optional[logging.Logger] = None):
+        self.__checks: Dict[str, List[GrepPattern]] = {
+            suffix: [GrepPattern(args, logger=logger) for args in regexes]
+            for suffix, regexes in checks.items()
+        }
+        self.__prefilter = self.__build_prefilter()
+
+    @property
+    def suffixes(self) -> Tuple[str, ...]:
+        """The suffixes checked by this scanner."""
+        return tuple(self.__checks.keys())
+
+    @property
+    def has_prefilter(self) -> bool:
+        """True if the log can be searched in blocks instead of line by line."""
+        return self.__prefilter is not None
+
+    def __build_prefilter(self) -> Optional[List[re.Pattern]]:
+        """
+        Private helper to build the expressions used to find candidate lines.
+
+        The expressions must find every line the suffixes can select, so they
+        are only built when the first pattern of every suffix selects matching
+        lines and can be searched for in a block of lines.
+        """
+        prefilter = {}
+        for chain in self.__checks.values():
+            if not chain:
+                # matches every line
+                return None
+
+            first = chain[0]
+            if first.regex is None:
+                # never matches
+                continue
+            if first.invert:
+                return None
+
+            pattern = first.regex.pattern
+            # anchors to the start or end of the string depend on searching line by line
+            if re.search(r"\\[AZ]", pattern):
+                return None
+
+            flags = first.regex.flags | re.MULTILINE
+            regex = first.regex
+            if pattern.startswith("^"):
+                # Dropping the anchor only adds candidates, but allows the
+                # search to skip ahead to a literal prefix
+                try:
+                    regex = re.compile(pattern[1:], flags)
+                except re.error:
+                    regex = re.compile(pattern, flags)
+            else:
+                regex = re.compile(pattern, flags)
+            prefilter[(regex.pattern, regex.flags)] = regex
+
+        return list(prefilter.values())
+
+    def match(self, suffix: str, line: str) -> Optional[str]:
+        """
+        Applies the patterns of a suffix to a line.
+
+        Args:
+            suffix (str): Suffix to check.
+            line (str): Line to process.
+
+        Returns:
+            str: The selected string or None if the line is not selected.
+        """
+        string = line
+        for pattern in self.__checks[suffix]:
+            string = pattern.match(string)
+            if string is None:
+                return None
+        return string
+
+    def __check_line(self, num: int, line: str,
+                     on_match: Callable[[str, int, str], None]) -> None:
+        for suffix in self.__checks:
+            string = self.match(suffix, line)
+            if string is not None:
+                on_match(suffix, num, string)
+
+    def scan(self, fobj: TextIO, on_match: Callable[[str, int, str], None]) -> int:
+        """
+        Scans a log for all suffixes.
+
+        Args:
+            fobj (file): Log opened in text mode.
+            on_match (callable): called with the suffix, line number and
+                selected string of every selected line, in the order of the
+                lines in the log.
+
+        Returns:
+            int: The number of lines in the log.
+        """
+        if self.__prefilter is None:
+            line_count = 0
+            for line_count, line in enumerate(fobj, start=1):
+                self.__check_line(line_count, line, on_match)
+            return line_count
+
+        line_count = 0
+        while True:
+            chunk = fobj.read(LogScanner.CHUNK_SIZE)
+            if not chunk:
+                break
+            if not chunk.endswith("\n"):
+                # Complete the last line of the block
+                chunk += fobj.readline()
+
+            # Find the start of every line which may match
+            starts = set()
+            for regex in self.__prefilter:
+                search_pos = 0
+                while search_pos < len(chunk):
+                    found = regex.search(chunk, search_pos)
+                    if not found or found.start() >= len(chunk):
+                        break
+                    starts.add(chunk.rfind("\n", 0, found.start()) + 1)
+                    search_pos = chunk.find("\n", found.start()) + 1
+                    if search_pos == 0:
+                        break
+
+            # Line number of the line starting at position
+            position, num = 0, line_count + 1
+            for start in sorted(starts):
+                num += chunk.count("\n", position, start)
+                position = start
+
+                end = chunk.find("\n", start)
+                if end == -1:
+                    end = len(chunk)
+                else:
+                    end += 1
+                self.__check_line(num, chunk[start:end], on_match)
+
+            line_count += chunk.count("\n")
+            if not chunk.endswith("\n"):
+                line_count += 1
+
+        return line_count
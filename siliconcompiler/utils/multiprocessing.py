@@ -17,12 +17,11 @@ from multiprocessing.context import BaseContext
 from multiprocessing.managers import SyncManager, RemoteError
 
 from siliconcompiler.utils.settings import SettingsManager
-from siliconcompiler.utils import default_sc_path, default_sc_system_path
-
-from siliconcompiler.report.dashboard.cli.board import Board
+from siliconcompiler.utils import default_cache_dir, default_sc_path, default_sc_system_path
 
 if TYPE_CHECKING:
     from siliconcompiler.package.cache import PathCache
+    from siliconcompiler.report.dashboard.cli.board import Board
 
 
 def get_process_context() -> BaseContext:
@@ -185,9 +184,9 @@ class MPManager(metaclass=_ManagerSingleton):
         """
         Performs the one-time initialization of the singleton instance.
 
-        This method sets up the start time, error flag, logger,
-        multiprocessing manager, and registers the cleanup function (`stop`)
-        to be called on program exit.
+        This method sets up the start time, error flag and logger, and
+        registers the cleanup function (`stop`) to be called on program exit.
+        The multiprocessing manager and settings are created on first use.
         """
         self.__start = datetime.now()
         self.__error = False
@@ -199,38 +198,24 @@ class MPManager(metaclass=_ManagerSingleton):
                                       f"{now_file}_{id(self)}.log")
         self._init_logger()
 
-        # Manager to handle shared data between processes
-        is_server = MPManager._get_manager_address() is None
-        if not is_server:
-            try:
-                self.__manager = SyncManager(address=MPManager._get_manager_address(),
-                                             authkey=MPManager.__authkey)
-                self.__manager.connect()
-                self.__manager_server = False
-            except FileNotFoundError:  # error when address has been deleted by previous server
-                self.__logger.warning("Manager address file not found; falling back to server mode")
-                is_server = True  # fall back to create new manager
-        if is_server:
-            # Pin the start method for the manager's server process: its
-            # start() launches a process, and under the Python 3.14 default
-            # (forkserver) that re-imports __main__ and breaks unguarded
-            # module-level proj.run() scripts. See get_process_context().
-            self.__manager = SyncManager(authkey=MPManager.__authkey,
-                                         ctx=get_process_context())
-            with forking():
-                self.__manager.start()
-            MPManager._set_manager_address(self.__manager.address)
-            self.__manager_server = True
+        # Guards the lazy creation of the shared resources below
+        self.__lock = threading.Lock()
+
+        # Manager to handle shared data between processes, started by
+        # get_manager() on first use: the fork path and read-only uses never
+        # need one, and starting it launches a server process.
+        self.__manager = None
+        self.__manager_server = False
 
-        # Dashboard singleton setup
-        self.__board_lock = self.__manager.Lock()
+        # Dashboard singleton setup. The board lives in this process, so a
+        # thread lock is enough to guard its creation.
+        self.__board_lock = threading.Lock()
         self.__board = None
 
-        # Settings
-        self.__settings = SettingsManager(
-            default_sc_path("settings.json"), self.__logger,
-            system_filepath=default_sc_system_path())
-        self.__transient_settings = SettingsManager(None, self.__logger)
+        # Settings, loaded on first access
+        self.__settings = None
+        self.__transient_settings = None
+        self.__version_cache = None
 
         # Cache of paths that data sources have resolved to. Imported here rather
         # than at module scope: siliconcompiler.package imports this module, so a
@@ -305,18 +290,12 @@ class MPManager(metaclass=_ManagerSingleton):
 
             # Stop the dashboard service if it's running
             if manager.__board:
-                try:
-                    with manager.__board_lock:
-                        if manager.__board:
-                            manager.__board.stop()
-                            manager.__board = None
-                except RemoteError:
-                    # Try without the lock
+                with manager.__board_lock:
                     if manager.__board:
                         manager.__board.stop()
                         manager.__board = None
 
-            if manager.__manager_server:
+            if manager.__manager is not None and manager.__manager_server:
                 # Shut down the multiprocessing manager
                 MPManager.__address = None
                 manager.__manager.shutdown()
@@ -355,15 +334,62 @@ class MPManager(metaclass=_ManagerSingleton):
             manager.logger().error("Error occurred")
         manager.__error = True
 
+    def __start_manager(self) -> None:
+        """
+        Connects to the manager at the shared address, or starts a new
+        manager server if there is none.
+        """
+        is_server = MPManager._get_manager_address() is None
+        if not is_server:
+            try:
+                manager = SyncManager(address=MPManager._get_manager_address(),
+                                      authkey=MPManager.__authkey)
+                manager.connect()
+                self.__manager_server = False
+            except FileNotFoundError:  # error when address has been deleted by previous server
+                self.__logger.warning("Manager address file not found; falling back to server mode")
+                is_server = True  # fall back to create new manager
+        if is_server:
+            # Pin the start method for the manager's server process: its
+            # start() launches a process, and under the Python 3.14 default
+            # (forkserver) that re-imports __main__ and breaks unguarded
+            # module-level proj.run() scripts. See get_process_context().
+            manager = SyncManager(authkey=MPManager.__authkey,
+                                  ctx=get_process_context())
+            with forking():
+                manager.start()
+            MPManager._set_manager_address(manager.address)
+            self.__manager_server = True
+        self.__manager = manager
+
     @staticmethod
     def get_manager() -> SyncManager:
         """
         Provides access to the shared multiprocessing.Manager instance.
 
+        The manager is connected, or started, on the first call.
+
         Returns:
             multiprocessing.Manager: The singleton manager instance.
         """
-        return MPManager().__manager
+        manager = MPManager()
+        if manager.__manager is None:
+            with manager.__lock:
+                if manager.__manager is None:
+                    manager.__start_manager()
+        return manager.__manager
+
+    @staticmethod
+    def has_manager() -> bool:
+        """
+        Checks if the shared multiprocessing.Manager has been started.
+
+        Returns:
+            bool: True if :meth:`get_manager` has connected or started the manager.
+        """
+        if not _ManagerSingleton.has_cls(MPManager):
+            return False
+        return MPManager().__manager is not None
 
     @staticmethod
     def get_settings() -> SettingsManager:
@@ -373,7 +399,14 @@ class MPManager(metaclass=_ManagerSingleton):
         Returns:
             SettingsManager: The singleton settings instance.
         """
-        return MPManager().__settings
+        manager = MPManager()
+        if manager.__settings is None:
+            with manager.__lock:
+                if manager.__settings is None:
+                    manager.__settings = SettingsManager(
+                        default_sc_path("settings.json"), manager.__logger,
+                        system_filepath=default_sc_system_path())
+        return manager.__settings
 
     @staticmethod
     def get_transient_settings() -> SettingsManager:
@@ -383,7 +416,32 @@ class MPManager(metaclass=_ManagerSingleton):
         Returns:
             SettingsManager: The singleton transient settings instance.
         """
-        return MPManager().__transient_settings
+        manager = MPManager()
+        if manager.__transient_settings is None:
+            with manager.__lock:
+                if manager.__transient_settings is None:
+                    manager.__transient_settings = SettingsManager(None, manager.__logger)
+        return manager.__transient_settings
+
+    @staticmethod
+    def get_version_cache() -> SettingsManager:
+        """
+        Provides access to the persistent cache of tool version checks.
+
+        The cache is stored in the user cache directory, so it is shared by all
+        jobs run by the user.
+
+        Returns:
+            SettingsManager: The singleton version cache instance.
+        """
+        manager = MPManager()
+        if manager.__version_cache is None:
+            with manager.__lock:
+                if manager.__version_cache is None:
+                    manager.__version_cache = SettingsManager(
+                        os.path.join(default_cache_dir(), "toolversions.json"),
+                        manager.__logger)
+        return manager.__version_cache
 
     @staticmethod
     def get_path_cache() -> "PathCache":
@@ -400,7 +458,7 @@ class MPManager(metaclass=_ManagerSingleton):
         return MPManager().__path_cache
 
     @staticmethod
-    def get_dashboard() -> Board:
+    def get_dashboard() -> "Board":
         """
         Lazily initializes and returns the singleton dashboard Board instance.
 
@@ -415,6 +473,7 @@ class MPManager(metaclass=_ManagerSingleton):
             with manager.__board_lock:
                 # Double-check locking to ensure thread safety
                 if not manager.__board:
+                    from siliconcompiler.report.dashboard.cli.board import Board
                     manager.__board = Board(manager.__manager)
         return manager.__board
 
@@ -111,6 +111,9 @@ class SettingsManager:
         self.__timeout = timeout
         self.__logger = logger.getChild("settings")
         self.__settings = {}
+        # (category, key) pairs changed since the last load or save, with a key
+        # of None for a deleted category. save() replays these onto the file.
+        self.__changes = set()
 
         # System layer state: resolved (unwrapped) values plus the set of
         # system-priority keys per category.
@@ -291,9 +294,55 @@ class SettingsManager:
         with self._category_lock(category):
             yield
 
-    def save(self):
+    def _read_for_merge(self) -> dict:
         """
-        Save the current settings to the disk in JSON format.
+        Read the settings file as it is on disk, for :meth:`save` to merge
+        into. Assumes the file lock is held by the caller. A missing or
+        unreadable file is treated as empty.
+        """
+        try:
+            with sc_open(self.__filepath, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _apply_changes(self, data: dict) -> None:
+        """
+        Replay the settings changed in this process onto ``data``. Assumes
+        ``__settings_lock`` is held by the caller.
+        """
+        for category, key in self.__changes:
+            if key is None:
+                data.pop(category, None)
+
+        for category, key in self.__changes:
+            if key is None:
+                continue
+            if category in self.__settings and key in self.__settings[category]:
+                if not isinstance(data.get(category), dict):
+                    data[category] = {}
+                data[category][key] = self.__settings[category][key]
+            elif isinstance(data.get(category), dict) and key in data[category]:
+                del data[category][key]
+                if not data[category]:
+                    del data[category]
+
+    def save(self, quiet: bool = False):
+        """
+        Save the settings to the disk in JSON format.
+
+        The file is re-read under the file lock and only the settings changed
+        by this process are written over it, so settings saved by other
+        processes since this one loaded the file are kept. The merged result
+        becomes the current settings.
+
+        Args:
+            quiet (bool): If True, a failure to save is logged at debug level
+                rather than as an error, for files that are only a cache.
         """
         if self.__filepath is None:
             return
@@ -306,10 +355,15 @@ class SettingsManager:
 
             with self.__settings_lock:
                 with self.__lock:
+                    data = self._read_for_merge()
+                    self._apply_changes(data)
                     with open(self.__filepath, 'w', encoding='utf-8') as f:
-                        json.dump(self.__settings, f, indent=4)
+                        json.dump(data, f, indent=4)
+                self.__settings = data
+                self.__changes = set()
         except Exception as e:
-            self.__logger.error(f"Failed to save settings to {self.__filepath}: {e}")
+            log = self.__logger.debug if quiet else self.__logger.error
+            log(f"Failed to save settings to {self.__filepath}: {e}")
             raise
 
     def set(self, category: str, key: str, value, keep: bool = False):
@@ -335,6 +389,7 @@ class SettingsManager:
                 if keep and key in self.__settings[category]:
                     return
                 self.__settings[category][key] = value
+                self.__changes.add((category, key))
 
     def get(self, category: str, key: str, default=None):
         """
@@ -419,8 +474,10 @@ class SettingsManager:
                     if key:
                         if key in self.__settings[category]:
                             del self.__settings[category][key]
+                            self.__changes.add((category, key))
                             # Clean up empty categories
                             if not self.__settings[category]:
                                 del self.__settings[category]
                     else:
                         del self.__settings[category]
+                        self.__changes.add((category, None))
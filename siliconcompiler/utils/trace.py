@@ -0,0 +1,122 @@
+"""
+Lightweight tracing of where SiliconCompiler spends time.
+
+:class:`Tracer` records nested, timed spans as Chrome trace events, which can
+be opened with ``chrome://tracing`` or https://ui.perfetto.dev. Recording a span
+costs two clock reads and a list append, so tracing is always enabled.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class Tracer:
+    """
+    Records nested spans of a single process as Chrome trace events.
+
+    Timestamps are taken from the wall clock, so spans recorded by different
+    processes, including scheduler workers on other machines, line up when
+    their events are merged into one trace.
+
+    Args:
+        name (str): name of the process shown in the trace.
+    """
+
+    def __init__(self, name: str):
+        self.__pid = os.getpid()
+        self.__events: List[Dict[str, Any]] = [{
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.__pid,
+            "tid": 0,
+            "args": {"name": name}
+        }]
+        self.__durations: Dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Records the time spent in the body of the context as a span.
+
+        Spans opened while another span is open on the same thread are shown
+        nested under it.
+
+        Args:
+            name (str): name of the span.
+            args: additional information to show with the span.
+
+        Yields:
+            dict: the additional information, which can be added to while
+            the span is open.
+        """
+        start = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield args
+        finally:
+            duration = time.perf_counter() - start_counter
+            event = {
+                "name": name,
+                "cat": "sc",
+                "ph": "X",
+                "ts": int(start * 1e6),
+                "dur": int(duration * 1e6),
+                "pid": self.__pid,
+                "tid": threading.get_ident()
+            }
+            if args:
+                event["args"] = args
+            self.__events.append(event)
+            self.__durations[name] = self.__durations.get(name, 0.0) + duration
+
+    def get_duration(self, name: str) -> float:
+        """
+        Returns the total time in seconds spent in the spans with this name.
+
+        Args:
+            name (str): name of the span.
+        """
+        return self.__durations.get(name, 0.0)
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        """
+        Returns the recorded trace events.
+        """
+        return list(self.__events)
+
+    def write(self, path: str, events: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        """
+        Writes the recorded events as a Chrome trace file.
+
+        Args:
+            path (str): path of the file to write.
+            events (list): additional events to include, such as events read
+                with :meth:`read` from the traces of other processes.
+        """
+        all_events = self.get_events()
+        if events:
+            all_events.extend(events)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": all_events, "displayTimeUnit": "ms"}, f)
+
+    @staticmethod
+    def read(path: str) -> List[Dict[str, Any]]:
+        """
+        Reads the events of a Chrome trace file.
+
+        Args:
+            path (str): path of the file to read.
+
+        Returns:
+            list: the trace events, or an empty list if the file cannot be read.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return list(json.load(f)["traceEvents"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
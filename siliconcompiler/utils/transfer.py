@@ -0,0 +1,255 @@
+"""
+Transfer of files between the directories of a run.
+
+Nodes forward their outputs to the inputs of the next nodes, runs are
+resumed from the nodes of a previous job, and results are stored into and
+restored from the result cache. :func:`transfer_file` tries a list of
+strategies for each file, from the cheapest to the most general, and returns
+the strategy which succeeded:
+
+* ``hardlink``: a new name for the same file, which requires both paths to be
+  on the same filesystem.
+* ``reflink``: a copy-on-write clone of the file, which shares the data blocks
+  with the source on filesystems that support it, such as btrfs and XFS.
+* ``copy_file_range`` and ``sendfile``: a copy done by the kernel, without
+  passing the data through Python, which some filesystems and network file
+  systems perform on the server.
+* ``symlink``: a link to the source path.
+* ``copy``: a copy with :func:`shutil.copy2`.
+
+:func:`copy_tree` copies a directory with multiple threads, since the time to
+copy a large tree is mostly spent waiting for the filesystem.
+"""
+import collections
+import errno
+import os
+import shutil
+import sys
+
+from typing import Callable, Counter, Iterable, List, Optional, Set, Tuple
+
+HARDLINK = "hardlink"
+REFLINK = "reflink"
+COPY_FILE_RANGE = "copy_file_range"
+SENDFILE = "sendfile"
+SYMLINK = "symlink"
+COPY = "copy"
+
+# Strategies which create an independent copy of the file
+COPY_STRATEGIES = (REFLINK, COPY_FILE_RANGE, SENDFILE, COPY)
+# Strategies which share the data with the source if possible
+LINK_STRATEGIES = (HARDLINK,) + COPY_STRATEGIES
+# Strategies which fall back to a symbolic link before copying
+LINK_SYMLINK_STRATEGIES = (HARDLINK, REFLINK, COPY_FILE_RANGE, SENDFILE, SYMLINK, COPY)
+
+# ioctl to clone a file, from linux/fs.h
+_FICLONE = 0x40049409
+
+# Number of threads used to copy a directory
+_MAX_WORKERS = 8
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflinks are only supported on Linux")
+
+    import fcntl
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.EOPNOTSUPP, "copy_file_range is not supported")
+
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    if not sys.platform.startswith("linux"):
+        # other platforms only send to sockets
+        raise OSError(errno.EOPNOTSUPP, "sendfile to files is only supported on Linux")
+
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
+_KERNEL_COPIES = {
+    REFLINK: _reflink,
+    COPY_FILE_RANGE: _copy_file_range,
+    SENDFILE: _sendfile
+}
+
+
+def _kernel_copy(method: Callable[[int, int, int], None], src: str, dst: str) -> None:
+    """
+    Copies the contents of src into a new file at dst with a kernel copy,
+    and removes the partial file if it fails.
+    """
+    with open(src, "rb") as fsrc:
+        size = os.fstat(fsrc.fileno()).st_size
+        try:
+            with open(dst, "xb") as fdst:
+                method(fsrc.fileno(), fdst.fileno(), size)
+                if os.fstat(fdst.fileno()).st_size != size:
+                    raise OSError(errno.EIO, f"incomplete copy of {src}")
+        except BaseException:
+            try:
+                os.remove(dst)
+            except OSError:
+                pass
+            raise
+    shutil.copystat(src, dst)
+
+
+def transfer_file(src: str, dst: str, strategies: Iterable[str] = LINK_STRATEGIES) -> str:
+    """
+    Transfers a file with the first strategy which succeeds.
+
+    An existing file at the destination is replaced, unless it already is
+    a hardlink to the source.
+
+    Args:
+        src (path): path to the source file.
+        dst (path): path to the destination file, or the directory to place
+            the file in.
+        strategies (list of str): strategies to try, in order.
+
+    Returns:
+        str: the strategy used to transfer the file.
+
+    Raises:
+        OSError: if none of the strategies succeeded, the error of the last one.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    if os.path.lexists(dst):
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return HARDLINK
+        os.remove(dst)
+
+    error: Optional[OSError] = None
+    for strategy in strategies:
+        try:
+            if strategy == HARDLINK:
+                os.link(src, dst)
+            elif strategy == SYMLINK:
+                os.symlink(src, dst)
+            elif strategy == COPY:
+                shutil.copy2(src, dst)
+            else:
+                _kernel_copy(_KERNEL_COPIES[strategy], src, dst)
+            return strategy
+        except OSError as e:
+            error = e
+
+    if error is None:
+        raise ValueError("no transfer strategies provided")
+    raise error
+
+
+def copy_tree(src: str, dst: str,
+              strategies: Iterable[str] = LINK_STRATEGIES,
+              symlinks: bool = False,
+              ignore: Optional[Callable[[str, List[str]], Iterable[str]]] = None,
+              max_workers: Optional[int] = None) -> Counter[str]:
+    """
+    Copies a directory, transferring its files in parallel.
+
+    This behaves like :func:`shutil.copytree` with ``dirs_exist_ok=True``,
+    and each file is transferred with :func:`transfer_file`.
+
+    Args:
+        src (path): directory to copy.
+        dst (path): directory to copy into, which is created if needed.
+        strategies (list of str): strategies to try for each file, in order.
+        symlinks (bool): if True, symbolic links are copied as links,
+            otherwise the files they point to are transferred.
+        ignore (callable): called with each directory and the names in it,
+            returns the names to leave out, as for :func:`shutil.copytree`.
+        max_workers (int): number of threads used to transfer the files.
+
+    Returns:
+        Counter: the number of files transferred with each strategy.
+
+    Raises:
+        shutil.Error: with the list of files which could not be transferred.
+    """
+    strategies = tuple(strategies)
+    files: List[Tuple[str, str]] = []
+    dirs: List[Tuple[str, str]] = []
+    errors = []
+
+    def scan(src_dir: str, dst_dir: str) -> None:
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+        ignored: Set[str] = set()
+        if ignore is not None:
+            ignored = set(ignore(src_dir, [entry.name for entry in entries]))
+
+        os.makedirs(dst_dir, exist_ok=True)
+        dirs.append((src_dir, dst_dir))
+
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            dst_path = os.path.join(dst_dir, entry.name)
+            if entry.is_symlink() and symlinks:
+                files.append((entry.path, dst_path))
+            elif entry.is_dir():
+                scan(entry.path, dst_path)
+            else:
+                files.append((entry.path, dst_path))
+
+    def transfer(src_path: str, dst_path: str) -> str:
+        if symlinks and os.path.islink(src_path):
+            if os.path.lexists(dst_path):
+                os.remove(dst_path)
+            os.symlink(os.readlink(src_path), dst_path)
+            shutil.copystat(src_path, dst_path, follow_symlinks=False)
+            return SYMLINK
+        return transfer_file(src_path, dst_path, strategies)
+
+    scan(src, dst)
+
+    used: Counter[str] = collections.Counter()
+    if max_workers is None:
+        max_workers = min(_MAX_WORKERS, len(files))
+
+    if max_workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(src_path, dst_path, executor.submit(transfer, src_path, dst_path))
+                       for src_path, dst_path in files]
+            for src_path, dst_path, future in futures:
+                try:
+                    used[future.result()] += 1
+                except OSError as e:
+                    errors.append((src_path, dst_path, str(e)))
+    else:
+        for src_path, dst_path in files:
+            try:
+                used[transfer(src_path, dst_path)] += 1
+            except OSError as e:
+                errors.append((src_path, dst_path, str(e)))
+
+    # Copy the directory times last, since adding the files changes them
+    for src_dir, dst_dir in reversed(dirs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+
+    if errors:
+        raise shutil.Error(errors)
+    return used
@@ -93,6 +93,19 @@ def mock_post(url, data={}, files={}, stream=True, timeout=0):
             'interval': 30,
             'job_hash': job_hash,
         })
+    elif url.endswith('check_blobs/'):
+        # The server already has every file of the job
+        return build_response(200, json_obj={
+            'missing': [],
+            'chunk_size': 8 * 1024 * 1024
+        })
+    elif url.endswith('progress_stream/'):
+        resp = build_response(200, text='event: status\ndata: ' + json.dumps({
+            'message': 'Job has no running steps.',
+            'status': JobStatus.COMPLETED
+        }) + '\n\n')
+        resp._content_consumed = True
+        return resp
     elif url.endswith('check_progress/'):
         return build_response(200, json_obj={
             'message': 'Job has no running steps.',
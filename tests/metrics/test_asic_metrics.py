@@ -47,6 +47,7 @@ def test_keys():
         ('drvs',),
         ('totalarea',),
         ('setupslack',),
+        ('overhead',),
         ('totaltime',)
     ])
 
@@ -30,6 +30,7 @@ def test_keys():
         ('wirelength',),
         ('brams',),
         ('setupwns',),
+        ('overhead',),
         ('totaltime',),
         ('holdpaths',),
         ('warnings',),
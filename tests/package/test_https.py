@@ -1,7 +1,9 @@
 import gzip
+import hashlib
 import logging
 import pytest
 import re
+import requests
 import responses
 import struct
 import sys
@@ -17,10 +19,21 @@ from unittest.mock import patch, MagicMock
 from siliconcompiler import utils
 from siliconcompiler.package import DataRootResolutionError
 from siliconcompiler.package.cache import DataSourceUnavailableError, PermanentResolutionError
-from siliconcompiler.package.https import HTTPResolver, _extract_archive
+from siliconcompiler.package.https import HTTPResolver, _detect_format, _extract_archive, \
+    _parse_content_range
 from siliconcompiler import Project
 
 
+def _mock_response(content, status_code=200, headers=None):
+    """A streamed ``requests`` response answering with ``content``."""
+    response = MagicMock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.side_effect = lambda chunk_size: iter([content])
+    return response
+
+
 @pytest.mark.parametrize('path,ref,cache_id', [
     ('https://github.com/siliconcompiler/siliconcompiler/archive/',
      '938df309b4803fd79b10de6d3c7d7aa4645c39f5',
@@ -186,9 +199,7 @@ def test_resolve_remote_relative_symlink(broken_tarfile_data_filter):
 
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -264,9 +275,7 @@ def test_http_resolver_resolve_remote_tarball(monkeypatch):
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -292,9 +301,7 @@ def test_http_resolver_resolve_remote_with_auth_token(monkeypatch):
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -323,9 +330,7 @@ def test_http_resolver_resolve_remote_github_header():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -361,9 +366,7 @@ def test_http_resolver_resolve_remote_invalid_archive():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = b"not a valid archive"
+        mock_response = _mock_response(b"not a valid archive")
         mock_requests.get.return_value = mock_response
 
         with pytest.raises(TypeError,
@@ -387,9 +390,7 @@ def test_http_resolver_resolve_remote_zip_file():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = zip_buffer.getvalue()
+        mock_response = _mock_response(zip_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -415,9 +416,7 @@ def test_http_resolver_resolve_remote_github_flatten():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -444,9 +443,7 @@ def test_http_resolver_resolve_remote_bz2_tarball():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -472,9 +469,7 @@ def test_http_resolver_resolve_remote_github_flatten_tgz():
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
 
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = tar_buffer.getvalue()
+        mock_response = _mock_response(tar_buffer.getvalue())
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -547,9 +542,7 @@ def _resolve_with_content(resolver, content):
     """Runs resolve_remote against a download that answers with ``content``."""
     import siliconcompiler.package.https as https_module
     with patch.object(https_module, "requests") as mock_requests:
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.content = content
+        mock_response = _mock_response(content)
         mock_requests.get.return_value = mock_response
 
         resolver.resolve_remote()
@@ -1160,3 +1153,254 @@ def test_http_resolver_get_auth_token_search_sequence(monkeypatch, pkg_name, exp
 
         # Should find the token at this position
         assert token == f"token_at_position_{idx}"
+
+
+# ============================================================================
+# Streaming downloads
+# ============================================================================
+
+def _streaming_resolver(source="https://example.com/data.tar.gz"):
+    project = Project("testproj")
+    project.option.set_cachedir(".")
+    return HTTPResolver("test", project, source, "v1.0")
+
+
+@pytest.mark.parametrize("compression,expected", (
+    ("gz", "gzip tar"),
+    ("bz2", "bzip2 tar"),
+    ("xz", "xz tar"),
+    ("zst", "zstd tar"),
+))
+def test_detect_format(compression, expected):
+    assert _detect_format(_tarball({"test.txt": b"test"}, compression)[:8]) == expected
+
+
+def test_detect_format_zip():
+    archive = BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr("test.txt", "test")
+
+    assert _detect_format(archive.getvalue()[:8]) == "zip"
+
+
+def test_detect_format_unknown():
+    assert _detect_format(b"not an archive") is None
+    assert _detect_format(b"") is None
+
+
+@pytest.mark.parametrize("value,expected", (
+    ("bytes 100-199/200", (100, 200)),
+    ("bytes 100-199/*", (100, None)),
+    ("bytes */200", (None, None)),
+    ("items 0-1/2", (None, None)),
+    (None, (None, None)),
+))
+def test_parse_content_range(value, expected):
+    assert _parse_content_range(value) == expected
+
+
+def test_http_resolver_download_streams_to_file():
+    """The archive is written to disk in chunks and removed once unpacked."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test"}, "gz")
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        response = _mock_response(None, headers={"Content-Length": str(len(archive))})
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            [archive[:10], archive[10:]])
+        mock_requests.get.return_value = response
+
+        resolver.resolve_remote()
+
+    assert mock_requests.get.call_args.kwargs["stream"] is True
+    assert "Range" not in mock_requests.get.call_args.kwargs["headers"]
+    assert mock_requests.get.call_args.kwargs["headers"]["Accept-Encoding"] == "identity"
+    response.close.assert_called()
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+    assert not os.path.exists(resolver.download_file)
+    assert os.listdir(".") == [resolver.cache_name]
+
+
+def test_http_resolver_download_interrupted_is_resumed():
+    """A transfer that ends early is kept and the next attempt asks for the rest."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test" * 1000}, "gz")
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.return_value = _mock_response(
+            archive[:20], headers={"Content-Length": str(len(archive)), "ETag": '"v1"'})
+
+        with pytest.raises(IOError, match=f"ended after 20 of {len(archive)} bytes"):
+            resolver.resolve_remote()
+    assert os.path.getsize(resolver.download_file) == 20
+
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.return_value = _mock_response(
+            archive[20:], status_code=206,
+            headers={"Content-Range": f"bytes 20-{len(archive) - 1}/{len(archive)}"})
+
+        resolver.resolve_remote()
+
+    headers = mock_requests.get.call_args.kwargs["headers"]
+    assert headers["Range"] == "bytes=20-"
+    assert headers["If-Range"] == '"v1"'
+    with open(os.path.join(str(resolver.cache_path), "test.txt"), "rb") as f:
+        assert f.read() == b"test" * 1000
+    assert not os.path.exists(resolver.download_file)
+
+
+def test_http_resolver_download_changed_archive_restarts():
+    """A server answering a resumed request in full replaces the partial download."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test"}, "gz")
+
+    with open(resolver.download_file, "wb") as f:
+        f.write(b"stale")
+    with open(f"{resolver.download_file}.json", "w") as f:
+        f.write('{"url": "https://example.com/data.tar.gz", "validator": "old"}')
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.return_value = _mock_response(archive)
+
+        resolver.resolve_remote()
+
+    assert mock_requests.get.call_args.kwargs["headers"]["Range"] == "bytes=5-"
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+
+
+@pytest.mark.parametrize("status_code,headers", (
+    (416, {}),
+    (206, {"Content-Range": "bytes 0-10/11"}),
+))
+def test_http_resolver_download_misaligned_range_restarts(status_code, headers):
+    """A range the server cannot serve from where the partial download ends starts over."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test"}, "gz")
+
+    with open(resolver.download_file, "wb") as f:
+        f.write(b"stale")
+    with open(f"{resolver.download_file}.json", "w") as f:
+        f.write('{"url": "https://example.com/data.tar.gz", "validator": "old"}')
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.side_effect = [
+            _mock_response(b"", status_code=status_code, headers=headers),
+            _mock_response(archive)
+        ]
+
+        resolver.resolve_remote()
+
+    assert mock_requests.get.call_count == 2
+    assert "Range" not in mock_requests.get.call_args.kwargs["headers"]
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+
+
+def test_http_resolver_download_encoded_not_resumed():
+    """A download decoded as it is read cannot be resumed by byte ranges."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test"}, "gz")
+
+    with open(f"{resolver.download_file}.json", "w") as f:
+        f.write('{"url": "https://example.com/data.tar.gz", "validator": "old"}')
+
+    def interrupted(chunk_size):
+        yield archive[:20]
+        raise requests.exceptions.ChunkedEncodingError("connection lost")
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        response = _mock_response(None, headers={"Content-Encoding": "gzip", "ETag": '"v1"'})
+        response.iter_content.side_effect = interrupted
+        mock_requests.get.return_value = response
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            resolver.resolve_remote()
+    assert not os.path.exists(f"{resolver.download_file}.json")
+
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.return_value = _mock_response(archive)
+
+        resolver.resolve_remote()
+
+    assert "Range" not in mock_requests.get.call_args.kwargs["headers"]
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+
+
+def test_http_resolver_download_other_url_not_resumed():
+    """A partial download of another URL is not resumed."""
+    resolver = _streaming_resolver()
+    archive = _tarball({"test.txt": b"test"}, "gz")
+
+    with open(resolver.download_file, "wb") as f:
+        f.write(b"stale")
+    with open(f"{resolver.download_file}.json", "w") as f:
+        f.write('{"url": "https://example.com/other.tar.gz", "validator": "old"}')
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        mock_requests.get.return_value = _mock_response(archive)
+
+        resolver.resolve_remote()
+
+    assert "Range" not in mock_requests.get.call_args.kwargs["headers"]
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+
+
+def test_http_resolver_checksum():
+    archive = _tarball({"test.txt": b"test"}, "gz")
+    digest = hashlib.sha256(archive).hexdigest()
+    resolver = _streaming_resolver(f"https://example.com/data.tar.gz#sha256={digest.upper()}")
+
+    assert resolver.checksum == ("sha256", digest)
+    assert resolver.download_url == "https://example.com/data.tar.gz"
+
+    _resolve_with_content(resolver, archive)
+
+    assert os.path.isfile(os.path.join(str(resolver.cache_path), "test.txt"))
+
+
+def test_http_resolver_checksum_mismatch():
+    """A download that does not match is discarded, and the attempt may be retried."""
+    resolver = _streaming_resolver(f"https://example.com/data.tar.gz#sha256={'0' * 64}")
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        _resolve_with_content(resolver, _tarball({"test.txt": b"test"}, "gz"))
+
+    assert not os.path.exists(resolver.download_file)
+    assert not resolver.is_permanent_failure(ValueError())
+
+
+def test_http_resolver_checksum_unknown_algorithm():
+    resolver = _streaming_resolver("https://example.com/data.tar.gz#crc=1234")
+
+    import siliconcompiler.package.https as https_module
+    with patch.object(https_module, "requests") as mock_requests:
+        with pytest.raises(PermanentResolutionError,
+                           match="Unsupported checksum algorithm for test: crc"):
+            resolver.resolve_remote()
+
+    mock_requests.get.assert_not_called()
+
+
+def test_http_resolver_no_checksum():
+    assert _streaming_resolver().checksum is None
+    assert _streaming_resolver("https://example.com/data.tar.gz#top").checksum is None
+
+
+def test_http_resolver_download_url_with_slash_and_checksum():
+    resolver = _streaming_resolver("https://example.com/releases/#sha256=abc")
+    assert resolver.download_url == "https://example.com/releases/v1.0.tar.gz"
+
+
+def test_http_resolver_invalid_archive_download_removed():
+    """A complete download that cannot be unpacked is not kept for a retry."""
+    resolver = _streaming_resolver()
+
+    with pytest.raises(TypeError):
+        _resolve_with_content(resolver, b"not a valid archive")
+
+    assert not os.path.exists(resolver.download_file)
@@ -0,0 +1,247 @@
+import hashlib
+import os
+import pytest
+import stat
+
+from siliconcompiler.remote.blobstore import BlobStore, GRACE_PERIOD, build_manifest, \
+    is_safe_path
+from siliconcompiler.utils.transfer import HARDLINK
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def upload(store, data, chunk_size=4):
+    digest = sha256(data)
+    # Out of order, as parallel uploads can arrive
+    offsets = list(range(0, max(len(data), 1), chunk_size))
+    for offset in reversed(offsets):
+        with store.write(digest, offset) as f:
+            f.write(data[offset:offset + chunk_size])
+    return digest
+
+
+@pytest.fixture
+def store():
+    return BlobStore(os.path.abspath("store"), os.path.abspath("staging"))
+
+
+def test_build_manifest():
+    write("job/top.v", b"module top; endmodule")
+    write("job/sc_collected_files/lib.v", b"module lib; endmodule")
+    write("job/empty.txt", b"")
+    os.chmod("job/top.v", 0o755)
+
+    assert build_manifest("job") == {
+        "top.v": {
+            "digest": sha256(b"module top; endmodule"),
+            "size": 21,
+            "mode": 0o755
+        },
+        "sc_collected_files/lib.v": {
+            "digest": sha256(b"module lib; endmodule"),
+            "size": 21,
+            "mode": stat.S_IMODE(os.stat("job/sc_collected_files/lib.v").st_mode)
+        },
+        "empty.txt": {
+            "digest": sha256(b""),
+            "size": 0,
+            "mode": stat.S_IMODE(os.stat("job/empty.txt").st_mode)
+        }
+    }
+
+
+def test_build_manifest_symlinks():
+    write("data.v", b"data")
+    os.makedirs("job")
+    os.symlink(os.path.abspath("data.v"), "job/link.v")
+    os.symlink("missing.v", "job/broken.v")
+
+    files = build_manifest("job")
+    assert list(files) == ["link.v"]
+    assert files["link.v"]["digest"] == sha256(b"data")
+
+
+@pytest.mark.parametrize("path,safe", [
+    ("top.v", True),
+    ("sc_collected_files/lib/top.v", True),
+    ("../top.v", False),
+    ("lib/../../top.v", False),
+    ("./top.v", False),
+    ("lib//top.v", False),
+    ("lib/", False),
+    ("/etc/passwd", False),
+    ("lib\\top.v", False),
+    ("C:/top.v", False),
+    ("", False)
+])
+def test_is_safe_path(path, safe):
+    assert is_safe_path(path) is safe
+
+
+def test_missing(store):
+    digest = upload(store, b"stored")
+    assert store.commit(digest)
+
+    other = sha256(b"other")
+    assert store.missing([digest, other, other]) == [other]
+
+
+def test_commit(store):
+    data = b"0123456789abcdefghij"
+    digest = upload(store, data)
+
+    assert not store.has(digest)
+    assert store.commit(digest)
+    assert store.has(digest)
+    assert read(store.path(digest)) == data
+    assert os.listdir("staging") == []
+
+
+def test_commit_empty_file(store):
+    digest = upload(store, b"")
+
+    assert store.commit(digest)
+    assert read(store.path(digest)) == b""
+
+
+def test_commit_mismatch(store):
+    digest = sha256(b"expected")
+    with store.write(digest, 0) as f:
+        f.write(b"expec")
+
+    assert not store.commit(digest)
+    assert not store.has(digest)
+    assert os.listdir("staging") == []
+
+
+def test_commit_not_uploaded(store):
+    assert not store.commit(sha256(b"never sent"))
+
+
+def test_commit_already_stored(store):
+    digest = upload(store, b"data")
+    assert store.commit(digest)
+
+    upload(store, b"data")
+    assert store.commit(digest)
+    assert os.listdir("staging") == []
+
+
+def test_invalid_digest(store):
+    with pytest.raises(ValueError, match="is not a valid digest"):
+        store.path("../../etc/passwd")
+    with pytest.raises(ValueError, match="is not a valid digest"):
+        with store.write("0" * 63, 0):
+            pass
+
+
+def test_materialize(store):
+    source = upload(store, b"module top; endmodule")
+    manifest = upload(store, b"{}")
+    for digest in (source, manifest):
+        assert store.commit(digest)
+    mode = stat.S_IMODE(os.stat(store.path(source)).st_mode)
+
+    used = store.materialize({
+        "sc_collected_files/top.v": {"digest": source, "mode": mode},
+        "gcd.pkg.json": {"digest": manifest, "mode": mode},
+    }, "job", shared=["sc_collected_files"])
+
+    assert used[HARDLINK] == 1
+    assert sum(used.values()) == 2
+    assert os.path.samefile("job/sc_collected_files/top.v", store.path(source))
+    # Rewritten in place by the job, so not shared with the store
+    assert not os.path.samefile("job/gcd.pkg.json", store.path(manifest))
+    assert read("job/gcd.pkg.json") == b"{}"
+
+
+def test_materialize_mode(store):
+    digest = upload(store, b"#!/bin/sh")
+    assert store.commit(digest)
+    os.chmod(store.path(digest), 0o644)
+
+    used = store.materialize({
+        "sc_collected_files/run.sh": {"digest": digest, "mode": 0o755},
+        "sc_collected_files/link.sh": {"digest": digest, "mode": 0o664}
+    }, "job", shared=["sc_collected_files"])
+
+    assert used[HARDLINK] == 1
+    assert os.path.samefile("job/sc_collected_files/link.sh", store.path(digest))
+    assert stat.S_IMODE(os.stat("job/sc_collected_files/run.sh").st_mode) == 0o755
+    assert stat.S_IMODE(os.stat(store.path(digest)).st_mode) == 0o644
+
+
+def test_materialize_unsafe_path(store):
+    digest = upload(store, b"data")
+    assert store.commit(digest)
+
+    with pytest.raises(ValueError, match="../escape.txt is not a valid path"):
+        store.materialize({"../escape.txt": {"digest": digest}}, "job")
+    assert not os.path.exists("escape.txt")
+
+
+def test_materialize_missing(store):
+    with pytest.raises(FileNotFoundError):
+        store.materialize({"top.v": {"digest": sha256(b"missing")}}, "job")
+
+
+def age(path, seconds):
+    then = os.stat(path).st_mtime - seconds
+    os.utime(path, (then, then))
+
+
+def test_collect(store):
+    '''Files no job links to and abandoned uploads are removed after the grace period'''
+    unused = upload(store, b"unused")
+    assert store.commit(unused)
+    linked = upload(store, b"linked")
+    assert store.commit(linked)
+    assert store.materialize({"src/top.v": {"digest": linked}}, "job",
+                             shared=["src"]) == {HARDLINK: 1}
+    recent = upload(store, b"recent")
+    assert store.commit(recent)
+    abandoned = upload(store, b"abandoned")
+    for digest in (unused, linked):
+        age(store.path(digest), 2 * GRACE_PERIOD)
+    age(os.path.join("staging", f"{abandoned}.part"), 2 * GRACE_PERIOD)
+
+    assert store.collect() == len(b"unused") + len(b"abandoned")
+
+    assert not store.has(unused)
+    assert store.has(linked)
+    assert store.has(recent)
+    assert os.listdir("staging") == []
+
+    # No longer used once the job is deleted
+    os.remove(os.path.join("job", "src", "top.v"))
+    assert store.collect() == len(b"linked")
+    assert store.collect(grace=0) == len(b"recent")
+    assert store.missing([linked, recent]) == sorted([linked, recent])
+
+
+def test_collect_empty(store):
+    assert store.collect() == 0
+
+
+def test_missing_refreshes(store):
+    '''Files reported as stored are kept until the job using them is created'''
+    digest = upload(store, b"stored")
+    assert store.commit(digest)
+    age(store.path(digest), 2 * GRACE_PERIOD)
+
+    assert store.missing([digest]) == []
+    assert store.collect() == 0
+    assert store.has(digest)
@@ -1,15 +1,19 @@
+import io
 import json
 import os
 import pytest
+import re
 import requests
 import time
 
 import os.path
 
 from siliconcompiler import NodeStatus
-from siliconcompiler.remote import Client
+from siliconcompiler.remote import Client, JobStatus
 from siliconcompiler.remote import NodeStatus as RemoteNodeStatus
+from siliconcompiler.remote.results import ZSTD, write_archive
 from siliconcompiler.remote.server import Server
+from siliconcompiler.utils.paths import jobdir
 
 
 def _client(project, nodes=('stepone0', 'steptwo0')):
@@ -202,6 +206,102 @@ def test_fetch_results_missing_node(gcd_remote_test, inline_download_pool, caplo
     assert 'Could not fetch results for node: nosuchnode0' in caplog.text
 
 
+class _Body:
+    '''Body of a streamed response, which can be cut off part way.'''
+
+    def __init__(self, data, cutoff=None):
+        self.__data = io.BytesIO(data)
+        self.__cutoff = cutoff
+
+    def read(self, size=-1, **kwargs):
+        if self.__cutoff is not None and self.__data.tell() >= self.__cutoff:
+            raise requests.exceptions.ChunkedEncodingError('Connection broken')
+        if self.__cutoff is not None:
+            size = self.__cutoff - self.__data.tell()
+        return self.__data.read(size)
+
+
+def _archive_response(code, data, headers, cutoff=None):
+    resp = requests.Response()
+    resp.status_code = code
+    resp.raw = _Body(data, cutoff=cutoff)
+    resp.headers.update(headers)
+    return resp
+
+
+def _results_archive(job_hash):
+    '''The results archive of a node, as the server stores it.'''
+    os.makedirs('server/gcd/job0/stepone/0/outputs')
+    with open('server/gcd/job0/stepone/0/outputs/gcd.v', 'wb') as f:
+        f.write(os.urandom(64 * 1024))
+    with write_archive('server/results.tar.zst', ZSTD) as tar:
+        tar.add('server/gcd', arcname=f'{job_hash}/gcd')
+    with open('server/results.tar.zst', 'rb') as f:
+        return f.read()
+
+
+def test_fetch_results_resumes_download(gcd_nop_project, monkeypatch, caplog):
+    '''A download which is cut off resumes from where it stopped'''
+    monkeypatch.setattr('siliconcompiler.remote.client.time.sleep', lambda _: None)
+    job_hash = 'c' * 32
+    gcd_nop_project.set('record', 'remoteid', job_hash)
+    archive = _results_archive(job_hash)
+    half = len(archive) // 2
+
+    requested = []
+
+    def post(url, headers=None, **kwargs):
+        requested.append(headers)
+        if 'Range' not in headers:
+            return _archive_response(200, archive,
+                                     {'Content-Length': str(len(archive)), 'ETag': '"v1"'},
+                                     cutoff=half)
+        return _archive_response(206, archive[half:],
+                                 {'Content-Range': f'bytes {half}-{len(archive) - 1}/'
+                                                   f'{len(archive)}',
+                                  'ETag': '"v1"'})
+
+    monkeypatch.setattr(requests, 'post', post)
+
+    Client(gcd_nop_project)._fetch_result('stepone0')
+
+    assert requested == [{}, {'Range': f'bytes={half}-', 'If-Match': '"v1"'}]
+    assert 'Download of results for stepone0 was interrupted, resuming' in caplog.text
+    with open('server/gcd/job0/stepone/0/outputs/gcd.v', 'rb') as expected, \
+            open('build/gcd/job0/stepone/0/outputs/gcd.v', 'rb') as fetched:
+        assert fetched.read() == expected.read()
+    # The partial download is gone once it is extracted
+    assert [name for name in os.listdir('build') if name.startswith('.')] == []
+
+
+def test_fetch_results_restarts_changed_download(gcd_nop_project, monkeypatch):
+    '''A partial download of an archive which changed since starts over'''
+    job_hash = 'c' * 32
+    gcd_nop_project.set('record', 'remoteid', job_hash)
+    archive = _results_archive(job_hash)
+
+    os.makedirs('build')
+    with open(f'build/.{job_hash}_stepone0.part', 'wb') as f:
+        f.write(b'stale')
+    with open(f'build/.{job_hash}_stepone0.part.etag', 'w') as f:
+        f.write('"v0"')
+
+    requested = []
+
+    def post(url, headers=None, **kwargs):
+        requested.append(headers)
+        if headers:
+            return _response(412, 'Precondition Failed')
+        return _archive_response(200, archive, {'Content-Length': str(len(archive))})
+
+    monkeypatch.setattr(requests, 'post', post)
+
+    Client(gcd_nop_project)._fetch_result('stepone0')
+
+    assert requested == [{'Range': 'bytes=5-', 'If-Match': '"v0"'}, {}]
+    assert os.path.isfile('build/gcd/job0/stepone/0/outputs/gcd.v')
+
+
 ###########################
 # Server communication
 ###########################
@@ -281,6 +381,189 @@ def test_post_error_without_json_body(gcd_nop_project, monkeypatch):
         Client(gcd_nop_project).delete_job()
 
 
+###########################
+# Progress stream
+###########################
+
+def _event_stream(*events):
+    text = ''
+    for event, data in events:
+        if event is None:
+            text += ': keepalive\n\n'
+        else:
+            text += f'event: {event}\ndata: {json.dumps(data)}\n\n'
+    resp = _response(200, text)
+    resp._content_consumed = True
+    return resp
+
+
+def _following_client(project, monkeypatch, streams):
+    '''A client whose server answers 'progress_stream' with each stream in turn'''
+    monkeypatch.setattr('siliconcompiler.remote.client.time.sleep', lambda _: None)
+    streams = list(streams)
+
+    def post(url, **kwargs):
+        assert url.endswith('/progress_stream/')
+        return streams.pop(0)
+    monkeypatch.setattr(requests, 'post', post)
+
+    client = _client(project)
+    client._Client__check_interval = 1
+    client._Client__setup_information_fetched = True
+    client._Client__setup_information_loaded = True
+
+    fetched = []
+    monkeypatch.setattr(client, '_Client__schedule_fetch_result',
+                        lambda node, log=True: fetched.append(node))
+    return client, fetched
+
+
+def test_follow_progress(gcd_nop_project, monkeypatch, caplog):
+    '''Each node is fetched as it ends, and its changes applied from the event'''
+    journal = [{'type': 'set', 'key': ['record', 'toolexitcode'], 'value': 3,
+                'field': 'value', 'step': 'stepone', 'index': '0'}]
+    client, fetched = _following_client(gcd_nop_project, monkeypatch, [_event_stream(
+        ('status', {'status': JobStatus.RUNNING,
+                    'message': {'null': {'status': NodeStatus.SUCCESS},
+                                'stepone0': {'status': NodeStatus.PENDING},
+                                'steptwo0': {'status': NodeStatus.PENDING}}}),
+        ('node_start', {'node': 'stepone0', 'status': NodeStatus.RUNNING}),
+        (None, None),
+        ('node_end', {'node': 'stepone0', 'status': NodeStatus.SUCCESS, 'journal': journal}),
+        ('job_end', {'status': JobStatus.COMPLETED}),
+        ('node_end', {'node': 'steptwo0', 'status': NodeStatus.SUCCESS, 'journal': None})
+    )])
+
+    starttimes = {}
+    assert client._Client__follow_progress(starttimes) is True
+
+    assert fetched == ['stepone0']
+    assert ('stepone', '0') in starttimes
+    assert gcd_nop_project.get('record', 'status', step='stepone', index='0') == \
+        NodeStatus.SUCCESS
+    assert gcd_nop_project.get('record', 'toolexitcode', step='stepone', index='0') == 3
+    assert client._Client__node_information['stepone0']['imported']
+    assert not client._Client__node_information['steptwo0']['imported']
+    assert 'Running: stepone/0' in caplog.text
+    assert 'Job status: completed' in caplog.text
+
+
+def test_follow_progress_reconnects(gcd_nop_project, monkeypatch, caplog):
+    '''A stream which drops before the job ends is opened again'''
+    running = ('status', {'status': JobStatus.RUNNING,
+                          'message': {'stepone0': {'status': NodeStatus.PENDING}}})
+    client, fetched = _following_client(gcd_nop_project, monkeypatch, [
+        _event_stream(running),
+        _event_stream(running, ('job_end', {'status': JobStatus.COMPLETED}))
+    ])
+
+    assert client._Client__follow_progress({}) is True
+    assert 'Lost connection to the job progress, reconnecting' in caplog.text
+
+
+def test_follow_progress_finished_job(gcd_nop_project, monkeypatch):
+    '''A job which is already over needs no more than its status'''
+    client, fetched = _following_client(gcd_nop_project, monkeypatch, [_event_stream(
+        ('status', {'status': JobStatus.COMPLETED, 'message': 'Job has no running steps.'})
+    )])
+
+    assert client._Client__follow_progress({}) is True
+    assert fetched == []
+
+
+def test_follow_progress_old_server(gcd_nop_project, monkeypatch):
+    '''A server without the stream is polled instead'''
+    client, _ = _following_client(gcd_nop_project, monkeypatch, [
+        _response(404, json.dumps({'message': 'Not Found'}))
+    ])
+
+    assert client._Client__follow_progress({}) is False
+
+
+###########################
+# Uploads
+###########################
+
+def _job_files(project, files):
+    job_dir = jobdir(project)
+    for name, data in files.items():
+        path = os.path.join(job_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+    return Client(project)._Client__job_files()
+
+
+def test_job_files_skip_log(gcd_nop_project):
+    '''The log of the run is still being written, so it is not uploaded'''
+    files = _job_files(gcd_nop_project, {
+        'job.log': b'log',
+        'sc_collected_files/gcd.v': b'module gcd; endmodule'
+    })
+
+    assert list(files) == ['sc_collected_files/gcd.v']
+
+
+def test_upload_files_only_missing(gcd_nop_project, monkeypatch):
+    '''Only the files the server lacks are sent, in chunks'''
+    files = _job_files(gcd_nop_project, {
+        'sc_collected_files/gcd.v': b'module gcd; endmodule',
+        'sc_collected_files/copy.v': b'module gcd; endmodule',
+        'sc_collected_files/gcd.sdc': b'create_clock'
+    })
+    missing = files['sc_collected_files/gcd.v']['digest']
+
+    uploaded = {}
+
+    def server(url, **kwargs):
+        if url.endswith('/check_blobs/'):
+            assert sorted(json.loads(kwargs['data'])['digests']) == \
+                sorted({info['digest'] for info in files.values()})
+            return _response(200, json.dumps({'missing': [missing], 'chunk_size': 4}))
+        assert url.endswith('/upload_blob/')
+        params = json.loads(kwargs['files']['params'])
+        uploaded[(params['digest'], params['offset'])] = kwargs['files']['data'][1]
+        return _response(200, json.dumps({'message': 'Chunk received.'}))
+
+    monkeypatch.setattr(requests, 'post', server)
+
+    assert Client(gcd_nop_project)._Client__upload_files(files)
+
+    assert {digest for digest, _ in uploaded} == {missing}
+    assert sorted(offset for _, offset in uploaded) == list(range(0, 21, 4))
+    assert b''.join(uploaded[key] for key in sorted(uploaded)) == b'module gcd; endmodule'
+
+
+def test_upload_files_old_server(gcd_nop_project, monkeypatch):
+    '''A server without deduplicated uploads gets the job as an archive'''
+    files = _job_files(gcd_nop_project, {'sc_collected_files/gcd.v': b'module gcd; endmodule'})
+
+    monkeypatch.setattr(requests, 'post', lambda url, **kwargs: _response(404, '404: Not Found'))
+
+    assert not Client(gcd_nop_project)._Client__upload_files(files)
+
+
+@pytest.mark.timeout(90)
+def test_resubmit_uploads_new_files(gcd_remote_test):
+    '''A second submission of the same job uploads nothing it already sent'''
+    def uploads():
+        with open(os.path.join(jobdir(project), 'job.log')) as f:
+            return re.search(r'Uploading (\d+) of (\d+) files', f.read()).groups()
+
+    project = gcd_remote_test()
+    assert project.run()
+    uploaded, total = uploads()
+    assert uploaded == total != '0'
+
+    # A finished remote run turns itself back into a local one
+    project.set('option', 'remote', True)
+    project.set('record', 'remoteid', None)
+    assert project.run()
+    # Only the files the first run added to the job directory are new
+    resubmitted, resubmitted_total = uploads()
+    assert int(resubmitted) <= int(resubmitted_total) - int(total)
+
+
 ###########################
 # Configuration
 ###########################
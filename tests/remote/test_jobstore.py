@@ -0,0 +1,81 @@
+import os
+
+from siliconcompiler.remote import JobStatus
+from siliconcompiler.remote.jobstore import JobStore
+
+
+def test_add():
+    store = JobStore("jobs.sqlite")
+    store.add("alice_0123", "0123", "alice", cores=4, memory=1024)
+
+    job = store.get_job("alice_0123")
+    assert job["job_hash"] == "0123"
+    assert job["username"] == "alice"
+    assert job["status"] == JobStatus.QUEUED
+    assert job["cores"] == 4
+    assert job["memory"] == 1024
+    assert job["nodes"] == {}
+    assert job["started"] is None
+
+
+def test_get_missing_job():
+    assert JobStore("jobs.sqlite").get_job("nosuchjob") is None
+
+
+def test_lifecycle():
+    store = JobStore("jobs.sqlite")
+    store.add("job", "0123", None)
+
+    store.start("job")
+    assert store.get_job("job")["status"] == JobStatus.RUNNING
+    assert store.get_job("job")["started"] is not None
+
+    store.requeue("job")
+    assert store.get_job("job")["status"] == JobStatus.QUEUED
+    assert store.get_job("job")["started"] is None
+
+    store.start("job")
+    store.end("job", JobStatus.COMPLETED)
+    assert store.get_job("job")["status"] == JobStatus.COMPLETED
+    assert store.get_job("job")["ended"] is not None
+
+    store.remove("job")
+    assert store.get_job("job") is None
+
+
+def test_set_nodes():
+    store = JobStore("jobs.sqlite")
+    store.add("job", "0123", None)
+
+    nodes = {
+        None: {"status": "success"},
+        "stepone0": {"status": "running", "step": "stepone", "index": "0", "starttime": 1.5}
+    }
+    store.set_nodes("job", nodes)
+
+    assert store.get_job("job")["nodes"] == nodes
+
+
+def test_get_jobs():
+    store = JobStore("jobs.sqlite")
+    for name in ("first", "second", "third"):
+        store.add(name, name, None)
+    store.start("second")
+    store.end("third", JobStatus.CANCELED)
+
+    assert [job["name"] for job in store.get_jobs()] == ["first", "second", "third"]
+    assert [job["name"] for job in store.get_jobs(JobStatus.QUEUED, JobStatus.RUNNING)] == \
+        ["first", "second"]
+    assert store.get_jobs(JobStatus.FAILED) == []
+
+
+def test_persistent():
+    store = JobStore("jobs.sqlite")
+    store.add("job", "0123", "alice")
+    store.set_nodes("job", {None: {"status": "pending"}})
+    store.close()
+
+    assert os.path.isfile("jobs.sqlite")
+    job = JobStore("jobs.sqlite").get_job("job")
+    assert job["username"] == "alice"
+    assert job["nodes"] == {None: {"status": "pending"}}
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import pytest
+import tarfile
+
+from siliconcompiler.remote import results
+from siliconcompiler.remote.results import DIGEST_HEADER, GZIP, ZSTD, archive_path, \
+    compressions, extract_archive, read_archive, transcode, write_archive
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def make_archive(compression, files=None):
+    files = files or {
+        "0123/gcd/job0/stepone/0/outputs/gcd.v": b"module gcd; endmodule",
+        "0123/gcd/job0/stepone/0/reports/area.rpt": b"area: 10"
+    }
+    for name, data in files.items():
+        write(os.path.join("server", name), data)
+
+    path = archive_path("results", compression)
+    with write_archive(path, compression) as tar:
+        tar.add(os.path.join("server", "0123"), arcname="0123")
+    return path
+
+
+def test_compressions():
+    assert compressions() == [ZSTD, GZIP]
+
+
+def test_compressions_without_zstd(monkeypatch):
+    monkeypatch.setattr(results, "zstd_available", lambda: False)
+    assert compressions() == [GZIP]
+
+
+def test_archive_path():
+    assert archive_path("job/0123_syn0", ZSTD) == "job/0123_syn0.tar.zst"
+    assert archive_path("job/0123_syn0", GZIP) == "job/0123_syn0.tar.gz"
+
+
+@pytest.mark.parametrize("compression", [ZSTD, GZIP])
+def test_write_archive(compression):
+    path = make_archive(compression)
+
+    with open(path, "rb") as f, read_archive(f) as tar:
+        digests = {member.name: member.pax_headers.get(DIGEST_HEADER) for member in tar}
+
+    assert digests["0123/gcd/job0/stepone/0/outputs/gcd.v"] == \
+        hashlib.sha256(b"module gcd; endmodule").hexdigest()
+    # Only files have a digest
+    assert digests["0123/gcd/job0/stepone/0/outputs"] is None
+    # Nothing is left over from writing it
+    assert sorted(os.listdir(".")) == sorted(["server", os.path.basename(path)])
+
+
+def test_write_archive_threads():
+    path = archive_path("results", ZSTD)
+    write("data.txt", b"data" * 10000)
+    with write_archive(path, ZSTD, threads=2) as tar:
+        tar.add("data.txt")
+
+    with open(path, "rb") as f, read_archive(f) as tar:
+        assert [member.name for member in tar] == ["data.txt"]
+
+
+def test_write_archive_failed():
+    '''An archive which could not be written is not left behind'''
+    with pytest.raises(ValueError):
+        with write_archive("results.tar.zst", ZSTD):
+            raise ValueError("failed")
+
+    assert os.listdir(".") == []
+
+
+def test_read_archive_without_zstd(monkeypatch):
+    path = make_archive(ZSTD)
+    monkeypatch.setattr("siliconcompiler.utils._zstd", None)
+
+    with pytest.raises(ModuleNotFoundError):
+        with open(path, "rb") as f, read_archive(f):
+            pass
+
+
+def test_transcode():
+    path = make_archive(ZSTD)
+
+    transcode(path, "copy.tar.gz", GZIP)
+
+    with tarfile.open("copy.tar.gz", "r:gz") as tar:
+        member = tar.getmember("0123/gcd/job0/stepone/0/outputs/gcd.v")
+        assert tar.extractfile(member).read() == b"module gcd; endmodule"
+        assert member.pax_headers[DIGEST_HEADER] == \
+            hashlib.sha256(b"module gcd; endmodule").hexdigest()
+
+
+@pytest.mark.parametrize("compression", [ZSTD, GZIP])
+def test_extract_archive(compression):
+    path = make_archive(compression)
+
+    with open(path, "rb") as f:
+        assert extract_archive(f, "build", "0123") == 8
+
+    assert read("build/gcd/job0/stepone/0/outputs/gcd.v") == b"module gcd; endmodule"
+    assert read("build/gcd/job0/stepone/0/reports/area.rpt") == b"area: 10"
+    assert not os.path.exists("build/0123")
+
+
+def test_extract_archive_other_prefix():
+    path = make_archive(GZIP)
+
+    with open(path, "rb") as f:
+        assert extract_archive(f, "build", "4567") == 0
+
+    assert not os.path.exists("build")
+
+
+def test_extract_archive_unchanged_files():
+    '''Files which are already up to date are not written again'''
+    path = make_archive(ZSTD)
+    write("build/gcd/job0/stepone/0/outputs/gcd.v", b"module gcd; endmodule")
+    write("build/gcd/job0/stepone/0/reports/area.rpt", b"area: 20")
+    for name in ("outputs/gcd.v", "reports/area.rpt"):
+        os.utime(os.path.join("build/gcd/job0/stepone/0", name), ns=(0, 0))
+
+    with open(path, "rb") as f:
+        extract_archive(f, "build", "0123")
+
+    assert os.stat("build/gcd/job0/stepone/0/outputs/gcd.v").st_mtime_ns == 0
+    assert os.stat("build/gcd/job0/stepone/0/reports/area.rpt").st_mtime_ns != 0
+    assert read("build/gcd/job0/stepone/0/reports/area.rpt") == b"area: 10"
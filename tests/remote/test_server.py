@@ -1,19 +1,28 @@
+import asyncio
+import contextlib
+import glob
 import pytest
+import hashlib
 import json
 import os
 import requests
 import sys
 import tarfile
 import tempfile
+import threading
 import time
 
 import os.path
 
 from aiohttp import web
-from unittest.mock import Mock, AsyncMock, patch
+from aiohttp.test_utils import TestClient, TestServer
+from unittest.mock import Mock, AsyncMock, PropertyMock, patch
 from siliconcompiler import NodeStatus
+from siliconcompiler.remote.blobstore import BlobStore, GRACE_PERIOD, MAX_BLOB_SIZE
 from siliconcompiler.remote.server import Server
 from siliconcompiler.remote import JobStatus, NodeStatus as RemoteNodeStatus
+from siliconcompiler.remote.results import GZIP, ZSTD, archive_path, compressions, \
+    write_archive
 
 
 ###########################
@@ -1301,6 +1310,123 @@ async def test_handle_check_progress_claimed_job():
 # Routing
 ###########################
 
+###########################
+# handle_progress_stream
+###########################
+
+@contextlib.asynccontextmanager
+async def _progress_stream(server, params):
+    '''Open a 'progress_stream' request against the handler.'''
+    app = web.Application()
+    app.router.add_post('/progress_stream/', server.handle_progress_stream)
+    async with TestClient(TestServer(app)) as client:
+        async with client.post('/progress_stream/', data=json.dumps(params)) as resp:
+            yield resp
+
+
+async def _next_event(resp):
+    '''Read the next server-sent event, skipping comments.'''
+    while True:
+        block = (await resp.content.readuntil(b'\n\n')).decode('utf-8')
+        if not block:
+            return None
+        if block.startswith(':'):
+            continue
+        event, data = block.strip().split('\n')
+        return event[len('event: '):], json.loads(data[len('data: '):])
+
+
+@pytest.mark.asyncio
+async def test_handle_progress_stream():
+    '''Node changes are pushed as they happen, and the stream ends with the job'''
+    server = _make_server()
+    job_hash = '0' * 32
+    nodes = {'stepone0': {'status': NodeStatus.PENDING, 'step': 'stepone', 'index': '0'}}
+    job_name = _register_job(server, job_hash, nodes=nodes)
+
+    project = Mock()
+    project.get.return_value = job_hash
+    server.sc_project_lookup[project] = {'name': job_name, 'jobhash': job_hash}
+
+    async with _progress_stream(server, {'job_hash': job_hash}) as resp:
+        assert resp.status == 200
+        assert resp.headers['Content-Type'] == 'text/event-stream'
+
+        event, data = await _next_event(resp)
+        assert event == 'status'
+        assert data['status'] == JobStatus.RUNNING
+        assert data['message']['stepone0'] == {'status': NodeStatus.PENDING}
+        assert server.sc_job_listeners[job_name]
+
+        # Published by the job's thread
+        await asyncio.to_thread(server._Server__node_start, project, 'stepone', '0')
+        assert await _next_event(resp) == ('node_start', {'node': 'stepone0',
+                                                          'status': NodeStatus.RUNNING})
+
+        with patch.object(server, '_Server__run_job'):
+            await asyncio.to_thread(server.remote_sc, project, None)
+        assert await _next_event(resp) == ('job_end', {'status': JobStatus.COMPLETED})
+        assert await _next_event(resp) is None
+
+    assert server.sc_job_listeners == {}
+
+
+@pytest.mark.asyncio
+async def test_handle_progress_stream_not_running():
+    '''A job which is not running gets its status and nothing else'''
+    server = _make_server()
+
+    async with _progress_stream(server, {'job_hash': '0' * 32}) as resp:
+        assert await _next_event(resp) == ('status', {
+            'status': JobStatus.COMPLETED,
+            'message': 'Job has no running steps.'
+        })
+        assert await _next_event(resp) is None
+
+    assert server.sc_job_listeners == {}
+
+
+@pytest.mark.asyncio
+async def test_handle_progress_stream_keepalive():
+    '''A quiet job is told apart from a dropped connection'''
+    server = _make_server()
+    server.set('option', 'checkinterval', 1)
+    _register_job(server, '0' * 32)
+
+    async with _progress_stream(server, {'job_hash': '0' * 32}) as resp:
+        assert (await _next_event(resp))[0] == 'status'
+        assert await resp.content.readuntil(b'\n\n') == b': keepalive\n\n'
+
+
+@pytest.mark.asyncio
+async def test_handle_progress_stream_shutdown():
+    '''Shutting down ends the streams rather than waiting on them'''
+    server = _make_server()
+    _register_job(server, '0' * 32)
+
+    async with _progress_stream(server, {'job_hash': '0' * 32}) as resp:
+        assert (await _next_event(resp))[0] == 'status'
+
+        await server._Server__close_streams(None)
+        assert await _next_event(resp) is None
+
+    assert server.sc_job_listeners == {}
+
+
+@pytest.mark.asyncio
+async def test_handle_progress_stream_invalid_params():
+    '''The request is checked before the stream starts'''
+    server = _make_server()
+
+    mock_request = Mock()
+    mock_request.json = AsyncMock(return_value={'job_hash': 'notahash'})
+
+    response = await server.handle_progress_stream(mock_request)
+
+    assert response.status == 400
+    assert server.sc_job_listeners == {}
+
+
 def test_server_routes():
     '''Every documented endpoint is routed, and results are not served
        statically'''
@@ -1319,7 +1445,10 @@ def test_server_routes():
 
     assert routed == {
         ('POST', '/remote_run/'),
+        ('POST', '/check_blobs/'),
+        ('POST', '/upload_blob/'),
         ('POST', '/check_progress/'),
+        ('POST', '/progress_stream/'),
         ('POST', '/check_server/'),
         ('POST', '/cancel_job/'),
         ('POST', '/delete_job/'),
@@ -1407,8 +1536,9 @@ async def test_handle_remote_run_stages_upload(gcd_nop_project):
         assert mock_run.called
 
     assert os.listdir(server.staging_mount) == []
-    # The extracted job directory is what remains under the mount.
-    assert sorted(os.listdir(server.nfs_mount)) == ['.staging', job_hash]
+    # The extracted job directory is what remains under the mount, next to
+    # the record of the jobs.
+    assert sorted(os.listdir(server.nfs_mount)) == ['.jobs.sqlite', '.staging', job_hash]
 
 
 @pytest.mark.asyncio
@@ -1426,6 +1556,354 @@ async def test_handle_remote_run_removes_failed_upload(gcd_nop_project):
     assert os.listdir(server.staging_mount) == []
 
 
+###########################
+# Deduplicated uploads
+###########################
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _blob_request(params, data=None):
+    '''A mock multipart 'upload_blob' request.'''
+    parts = []
+    if params is not None:
+        parts.append(_MockPart('params', data=params))
+    if data is not None:
+        parts.append(_MockPart('data', chunks=[data[:3], data[3:]]))
+
+    class MockReader:
+        async def next(self):
+            if parts:
+                return parts.pop(0)
+            return None
+
+    request = Mock()
+
+    async def get_multipart():
+        return MockReader()
+    request.multipart = get_multipart
+    return request
+
+
+async def _upload_blob(server, data, **params):
+    request = _blob_request({'digest': _digest(data), 'offset': 0, **params}, data)
+    return await server.handle_upload_blob(request)
+
+
+def _files_request(cfg, files, **params):
+    '''A mock multipart 'remote_run' request for uploaded files.'''
+    request = _upload_request(cfg)
+    request_multipart = request.multipart
+
+    async def get_multipart():
+        reader = await request_multipart()
+        part = await reader.next()
+        part._data['params'] = {**params, 'files': files}
+        parts = [part]
+
+        class MockReader:
+            async def next(self):
+                if parts:
+                    return parts.pop(0)
+                return None
+        return MockReader()
+
+    request.multipart = get_multipart
+    return request
+
+
+@pytest.mark.asyncio
+async def test_handle_check_blobs():
+    '''Only the files the server does not have are requested'''
+    server = _make_server()
+
+    assert (await _upload_blob(server, b'stored')).status == 200
+    assert server._Server__blob_store(None).commit(_digest(b'stored'))
+
+    request = Mock()
+    request.json = AsyncMock(return_value={
+        'digests': [_digest(b'stored'), _digest(b'new')]})
+    response = await server.handle_check_blobs(request)
+
+    assert response.status == 200
+    assert json.loads(response.body) == {
+        'missing': [_digest(b'new')],
+        'chunk_size': 8 * 1024 * 1024
+    }
+
+
+@pytest.mark.asyncio
+async def test_handle_check_blobs_per_user():
+    '''A user cannot see the files of another user'''
+    server = _make_server(auth=True)
+    server.user_keys = {
+        'user1': {'password': 'key1'},
+        'user2': {'password': 'key2'}
+    }
+
+    data = b'secret'
+    response = await _upload_blob(server, data, username='user1', key='key1')
+    assert response.status == 200
+    assert server._Server__blob_store('user1').commit(_digest(data))
+
+    for username, key, missing in (('user1', 'key1', []),
+                                   ('user2', 'key2', [_digest(data)])):
+        request = Mock()
+        request.json = AsyncMock(return_value={
+            'username': username, 'key': key, 'digests': [_digest(data)]})
+        response = await server.handle_check_blobs(request)
+        assert json.loads(response.body)['missing'] == missing
+
+
+@pytest.mark.asyncio
+async def test_handle_check_blobs_invalid_digest():
+    '''Digests are checked before they reach the filesystem'''
+    server = _make_server()
+
+    request = Mock()
+    request.json = AsyncMock(return_value={'digests': ['../../etc/passwd']})
+    response = await server.handle_check_blobs(request)
+
+    assert response.status == 400
+
+
+def test_upload_chunk_size():
+    '''Chunks fit within the upload limit'''
+    server = _make_server()
+    server.set('option', 'maxuploadsize', 5)
+
+    assert server.upload_chunk_size == 5 * 1024 * 1024 // 2
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob():
+    '''Chunks are staged until the job that uses them is submitted'''
+    server = _make_server()
+
+    data = b'0123456789'
+    digest = _digest(data)
+    with patch.object(Server, 'upload_chunk_size', new_callable=PropertyMock,
+                      return_value=6):
+        request = _blob_request({'digest': digest, 'offset': 6}, data[6:])
+        assert (await server.handle_upload_blob(request)).status == 200
+        request = _blob_request({'digest': digest, 'offset': 0}, data[:6])
+        assert (await server.handle_upload_blob(request)).status == 200
+
+    store = server._Server__blob_store(None)
+    assert not store.has(digest)
+    assert store.commit(digest)
+    with open(store.path(digest), 'rb') as f:
+        assert f.read() == data
+    assert os.path.dirname(store.path(digest)).startswith(server.blob_mount)
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob_off_event_loop():
+    '''Chunks are written to disk without blocking the event loop'''
+    server = _make_server()
+
+    threads = []
+    write = BlobStore.write
+
+    def record_write(store, digest, offset):
+        threads.append(threading.current_thread())
+        return write(store, digest, offset)
+
+    with patch.object(BlobStore, 'write', autospec=True, side_effect=record_write):
+        assert (await _upload_blob(server, b'data')).status == 200
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset', [3, 8 * 1024 * 1024 + 1, MAX_BLOB_SIZE])
+async def test_handle_upload_blob_invalid_offset(offset):
+    '''Chunks start at a multiple of the chunk size, within the largest file'''
+    server = _make_server()
+
+    request = _blob_request({'digest': _digest(b'data'), 'offset': offset}, b'data')
+    response = await server.handle_upload_blob(request)
+
+    assert response.status == 400
+    assert 'Invalid chunk offset' in json.loads(response.body)['message']
+    assert not os.path.exists(server.staging_mount)
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob_offset_past_upload_limit():
+    '''A file cannot be larger than a whole job upload'''
+    server = _make_server()
+    server.set('option', 'maxuploadsize', 4)
+
+    chunk_size = server.upload_chunk_size
+    request = _blob_request({'digest': _digest(b'data'), 'offset': chunk_size}, b'data')
+    assert (await server.handle_upload_blob(request)).status == 200
+
+    request = _blob_request({'digest': _digest(b'data'), 'offset': 2 * chunk_size}, b'data')
+    assert (await server.handle_upload_blob(request)).status == 400
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob_chunk_too_large():
+    '''A chunk cannot be larger than the chunk size'''
+    server = _make_server()
+
+    with patch.object(Server, 'upload_chunk_size', new_callable=PropertyMock,
+                      return_value=4):
+        response = await _upload_blob(server, b'01234')
+
+    assert response.status == 400
+    assert 'Chunk is larger than 4 bytes' in json.loads(response.body)['message']
+    assert not os.path.exists(server.staging_mount)
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob_missing_parts():
+    '''A chunk needs its parameters first, then its data'''
+    server = _make_server()
+
+    response = await server.handle_upload_blob(_blob_request(None, b'data'))
+    assert response.status == 400
+    assert 'Upload parameters not provided' in json.loads(response.body)['message']
+
+    request = _blob_request({'digest': _digest(b'data'), 'offset': 0})
+    response = await server.handle_upload_blob(request)
+    assert response.status == 400
+    assert 'Upload data not provided' in json.loads(response.body)['message']
+
+
+@pytest.mark.asyncio
+async def test_handle_upload_blob_invalid_params():
+    '''The digest names the staged file, so it is checked first'''
+    server = _make_server()
+
+    request = _blob_request({'digest': '../escape', 'offset': 0}, b'data')
+    response = await server.handle_upload_blob(request)
+
+    assert response.status == 400
+    assert not os.path.exists(server.staging_mount)
+
+
+@pytest.mark.asyncio
+async def test_handle_remote_run_uploaded_files(gcd_nop_project):
+    '''The job directory is created from the uploaded files'''
+    server = _make_server()
+
+    source = b'module gcd; endmodule'
+    manifest = b'{}'
+    for data in (source, manifest):
+        assert (await _upload_blob(server, data)).status == 200
+
+    files = {
+        'sc_collected_files/gcd.v': {'digest': _digest(source), 'size': len(source)},
+        'gcd.pkg.json': {'digest': _digest(manifest), 'size': len(manifest)}
+    }
+    request = _files_request(gcd_nop_project.getdict(), files)
+
+    with patch.object(Server, 'remote_sc', autospec=True):
+        response = await server.handle_remote_run(request)
+        job_hash = json.loads(response.body)['job_hash']
+        assert response.status == 200
+        server.sc_job_threads[job_hash]['thread'].join(timeout=10)
+
+    job_dir = os.path.join(server.nfs_mount, job_hash, 'gcd', 'job0')
+    store = server._Server__blob_store(None)
+    assert os.path.samefile(os.path.join(job_dir, 'sc_collected_files', 'gcd.v'),
+                            store.path(_digest(source)))
+    with open(os.path.join(job_dir, 'gcd.pkg.json'), 'rb') as f:
+        assert f.read() == manifest
+    assert not os.path.samefile(os.path.join(job_dir, 'gcd.pkg.json'),
+                                store.path(_digest(manifest)))
+
+
+@pytest.mark.asyncio
+async def test_handle_delete_job_collects_blobs(gcd_nop_project):
+    '''Uploaded files are removed once no job uses them'''
+    server = _make_server()
+
+    source = b'module gcd; endmodule'
+    manifest = b'{}'
+    for data in (source, manifest):
+        assert (await _upload_blob(server, data)).status == 200
+    abandoned = b'abandoned'
+    request = _blob_request({'digest': _digest(abandoned), 'offset': 0}, abandoned)
+    assert (await server.handle_upload_blob(request)).status == 200
+
+    files = {
+        'sc_collected_files/gcd.v': {'digest': _digest(source), 'size': len(source)},
+        'gcd.pkg.json': {'digest': _digest(manifest), 'size': len(manifest)}
+    }
+    with patch.object(Server, 'remote_sc', autospec=True):
+        response = await server.handle_remote_run(_files_request(gcd_nop_project.getdict(),
+                                                                 files))
+        job_hash = json.loads(response.body)['job_hash']
+        server.sc_job_threads[job_hash]['thread'].join(timeout=10)
+    server.sc_jobs = {}
+
+    # Uploaded long ago
+    store = server._Server__blob_store(None)
+    then = time.time() - 2 * GRACE_PERIOD
+    for path in (store.path(_digest(source)), store.path(_digest(manifest)),
+                 *glob.glob(os.path.join(server.staging_mount, 'blobs', '*', '*.part'))):
+        os.utime(path, (then, then))
+
+    # The manifest is copied into the job, the sources are linked
+    server._Server__collect_blobs()
+    assert store.missing([_digest(source), _digest(manifest), _digest(abandoned)]) == \
+        sorted([_digest(manifest), _digest(abandoned)])
+    assert glob.glob(os.path.join(server.staging_mount, 'blobs', '*', '*.part')) == []
+
+    os.utime(store.path(_digest(source)), (then, then))
+    request = Mock()
+    request.json = AsyncMock(return_value={'job_hash': job_hash})
+    assert (await server.handle_delete_job(request)).status == 200
+    assert not store.has(_digest(source))
+
+
+@pytest.mark.asyncio
+async def test_handle_remote_run_missing_files(gcd_nop_project):
+    '''A job is not started until all of its files are uploaded'''
+    server = _make_server()
+
+    # Incomplete, so it does not match its digest
+    data = b'module gcd; endmodule'
+    request = _blob_request({'digest': _digest(data), 'offset': 0}, data[:5])
+    assert (await server.handle_upload_blob(request)).status == 200
+
+    files = {'gcd.v': {'digest': _digest(data)}}
+    request = _files_request(gcd_nop_project.getdict(), files)
+
+    with patch.object(Server, 'remote_sc', autospec=True) as mock_run:
+        response = await server.handle_remote_run(request)
+
+    assert response.status == 409
+    assert json.loads(response.body)['missing'] == [_digest(data)]
+    assert not mock_run.called
+    assert not server.sc_jobs
+    assert sorted(os.listdir(server.nfs_mount)) == ['.staging']
+
+
+@pytest.mark.asyncio
+async def test_handle_remote_run_unsafe_path(gcd_nop_project):
+    '''Uploaded files cannot be placed outside of the job directory'''
+    server = _make_server()
+
+    data = b'data'
+    assert (await _upload_blob(server, data)).status == 200
+
+    files = {'../../escape.txt': {'digest': _digest(data)}}
+    request = _files_request(gcd_nop_project.getdict(), files)
+
+    with patch.object(Server, 'remote_sc', autospec=True) as mock_run:
+        response = await server.handle_remote_run(request)
+
+    assert response.status == 400
+    assert not mock_run.called
+    assert sorted(os.listdir(server.nfs_mount)) == ['.blobs', '.staging']
+
+
 ###########################
 # Job bookkeeping
 ###########################
@@ -1520,6 +1998,239 @@ async def test_shutdown_with_no_jobs():
     assert not mock_halt.called
 
 
+###########################
+# Job queue
+###########################
+
+@pytest.fixture
+def queue_server(monkeypatch):
+    '''A server on four cores, whose jobs are started but never run'''
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1, 2, 3}, raising=False)
+
+    def make(**options):
+        server = _make_server(cluster=options.pop('cluster', 'local'))
+        for key, value in options.items():
+            server.set('option', key, value)
+        return server
+
+    with patch.object(Server, 'remote_sc', autospec=True):
+        yield make
+
+
+def _submit(server, project, job_hash, username=None):
+    '''Submit a copy of the project as a job, the way handle_remote_run does.'''
+    project = project.copy()
+    project.set('record', 'remoteid', job_hash)
+    server._Server__submit_job(project, username, job_hash)
+    return project
+
+
+def _end(server, project, username=None):
+    '''End a running job, the way remote_sc does.'''
+    job_name = server.job_name(username, project.get('record', 'remoteid'))
+    server._Server__end_job(job_name, project)
+
+
+def _running(server):
+    return {name: info['cpus'] for name, info in server.sc_job_threads.items()}
+
+
+def _queued(server):
+    return [job['name'] for job in server.sc_job_queue]
+
+
+def test_jobs_share_cores(queue_server, gcd_nop_project):
+    '''Jobs are given cores of their own, and wait for them when all are taken'''
+    server = queue_server(jobcores=2)
+
+    first = _submit(server, gcd_nop_project, '1' * 32)
+    _submit(server, gcd_nop_project, '2' * 32)
+    _submit(server, gcd_nop_project, '3' * 32)
+
+    assert _running(server) == {'1' * 32: [0, 1], '2' * 32: [2, 3]}
+    assert _queued(server) == ['3' * 32]
+    # A queued job is reported as waiting to run
+    assert server.sc_jobs['3' * 32]['stepone0']['status'] == NodeStatus.PENDING
+    assert server.job_store.get_job('3' * 32)['status'] == JobStatus.QUEUED
+
+    _end(server, first)
+
+    assert _running(server) == {'2' * 32: [2, 3], '3' * 32: [0, 1]}
+    assert _queued(server) == []
+    assert server.job_store.get_job('1' * 32)['status'] == JobStatus.COMPLETED
+    assert server.job_store.get_job('3' * 32)['status'] == JobStatus.RUNNING
+
+
+def test_jobs_use_all_cores_by_default(queue_server, gcd_nop_project):
+    '''Without a share per job, jobs run one at a time on every core'''
+    server = queue_server(cores=3)
+
+    _submit(server, gcd_nop_project, '1' * 32)
+    _submit(server, gcd_nop_project, '2' * 32)
+
+    assert _running(server) == {'1' * 32: [0, 1, 2]}
+    assert _queued(server) == ['2' * 32]
+
+
+def test_jobs_share_memory(queue_server, gcd_nop_project):
+    '''A job waits for the memory its nodes declare, unless it would run alone'''
+    server = queue_server(jobcores=1, memory=1000)
+    gcd_nop_project.option.scheduler.set_memory(600, step='steptwo', index='0')
+
+    first = _submit(server, gcd_nop_project, '1' * 32)
+    _submit(server, gcd_nop_project, '2' * 32)
+
+    assert list(_running(server)) == ['1' * 32]
+    assert server.sc_job_threads['1' * 32]['memory'] == 600 * 1024 * 1024
+
+    _end(server, first)
+    assert list(_running(server)) == ['2' * 32]
+
+
+def test_max_jobs(queue_server, gcd_nop_project):
+    '''Slurm jobs do not use the server's cores, but are still bounded'''
+    server = queue_server(cluster='slurm', maxjobs=2)
+
+    for job_hash in ('1' * 32, '2' * 32, '3' * 32):
+        _submit(server, gcd_nop_project, job_hash)
+
+    assert _running(server) == {'1' * 32: [], '2' * 32: []}
+    assert _queued(server) == ['3' * 32]
+
+
+def test_jobs_fair_across_users(queue_server, gcd_nop_project):
+    '''The next job is the oldest of the user with the fewest running jobs'''
+    server = queue_server(cluster='slurm', maxjobs=2)
+
+    first = _submit(server, gcd_nop_project, '1' * 32, username='alice')
+    _submit(server, gcd_nop_project, '2' * 32, username='alice')
+    _submit(server, gcd_nop_project, '3' * 32, username='alice')
+    _submit(server, gcd_nop_project, '4' * 32, username='bob')
+
+    _end(server, first, username='alice')
+
+    assert set(_running(server)) == {'alice_' + '2' * 32, 'bob_' + '4' * 32}
+    assert _queued(server) == ['alice_' + '3' * 32]
+
+
+def test_user_jobs(queue_server, gcd_nop_project):
+    '''A user's jobs beyond their limit do not hold up other users'''
+    server = queue_server(cluster='slurm', userjobs=1)
+
+    _submit(server, gcd_nop_project, '1' * 32, username='alice')
+    _submit(server, gcd_nop_project, '2' * 32, username='alice')
+    _submit(server, gcd_nop_project, '3' * 32, username='bob')
+
+    assert set(_running(server)) == {'alice_' + '1' * 32, 'bob_' + '3' * 32}
+    assert _queued(server) == ['alice_' + '2' * 32]
+
+
+def test_cancel_queued_job(queue_server, gcd_nop_project):
+    '''A queued job is canceled without ever starting'''
+    server = queue_server(maxjobs=1)
+
+    _submit(server, gcd_nop_project, '1' * 32)
+    _submit(server, gcd_nop_project, '2' * 32)
+
+    server._Server__cancel_job('2' * 32, '2' * 32)
+
+    assert _queued(server) == []
+    assert '2' * 32 not in server.sc_jobs
+    assert '2' * 32 not in server.sc_canceled_jobs
+    assert server.job_store.get_job('2' * 32)['status'] == JobStatus.CANCELED
+
+
+def test_remote_sc_confines_job(gcd_nop_project, monkeypatch):
+    '''A job's thread, and so its nodes, only run on the job's cores'''
+    server = _make_server()
+    job_hash = '1' * 32
+    gcd_nop_project.set('record', 'remoteid', job_hash)
+    server.sc_job_threads[job_hash] = {'thread': Mock(), 'jobhash': job_hash, 'cpus': [2, 3]}
+
+    pinned = []
+    monkeypatch.setattr(os, 'sched_setaffinity', lambda pid, cpus: pinned.append((pid, cpus)),
+                        raising=False)
+    monkeypatch.setattr(gcd_nop_project, 'run', lambda: True)
+
+    server.remote_sc(gcd_nop_project, None)
+
+    assert pinned == [(0, [2, 3])]
+
+
+def test_remote_sc_records_job(gcd_nop_project, monkeypatch):
+    '''The job store follows a job to its end'''
+    server = _make_server()
+    job_hash = '1' * 32
+    gcd_nop_project.set('record', 'remoteid', job_hash)
+    server.job_store.add(job_hash, job_hash, None)
+    monkeypatch.setattr(gcd_nop_project, 'run', lambda: True)
+
+    server.remote_sc(gcd_nop_project, None)
+
+    job = server.job_store.get_job(job_hash)
+    assert job['status'] == JobStatus.COMPLETED
+    assert set(job['nodes']) == {None, 'stepone0', 'steptwo0'}
+
+
+def test_resume_jobs(gcd_nop_project, caplog):
+    '''A restarted server runs the jobs it had not finished again'''
+    server = _make_server()
+    for job_hash, status in (('1' * 32, JobStatus.RUNNING), ('2' * 32, JobStatus.QUEUED),
+                             ('3' * 32, JobStatus.COMPLETED), ('4' * 32, JobStatus.RUNNING)):
+        server.job_store.add(job_hash, job_hash, None)
+        if status != JobStatus.QUEUED:
+            server.job_store.start(job_hash)
+        if status == JobStatus.COMPLETED:
+            server.job_store.end(job_hash, status)
+        if job_hash != '4' * 32:
+            project = gcd_nop_project.copy()
+            project.set('record', 'remoteid', job_hash)
+            os.makedirs(os.path.join(server.nfs_mount, job_hash))
+            project.write_manifest(server._Server__job_manifest(job_hash))
+
+    # As it comes back up
+    restarted = Server()
+    restarted.set('option', 'nfsmount', server.nfs_mount)
+    with patch.object(Server, 'remote_sc', autospec=True) as mock_run, \
+            patch("aiohttp.web.run_app"):
+        restarted.run()
+        for info in restarted.sc_job_threads.values():
+            info['thread'].join(timeout=10)
+
+    resumed = [call.args[1].get('record', 'remoteid') for call in mock_run.call_args_list]
+    assert resumed == ['1' * 32] and _queued(restarted) == ['2' * 32]
+    assert f"Resuming job: {'1' * 32}" in caplog.text
+    # Its manifest is gone, so it cannot run again
+    assert f"Unable to resume job {'4' * 32}" in caplog.text
+    assert restarted.job_store.get_job('4' * 32)['status'] == JobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_shutdown_requeues_running_jobs():
+    '''Jobs interrupted by a shutdown run again once the server is back'''
+    server = _make_server()
+    job_hash = '6' * 32
+    job_name = _register_job(server, job_hash)
+    server.job_store.add(job_name, job_hash, None)
+    server.job_store.start(job_name)
+
+    thread = Mock()
+    thread.is_alive.return_value = False
+    server.sc_job_threads[job_name] = {'thread': thread, 'jobhash': job_hash}
+
+    with patch("aiohttp.web.run_app"):
+        server.run()
+
+    server.app.freeze()
+    with patch('siliconcompiler.remote.server.TaskScheduler.halt_all'):
+        await server.app.cleanup()
+
+    # What the job's thread does once its run is halted
+    server._Server__end_job(job_name, None)
+
+    assert server.job_store.get_job(job_name)['status'] == JobStatus.QUEUED
+
+
 ###########################
 # Live server
 ###########################
@@ -1688,7 +2399,8 @@ def test_run_start_publishes_node_statuses():
 
     server._Server__run_start(project)
 
-    assert os.path.isfile(os.path.join(job_root, f'{job_hash}_None.tar.gz'))
+    assert os.path.isfile(archive_path(os.path.join(job_root, f'{job_hash}_None'),
+                                       compressions()[0]))
     assert server.sc_jobs[job_hash][None]['status'] == NodeStatus.SUCCESS
     assert server.sc_jobs[job_hash]['stepone0']['status'] == NodeStatus.SUCCESS
 
@@ -1731,12 +2443,108 @@ def test_node_end_archives_and_stops_the_clock():
 
     server._Server__node_end(project, 'stepone', '0')
 
-    assert os.path.isfile(os.path.join(job_root, f'{job_hash}_stepone0.tar.gz'))
+    assert os.path.isfile(archive_path(os.path.join(job_root, f'{job_hash}_stepone0'),
+                                       compressions()[0]))
     node = server.sc_jobs[job_hash]['stepone0']
     assert node['status'] == NodeStatus.SUCCESS
     assert node['endtime'] >= node['starttime']
 
 
+###########################
+# Result downloads
+###########################
+
+def _results_server(compression):
+    '''A server holding the results of a node, archived the way __node_end does.'''
+    server = _make_server()
+    job_hash = 'e' * 32
+    job_dir = os.path.join(server.nfs_mount, job_hash)
+    os.makedirs(os.path.join(job_dir, 'gcd'))
+    with open(os.path.join(job_dir, 'gcd', 'data.bin'), 'wb') as f:
+        f.write(os.urandom(64 * 1024))
+
+    path = archive_path(os.path.join(job_dir, f'{job_hash}_stepone0'), compression)
+    with write_archive(path, compression) as tar:
+        tar.add(os.path.join(job_dir, 'gcd'), arcname=f'{job_hash}/gcd')
+    return server, job_hash, path
+
+
+@contextlib.asynccontextmanager
+async def _get_results(server, job_hash, params, headers=None):
+    '''Send a 'get_results' request to the handler.'''
+    app = web.Application()
+    app.router.add_post('/get_results/{job_hash}.tar.gz', server.handle_get_results)
+    async with TestClient(TestServer(app)) as client:
+        async with client.post(f'/get_results/{job_hash}.tar.gz', data=json.dumps(params),
+                               headers=headers) as resp:
+            yield resp
+
+
+@pytest.mark.asyncio
+async def test_get_results_accepted_compression():
+    '''The archive is sent as it is stored to a client which can read it'''
+    server, job_hash, path = _results_server(ZSTD)
+
+    async with _get_results(server, job_hash,
+                            {'node': 'stepone0', 'compression': [ZSTD, GZIP]}) as resp:
+        assert resp.status == 200
+        with open(path, 'rb') as f:
+            assert await resp.read() == f.read()
+
+    assert not os.path.exists(archive_path(path[:-len('.tar.zst')], GZIP))
+
+
+@pytest.mark.asyncio
+async def test_get_results_transcodes_once():
+    '''A client which only reads gzip, as older clients do, is sent a gzip
+       copy, made the first time it is asked for'''
+    server, job_hash, path = _results_server(ZSTD)
+    gzip_path = archive_path(path[:-len('.tar.zst')], GZIP)
+
+    async with _get_results(server, job_hash, {'node': 'stepone0'}) as resp:
+        assert resp.status == 200
+        data = await resp.read()
+    assert data[:2] == b'\x1f\x8b'
+
+    mtime = os.stat(gzip_path).st_mtime_ns
+    async with _get_results(server, job_hash,
+                            {'node': 'stepone0', 'compression': [GZIP]}) as resp:
+        assert await resp.read() == data
+    assert os.stat(gzip_path).st_mtime_ns == mtime
+
+
+@pytest.mark.asyncio
+async def test_get_results_range():
+    '''A download which was cut off is resumed from where it stopped'''
+    server, job_hash, path = _results_server(GZIP)
+    with open(path, 'rb') as f:
+        archive = f.read()
+
+    async with _get_results(server, job_hash, {'node': 'stepone0'}) as resp:
+        etag = resp.headers['ETag']
+        assert resp.headers['Accept-Ranges'] == 'bytes'
+
+    async with _get_results(server, job_hash, {'node': 'stepone0'},
+                            headers={'Range': 'bytes=100-', 'If-Match': etag}) as resp:
+        assert resp.status == 206
+        assert resp.headers['Content-Range'] == f'bytes 100-{len(archive) - 1}/{len(archive)}'
+        assert await resp.read() == archive[100:]
+
+    # Not resumed from an archive which changed since
+    async with _get_results(server, job_hash, {'node': 'stepone0'},
+                            headers={'Range': 'bytes=100-', 'If-Match': '"other"'}) as resp:
+        assert resp.status == 412
+
+
+@pytest.mark.asyncio
+async def test_get_results_missing_node():
+    server, job_hash, _ = _results_server(ZSTD)
+
+    async with _get_results(server, job_hash,
+                            {'node': 'steptwo0', 'compression': [GZIP]}) as resp:
+        assert resp.status == 404
+
+
 ###########################
 # Remaining server paths
 ###########################
@@ -1880,7 +1880,7 @@ def test_get_job_topology_invalidated_by_skipped(mock_project, fake_console):
 @pytest.mark.timeout(30)
 def test_get_job_topology_distance_walk_runs_once(mock_project, fake_console,
                                                   monkeypatch):
-    """The recursive `get_node_distance` walk inside `_get_flow_topology`
+    """The node distance walk inside `_get_flow_topology`
     is the expensive piece we're trying to avoid. After the first call
     seeds the cache, status-only refreshes must not call it again.
 
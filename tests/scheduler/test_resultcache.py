@@ -0,0 +1,236 @@
+import json
+import os
+import time
+
+import pytest
+
+from pathlib import Path
+
+from siliconcompiler import Project, Design
+from siliconcompiler.scheduler.resultcache import ResultCache
+
+
+def _make_node(path, content="data", name="file.txt"):
+    os.makedirs(os.path.join(path, "outputs"), exist_ok=True)
+    with open(os.path.join(path, "outputs", name), "w") as f:
+        f.write(content)
+    with open(os.path.join(path, "journal.jsonl"), "w") as f:
+        f.write(json.dumps({"type": "set", "key": ["option", "quiet"], "value": True,
+                            "field": "value", "step": None, "index": None}))
+        f.write("\n")
+    return path
+
+
+def test_from_project_disabled():
+    assert ResultCache.from_project(Project(Design("test")), "syn", "0") is None
+
+
+def test_from_project():
+    proj = Project(Design("test"))
+    proj.option.set_cachedir("cache")
+    proj.option.set_resultcache(True, step="syn", index="0")
+    proj.option.set_resultcachesize(5)
+
+    assert ResultCache.from_project(proj, "place", "0") is None
+
+    cache = ResultCache.from_project(proj, "syn", "0")
+    assert cache.path == Path(os.path.abspath("cache")) / "results"
+    assert cache.max_size == 5 * 1024 * 1024
+
+
+def test_store_and_restore():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node")
+
+    assert not cache.has("abcdef")
+    assert cache.store("abcdef", node, "node/journal.jsonl") is True
+    assert cache.has("abcdef")
+
+    os.makedirs("restore/outputs")
+    with open("restore/outputs/stale.txt", "w") as f:
+        f.write("stale")
+
+    assert cache.restore("abcdef", "restore", "restore/journal.jsonl") is True
+    assert os.listdir("restore/outputs") == ["file.txt"]
+    with open("restore/outputs/file.txt") as f:
+        assert f.read() == "data"
+    with open("restore/journal.jsonl") as f:
+        assert json.loads(f.readline())["key"] == ["option", "quiet"]
+
+
+def test_store_existing():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node")
+
+    assert cache.store("abcdef", node, "node/journal.jsonl") is True
+    assert cache.store("abcdef", node, "node/journal.jsonl") is False
+
+
+def test_store_exclude():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node")
+    _make_node("node", name="design.pkg.json")
+
+    cache.store("abcdef", node, "node/journal.jsonl", exclude=["design.pkg.json"])
+    cache.restore("abcdef", "restore", "restore/journal.jsonl")
+    assert os.listdir("restore/outputs") == ["file.txt"]
+
+
+def test_store_info():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node")
+
+    cache.store("abcdef", node, "node/journal.jsonl", info={"tool": "yosys"})
+    with open("cache/ab/abcdef/entry.json") as f:
+        info = json.load(f)
+    assert info["key"] == "abcdef"
+    assert info["tool"] == "yosys"
+    assert info["size"] > 0
+    assert os.listdir("cache/tmp") == []
+
+
+def test_restore_missing():
+    cache = ResultCache("cache", 1024 * 1024)
+    assert cache.restore("abcdef", "restore", "restore/journal.jsonl") is False
+    assert not os.path.exists("restore")
+
+
+def test_evict_lru():
+    cache = ResultCache("cache", 2500)
+    node = _make_node("node", content="x" * 1000)
+
+    cache.store("aaaa", node, "node/journal.jsonl")
+    cache.store("bbbb", node, "node/journal.jsonl")
+
+    # use aaaa, so bbbb is the oldest
+    then = time.time() - 100
+    os.utime("cache/aa/aaaa/entry.json", (then, then))
+    os.utime("cache/bb/bbbb/entry.json", (then - 10, then - 10))
+    cache.restore("aaaa", "restore", "restore/journal.jsonl")
+
+    cache.store("cccc", node, "node/journal.jsonl")
+
+    assert cache.has("aaaa")
+    assert not cache.has("bbbb")
+    assert cache.has("cccc")
+    assert not os.path.exists("cache/bb/bbbb")
+    assert cache.size() <= 2500
+
+
+def test_evict_skips_uncommitted_entries():
+    '''Entries another process is still storing are neither counted nor removed'''
+    cache = ResultCache("cache", 1500)
+    node = _make_node("node", content="x" * 1000)
+    cache.store("aaaa", node, "node/journal.jsonl")
+
+    # written by store() before it takes the lock to commit the entry
+    pending = Path("cache/tmp/bbbb-0123")
+    os.makedirs(pending)
+    with open(pending / "entry.json", "w") as f:
+        json.dump({"key": "bbbb", "size": 1000}, f)
+
+    assert cache.size() < 1500
+    cache.evict()
+    assert cache.has("aaaa")
+    assert (pending / "entry.json").is_file()
+
+
+def test_restore_without_lock(monkeypatch):
+    '''Outputs are copied without holding the lock, and the entry cannot be
+    evicted while they are'''
+    from siliconcompiler.scheduler import resultcache
+
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node", content="x" * 1000)
+    cache.store("aaaa", node, "node/journal.jsonl")
+
+    copied = []
+
+    def copy_tree(src, dst, *args, **kwargs):
+        # Another node takes the lock and shrinks the cache while this one copies
+        ResultCache("cache", 0).evict()
+        copied.append(dst)
+        return real_copy_tree(src, dst, *args, **kwargs)
+
+    real_copy_tree = resultcache.copy_tree
+    monkeypatch.setattr(resultcache, "copy_tree", copy_tree)
+
+    assert cache.restore("aaaa", "restore", "restore/journal.jsonl") is True
+    assert len(copied) == 1
+    assert copied[0] != os.path.join("restore", "outputs")
+    assert sorted(os.listdir("restore")) == ["journal.jsonl", "outputs"]
+    with open("restore/outputs/file.txt") as f:
+        assert f.read() == "x" * 1000
+    assert cache.has("aaaa")
+    assert os.listdir("cache/pins") == []
+
+    # No longer in use
+    ResultCache("cache", 0).evict()
+    assert not cache.has("aaaa")
+
+
+def test_restore_failed_keeps_outputs(monkeypatch):
+    from siliconcompiler.scheduler import resultcache
+
+    cache = ResultCache("cache", 1024 * 1024)
+    cache.store("aaaa", _make_node("node"), "node/journal.jsonl")
+    _make_node("restore", content="previous")
+
+    def copy_tree(src, dst, *args, **kwargs):
+        os.makedirs(dst)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(resultcache, "copy_tree", copy_tree)
+
+    with pytest.raises(OSError, match="disk full"):
+        cache.restore("aaaa", "restore", "restore/journal.jsonl")
+    assert sorted(os.listdir("restore")) == ["journal.jsonl", "outputs"]
+    with open("restore/outputs/file.txt") as f:
+        assert f.read() == "previous"
+    assert os.listdir("cache/pins") == []
+
+
+def test_evict_ignores_stale_pins():
+    cache = ResultCache("cache", 1024 * 1024)
+    cache.store("aaaa", _make_node("node"), "node/journal.jsonl")
+
+    os.makedirs("cache/pins")
+    Path("cache/pins/aaaa-0123").touch()
+    ResultCache("cache", 0).evict()
+    assert cache.has("aaaa")
+
+    then = time.time() - 2 * 24 * 60 * 60
+    os.utime("cache/pins/aaaa-0123", (then, then))
+    ResultCache("cache", 0).evict()
+    assert not cache.has("aaaa")
+
+
+def test_evict():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node", content="x" * 1000)
+    cache.store("aaaa", node, "node/journal.jsonl")
+    cache.store("bbbb", node, "node/journal.jsonl")
+
+    ResultCache("cache", 1500).evict()
+    assert cache.size() <= 1500
+    assert cache.has("aaaa") != cache.has("bbbb")
+
+
+def test_clear():
+    cache = ResultCache("cache", 1024 * 1024)
+    node = _make_node("node")
+    cache.store("aaaa", node, "node/journal.jsonl")
+
+    cache.clear()
+    assert not cache.has("aaaa")
+    assert cache.size() == 0
+
+
+def test_lock_timeout():
+    cache = ResultCache("cache", 1024 * 1024, timeout=0)
+    other = ResultCache("cache", 1024 * 1024, timeout=0)
+
+    with cache.lock():
+        with pytest.raises(RuntimeError, match="Another thread is currently holding the lock"):
+            with other.lock():
+                pass
@@ -1,3 +1,4 @@
+import json
 import logging
 import logging.handlers
 import os
@@ -22,6 +23,7 @@ from siliconcompiler.tools.builtin.join import JoinTask
 from scheduler.tools.echo import EchoTask
 
 from siliconcompiler.utils.multiprocessing import MPManager
+from siliconcompiler.schema import Journal
 from siliconcompiler.scheduler import SchedulerNode
 from siliconcompiler.scheduler.schedulernode import SchedulerFlowReset, \
     SchedulerNodeReset, SchedulerNodeResetSilent
@@ -261,6 +263,18 @@ def test_get_manifest_input(project):
         node.workdir, "inputs", f"{node.name}.pkg.json")
 
 
+def test_get_journal(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    assert node.get_journal() == os.path.join(
+        node.workdir, f"{node.name}.journal.jsonl")
+
+
+def test_get_trace(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    assert node.get_trace() == os.path.join(
+        node.workdir, "sc_steptwo_0.trace.json")
+
+
 @pytest.mark.parametrize(
     "type,expect_name", [
         ("exe", "steptwo.log"),
@@ -286,6 +300,7 @@ def test_halt(project):
         node.halt()
     assert project.get("record", "status", step="steptwo", index="0") == NodeStatus.ERROR
     assert os.path.exists("build/testdesign/job0/steptwo/0/outputs/testdesign.pkg.json")
+    assert os.path.exists("build/testdesign/job0/steptwo/0/testdesign.journal.jsonl")
 
 
 def test_halt_sends_pathcache(project):
@@ -1369,6 +1384,49 @@ def test_setup_input_directory_directory(project):
     assert not os.path.isfile(input_dir / "dummy.pkg.json")
 
 
+def test_setup_input_directory_records_transfers(project):
+    output_dir = Path(workdir(project, step="stepone", index="0")) / "outputs"
+    input_dir = Path(workdir(project, step="steptwo", index="0")) / "inputs"
+    os.makedirs(output_dir / "dir0", exist_ok=True)
+    os.makedirs(input_dir, exist_ok=True)
+
+    (output_dir / "file0.txt").write_text("file0")
+    (output_dir / "dir0" / "file1.txt").write_text("file1")
+    (output_dir / "dir0" / "file2.txt").write_text("file2")
+
+    project.set("record", "inputnode", ("stepone", "0"), step="steptwo", index="0")
+    project.set("tool", "builtin", "task", "nop", "input", ["file0.txt", "dir0"],
+                step="steptwo", index="0")
+
+    node = SchedulerNode(project, "steptwo", "0")
+    assert node.get_transfers() == {}
+    with node.runtime():
+        node.setup_input_directory()
+
+    assert node.get_transfers() == {"hardlink": 3}
+    assert (input_dir / "dir0" / "file2.txt").read_text() == "file2"
+
+
+def test_setup_input_directory_transfer_error(project_logger, project, caplog):
+    output_dir = Path(workdir(project, step="stepone", index="0")) / "outputs"
+    input_dir = Path(workdir(project, step="steptwo", index="0")) / "inputs"
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(input_dir, exist_ok=True)
+    (output_dir / "file0.txt").write_text("file0")
+
+    project.set("record", "inputnode", ("stepone", "0"), step="steptwo", index="0")
+    project.set("tool", "builtin", "task", "nop", "input", "file0.txt", step="steptwo", index="0")
+
+    node = SchedulerNode(project, "steptwo", "0")
+    with patch("siliconcompiler.scheduler.schedulernode.transfer_file") as call_transfer:
+        call_transfer.side_effect = PermissionError("denied")
+        with node.runtime():
+            node.setup_input_directory()
+
+    assert node.get_transfers() == {}
+    assert f"Unable to transfer {output_dir / 'file0.txt'}: denied" in caplog.text
+
+
 def test_setup_input_directory_renames_dir(project):
     output_dir = Path(workdir(project, step="stepone", index="0")) / "outputs"
     input_dir = Path(workdir(project, step="steptwo", index="0")) / "inputs"
@@ -1625,6 +1683,157 @@ def test_run_pass(project):
     assert project.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
 
 
+def test_run_pass_journal(project):
+    project.write_manifest("before.pkg.json")
+
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+    node.run()
+
+    assert os.path.exists(node.get_journal())
+
+    # Journal file must contain the same transactions as the output manifest
+    with open(node.get_manifest()) as f:
+        manifest_journal = json.load(f)["__journal__"]
+    with open(node.get_journal()) as f:
+        file_journal = [json.loads(line) for line in f]
+    assert file_journal == manifest_journal
+
+    check = Project.from_manifest(filepath="before.pkg.json")
+    assert check.get("metric", "tasktime", step="stepone", index="0") is None
+    Journal.replay_file(check, node.get_journal())
+    assert check.get("metric", "tasktime", step="stepone", index="0") == \
+        project.get("metric", "tasktime", step="stepone", index="0")
+
+
+def test_run_pass_trace(project):
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+    node.run()
+
+    with open(node.get_trace()) as f:
+        events = json.load(f)["traceEvents"]
+    names = set(event["name"] for event in events)
+    assert {"process_name", "run", "setup_work_directory", "setup_input_directory",
+            "write_input_manifest", "validate", "execute", "pre_process", "check_version",
+            "run_task", "post_process", "check_logfile", "write_output_manifest"} <= names
+    assert all(event["pid"] == os.getpid() for event in events)
+    run_event = [event for event in events if event["name"] == "run"][0]
+    assert "transfers" not in run_event.get("args", {})
+
+    tasktime = project.get("metric", "tasktime", step="stepone", index="0")
+    overhead = project.get("metric", "overhead", step="stepone", index="0")
+    assert overhead is not None
+    assert 0 <= overhead <= tasktime
+
+
+def test_run_failed_trace(project):
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+
+    with patch("siliconcompiler.scheduler.SchedulerNode.validate") as call_validate:
+        call_validate.return_value = False
+        with pytest.raises(SystemExit):
+            node.run()
+
+    with open(node.get_trace()) as f:
+        events = json.load(f)["traceEvents"]
+    names = set(event["name"] for event in events)
+    assert {"run", "validate"} <= names
+    assert "execute" not in names
+
+
+def test_get_result_cache_key(project):
+    node = SchedulerNode(project, "stepone", "0")
+    with node.runtime():
+        key = node.get_result_cache_key()
+    assert len(key) == 64
+
+    with node.runtime():
+        assert node.get_result_cache_key() == key
+
+    project.set("tool", "builtin", "task", "nop", "option", "-new", step="stepone", index="0")
+    with node.runtime():
+        assert node.get_result_cache_key() != key
+
+
+def test_get_result_cache_key_inputs(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    os.makedirs(os.path.join(node.workdir, "inputs"))
+    with node.runtime():
+        key = node.get_result_cache_key()
+
+    with open(os.path.join(node.workdir, "inputs", "top.v"), "w") as f:
+        f.write("module top(); endmodule")
+    with node.runtime():
+        key_input = node.get_result_cache_key()
+    assert key_input != key
+
+    with open(os.path.join(node.workdir, "inputs", "top.v"), "w") as f:
+        f.write("module top(input a); endmodule")
+    with node.runtime():
+        assert node.get_result_cache_key() not in (key, key_input)
+
+    # input manifest is not part of the key
+    with open(node.get_manifest(input=True), "w") as f:
+        f.write("{}")
+    with node.runtime():
+        assert node.get_result_cache_key() not in (key, key_input)
+
+
+def test_get_result_cache_key_cached_digest(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    os.makedirs(os.path.join(node.workdir, "inputs"))
+    with open(os.path.join(node.workdir, "inputs", "top.v"), "w") as f:
+        f.write("module top(); endmodule")
+    os.utime(os.path.join(node.workdir, "inputs", "top.v"), (0, 0))
+
+    with node.runtime():
+        key = node.get_result_cache_key()
+
+    with patch("siliconcompiler.schema.filehash.digest_file") as call_digest:
+        with node.runtime():
+            assert node.get_result_cache_key() == key
+        call_digest.assert_not_called()
+
+
+def test_run_result_cache(project_logger, project, caplog):
+    project.option.set_cachedir("cache")
+    project.option.set_resultcache(True)
+    project_logger(project)
+
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+    node.run()
+    assert "Stored stepone/0 in result cache" in caplog.text
+
+    # run the same node in a different job
+    other = Project.from_manifest(filepath=node.get_manifest(input=True))
+    other.option.set_jobname("job1")
+    project_logger(other)
+    other_node = SchedulerNode(other, "stepone", "0")
+    other_node.task.setup_work_directory(other_node.workdir)
+    with patch("siliconcompiler.scheduler.SchedulerNode.execute") as call_execute:
+        other_node.run()
+        call_execute.assert_not_called()
+    assert "Restored stepone/0 from result cache" in caplog.text
+
+    assert other.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
+    assert other.get("metric", "tasktime", step="stepone", index="0") is not None
+    assert os.path.exists(other_node.get_manifest())
+    with open(other_node.get_manifest()) as f:
+        assert json.load(f)["__journal__"]
+
+
+def test_run_result_cache_disabled(project):
+    project.option.set_cachedir("cache")
+
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+    node.run()
+    assert not os.path.exists("cache/results")
+
+
 def test_run_pass_record(project):
     project.set("option", "track", True)
 
@@ -1689,6 +1898,21 @@ def test_run_pass_hash(project):
     assert project.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
 
 
+def test_run_pass_hash_cache(project):
+    project.set("option", "hash", True)
+    project.set("option", "cachedir", "cache")
+
+    node = SchedulerNode(project, "stepone", "0")
+    node.task.setup_work_directory(node.workdir)
+
+    with patch("siliconcompiler.schema.filehash.FileHashCache.load") as call_load:
+        node.run()
+        call_load.assert_any_call(os.path.abspath("cache/filehashes.json"))
+
+    assert os.path.isfile("cache/filehashes.json")
+    assert project.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
+
+
 def test_run_failed_to_validate(project_logger, project, caplog):
     project_logger(project)
     project.logger.setLevel(logging.INFO)
@@ -1,5 +1,7 @@
+import json
 import logging
 import multiprocessing
+import os
 import time
 import weakref
 
@@ -15,6 +17,7 @@ from siliconcompiler.scheduler import TaskScheduler
 from siliconcompiler.scheduler import taskscheduler as taskscheduler_module
 from siliconcompiler.scheduler.taskscheduler import utils as imported_utils
 from siliconcompiler.scheduler import SchedulerNode, SCRuntimeError
+from siliconcompiler.utils.paths import jobdir
 
 from siliconcompiler.tools.builtin.nop import NOPTask
 from siliconcompiler.tools.builtin.join import JoinTask
@@ -116,6 +119,22 @@ def test_run(large_flow, make_tasks):
         assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
 
 
+@pytest.mark.timeout(180)
+def test_run_trace(large_flow, make_tasks):
+    tasks = make_tasks(large_flow)
+    scheduler = TaskScheduler(large_flow, tasks)
+    scheduler.run(logging.NullHandler())
+
+    with open(os.path.join(jobdir(large_flow), "job.trace.json")) as f:
+        events = json.load(f)["traceEvents"]
+
+    processes = set(event["args"]["name"] for event in events if event["name"] == "process_name")
+    assert processes == {"scheduler", *[f"{step}/{index}" for step, index in tasks]}
+
+    started = set(event["args"]["node"] for event in events if event["name"] == "start_node")
+    assert started == set(f"{step}/{index}" for step, index in tasks)
+
+
 def test_log_queue_matches_start_method(large_flow, make_tasks):
     """The per-scheduler log queue must be fork-safe for the active start method.
 
@@ -416,7 +435,11 @@ def _setup_completed_node(scheduler, node, exitcode, *, pipe_has_data=False):
     proc.is_alive.return_value = False
     proc.exitcode = exitcode
     info["proc"] = proc
-    info["running"] = True
+    # Starting the node marks it as running, keep the status the test wrote
+    record = scheduler._TaskScheduler__record
+    status = record.get("status", step=node[0], index=node[1])
+    scheduler._TaskScheduler__start_node(node)
+    record.set("status", status, step=node[0], index=node[1])
 
     pipe = MagicMock()
     pipe.poll.return_value = pipe_has_data
@@ -697,10 +720,8 @@ def test_breakpoint_waits_for_running_nodes_to_drain(large_flow, make_tasks):
     _set_resources(scheduler, max_parallel=3)
 
     # Pretend an ordinary sibling is already running.
-    info = scheduler._TaskScheduler__nodes[("stepone", "1")]
-    info["running"] = True
     procs[("stepone", "1")].is_alive.return_value = True
-    large_flow.set("record", "status", NodeStatus.RUNNING, step="stepone", index="1")
+    scheduler._TaskScheduler__start_node(("stepone", "1"))
 
     # Breakpoint cannot start (something is running) and stepone/2 must be
     # held back so the machine can drain.
@@ -716,10 +737,8 @@ def test_breakpoint_runs_after_drain(large_flow, make_tasks):
     procs = _mock_all_procs(scheduler)
     _set_resources(scheduler, max_parallel=3)
 
-    info = scheduler._TaskScheduler__nodes[("stepone", "1")]
-    info["running"] = True
     procs[("stepone", "1")].is_alive.return_value = True
-    large_flow.set("record", "status", NodeStatus.RUNNING, step="stepone", index="1")
+    scheduler._TaskScheduler__start_node(("stepone", "1"))
 
     _launch(scheduler)
     assert scheduler.get_running_nodes() == [("stepone", "1")]
@@ -792,6 +811,40 @@ def test_no_breakpoint_respects_max_parallel(large_flow, make_tasks):
     assert scheduler.get_running_nodes() == [("stepone", "0"), ("stepone", "1")]
 
 
+def test_node_ready_after_last_input_completes(large_flow, make_tasks):
+    '''A node only becomes ready once every one of its inputs has finished.'''
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [
+        ("stepone", "0"), ("stepone", "1"), ("stepone", "2")]
+
+    _mark_done(scheduler, large_flow, ("stepone", "0"))
+    _mark_done(scheduler, large_flow, ("stepone", "1"))
+    assert _launch(scheduler) is False
+    assert scheduler.get_running_nodes() == [("stepone", "2")]
+    assert ("joinone", "0") in scheduler.get_nodes_waiting_to_run()
+
+    _mark_done(scheduler, large_flow, ("stepone", "2"))
+    assert _launch(scheduler) is True
+    assert scheduler.get_running_nodes() == [("joinone", "0")]
+    assert ("joinone", "0") not in scheduler.get_nodes_waiting_to_run()
+
+
+def test_node_with_completed_inputs_is_ready(large_flow, make_tasks):
+    '''Inputs which completed in a previous run do not block a node.'''
+    for n in range(3):
+        large_flow.set("record", "status", NodeStatus.SUCCESS, step="stepone", index=str(n))
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+
+    assert _launch(scheduler) is True
+    assert scheduler.get_running_nodes() == [("joinone", "0")]
+
+
 def test_breakpoint_node_with_failed_deps_is_pruned(large_flow, make_tasks):
     '''A breakpoint node whose dependencies failed must still be pruned (its
     proc cleared) rather than waiting forever for an isolated slot.'''
@@ -801,7 +854,8 @@ def test_breakpoint_node_with_failed_deps_is_pruned(large_flow, make_tasks):
     _set_resources(scheduler, max_parallel=3)
 
     # steptwo/* depend on joinone/0; mark it failed.
-    large_flow.set("record", "status", NodeStatus.ERROR, step="joinone", index="0")
+    scheduler._TaskScheduler__start_node(("joinone", "0"))
+    _mark_done(scheduler, large_flow, ("joinone", "0"), status=NodeStatus.ERROR)
 
     _launch(scheduler)
     info = scheduler._TaskScheduler__nodes[("steptwo", "0")]
@@ -975,3 +1029,207 @@ def test_halt_all_is_serialized(large_flow, make_tasks):
 
     assert errors == []
     assert state["peak"] == 1, "two threads halted the same run at once"
+
+
+def _record_tasktimes(proj, times):
+    '''Record a previous job with the given task times so the critical path
+    policy can estimate node runtimes.'''
+    for (step, index), runtime in times.items():
+        proj.set("metric", "tasktime", runtime, step=step, index=index)
+    proj._record_history()
+    for step, index in times:
+        proj.unset("metric", "tasktime", step=step, index=index)
+
+
+def test_priority_order_by_default(large_flow, make_tasks):
+    _record_tasktimes(large_flow, {("stepone", "2"): 100.0})
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=1)
+
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0")]
+
+
+def test_priority_critical_path(large_flow, make_tasks):
+    _record_tasktimes(large_flow, {
+        ("stepone", "0"): 1.0,
+        ("stepone", "1"): 5.0,
+        ("stepone", "2"): 100.0})
+    large_flow.option.scheduler.set_priority("critical_path")
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=1)
+
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "2")]
+
+    _mark_done(scheduler, large_flow, ("stepone", "2"))
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "1")]
+
+
+def test_priority_critical_path_downstream(large_flow, make_tasks):
+    _record_tasktimes(large_flow, {
+        ("stepone", "0"): 1.0,
+        ("stepone", "1"): 1.0,
+        ("stepone", "2"): 1.0,
+        ("steptwo", "0"): 1.0,
+        ("steptwo", "1"): 50.0,
+        ("steptwo", "2"): 1.0})
+    large_flow.option.scheduler.set_priority("critical_path")
+    tasks = make_tasks(large_flow)
+    for step in ("joinone", "jointwo", "jointhree"):
+        tasks[(step, "0")].set_builtin()
+    scheduler = TaskScheduler(large_flow, tasks)
+
+    priority = scheduler._TaskScheduler__priority
+    # steptwo1 is on the critical path of every node before it and joins are free
+    assert scheduler._TaskScheduler__weights[("joinone", "0")] == 0.0
+    assert priority[("steptwo", "1")] == 50.0 + priority[("jointwo", "0")]
+    assert priority[("joinone", "0")] == priority[("steptwo", "1")]
+    assert priority[("stepone", "0")] == 1.0 + priority[("joinone", "0")]
+
+
+def test_priority_critical_path_backfill(large_flow, make_tasks):
+    _record_tasktimes(large_flow, {
+        ("stepone", "0"): 1000.0,
+        ("stepone", "1"): 500.0,
+        ("stepone", "2"): 1.0})
+    large_flow.option.scheduler.set_priority("critical_path")
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+    scheduler._TaskScheduler__max_cores = 4
+
+    nodes = scheduler._TaskScheduler__nodes
+    nodes[("stepone", "0")]["threads"] = 2
+    nodes[("stepone", "1")]["threads"] = 4
+    nodes[("stepone", "2")]["threads"] = 2
+
+    # stepone1 needs the whole machine once stepone0 is done, stepone2 is
+    # short enough to run before then
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0"), ("stepone", "2")]
+
+
+def test_priority_critical_path_no_backfill(large_flow, make_tasks):
+    _record_tasktimes(large_flow, {
+        ("stepone", "0"): 10.0,
+        ("stepone", "1"): 500.0,
+        ("stepone", "2"): 100.0})
+    large_flow.option.scheduler.set_priority("critical_path")
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+    scheduler._TaskScheduler__max_cores = 4
+
+    nodes = scheduler._TaskScheduler__nodes
+    nodes[("stepone", "0")]["threads"] = 2
+    nodes[("stepone", "1")]["threads"] = 4
+    nodes[("stepone", "2")]["threads"] = 2
+
+    # Start stepone0 first, stepone2 would delay stepone1
+    scheduler._TaskScheduler__start_node(("stepone", "0"))
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0")]
+
+
+def test_memory_declared(large_flow, make_tasks):
+    large_flow.option.scheduler.set_memory(2000, step="stepone", index="1")
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+
+    nodes = scheduler._TaskScheduler__nodes
+    assert nodes[("stepone", "1")]["memory"] == 2000 * 1024 * 1024
+    assert nodes[("stepone", "0")]["memory"] == 0
+
+
+def test_memory_from_history(large_flow, make_tasks):
+    large_flow.set("metric", "memory", 1000, step="stepone", index="0")
+    large_flow.set("metric", "memory", 3000, step="stepone", index="1")
+    large_flow._record_history()
+    large_flow.unset("metric", "memory", step="stepone", index="0")
+    large_flow.unset("metric", "memory", step="stepone", index="1")
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+
+    nodes = scheduler._TaskScheduler__nodes
+    assert nodes[("stepone", "0")]["memory"] == 1000
+    assert nodes[("stepone", "1")]["memory"] == 3000
+    # same tool and task, uses the peak
+    assert nodes[("stepone", "2")]["memory"] == 3000
+    assert nodes[("steptwo", "0")]["memory"] == 3000
+    assert nodes[("joinone", "0")]["memory"] == 0
+
+
+def _set_memory(monkeypatch, available, used=0):
+    '''Pin the memory available on the machine, and the memory each running
+    node process uses, in MB.'''
+    monkeypatch.setattr(TaskScheduler, "_TaskScheduler__get_available_memory",
+                        staticmethod(lambda: available * 1024 * 1024))
+    monkeypatch.setattr(TaskScheduler, "_TaskScheduler__get_process_memory",
+                        staticmethod(lambda pid: used * 1024 * 1024))
+
+
+def test_memory_admission(large_flow, make_tasks, monkeypatch):
+    for index in range(3):
+        large_flow.option.scheduler.set_memory(1000, step="stepone", index=str(index))
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+    _set_memory(monkeypatch, 2500)
+
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0"), ("stepone", "1")]
+
+    _mark_done(scheduler, large_flow, ("stepone", "0"))
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "1"), ("stepone", "2")]
+
+
+def test_memory_admission_resamples(large_flow, make_tasks, monkeypatch):
+    '''Memory freed or taken by other processes during the run is seen'''
+    for index in range(3):
+        large_flow.option.scheduler.set_memory(1000, step="stepone", index=str(index))
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=3)
+
+    _set_memory(monkeypatch, 1500)
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0")]
+
+    # Another process exited; the running node has not allocated anything yet
+    _set_memory(monkeypatch, 2500)
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0"), ("stepone", "1")]
+
+
+def test_memory_admission_counts_running_usage(large_flow, make_tasks, monkeypatch):
+    '''Memory the running nodes already use is still theirs to use'''
+    for index in range(3):
+        large_flow.option.scheduler.set_memory(1000, step="stepone", index=str(index))
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=2)
+
+    _set_memory(monkeypatch, 1500)
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0")]
+
+    # The running node took 1000 MB of the 2500 MB left for the run
+    _set_memory(monkeypatch, 1500, used=1000)
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0"), ("stepone", "1")]
+
+
+def test_memory_admission_runs_alone(large_flow, make_tasks, monkeypatch):
+    large_flow.option.scheduler.set_memory(1000, step="stepone", index="0")
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    _mock_all_procs(scheduler)
+    _set_resources(scheduler, max_parallel=1)
+    _set_memory(monkeypatch, 500)
+
+    # larger than the machine but nothing else is running
+    _launch(scheduler)
+    assert scheduler.get_running_nodes() == [("stepone", "0")]
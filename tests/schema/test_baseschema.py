@@ -85,6 +85,29 @@ def test_copy_with_child_default():
         check_copy.get("test0", field="schema")
 
 
+def test_copy_independent_values():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test2", Parameter("[str]"))
+    edit.insert("test1", Parameter("str"))
+
+    assert schema.set("test0", "testthis", "test2", ["one"])
+    assert schema.set("test1", "one")
+
+    check_copy = schema.copy()
+
+    assert check_copy.add("test0", "testthis", "test2", "two")
+    assert schema.set("test1", "two")
+    assert check_copy.set("test0", "other", "test2", ["three"])
+
+    assert schema.get("test0", "testthis", "test2") == ["one"]
+    assert check_copy.get("test0", "testthis", "test2") == ["one", "two"]
+    assert schema.get("test1") == "two"
+    assert check_copy.get("test1") == "one"
+    assert schema.getkeys("test0") == ("testthis",)
+    assert check_copy.getkeys("test0") == ("other", "testthis")
+
+
 def test_get_value():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -470,6 +493,123 @@ def test_allkeys_end_parameter():
     assert schema.allkeys("test1", "test3") == set()
 
 
+def test_iter_params():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    edit.insert("test1", Parameter("file"))
+
+    assert schema.set("test0", "test2", "test1", "hello")
+
+    params = dict(schema.iter_params())
+    assert set(params.keys()) == schema.allkeys()
+    for keypath, param in params.items():
+        assert param is schema.get(*keypath, field=None)
+
+    assert set(dict(schema.iter_params(include_default=False)).keys()) == \
+        schema.allkeys(include_default=False)
+    assert set(dict(schema.iter_params("test0")).keys()) == schema.allkeys("test0")
+
+
+def test_iter_params_invalid():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+
+    assert list(schema.iter_params("notthis")) == []
+    assert list(schema.iter_params("test0", "test1")) == []
+
+
+def test_iter_params_kind():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("str", Parameter("str"))
+    edit.insert("file", Parameter("[file]"))
+    edit.insert("dir", Parameter("dir"))
+
+    assert [key for key, _ in schema.iter_params(kind="path")] == [("file",), ("dir",)]
+    assert [key for key, _ in schema.iter_params(kind="file")] == [("file",)]
+    assert [key for key, _ in schema.iter_params(kind="dir")] == [("dir",)]
+
+    with pytest.raises(ValueError, match="^int is not a valid parameter kind$"):
+        list(schema.iter_params(kind="int"))
+
+
+def test_iter_params_updates():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+
+    assert set(dict(schema.iter_params()).keys()) == {("test0", "default", "test1")}
+
+    # default materialization
+    assert schema.set("test0", "test2", "test1", "hello")
+    assert set(dict(schema.iter_params()).keys()) == {
+        ("test0", "default", "test1"),
+        ("test0", "test2", "test1")
+    }
+
+    # insert below the root
+    EditableSchema(schema.get("test0", "test2", field="schema")).insert("test3", Parameter("str"))
+    assert ("test0", "test2", "test3") in dict(schema.iter_params())
+
+    # remove
+    schema.remove("test0", "test2")
+    assert set(dict(schema.iter_params()).keys()) == {("test0", "default", "test1")}
+
+    edit.remove("test0", "default", "test1")
+    assert list(schema.iter_params()) == []
+
+
+def test_iter_params_copy():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    list(schema.iter_params())
+
+    schema_copy = schema.copy()
+    assert schema_copy.set("test0", "test2", "test1", "hello")
+
+    assert set(dict(schema.iter_params()).keys()) == {("test0", "default", "test1")}
+    for keypath, param in schema_copy.iter_params():
+        assert param is schema_copy.get(*keypath, field=None)
+
+
+def test_iter_params_from_dict():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert schema.set("test0", "test2", "test1", "hello")
+    manifest = schema.getdict()
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert set(dict(schema.iter_params()).keys()) == {("test0", "default", "test1")}
+
+    schema._from_dict(manifest, [])
+    params = dict(schema.iter_params())
+    assert set(params.keys()) == {
+        ("test0", "default", "test1"),
+        ("test0", "test2", "test1")
+    }
+    assert params[("test0", "test2", "test1")].get() == "hello"
+
+
+def test_get_param():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert schema.set("test0", "test2", "test1", "hello")
+
+    assert schema._get_param("test0", "test2", "test1").get() == "hello"
+    assert schema._get_param("test0", "test3", "test1") is \
+        schema.get("test0", "default", "test1", field=None)
+
+    with pytest.raises(KeyError):
+        schema._get_param("test0", "test2", "test4")
+
+
 def test_getdict():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -1029,6 +1169,260 @@ def test_write_manifest_gz_stdjson(monkeypatch):
     assert os.path.isfile("test.json.gz")
 
 
+@pytest.mark.parametrize("stdjson", (False, True))
+def test_write_manifest_zst(monkeypatch, stdjson):
+    import json
+    from siliconcompiler.schema import baseschema
+    if stdjson:
+        monkeypatch.setattr(baseschema, 'json', json)
+        monkeypatch.setattr(baseschema, '_has_orjson', False)
+
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str", help="long help", shorthelp="short"))
+            edit.insert("test0", "test2", Parameter("[file]", help="long help",
+                                                    example=["cli: -a", "api: a"]))
+            edit.insert("default", "test3", Parameter("int", help="long help"))
+            edit.insert("empty", BaseSchema())
+
+        def _getdict_meta(self):
+            return {"path": Path("/some/path")}
+
+    schema = NewSchema()
+    schema.set("test0", "test1", "µm_Ω")
+    schema.set("test0", "test2", ["a.v", "b.v"])
+    schema.set("key", "test3", 5)
+
+    assert not os.path.isfile("test.json.zst")
+    schema.write_manifest("test.json.zst")
+    assert os.path.isfile("test.json.zst")
+
+    assert BaseSchema._read_manifest("test.json.zst") == \
+        json.loads(json.dumps(schema.getdict(), default=str))
+
+    with baseschema.zstd.open("test.json.zst", "rb") as f:
+        raw = json.loads(f.read())
+    assert raw["__strings__"].count("long help") == 1
+    assert raw["test0"]["test1"]["help"] == raw["test0"]["test2"]["help"]
+
+
+def test_write_manifest_zst_lazy():
+    from siliconcompiler.schema import baseschema
+
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test2", Parameter("str", help="long help"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    schema = NewSchema()
+    schema.set("test0", "test2", "testthis")
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        new_schema = NewSchema.from_manifest(cfg=schema.getdict(), lazyload=True)
+        assert new_schema._BaseSchema__lazy
+
+        new_schema.write_manifest("test.json.zst")
+        assert new_schema._BaseSchema__lazy
+
+        with baseschema.zstd.open("test.json.zst", "rb") as f:
+            assert b"long help" not in f.read().split(b'"__strings__"')[0]
+
+        assert BaseSchema._read_manifest("test.json.zst") == schema.getdict()
+
+
+def test_write_manifest_zst_no_zstd(monkeypatch):
+    from siliconcompiler.schema import baseschema
+    monkeypatch.setattr(baseschema, '_has_zstd', False)
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+
+    with pytest.raises(RuntimeError, match=r"^zstd is not available$"):
+        schema.write_manifest("test.json.zst")
+    assert not os.path.isfile("test.json.zst")
+
+
+def test_read_manifest_zst_no_zstd(monkeypatch):
+    from siliconcompiler.schema import baseschema
+
+    schema = BaseSchema()
+    schema.write_manifest("test.json.zst")
+
+    monkeypatch.setattr(baseschema, '_has_zstd', False)
+    with pytest.raises(RuntimeError, match=r"^zstd is not available$"):
+        BaseSchema._read_manifest("test.json.zst")
+
+
+def test_from_manifest_file_zst():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str", help="long help"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    schema = NewSchema()
+    schema.set("test0", "test1", "testthis")
+    schema.write_manifest("test.json.zst")
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        new_schema = NewSchema.from_manifest(filepath="test.json.zst")
+
+    assert new_schema.getdict() == schema.getdict()
+    assert new_schema.get("test0", "test1", field="help") == "long help"
+
+
+@pytest.mark.parametrize("filename", ("test.json", "test.json.zst"))
+def test_write_manifest_no_definitions(filename):
+    class ChildSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test4", Parameter("str", help="child help"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "ChildSchema"
+
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str", help="long help"))
+            edit.insert("test0", "test2", Parameter("str", help="long help"))
+            edit.insert("lib", "default", "test3", Parameter("int", help="default help"))
+            edit.insert("child", "default", ChildSchema())
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    schema = NewSchema()
+    schema.set("test0", "test1", "testthis")
+    schema.set("test0", "test2", "changed help", field="help")
+    schema.set("lib", "key", "test3", 5)
+    schema.set("child", "key", "test4", "childvalue")
+    EditableSchema(schema).insert("test0", "added", Parameter("str"))
+    schema.set("test0", "added", "addedvalue")
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema,
+            "ChildSchema": ChildSchema
+        }
+        schema.write_manifest(filename, definitions=False)
+        new_schema = BaseSchema.from_manifest(filepath=filename, lazyload=False)
+        schema.write_manifest("full.json")
+        full_schema = BaseSchema.from_manifest(filepath="full.json", lazyload=False)
+
+    raw = BaseSchema._read_manifest(filename)
+    assert raw["__values__"] is True
+    assert raw["test0"]["test1"] == {"node": {"*": {"*": {"value": "testthis",
+                                                          "signature": None}}}}
+    assert raw["lib"]["key"]["test3"] == {"node": {"*": {"*": {"value": 5, "signature": None}}}}
+    assert "type" not in raw["child"]["key"]["test4"]
+    assert raw["child"]["key"]["__meta__"]["sctype"] == "ChildSchema"
+    assert raw["test0"]["test2"]["help"] == "changed help"
+    assert raw["test0"]["added"]["type"] == "str"
+    assert raw["__meta__"]["sctype"] == "NewSchema"
+
+    assert new_schema.__class__ is NewSchema
+    assert new_schema.getdict() == full_schema.getdict()
+    assert new_schema.get("test0", "test1") == "testthis"
+    assert new_schema.get("test0", "test1", field="help") == "long help"
+    assert new_schema.get("test0", "test2", field="help") == "changed help"
+    assert new_schema.get("child", "key", "test4") == "childvalue"
+    assert new_schema.get("child", "key", "test4", field="help") == "child help"
+
+
+def test_write_manifest_no_definitions_unknown_class():
+    import json
+
+    schema = BaseSchema()
+    EditableSchema(schema).insert("test0", Parameter("str", help="long help"))
+    schema.set("test0", "testthis")
+
+    schema.write_manifest("test.json", definitions=False)
+    with open("test.json") as f:
+        assert json.load(f) == {**schema.getdict(), "__values__": True}
+
+
+def test_write_manifest_no_definitions_version():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert(BaseSchema._version_key, Parameter("str", defvalue="0.50.0"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        NewSchema().write_manifest("test.json", definitions=False)
+
+    assert BaseSchema._read_manifest("test.json")[BaseSchema._version_key]["type"] == "str"
+
+
+def test_write_manifest_no_definitions_lazy():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str", help="long help"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    schema = NewSchema()
+    schema.set("test0", "test1", "testthis")
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        schema.write_manifest("test.json", definitions=False)
+        new_schema = NewSchema.from_manifest(filepath="test.json")
+        assert new_schema._BaseSchema__lazy
+
+        # Written as loaded
+        new_schema.write_manifest("test2.json", definitions=False)
+        assert new_schema._BaseSchema__lazy
+        assert BaseSchema._read_manifest("test2.json") == BaseSchema._read_manifest("test.json")
+
+        # Full manifest is rebuilt
+        assert NewSchema.from_manifest(filepath="test.json").getdict("test0") == \
+            schema.getdict("test0")
+        assert new_schema.getdict() == schema.getdict()
+        assert NewSchema.from_manifest(filepath="test2.json").getdict() == schema.getdict()
+
+
 def test_from_manifest_file():
     from siliconcompiler.schema.baseschema import _has_orjson
     assert _has_orjson
@@ -1439,7 +1833,7 @@ def test_forward_exception_with_key_get(error, monkeypatch):
 
     def dummy_get(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'get', dummy_get)
+    monkeypatch.setattr(Parameter, 'get', dummy_get)
 
     with pytest.raises(error,
                        match=r"^error while accessing \[test0,test1\]: "
@@ -1456,7 +1850,7 @@ def test_forward_exception_with_key_set(error, monkeypatch):
 
     def dummy_set(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'set', dummy_set)
+    monkeypatch.setattr(Parameter, 'set', dummy_set)
 
     with pytest.raises(error,
                        match=r"^error while setting \[test0,test1\]: "
@@ -1473,7 +1867,7 @@ def test_forward_exception_with_key_add(error, monkeypatch):
 
     def dummy_add(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'add', dummy_add)
+    monkeypatch.setattr(Parameter, 'add', dummy_add)
 
     with pytest.raises(error,
                        match=r"^error while adding to \[test0,test1\]: "
@@ -1490,7 +1884,7 @@ def test_forward_exception_with_key_unset(error, monkeypatch):
 
     def dummy_unset(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'unset', dummy_unset)
+    monkeypatch.setattr(Parameter, 'unset', dummy_unset)
 
     with pytest.raises(error,
                        match=r"^error while unsetting \[test0,test1\]: "
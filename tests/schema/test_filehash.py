@@ -0,0 +1,291 @@
+import hashlib
+import json
+import os
+import time
+
+import pytest
+
+from siliconcompiler.schema import filehash
+from siliconcompiler.schema.filehash import FileHashCache, digest_file, update_hash
+
+
+def _write(path, content, age=10):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", newline="\n") as f:
+        f.write(content)
+    # move out of the racy window
+    then = time.time() - age
+    os.utime(path, (then, then))
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    reads = []
+
+    orig_digest_file = filehash.digest_file
+    orig_update_hash = filehash.update_hash
+    orig_read_file = filehash.read_file
+
+    def dummy_digest_file(filename, hashfunc):
+        reads.append(os.path.basename(filename))
+        return orig_digest_file(filename, hashfunc)
+
+    def dummy_update_hash(hashobj, filename):
+        reads.append(os.path.basename(filename))
+        return orig_update_hash(hashobj, filename)
+
+    def dummy_read_file(filename):
+        reads.append(os.path.basename(filename))
+        return orig_read_file(filename)
+
+    monkeypatch.setattr(filehash, "digest_file", dummy_digest_file)
+    monkeypatch.setattr(filehash, "read_file", dummy_read_file)
+    monkeypatch.setattr(filehash, "update_hash", dummy_update_hash)
+    return reads
+
+
+@pytest.mark.parametrize("size", [0, 10, filehash.BUFFER_SIZE + 10])
+def test_digest_file(size):
+    data = os.urandom(size)
+    with open("file.bin", "wb") as f:
+        f.write(data)
+
+    assert digest_file("file.bin", hashlib.sha256) == hashlib.sha256(data).hexdigest()
+
+    hashobj = hashlib.md5()
+    update_hash(hashobj, "file.bin")
+    assert hashobj.hexdigest() == hashlib.md5(data).hexdigest()
+
+
+def test_hash_file_cached(count_reads):
+    _write("file.txt", "foobar\n")
+
+    cache = FileHashCache()
+    assert cache.hash_file("file.txt", "md5", hashlib.md5) == \
+        hashlib.md5(b"foobar\n").hexdigest()
+    assert cache.hash_file(os.path.abspath("file.txt"), "md5", hashlib.md5) == \
+        hashlib.md5(b"foobar\n").hexdigest()
+    assert count_reads == ["file.txt"]
+    assert len(cache) == 1
+
+
+def test_hash_file_per_algorithm(count_reads):
+    _write("file.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+    assert cache.hash_file("file.txt", "sha1", hashlib.sha1) == \
+        hashlib.sha1(b"foobar\n").hexdigest()
+    assert count_reads == ["file.txt", "file.txt"]
+
+
+def test_hash_file_changed(count_reads):
+    _write("file.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+
+    _write("file.txt", "foobaz\n", age=5)
+    assert cache.hash_file("file.txt", "md5", hashlib.md5) == \
+        hashlib.md5(b"foobaz\n").hexdigest()
+    assert count_reads == ["file.txt", "file.txt"]
+
+
+def test_hash_file_racy(count_reads):
+    with open("file.txt", "w") as f:
+        f.write("foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+    assert count_reads == ["file.txt", "file.txt"]
+    assert len(cache) == 0
+
+
+def test_hash_file_missing():
+    with pytest.raises(FileNotFoundError):
+        FileHashCache().hash_file("file.txt", "md5", hashlib.md5)
+
+
+def test_hash_directory(count_reads):
+    _write("dir/foo.txt", "foobar\n")
+    _write("dir/sub/foo1.txt", "foobar\n")
+
+    expect = hashlib.md5()
+    expect.update(b"foo.txt")
+    expect.update(b"foobar\n")
+    expect.update(b"sub/foo1.txt")
+    expect.update(b"foobar\n")
+
+    cache = FileHashCache()
+    assert cache.hash_directory("dir", "md5", hashlib.md5) == expect.hexdigest()
+    assert cache.hash_directory("dir", "md5", hashlib.md5) == expect.hexdigest()
+    assert count_reads == ["foo.txt", "foo1.txt"]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 20, filehash.READ_AHEAD_SIZE])
+def test_hash_directory_read_ahead(monkeypatch, read_ahead):
+    '''Files read ahead are hashed in the same order as files read one at a time'''
+    monkeypatch.setattr(filehash, "READ_AHEAD_SIZE", read_ahead)
+
+    expect = hashlib.sha256()
+    for n in range(20):
+        content = f"file{n}\n" * n
+        _write(f"dir/{n // 5}/file{n}.txt", content)
+        expect.update(f"{n // 5}/file{n}.txt".encode("utf-8"))
+        expect.update(content.encode("utf-8"))
+
+    assert FileHashCache().hash_directory("dir", "sha256", hashlib.sha256) == \
+        expect.hexdigest()
+
+
+def test_hash_directory_read_failed(monkeypatch):
+    _write("dir/foo.txt", "foobar\n")
+    _write("dir/foo1.txt", "foobar\n")
+
+    def read_file(filename):
+        raise PermissionError(filename)
+
+    monkeypatch.setattr(filehash, "read_file", read_file)
+
+    cache = FileHashCache()
+    with pytest.raises(PermissionError):
+        cache.hash_directory("dir", "md5", hashlib.md5)
+    assert len(cache) == 0
+
+
+def test_hash_directory_changed(count_reads):
+    _write("dir/foo.txt", "foobar\n")
+    _write("dir/foo1.txt", "foobar\n")
+
+    cache = FileHashCache()
+    digest = cache.hash_directory("dir", "md5", hashlib.md5)
+
+    os.rename("dir/foo1.txt", "dir/foo2.txt")
+    assert cache.hash_directory("dir", "md5", hashlib.md5) != digest
+    assert count_reads == ["foo.txt", "foo1.txt", "foo.txt", "foo2.txt"]
+
+
+def test_hash_directory_empty():
+    os.makedirs("dir")
+    assert FileHashCache().hash_directory("dir", "md5", hashlib.md5) is None
+
+
+def test_save_and_load(count_reads):
+    _write("file.txt", "foobar\n")
+    _write("dir/foo.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+    cache.hash_directory("dir", "md5", hashlib.md5)
+    cache.save("cache/hashes.json")
+
+    new_cache = FileHashCache()
+    new_cache.load("cache/hashes.json")
+    assert len(new_cache) == 2
+    new_cache.hash_file("file.txt", "md5", hashlib.md5)
+    new_cache.hash_directory("dir", "md5", hashlib.md5)
+    assert count_reads == ["file.txt", "foo.txt"]
+
+
+def test_save_merges():
+    _write("file1.txt", "foobar\n")
+    _write("file2.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file1.txt", "md5", hashlib.md5)
+    cache.save("hashes.json")
+
+    other = FileHashCache()
+    other.hash_file("file2.txt", "md5", hashlib.md5)
+    other.save("hashes.json")
+
+    with open("hashes.json") as f:
+        data = json.load(f)
+    assert sorted(data["files"]["md5"].keys()) == \
+        [os.path.abspath("file1.txt"), os.path.abspath("file2.txt")]
+
+
+def test_save_prunes():
+    _write("file1.txt", "foobar\n")
+    _write("file2.txt", "foobar\n")
+    _write("dir/foo.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file1.txt", "md5", hashlib.md5)
+    cache.hash_file("file2.txt", "md5", hashlib.md5)
+    cache.hash_directory("dir", "md5", hashlib.md5)
+
+    os.remove("file1.txt")
+    _write("file2.txt", "changed\n", age=5)
+    os.remove("dir/foo.txt")
+    os.rmdir("dir")
+    cache.save("hashes.json")
+
+    with open("hashes.json") as f:
+        data = json.load(f)
+    assert data["files"]["md5"] == {}
+    assert data["dirs"]["md5"] == {}
+
+
+def test_save_only_new(monkeypatch):
+    '''Entries loaded from the file are written back without checking them again'''
+    _write("file1.txt", "foobar\n")
+    _write("file2.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file1.txt", "md5", hashlib.md5)
+    cache.save("hashes.json")
+    os.remove("file1.txt")
+
+    other = FileHashCache()
+    other.load("hashes.json")
+    other.hash_file("file2.txt", "md5", hashlib.md5)
+
+    checked = []
+    orig_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        checked.append(os.path.basename(path))
+        return orig_stat(path, *args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(filehash.os, "stat", stat)
+        other.save("hashes.json")
+
+    assert [name for name in checked if name.endswith(".txt")] == ["file2.txt"]
+    with open("hashes.json") as f:
+        data = json.load(f)
+    assert sorted(data["files"]["md5"].keys()) == \
+        [os.path.abspath("file1.txt"), os.path.abspath("file2.txt")]
+
+
+@pytest.mark.parametrize("content", ["", "{", "[]", '{"version": 0, "files": {}}'])
+def test_load_invalid(content):
+    with open("hashes.json", "w") as f:
+        f.write(content)
+
+    cache = FileHashCache()
+    cache.load("hashes.json")
+    assert len(cache) == 0
+
+
+def test_load_missing():
+    cache = FileHashCache()
+    cache.load("hashes.json")
+    assert len(cache) == 0
+
+
+def test_clear():
+    _write("file.txt", "foobar\n")
+
+    cache = FileHashCache()
+    cache.hash_file("file.txt", "md5", hashlib.md5)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_default():
+    assert FileHashCache.default() is FileHashCache.default()
@@ -88,6 +88,44 @@ def test_access_invalid():
         Journal.access(Parameter("str"))
 
 
+def test_revision():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", Parameter("str"))
+    edit.insert("test1", Parameter("[str]"))
+
+    revision = Journal.revision()
+    schema.get("test0")
+    assert Journal.revision() == revision
+
+    schema.set("test0", "hello")
+    assert Journal.revision() > revision
+
+    revision = Journal.revision()
+    schema.add("test1", "hello")
+    assert Journal.revision() > revision
+
+    revision = Journal.revision()
+    schema.unset("test0")
+    assert Journal.revision() > revision
+
+
+def test_revision_while_journaling():
+    schema = BaseSchema()
+    EditableSchema(schema).insert("test0", Parameter("str"))
+    Journal.access(schema).start()
+
+    revision = Journal.revision()
+    schema.set("test0", "hello")
+    assert Journal.revision() > revision
+
+
+def test_revision_changed():
+    revision = Journal.revision()
+    Journal._changed()
+    assert Journal.revision() > revision
+
+
 def test_start_stop():
     journal = Journal()
     assert journal.get() is None
@@ -415,7 +453,7 @@ def test_forward_exception_with_key_set_replay(error, monkeypatch):
 
     def dummy_set(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'set', dummy_set)
+    monkeypatch.setattr(Parameter, 'set', dummy_set)
 
     journal = Journal()
     journal._Journal__journal = [
@@ -444,7 +482,7 @@ def test_forward_exception_with_key_add_replay(error, monkeypatch):
 
     def dummy_add(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'add', dummy_add)
+    monkeypatch.setattr(Parameter, 'add', dummy_add)
 
     journal = Journal()
     journal._Journal__journal = [
@@ -543,3 +581,75 @@ def test_replay_file_empty():
     assert schema.get("test0", "test1") == []
     Journal.replay_file(schema, "replay.json")
     assert schema.get("test0", "test1") == []
+
+
+def test_write_file():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.set("test0", "test1", "hello")
+    schema.add("test0", "test1", "world")
+    journal.write_file("journal.jsonl")
+
+    with open("journal.jsonl") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert [json.loads(line) for line in lines] == json.loads(json.dumps(journal.get()))
+
+
+def test_write_file_not_journaling():
+    schema = BaseSchema()
+    Journal.access(schema).write_file("journal.jsonl")
+
+    with open("journal.jsonl") as f:
+        assert f.read() == ""
+
+
+def test_replay_file_journal_file():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.set("test0", "test1", "hello")
+    schema.add("test0", "test1", "µm_Ω")
+    journal.write_file("journal.jsonl")
+    journal.stop()
+
+    check = BaseSchema()
+    EditableSchema(check).insert("test0", "test1", Parameter("[str]"))
+    Journal.replay_file(check, "journal.jsonl")
+    assert check.get("test0", "test1") == ["hello", "µm_Ω"]
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz", ".pkg.json.zst"])
+def test_replay_file_manifest_formats(suffix):
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.set("test0", "test1", "hello")
+    schema.add("test0", "test1", "µm_Ω")
+    schema.write_manifest(f"replay{suffix}")
+    journal.stop()
+
+    check = BaseSchema()
+    EditableSchema(check).insert("test0", "test1", Parameter("[str]"))
+    Journal.replay_file(check, f"replay{suffix}")
+    assert check.get("test0", "test1") == ["hello", "µm_Ω"]
+
+
+def test_replay_file_journal_file_empty():
+    with open("journal.jsonl", "w") as f:
+        f.write("\n")
+
+    schema = BaseSchema()
+    EditableSchema(schema).insert("test0", "test1", Parameter("[str]"))
+    Journal.replay_file(schema, "journal.jsonl")
+    assert schema.get("test0", "test1") == []
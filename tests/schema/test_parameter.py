@@ -1,4 +1,5 @@
 import argparse
+import pickle
 import pytest
 
 from unittest.mock import patch
@@ -655,6 +656,71 @@ def test_from_dict_round_trip_enum():
     assert param_check.get(step="teststep", index="0") == ("step", "test0")
 
 
+def test_getdict_values():
+    param = Parameter("[str]", help="long help", pernode=PerNode.OPTIONAL)
+    param.set(["test"])
+    param.set(["step"], step="teststep", index="0")
+
+    assert param._getdict_values() == {
+        "node": {
+            "*": {"*": {"signature": [None], "value": ["test"]}},
+            "teststep": {"0": {"signature": [None], "value": ["step"]}}
+        }
+    }
+
+
+def test_from_dict_values():
+    param = Parameter("(str,int)", help="long help", pernode=PerNode.OPTIONAL, unit="nm")
+    param.set(("test", 1))
+    param.set(("step", 2), step="teststep", index="0")
+
+    param_check = Parameter("(str,int)", help="long help", pernode=PerNode.OPTIONAL, unit="nm")
+    param_check._from_dict(param._getdict_values(), [], None)
+    assert param.getdict() == param_check.getdict()
+
+    assert param_check.get() == ("test", 1)
+    assert param_check.get(step="teststep", index="0") == ("step", 2)
+
+
+def test_from_dict_values_keeps_definition():
+    param = Parameter("int", defvalue=5, help="long help")
+    param_check = Parameter.from_dict(param._getdict_values(), [], None)
+    assert param_check.get(field="type") == "str"
+    assert param_check.get() is None
+    assert param_check.get(field="help") is None
+
+
+@pytest.mark.parametrize("field,value", [
+    ("help", "other help"),
+    ("shorthelp", "other"),
+    ("switch", ["-other"]),
+    ("example", ["other"]),
+    ("scope", Scope.SCRATCH),
+    ("pernode", PerNode.REQUIRED),
+    ("require", True),
+    ("lock", True),
+    ("unit", "um"),
+    ("notes", "other"),
+    ("hashalgo", "md5"),
+    ("copy", True)])
+def test_has_same_definition(field, value):
+    param = Parameter("file", help="long help", unit="nm")
+    other = Parameter("file", help="long help", unit="nm")
+    assert param._has_same_definition(other)
+
+    param.set("test.v")
+    assert param._has_same_definition(other)
+
+    other.set(value, field=field)
+    assert not param._has_same_definition(other)
+
+
+def test_has_same_definition_type():
+    assert not Parameter("int")._has_same_definition(Parameter("float"))
+    assert not Parameter("int", defvalue=1)._has_same_definition(Parameter("int", defvalue=2))
+    assert Parameter("int", defvalue=1)._has_same_definition(Parameter("int", defvalue=1))
+
+
 def test_from_dict_locked():
     param = Parameter(
         "(str,int)",
@@ -1039,6 +1105,97 @@ def test_copy():
     assert param.getdict() == copy_param.getdict()
 
 
+def test_copy_shares_values():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL)
+    param.set(["a", "b"], step="step", index="0")
+
+    copy_param = param.copy()
+    assert copy_param._Parameter__node is param._Parameter__node
+
+    copy_param.add("c", step="step", index="0")
+    assert copy_param._Parameter__node is not param._Parameter__node
+
+
+@pytest.mark.parametrize("modify", [
+    lambda param: param.set(["c"]),
+    lambda param: param.set(["c"], step="step", index="0"),
+    lambda param: param.add("c", step="step", index="0"),
+    lambda param: param.unset(step="step", index="0"),
+    lambda param: param.add("-c", field="switch"),
+    lambda param: param.add("c", field="example"),
+    lambda param: param.get(field=None, step="step", index="0")[0].set("c"),
+    lambda param: param.getvalues(return_values=False)[0][0].set(["c"]),
+    lambda param: param._default.set(["c"]),
+])
+@pytest.mark.parametrize("modify_copy", [True, False])
+def test_copy_on_write(modify, modify_copy):
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL, switch="-a", example="a")
+    param.set(["a", "b"], step="step", index="0")
+    expect = param.getdict()
+
+    copy_param = param.copy()
+    if modify_copy:
+        modify(copy_param)
+        assert param.getdict() == expect
+        assert copy_param.getdict() != expect
+    else:
+        modify(param)
+        assert copy_param.getdict() == expect
+        assert param.getdict() != expect
+
+
+def test_shared_definition():
+    param = Parameter("[str]", help="help", switch="-a <str>")
+    other = Parameter("[str]", help="help", switch="-a <str>")
+    assert param._Parameter__definition is other._Parameter__definition
+
+    assert param.set("new help", field="help")
+    assert param.add("-b <str>", field="switch")
+    assert param.get(field="help") == "new help"
+    assert param.get(field="switch") == ["-a <str>", "-b <str>"]
+    assert other.get(field="help") == "help"
+    assert other.get(field="switch") == ["-a <str>"]
+
+
+def test_shared_definition_type():
+    param = Parameter("[str]")
+    assert param.set("[str]", field="type")
+    assert Parameter("[str]").get(field="type") == "[str]"
+    assert Parameter("[str]").is_list()
+
+
+def test_definition_immutable():
+    param = Parameter("str")
+    with pytest.raises(AttributeError):
+        param._Parameter__definition.help = "help"
+
+
+def test_no_instance_dict():
+    assert not hasattr(Parameter("str"), "__dict__")
+
+
+def test_pickle():
+    param = Parameter("[file]", help="help", pernode=PerNode.OPTIONAL)
+    param.set(["file0.txt"], step="step", index="0")
+
+    check_param = pickle.loads(pickle.dumps(param))
+    assert check_param.getdict() == param.getdict()
+    assert check_param._Parameter__definition is param._Parameter__definition
+
+
+def test_copy_of_copy():
+    param = Parameter("str")
+    param.set("a")
+
+    copy_param = param.copy()
+    second_copy = copy_param.copy()
+    copy_param.set("b")
+
+    assert param.get() == "a"
+    assert copy_param.get() == "b"
+    assert second_copy.get() == "a"
+
+
 def test_tcl_optional():
     param = Parameter("str", pernode=PerNode.OPTIONAL)
 
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import pathlib
 import pytest
@@ -137,6 +138,36 @@ def test_copy():
     assert value is not new_value
 
 
+def test_copy_file():
+    value = FileNodeValue("file.txt", dataroot="root")
+    value.set("hash", field="filehash")
+    value.set("today", field="date")
+    value.add("author0", field="author")
+
+    new_value = value.copy()
+    assert new_value.getdict() == value.getdict()
+
+    new_value.add("author1", field="author")
+    assert value.get(field="author") == ["author0"]
+    assert new_value.get(field="author") == ["author0", "author1"]
+
+
+def test_copy_nodelist_values():
+    value = NodeListValue(FileNodeValue())
+    value.set(["file0.txt", "file1.txt"])
+
+    new_value = value.copy()
+    new_value.values[0].set("hash", field="filehash")
+    assert value.values[0].get(field="filehash") is None
+    assert new_value.values[0].get(field="filehash") == "hash"
+
+
+def test_no_instance_dict():
+    for value in (NodeValue("str"), FileNodeValue(), DirectoryNodeValue(),
+                  NodeListValue(NodeValue("str")), NodeSetValue(NodeValue("str"))):
+        assert not hasattr(value, "__dict__")
+
+
 def test_value_init():
     assert NodeValue("str").get() is None
     assert NodeValue("str", value="test").get() == "test"
@@ -787,6 +818,18 @@ def test_directory_hash_invalid_algoritm():
         param.hash('md56')
 
 
+def test_directory_hash_with_hashobj():
+    os.makedirs('test1', exist_ok=True)
+    with open('test1/foo.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+    with open('test1/foo1.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+
+    hashobj = hashlib.md5()
+    assert PathNodeValue.hash_directory("test1", hashobj=hashobj) == \
+        'b9e044ee9606b2b5ac73e2213c2eedc7'
+
+
 def test_file_add_to_parent_field():
     param = FileNodeValue()
 
@@ -0,0 +1,54 @@
+from siliconcompiler.schema import Parameter
+from siliconcompiler.schema.stringtable import StringTable
+
+
+def test_is_parameter():
+    assert StringTable.is_parameter(Parameter("str").getdict())
+    assert not StringTable.is_parameter({"type": {"node": {}}, "node": {}})
+    assert not StringTable.is_parameter({})
+
+
+def test_encode_parameter():
+    param = Parameter("str", help="help", shorthelp="short", example=["one", "two"],
+                      switch=["-one"]).getdict()
+
+    table = StringTable()
+    encoded = table.encode_parameter(param)
+    assert encoded["switch"] == [0]
+    assert encoded["shorthelp"] == 1
+    assert encoded["example"] == [2, 3]
+    assert encoded["help"] == 4
+    assert encoded["notes"] is None
+    assert table.strings == ["-one", "short", "one", "two", "help"]
+
+    # original is unchanged
+    assert param["help"] == "help"
+
+
+def test_encode_dedup():
+    table = StringTable()
+    first = table.encode_parameter(Parameter("str", help="help").getdict())
+    second = table.encode_parameter(Parameter("int", help="help").getdict())
+    assert first["help"] == second["help"]
+    assert table.strings.count("help") == 1
+
+
+def test_encode_and_decode():
+    manifest = {
+        "a": Parameter("str", help="help").getdict(),
+        "b": {
+            "c": Parameter("[str]", help="help", example=["one"]).getdict()
+        },
+        "__meta__": {"help": "not a parameter"},
+        "__journal__": [{"help": "not a parameter"}]
+    }
+
+    table = StringTable()
+    encoded = table.encode(manifest)
+    assert encoded["a"]["help"] == 0
+    assert encoded["b"]["c"]["help"] == 0
+    assert encoded["__meta__"] == {"help": "not a parameter"}
+
+    decoder = StringTable(table.strings)
+    decoder.decode(encoded)
+    assert encoded == manifest
@@ -18,6 +18,7 @@ def test_keys():
         ('tasktime',),
         ('memory',),
         ('warnings',),
+        ('overhead',),
         ('totaltime',),
         ('errors',),
     ])
@@ -105,6 +106,26 @@ def test_record_tasktime():
     assert schema.get("tasktime", step="testone", index="0") == 10.0
 
 
+def test_record_overhead_no_data():
+    schema = MetricSchema()
+    assert schema.record_overhead("testone", "0", 5.0) is False
+    assert schema.get("overhead", step="testone", index="0") is None
+
+
+def test_record_overhead():
+    schema = MetricSchema()
+    assert schema.set("tasktime", 10.0, step="testone", index="0")
+    assert schema.record_overhead("testone", "0", 7.5)
+    assert schema.get("overhead", step="testone", index="0") == 2.5
+
+
+def test_record_overhead_clipped():
+    schema = MetricSchema()
+    assert schema.set("tasktime", 10.0, step="testone", index="0")
+    assert schema.record_overhead("testone", "0", 10.5)
+    assert schema.get("overhead", step="testone", index="0") == 0.0
+
+
 def test_record_totaltime_no_data():
     flow = Flowgraph("testflow")
     flow.node("testone", NOPTask(), index="0")
@@ -558,13 +579,14 @@ def test_summary_table_no_trim():
 
     table = schema.summary_table(trim_empty_metrics=False)
     assert table.index.to_list() == [
-        'errors', 'warnings', 'memory', 'exetime', 'tasktime', 'totaltime']
+        'errors', 'warnings', 'memory', 'exetime', 'tasktime', 'totaltime', 'overhead']
     assert table.columns.to_list() == ["unit", "step/0", "step/1", "step/2", "step/3"]
     assert table.to_dict() == {
         'unit': {
             'errors': '',
             'exetime': 's',
             'memory': 'B',
+            'overhead': 's',
             'tasktime': 's',
             'totaltime': 's',
             'warnings': ''
@@ -573,6 +595,7 @@ def test_summary_table_no_trim():
             'errors': ' ---  ',
             'exetime': '0:15.000',
             'memory': ' ---  ',
+            'overhead': ' ---  ',
             'tasktime': '0:05.000',
             'totaltime': ' ---  ',
             'warnings': ' ---  '
@@ -581,6 +604,7 @@ def test_summary_table_no_trim():
             'errors': ' ---  ',
             'exetime': '0:17.000',
             'memory': ' ---  ',
+            'overhead': ' ---  ',
             'tasktime': '0:07.000',
             'totaltime': ' ---  ',
             'warnings': ' ---  '
@@ -589,6 +613,7 @@ def test_summary_table_no_trim():
             'errors': ' ---  ',
             'exetime': '1:52.500',
             'memory': ' ---  ',
+            'overhead': ' ---  ',
             'tasktime': '0:12.500',
             'totaltime': ' ---  ',
             'warnings': ' ---  '
@@ -597,6 +622,7 @@ def test_summary_table_no_trim():
             'errors': ' ---  ',
             'exetime': '1:55.500',
             'memory': ' ---  ',
+            'overhead': ' ---  ',
             'tasktime': '0:15.500',
             'totaltime': ' ---  ',
             'warnings': ' ---  '
@@ -36,6 +36,7 @@ def test_keys():
         ('jobincr',),
         ('scheduler', 'maxthreads'),
         ('scheduler', 'maxnodes'),
+        ('scheduler', 'priority'),
         ('nodisplay',),
         ('scheduler', 'memory'),
         ('credentials',),
@@ -46,6 +47,8 @@ def test_keys():
         ('env', 'default'),
         ('timeout',),
         ('hash',),
+        ('resultcache',),
+        ('resultcachesize',),
         ('breakpoint',),
         ('scheduler', 'options'),
         ('track',), ('continue',),
@@ -150,6 +153,21 @@ def test_hash():
     assert option.get_hash() is True
 
 
+def test_resultcache():
+    option = OptionSchema()
+    assert option.get_resultcache() is False
+    option.set_resultcache(True, step="syn", index="0")
+    assert option.get_resultcache() is False
+    assert option.get_resultcache(step="syn", index="0") is True
+
+
+def test_resultcachesize():
+    option = OptionSchema()
+    assert option.get_resultcachesize() == 10240
+    option.set_resultcachesize(500)
+    assert option.get_resultcachesize() == 500
+
+
 def test_nodisplay():
     option = OptionSchema()
     assert option.get_nodisplay() is False
@@ -431,6 +449,13 @@ def test_maxthreads():
     assert scheduler.get_maxthreads() == 8
 
 
+def test_priority():
+    scheduler = OptionSchema().scheduler
+    assert scheduler.get_priority() == "order"
+    scheduler.set_priority("critical_path")
+    assert scheduler.get_priority() == "critical_path"
+
+
 def test_load_default_options():
     settings = MPManager.get_settings()
     settings.delete("schema-options")
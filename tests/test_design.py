@@ -1,7 +1,9 @@
+import inspect
 import pathlib
 import pytest
 import re
 import shutil
+import sys
 
 import os.path
 
@@ -1155,6 +1157,64 @@ def test_get_fileset():
         dut.get_fileset("constraint")
 
 
+def test_get_fileset_deep_chain():
+    designs = [Design(f"design{n}") for n in range(300)]
+    for n, design in enumerate(designs):
+        with design.active_fileset("rtl"):
+            design.add_file(f"design{n}.v")
+            if n > 0:
+                design.add_depfileset(designs[n - 1], "rtl")
+
+    # Leave less room on the stack than the chain is deep
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack(0)) + 100)
+    try:
+        filesets = designs[-1].get_fileset("rtl")
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert filesets == [(design, "rtl") for design in designs]
+
+
+def test_get_fileset_cached_until_changed():
+    lib = Design("lib")
+    with lib.active_fileset("rtl"):
+        lib.add_file("lib.v")
+    dut = Design("dut")
+    with dut.active_fileset("rtl"):
+        dut.add_file("dut.v")
+
+    first = dut.get_fileset("rtl")
+    assert first == [(dut, "rtl")]
+
+    second = dut.get_fileset("rtl")
+    assert second == first
+    assert second is not first
+
+    with dut.active_fileset("rtl"):
+        dut.add_depfileset(lib, "rtl")
+    assert dut.get_fileset("rtl") == [(lib, "rtl"), (dut, "rtl")]
+    assert dut.get_fileset(["rtl"]) == [(lib, "rtl"), (dut, "rtl")]
+
+
+def test_get_fileset_cached_by_alias():
+    lib = Design("lib")
+    with lib.active_fileset("rtl"):
+        lib.add_file("lib.v")
+    other = Design("lib")
+    with other.active_fileset("other"):
+        other.add_file("other.v")
+    dut = Design("dut")
+    with dut.active_fileset("rtl"):
+        dut.add_depfileset(lib, "rtl")
+
+    assert dut.get_fileset("rtl") == [(lib, "rtl"), (dut, "rtl")]
+    assert dut.get_fileset("rtl", alias={("lib", "rtl"): (other, "other")}) == \
+        [(other, "other"), (dut, "rtl")]
+    assert dut.get_fileset("rtl", alias={("lib", "rtl"): (None, None)}) == [(dut, "rtl")]
+    assert dut.get_fileset("rtl") == [(lib, "rtl"), (dut, "rtl")]
+
+
 def test_get_fileset_self():
     class Heartbeat(Design):
         def __init__(self):
@@ -1592,16 +1652,16 @@ def test_fileset_recursion_runs_once():
             # Patch all dependencies to use DummyDesign's __get_fileset
             for dep in getattr(self, "_depmap", {}).values():
                 dep.__class__.__get_fileset = DummyDesign.__get_fileset
-            return super()._Design__get_fileset(filesets, alias, filelist, visited, mapping)
+            return super()._Design__walk_fileset(filesets, alias, filelist, visited, mapping)
 
-    # Patch Design.__get_fileset to track calls
+    # Patch Design.__walk_fileset to track calls
     call_log = []
-    orig_get_fileset = Design._Design__get_fileset
+    orig_get_fileset = Design._Design__walk_fileset
 
     def tracking_get_fileset(self, filesets, alias, filelist, visited, mapping):
         call_log.append(self.name)
         return orig_get_fileset(self, filesets, alias, filelist, visited, mapping)
-    Design._Design__get_fileset = tracking_get_fileset
+    Design._Design__walk_fileset = tracking_get_fileset
 
     # Create a design hierarchy with duplicate dependency
     a = DummyDesign("A")
@@ -1625,4 +1685,4 @@ def test_fileset_recursion_runs_once():
     assert names == {"A", "B", "C"}
 
     # Restore original method
-    Design._Design__get_fileset = orig_get_fileset
+    Design._Design__walk_fileset = orig_get_fileset
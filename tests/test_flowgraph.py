@@ -215,6 +215,25 @@ def test_edge():
     assert flow.get("steptwo", "0", "input") == [("stepone", "0")]
 
 
+def test_edge_nodes_added_while_building():
+    '''Nodes added after an edge are known without collecting the nodes again'''
+    flow = Flowgraph("testflow")
+    flow.node("stepone", NOPTask())
+    flow.node("steptwo", NOPTask())
+    flow.edge("stepone", "steptwo")
+
+    with patch.object(Flowgraph, "get_nodes", autospec=True,
+                      side_effect=Flowgraph.get_nodes) as get_nodes:
+        flow.node("stepthree", NOPTask())
+        flow.edge("steptwo", "stepthree")
+        with pytest.raises(ValueError, match="stepfour/0 is not a defined node"):
+            flow.edge("stepthree", "stepfour")
+        get_nodes.assert_not_called()
+
+    assert flow.get_nodes() == (("stepone", "0"), ("stepthree", "0"), ("steptwo", "0"))
+    assert flow.get("stepthree", "0", "input") == [("steptwo", "0")]
+
+
 def test_edge_double():
     flow = Flowgraph("testflow")
     flow.node("stepone", "siliconcompiler.tools.builtin.nop/NOPTask")
@@ -834,6 +853,18 @@ def test_validate_loop(large_flow, caplog):
         "stepone/2 -> joinone/0" in caplog.text
 
 
+def test_validate_loop_unreachable(caplog):
+    flow = Flowgraph("testflow")
+    flow.node("entry", NOPTask())
+    flow.node("stepone", NOPTask())
+    flow.node("steptwo", NOPTask())
+    flow.edge("stepone", "steptwo")
+    flow.edge("steptwo", "stepone")
+
+    assert not flow.validate(logger=logging.getLogger())
+    assert "Loop detected in testflow: stepone/0 -> steptwo/0 -> stepone/0" in caplog.text
+
+
 def test_runtime_init():
     with pytest.raises(ValueError,
                        match=r"^base must a Flowgraph, not: "
@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import siliconcompiler
+
+
+def _import_modules(statement):
+    script = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", script],
+                          capture_output=True, text=True, check=True)
+    return set(json.loads(proc.stdout))
+
+
+def _import_time(module):
+    '''
+    Returns the cumulative import time of a module in microseconds, as
+    reported by -X importtime.
+    '''
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise ValueError(f"{module} not found in import times")
+
+
+@pytest.mark.parametrize("name", siliconcompiler.__all__)
+def test_lazy_attribute(name):
+    assert hasattr(siliconcompiler, name)
+    assert name in dir(siliconcompiler)
+
+
+def test_lazy_attribute_invalid():
+    with pytest.raises(AttributeError,
+                       match="^module 'siliconcompiler' has no attribute 'notthis'$"):
+        siliconcompiler.notthis
+
+
+def test_import_package():
+    modules = _import_modules("import siliconcompiler")
+
+    assert "siliconcompiler.project" not in modules
+    assert "siliconcompiler.schema" not in modules
+    assert "siliconcompiler.tool" not in modules
+
+
+def test_import_project():
+    modules = _import_modules("from siliconcompiler import Project")
+
+    assert "siliconcompiler.project" in modules
+    for module in ("docker", "rich", "jinja2", "yaml", "graphviz", "PIL",
+                   "siliconcompiler.scheduler.scheduler",
+                   "siliconcompiler.scheduler.docker",
+                   "siliconcompiler.scheduler.slurm",
+                   "siliconcompiler.report.dashboard.cli.board"):
+        assert module not in modules
+
+
+def test_import_scheduler():
+    modules = _import_modules("from siliconcompiler.scheduler import Scheduler")
+
+    assert "siliconcompiler.scheduler.scheduler" in modules
+    assert "docker" not in modules
+    assert "siliconcompiler.scheduler.slurm" not in modules
+
+
+def test_import_time_budget():
+    # The package only defines lazy attributes, so importing it should take
+    # a few milliseconds, this budget leaves room for loaded test machines
+    assert _import_time("siliconcompiler") < 50000
@@ -580,6 +580,115 @@ def test_get_exe_version_non_zero_return(running_node, monkeypatch, caplog):
     assert "Version check on 'exe' ended with code 1" in caplog.text
 
 
+def _setup_version_cache(running_node, monkeypatch):
+    monkeypatch.setattr(running_node.task, 'parse_version', lambda stdout: stdout)
+
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'exe', 'testexe')
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'vswitch', '-version')
+
+    exe = os.path.abspath("testexe")
+    with open(exe, "w") as f:
+        f.write("binary")
+    monkeypatch.setattr(running_node.task, 'get_exe', lambda: exe)
+
+    calls = []
+
+    def dummy_run(cmdlist, **kwargs):
+        calls.append(cmdlist)
+
+        class Ret:
+            returncode = 0
+            stdout = f"version{len(calls)}"
+
+        return Ret()
+    monkeypatch.setattr(imported_subprocess, 'run', dummy_run)
+
+    return exe, calls
+
+
+def test_get_exe_version_cached(running_node, monkeypatch):
+    exe, calls = _setup_version_cache(running_node, monkeypatch)
+
+    for _ in range(3):
+        with running_node.task.runtime(running_node) as runtool:
+            assert runtool.get_exe_version() == "version1"
+    assert len(calls) == 1
+
+    # check persists across managers
+    MPManager.stop()
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "version1"
+    assert len(calls) == 1
+    assert os.path.isfile(os.path.join(os.environ["HOME"], ".sc", "cache", "toolversions.json"))
+
+
+def test_get_exe_version_cached_exe_changed(running_node, monkeypatch):
+    exe, calls = _setup_version_cache(running_node, monkeypatch)
+
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "version1"
+
+    with open(exe, "w") as f:
+        f.write("new binary")
+
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "version2"
+        assert runtool.get_exe_version() == "version2"
+    assert len(calls) == 2
+
+
+def test_get_exe_version_cached_env_changed(running_node, monkeypatch):
+    exe, calls = _setup_version_cache(running_node, monkeypatch)
+
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "version1"
+
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'env', 'LICENSE', 'server')
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "version2"
+    assert len(calls) == 2
+
+
+def test_get_exe_version_cached_not_on_failure(running_node, monkeypatch):
+    exe, calls = _setup_version_cache(running_node, monkeypatch)
+
+    def dummy_run(cmdlist, **kwargs):
+        calls.append(cmdlist)
+
+        class Ret:
+            returncode = 1
+            stdout = "error"
+
+        return Ret()
+    monkeypatch.setattr(imported_subprocess, 'run', dummy_run)
+
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "error"
+        assert runtool.get_exe_version() == "error"
+    assert len(calls) == 2
+
+
+def test_get_exe_version_cache_not_writable(running_node, monkeypatch, caplog):
+    exe, calls = _setup_version_cache(running_node, monkeypatch)
+
+    class UnwritableLock:
+        def __enter__(self):
+            raise PermissionError("read-only cache")
+
+        def __exit__(self, *args):
+            return False
+
+    cache = MPManager.get_version_cache()
+    monkeypatch.setattr(cache, "_SettingsManager__lock", UnwritableLock())
+
+    with caplog.at_level(logging.DEBUG, logger=cache._SettingsManager__logger.name):
+        with running_node.task.runtime(running_node) as runtool:
+            assert runtool.get_exe_version() == "version1"
+
+    assert "Failed to save settings" in caplog.text
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
 def test_get_exe_version_internal_error(running_node, monkeypatch, caplog):
     def parse_version(stdout):
         raise ValueError("look for this match")
@@ -0,0 +1,150 @@
+import pytest
+
+from siliconcompiler.utils.graph import DirectedGraph
+
+
+@pytest.fixture
+def diamond():
+    return DirectedGraph({
+        "a": [],
+        "b": ["a"],
+        "c": ["a"],
+        "d": ["b", "c"],
+        "e": ["d"]
+    })
+
+
+def test_nodes(diamond):
+    assert diamond.nodes == ("a", "b", "c", "d", "e")
+
+
+def test_nodes_input_only():
+    graph = DirectedGraph({"b": ["a"]})
+    assert graph.nodes == ("a", "b")
+    assert graph.get_inputs("a") == tuple()
+    assert graph.get_outputs("a") == ("b",)
+
+
+def test_inputs_outputs(diamond):
+    assert diamond.get_inputs("d") == ("b", "c")
+    assert diamond.get_outputs("a") == ("b", "c")
+    assert diamond.get_outputs("e") == tuple()
+    assert diamond.get_inputs("missing") == tuple()
+    assert diamond.get_outputs("missing") == tuple()
+
+
+def test_entry_exit_nodes(diamond):
+    assert diamond.get_entry_nodes() == ("a",)
+    assert diamond.get_exit_nodes() == ("e",)
+
+
+def test_reachable(diamond):
+    assert diamond.reachable(["b"]) == {"b", "d", "e"}
+    assert diamond.reachable(["d"], reverse=True) == {"a", "b", "c", "d"}
+    assert diamond.reachable(["b", "c"]) == {"b", "c", "d", "e"}
+
+
+def test_reachable_stop(diamond):
+    assert diamond.reachable(["a"], stop=["d"]) == {"a", "b", "c", "d"}
+    assert diamond.reachable(["a"], stop=["a"]) == {"a"}
+
+
+def test_reachable_exclude(diamond):
+    assert diamond.reachable(["a"], exclude=["b"]) == {"a", "c", "d", "e"}
+    assert diamond.reachable(["a"], exclude=["b", "c"]) == {"a"}
+    assert diamond.reachable(["a"], exclude=["a"]) == set()
+
+
+def test_get_distances(diamond):
+    assert diamond.get_distances("a") == {"b": 1, "c": 1, "d": 2, "e": 3}
+    assert diamond.get_distances("e", reverse=True) == {"d": 1, "b": 2, "c": 2, "a": 3}
+    assert diamond.get_distances("e") == {}
+
+
+def test_get_levels(diamond):
+    assert diamond.get_levels() == [("a",), ("b", "c"), ("d",), ("e",)]
+    assert diamond.get_levels(reverse=True) == [("e",), ("d",), ("b", "c"), ("a",)]
+
+
+def test_get_levels_longest_path():
+    graph = DirectedGraph({
+        "a": [],
+        "b": ["a"],
+        "c": ["a", "b"],
+        "d": []
+    })
+    assert graph.get_levels() == [("a", "d"), ("b",), ("c",)]
+    assert graph.get_levels(reverse=True) == [("c", "d"), ("b",), ("a",)]
+
+
+def test_get_levels_loop():
+    graph = DirectedGraph({
+        "a": [],
+        "b": ["a", "c"],
+        "c": ["b"]
+    })
+    assert graph.get_levels() == [("a",)]
+
+
+def test_no_loops(diamond):
+    assert diamond.get_loops() == []
+    assert diamond.find_loop("a") is None
+
+
+def test_find_loop():
+    graph = DirectedGraph({
+        "a": [],
+        "b": ["a", "d"],
+        "c": ["b"],
+        "d": ["c"]
+    })
+    assert graph.find_loop("a") == ["a", "b", "c", "d", "b"]
+    assert graph.get_loops() == [("b", "c", "d")]
+
+
+def test_find_loop_acyclic():
+    graph = DirectedGraph({
+        "a": [],
+        "b": ["a"],
+        "c": ["a", "b"]
+    })
+    acyclic = set()
+    assert graph.find_loop("b", acyclic) is None
+    assert acyclic == {"b", "c"}
+    assert graph.find_loop("a", acyclic) is None
+    assert acyclic == {"a", "b", "c"}
+
+
+def test_get_loops_self_loop():
+    graph = DirectedGraph({"a": ["a"], "b": ["a"]})
+    assert graph.get_loops() == [("a",)]
+    assert graph.find_loop("a") == ["a", "a"]
+
+
+def test_get_loops_multiple():
+    graph = DirectedGraph({
+        "a": ["b"],
+        "b": ["a"],
+        "c": ["b", "d"],
+        "d": ["c"]
+    })
+    assert sorted(graph.get_loops()) == [("a", "b"), ("c", "d")]
+
+
+def test_large_graph():
+    # stacked fan-out and fan-in has an exponential number of paths
+    inputs = {"start": []}
+    prev = "start"
+    for stage in range(200):
+        branches = [f"{stage}.{n}" for n in range(20)]
+        for branch in branches:
+            inputs[branch] = [prev]
+        inputs[f"{stage}.join"] = branches
+        prev = f"{stage}.join"
+
+    graph = DirectedGraph(inputs)
+    assert graph.get_loops() == []
+    assert graph.find_loop("start") is None
+    assert len(graph.reachable(["start"])) == len(inputs)
+    assert graph.get_distances("start")[prev] == 400
+    assert len(graph.get_levels()) == 401
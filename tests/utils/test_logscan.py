@@ -0,0 +1,149 @@
+import io
+import logging
+
+import pytest
+
+from siliconcompiler.utils import grep
+from siliconcompiler.utils.logscan import GrepPattern, LogScanner
+
+
+LOG = """\
+Starting synthesis
+Warning: net a is undriven
+INFO: reading top.v
+ERROR: module bar not found
+warning: case mismatch
+Error: 2 errors found
+  -- error details
+Done
+"""
+
+
+def _expected(checks, log):
+    # Reference: apply grep to every line, one suffix at a time
+    found = {}
+    lines = io.StringIO(log, newline="\n").readlines()
+    for suffix, regexes in checks.items():
+        found[suffix] = []
+        for num, line in enumerate(lines, start=1):
+            string = line
+            for regex in regexes:
+                string = grep(logging.getLogger(), regex, string)
+            if string is not None:
+                found[suffix].append((num, string))
+    return len(lines), found
+
+
+def _scan(scanner, log):
+    found = {suffix: [] for suffix in scanner.suffixes}
+
+    def on_match(suffix, num, string):
+        found[suffix].append((num, string))
+
+    line_count = scanner.scan(io.StringIO(log, newline="\n"), on_match)
+    return line_count, found
+
+
+@pytest.mark.parametrize("args,line", [
+    ("hello", "this is a hello world"),
+    ("-v hello", "contains hello"),
+    ("-i hello", "HELLO world"),
+    ("-w cat", "The catalog is big."),
+    ("-x hello", "hello"),
+    ("-o -i world", "Hello WORLD"),
+    ("-e -hello world", "-hello world is great"),
+    ("", "line"),
+    ("*", "test"),
+])
+def test_grep_pattern_same_as_grep(args, line):
+    assert GrepPattern(args).match(line) == grep(logging.getLogger(), args, line)
+
+
+def test_grep_pattern_properties():
+    pattern = GrepPattern("-vi hello")
+    assert pattern.args == "-vi hello"
+    assert pattern.invert is True
+    assert pattern.only_match is False
+    assert pattern.regex.pattern == "hello"
+
+
+def test_grep_pattern_invalid(caplog):
+    pattern = GrepPattern("*", logger=logging.getLogger())
+    assert pattern.regex is None
+    assert pattern.match("*") is None
+    assert "Invalid regex pattern" in caplog.text
+
+
+def test_grep_pattern_none():
+    assert GrepPattern("hello").match(None) is None
+
+
+@pytest.mark.parametrize("checks", [
+    {"errors": ["-i error"], "warnings": ["-i warning"]},
+    {"errors": ["^ERROR", "-v bar"]},
+    {"errors": ["-o -i error"]},
+    {"errors": ["-x Done"], "info": ["-w INFO"]},
+    {"errors": ["-v Warning"]},
+    {"errors": ["(e)rror.*\\1"]},
+    {"errors": ["*"], "warnings": ["-i warning"]},
+    {"errors": ["\\s+--"]},
+    {"errors": ["undriven\\s+INFO"]},
+    {"errors": ["^Error", "-o [0-9]+"], "warnings": ["^warning|^Warning"]},
+    {"errors": ["^\\s+-"]},
+])
+@pytest.mark.parametrize("chunk_size", [4, 20, 1024])
+def test_scan_same_as_grep(checks, chunk_size, monkeypatch):
+    monkeypatch.setattr(LogScanner, "CHUNK_SIZE", chunk_size)
+
+    scanner = LogScanner(checks)
+    assert _scan(scanner, LOG) == _expected(checks, LOG)
+
+
+def test_scan_no_trailing_newline():
+    checks = {"errors": ["Done"]}
+    log = LOG.rstrip("\n")
+
+    scanner = LogScanner(checks)
+    assert scanner.has_prefilter
+    assert _scan(scanner, log) == (8, {"errors": [(8, "Done")]})
+
+
+def test_scan_empty():
+    scanner = LogScanner({"errors": ["error"]})
+    assert _scan(scanner, "") == (0, {"errors": []})
+
+
+@pytest.mark.parametrize("chunk_size", [4, 1024])
+def test_scan_in_order(chunk_size, monkeypatch):
+    '''Matches are passed on in the order of the lines in the log'''
+    monkeypatch.setattr(LogScanner, "CHUNK_SIZE", chunk_size)
+
+    found = []
+    scanner = LogScanner({"errors": ["-i error"], "warnings": ["-i warning"]})
+    scanner.scan(io.StringIO("warning 1\nerror 2\nwarning 3\nerror warning 4\n"),
+                 lambda suffix, num, string: found.append((num, suffix)))
+
+    assert found == [(1, "warnings"), (2, "errors"), (3, "warnings"),
+                     (4, "errors"), (4, "warnings")]
+
+
+def test_scan_no_prefilter_invert():
+    scanner = LogScanner({"errors": ["-i error"], "other": ["-v error"]})
+    assert not scanner.has_prefilter
+
+
+def test_scan_no_prefilter_string_anchor():
+    scanner = LogScanner({"errors": ["\\Aerror"]})
+    assert not scanner.has_prefilter
+
+
+def test_scan_prefilter():
+    scanner = LogScanner({"errors": ["-i error"], "warnings": ["-i warning", "-v net"]})
+    assert scanner.has_prefilter
+    assert scanner.suffixes == ("errors", "warnings")
+
+
+def test_match():
+    scanner = LogScanner({"warnings": ["-i warning", "-v net"]})
+    assert scanner.match("warnings", "Warning: net a is undriven") is None
+    assert scanner.match("warnings", "warning: case mismatch") == "warning: case mismatch"
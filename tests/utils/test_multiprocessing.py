@@ -112,6 +112,43 @@ def test_get_manager():
     assert man0 is man1
 
 
+@pytest.mark.isolated_manager
+def test_manager_started_on_first_use():
+    MPManager()
+    assert MPManager.has_manager() is False
+    assert MPManager._get_manager_address() is None
+
+    MPManager.get_settings()
+    MPManager.get_dashboard()
+    assert MPManager.has_manager() is False
+
+    manager = MPManager.get_manager()
+    assert MPManager.has_manager() is True
+    assert MPManager._get_manager_address() == manager.address
+
+
+def test_has_manager_without_instance():
+    MPManager.stop()
+    assert MPManager.has_manager() is False
+    assert _ManagerSingleton.has_cls(MPManager) is False
+
+
+def test_stop_without_manager():
+    MPManager()
+    assert MPManager.has_manager() is False
+    MPManager.stop()
+    assert _ManagerSingleton.has_cls(MPManager) is False
+
+
+def test_settings_loaded_on_first_use():
+    with patch("siliconcompiler.utils.multiprocessing.SettingsManager") as settings:
+        MPManager()
+        settings.assert_not_called()
+
+        assert MPManager.get_settings() is MPManager.get_settings()
+        settings.assert_called_once()
+
+
 def test_get_dasboard():
     dash0 = MPManager().get_dashboard()
     dash1 = MPManager().get_dashboard()
@@ -290,6 +327,7 @@ def test_stop_swallows_keyboard_interrupt_in_manager_shutdown():
     '''A KeyboardInterrupt raised while shutting down the multiprocessing
     manager must not escape.'''
     manager = MPManager()
+    MPManager.get_manager()
     # Force the manager_server branch on so shutdown() is reached.
     manager._MPManager__manager_server = True
 
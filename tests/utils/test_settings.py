@@ -157,6 +157,56 @@ def test_save_permission_error(settings_file, monkeypatch, caplog):
     assert "Failed to save settings" in caplog.text
 
 
+def test_save_permission_error_quiet(settings_file, monkeypatch, caplog):
+    """A quiet save logs its failure at debug level."""
+    manager = SettingsManager(settings_file, logging.getLogger())
+
+    def mock_open(*args, **kwargs):
+        raise PermissionError("Simulated permission denied")
+
+    with caplog.at_level(logging.DEBUG):
+        with monkeypatch.context() as m:
+            m.setattr("builtins.open", mock_open)
+            with pytest.raises(PermissionError):
+                manager.save(quiet=True)
+
+    assert "Failed to save settings" in caplog.text
+    assert all(record.levelno == logging.DEBUG for record in caplog.records)
+
+
+def test_save_merges_concurrent_changes(settings_file):
+    """Settings saved by another manager since this one loaded are kept."""
+    first = SettingsManager(settings_file, logging.getLogger())
+    second = SettingsManager(settings_file, logging.getLogger())
+
+    first.set("versions", "a", 1)
+    first.save()
+    second.set("versions", "b", 2)
+    second.save()
+
+    with open(settings_file, encoding="utf-8") as f:
+        assert json.load(f) == {"versions": {"a": 1, "b": 2}}
+    assert second.get("versions", "a") == 1
+
+
+def test_save_merges_deletes(settings_file):
+    """Settings deleted in this manager are removed, others on disk are kept."""
+    _write_json(settings_file, {"misc": {"temp": 1, "keep": 2}, "drop": {"x": 1}})
+    manager = SettingsManager(settings_file, logging.getLogger())
+    manager.delete("misc", "temp")
+    manager.delete("drop")
+
+    other = SettingsManager(settings_file, logging.getLogger())
+    other.set("drop", "y", 2)
+    other.set("misc", "new", 3)
+    other.save()
+
+    manager.save()
+
+    with open(settings_file, encoding="utf-8") as f:
+        assert json.load(f) == {"misc": {"keep": 2, "new": 3}}
+
+
 def test_load_generic_exception(tmp_path, caplog):
     """Test the generic exception catcher in _load."""
     # Point to a directory instead of a file to force an OS error (IsADirectoryError)
@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+
+from siliconcompiler.utils.trace import Tracer
+
+
+def test_span():
+    tracer = Tracer("test")
+
+    with tracer.span("outer"):
+        with tracer.span("inner", node="step/0"):
+            pass
+
+    events = tracer.get_events()
+    assert [event["name"] for event in events] == ["process_name", "inner", "outer"]
+
+    process, inner, outer = events
+    assert process["ph"] == "M"
+    assert process["args"] == {"name": "test"}
+    assert process["pid"] == os.getpid()
+
+    assert inner["ph"] == "X"
+    assert inner["pid"] == os.getpid()
+    assert inner["args"] == {"node": "step/0"}
+    assert "args" not in outer
+
+    # inner is nested in outer
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+
+
+def test_span_exception():
+    tracer = Tracer("test")
+
+    with pytest.raises(ValueError):
+        with tracer.span("fails"):
+            raise ValueError
+
+    assert [event["name"] for event in tracer.get_events()] == ["process_name", "fails"]
+
+
+def test_span_add_args():
+    tracer = Tracer("test")
+
+    with tracer.span("args", node="step/0") as args:
+        args["files"] = 2
+    with tracer.span("noargs"):
+        pass
+
+    _, with_args, without_args = tracer.get_events()
+    assert with_args["args"] == {"node": "step/0", "files": 2}
+    assert "args" not in without_args
+
+
+def test_get_duration():
+    tracer = Tracer("test")
+    assert tracer.get_duration("repeat") == 0.0
+
+    with tracer.span("repeat"):
+        pass
+    first = tracer.get_duration("repeat")
+    assert first > 0.0
+
+    with tracer.span("repeat"):
+        pass
+    assert tracer.get_duration("repeat") > first
+
+
+def test_write_read(tmp_path):
+    node = Tracer("node")
+    with node.span("run"):
+        pass
+    node.write(tmp_path / "node.json")
+
+    job = Tracer("job")
+    with job.span("run"):
+        pass
+    job.write(tmp_path / "job.json", Tracer.read(tmp_path / "node.json"))
+
+    with open(tmp_path / "job.json") as f:
+        trace = json.load(f)
+
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["traceEvents"] == job.get_events() + node.get_events()
+    assert Tracer.read(tmp_path / "job.json") == trace["traceEvents"]
+
+
+def test_read_missing(tmp_path):
+    assert Tracer.read(tmp_path / "missing.json") == []
+
+
+def test_read_invalid(tmp_path):
+    with open(tmp_path / "invalid.json", "w") as f:
+        f.write("{")
+    assert Tracer.read(tmp_path / "invalid.json") == []
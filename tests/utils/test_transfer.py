@@ -0,0 +1,195 @@
+import errno
+import os
+import shutil
+
+import pytest
+
+from siliconcompiler.utils import transfer
+from siliconcompiler.utils.transfer import COPY, COPY_FILE_RANGE, COPY_STRATEGIES, HARDLINK, \
+    LINK_STRATEGIES, REFLINK, SENDFILE, SYMLINK, copy_tree, transfer_file
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_transfer_file_hardlink():
+    write("src.txt", "data")
+
+    assert transfer_file("src.txt", "dst.txt") == HARDLINK
+    assert os.path.samefile("src.txt", "dst.txt")
+
+
+def test_transfer_file_into_directory():
+    write("src.txt", "data")
+    os.makedirs("outputs")
+
+    assert transfer_file("src.txt", "outputs") == HARDLINK
+    assert read("outputs/src.txt") == "data"
+
+
+@pytest.mark.parametrize("strategy", [COPY_FILE_RANGE, SENDFILE, COPY])
+def test_transfer_file_copy(strategy):
+    if strategy == COPY_FILE_RANGE and not hasattr(os, "copy_file_range"):
+        pytest.skip("copy_file_range is not available")
+    if strategy == SENDFILE and not hasattr(os, "sendfile"):
+        pytest.skip("sendfile is not available")
+
+    write("src.txt", "data" * 100000)
+    os.chmod("src.txt", 0o640)
+
+    try:
+        used = transfer_file("src.txt", "dst.txt", [strategy])
+    except OSError as e:
+        pytest.skip(f"{strategy} is not supported here: {e}")
+
+    assert used == strategy
+    assert read("dst.txt") == "data" * 100000
+    assert not os.path.samefile("src.txt", "dst.txt")
+    assert os.stat("dst.txt").st_mode == os.stat("src.txt").st_mode
+
+
+def test_transfer_file_reflink_unsupported_falls_back(monkeypatch):
+    def no_reflink(src_fd, dst_fd, size):
+        raise OSError(errno.EOPNOTSUPP, "not supported")
+    monkeypatch.setitem(transfer._KERNEL_COPIES, REFLINK, no_reflink)
+
+    write("src.txt", "data")
+
+    assert transfer_file("src.txt", "dst.txt", [REFLINK, COPY]) == COPY
+    assert read("dst.txt") == "data"
+
+
+def test_transfer_file_partial_copy_removed(monkeypatch):
+    def partial(src_fd, dst_fd, size):
+        os.write(dst_fd, b"da")
+        raise OSError(errno.EXDEV, "cross device")
+    monkeypatch.setitem(transfer._KERNEL_COPIES, COPY_FILE_RANGE, partial)
+
+    write("src.txt", "data")
+
+    with pytest.raises(OSError):
+        transfer_file("src.txt", "dst.txt", [COPY_FILE_RANGE])
+    assert not os.path.exists("dst.txt")
+
+
+def test_transfer_file_cross_device_link(monkeypatch):
+    def link(src, dst):
+        raise OSError(errno.EXDEV, "cross device")
+    monkeypatch.setattr(transfer.os, "link", link)
+
+    write("src.txt", "data")
+
+    assert transfer_file("src.txt", "dst.txt") in COPY_STRATEGIES
+    assert read("dst.txt") == "data"
+    assert not os.path.samefile("src.txt", "dst.txt")
+
+
+def test_transfer_file_symlink():
+    write("src.txt", "data")
+
+    assert transfer_file(os.path.abspath("src.txt"), "dst.txt", [SYMLINK]) == SYMLINK
+    assert os.path.islink("dst.txt")
+
+
+def test_transfer_file_replaces_existing():
+    write("src.txt", "new")
+    write("dst.txt", "old")
+
+    assert transfer_file("src.txt", "dst.txt", COPY_STRATEGIES) in COPY_STRATEGIES
+    assert read("dst.txt") == "new"
+
+
+def test_transfer_file_same_file():
+    write("src.txt", "data")
+    os.link("src.txt", "dst.txt")
+
+    assert transfer_file("src.txt", "dst.txt") == HARDLINK
+    assert read("src.txt") == "data"
+
+
+def test_transfer_file_missing():
+    with pytest.raises(FileNotFoundError):
+        transfer_file("missing.txt", "dst.txt")
+
+
+def test_transfer_file_no_strategies():
+    write("src.txt", "data")
+
+    with pytest.raises(ValueError, match="no transfer strategies provided"):
+        transfer_file("src.txt", "dst.txt", [])
+
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_copy_tree(max_workers):
+    for n in range(20):
+        write(f"src/dir{n % 3}/file{n}.txt", str(n))
+    os.makedirs("src/empty")
+
+    used = copy_tree("src", "dst", max_workers=max_workers)
+
+    assert sum(used.values()) == 20
+    assert set(used).issubset(LINK_STRATEGIES)
+    assert os.path.isdir("dst/empty")
+    for n in range(20):
+        assert read(f"dst/dir{n % 3}/file{n}.txt") == str(n)
+
+
+def test_copy_tree_existing_destination():
+    write("src/file.txt", "new")
+    write("dst/file.txt", "old")
+    write("dst/other.txt", "other")
+
+    copy_tree("src", "dst", COPY_STRATEGIES)
+
+    assert read("dst/file.txt") == "new"
+    assert read("dst/other.txt") == "other"
+
+
+def test_copy_tree_ignore():
+    write("src/keep.txt", "keep")
+    write("src/skip.txt", "skip")
+    write("src/skipdir/file.txt", "skip")
+
+    copy_tree("src", "dst", ignore=lambda _, names: [n for n in names if n.startswith("skip")])
+
+    assert os.listdir("dst") == ["keep.txt"]
+
+
+def test_copy_tree_symlinks():
+    write("src/file.txt", "data")
+    os.symlink("file.txt", "src/link.txt")
+
+    used = copy_tree("src", "dst", COPY_STRATEGIES, symlinks=True)
+
+    assert used[SYMLINK] == 1
+    assert os.readlink("dst/link.txt") == "file.txt"
+
+
+def test_copy_tree_follow_symlinks():
+    write("src/file.txt", "data")
+    os.symlink("file.txt", "src/link.txt")
+
+    copy_tree("src", "dst", COPY_STRATEGIES)
+
+    assert not os.path.islink("dst/link.txt")
+    assert read("dst/link.txt") == "data"
+
+
+def test_copy_tree_errors():
+    write("src/file.txt", "data")
+    os.symlink("missing.txt", "src/broken.txt")
+
+    with pytest.raises(shutil.Error) as e:
+        copy_tree("src", "dst", COPY_STRATEGIES)
+
+    assert len(e.value.args[0]) == 1
+    assert e.value.args[0][0][0] == os.path.join("src", "broken.txt")
+    assert read("dst/file.txt") == "data"
@@ -1256,6 +1256,29 @@ def test_open_zstd_stream_without_bindings(monkeypatch):
         utils.open_zstd_stream(BytesIO(b""))
 
 
+@pytest.mark.parametrize("threads", [0, 2])
+def test_open_zstd_writer_round_trip(threads):
+    """What the compressor writes, with or without worker threads, reads back."""
+    payload = b"the quick brown fox" * 1000
+    sink = BytesIO()
+
+    with utils.open_zstd_writer(sink, threads=threads) as stream:
+        stream.write(payload)
+
+    assert sink.closed is False
+    with utils.open_zstd_stream(BytesIO(sink.getvalue())) as stream:
+        assert stream.read() == payload
+
+
+def test_open_zstd_writer_without_bindings(monkeypatch):
+    """Asked to compress without the bindings, the shim names what would fix it."""
+    monkeypatch.setattr(utils, "_zstd", None)
+
+    expected = "compression.zstd" if sys.version_info >= (3, 14) else "backports.zstd"
+    with pytest.raises(ModuleNotFoundError, match=expected):
+        utils.open_zstd_writer(BytesIO())
+
+
 def test_zstd_errors_without_bindings(monkeypatch):
     """
     With no bindings there is no error class to catch, and the empty tuple says so.